@@ -1,22 +1,24 @@
 # Licensed under a 3-clause BSD style license - see LICENSE.rst
 
+from importlib import import_module
+
 try:
     from .version import version as __version__
 except ImportError:
     __version__ = ''
 
 
-# Top-level API as exposed to users.
-from jdaviz.configs.cubeviz import Cubeviz  # noqa: F401
-from jdaviz.configs.imviz import Imviz  # noqa: F401
-from jdaviz.configs.mosviz import Mosviz  # noqa: F401
-from jdaviz.configs.rampviz import Rampviz  # noqa: F401
-from jdaviz.configs.specviz import Specviz  # noqa: F401
-from jdaviz.configs.specviz2d import Specviz2d  # noqa: F401
-from jdaviz.configs.deconfigged import App  # noqa: F401
-
-from jdaviz.utils import enable_hot_reloading  # noqa: F401
-from jdaviz.core.launcher import open  # noqa: F401
+# Top-level API as exposed to users.  These are imported on first access (see
+# ``__getattr__``), so that importing jdaviz does not import every config and plugin.
+_lazy_imports = {'Cubeviz': 'jdaviz.configs.cubeviz',
+                 'Imviz': 'jdaviz.configs.imviz',
+                 'Mosviz': 'jdaviz.configs.mosviz',
+                 'Rampviz': 'jdaviz.configs.rampviz',
+                 'Specviz': 'jdaviz.configs.specviz',
+                 'Specviz2d': 'jdaviz.configs.specviz2d',
+                 'App': 'jdaviz.configs.deconfigged',
+                 'enable_hot_reloading': 'jdaviz.utils',
+                 'open': 'jdaviz.core.launcher'}
 
 
 _expose = ['show', 'load', 'batch_load',
@@ -62,6 +64,7 @@ def app(replace=False, set_as_current=True):
     # instance.  After the other configs pass their deprecation period, we should try to
     # rename the internal Application instance and/or merge functionality in with the
     # App class to avoid confusion.
+    from jdaviz.configs.deconfigged import App
     ca = App(api_hints_obj='jd')
     if replace:
         _apps[_current_index] = ca
@@ -126,6 +129,10 @@ def __dir__():
 def __getattr__(name):
     if name in _expose:
         return getattr(gca(), name)
+    if name in _lazy_imports:
+        value = getattr(import_module(_lazy_imports[name]), name)
+        globals()[name] = value
+        return value
     if name in globals():
         return globals()[name]
     raise AttributeError()
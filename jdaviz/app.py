@@ -51,6 +51,8 @@ from jdaviz.core.events import (LoadDataMessage, NewViewerMessage, AddDataMessag
 from jdaviz.core.registries import (tool_registry, tray_registry,
                                     viewer_registry, viewer_creator_registry,
                                     data_parser_registry, loader_resolver_registry)
+from jdaviz.core.live_results import LiveResultsScheduler
+from jdaviz.core.object_cache import ObjectCache
 from jdaviz.core.tools import ICON_DIR
 from jdaviz.utils import (SnackbarQueue, alpha_index, data_has_valid_wcs,
                           layer_is_table_data, MultiMaskSubsetState,
@@ -363,6 +365,11 @@ class Application(VuetifyTemplate, HubListener):
 
     def __init__(self, configuration=None, *args, **kwargs):
         super().__init__(*args, **kwargs)
+        # registries of plugins, viewers and tools are populated when the configs are
+        # imported, which is deferred by ``import jdaviz`` until first needed
+        from jdaviz.configs import _import_configs
+        _import_configs()
+
         self._jdaviz_helper = None
         self.popout_button = PopoutButton(self)
         self.style_registry_instance = style_registry.get_style_registry()
@@ -385,6 +392,9 @@ class Application(VuetifyTemplate, HubListener):
         # Create a dictionary for holding non-ipywidget viewer objects so we
         #  can reference their state easily since glue does not store viewers
         self._viewer_store = {}
+        # memory budget shared by the frame caches of the cube viewers, created along
+        # with the first one (see CubevizImageView)
+        self._frame_cache_budget = None
 
         from jdaviz.core.events import PluginTableAddedMessage, PluginPlotAddedMessage
         self._plugin_tables = {}
@@ -443,9 +453,9 @@ class Application(VuetifyTemplate, HubListener):
         self.hub.subscribe(self, SnackbarMessage,
                            handler=self._on_snackbar_message)
 
-        # Internal cache so we don't have to keep calling get_object for the same Data.
-        # Key should be (data_label, statistic) and value the translated object.
-        self._get_object_cache = {}
+        # Internal cache so we don't have to keep calling get_object for the same Data
+        # or Subset, invalidated from hub messages.
+        self._object_cache = ObjectCache(hub=self.hub)
 
         self.hub.subscribe(self, SubsetUpdateMessage,
                            handler=self._on_subset_update_message)
@@ -458,18 +468,35 @@ class Application(VuetifyTemplate, HubListener):
         # Store for associations between Data entries:
         self._data_associations = self._init_data_associations()
 
+        # Recomputes live-updating plugin results when their inputs change (its background
+        # threads are shut down when the app is closed)
+        self._live_results = LiveResultsScheduler()
+
         # Subscribe to messages that result in changes to the layers
         self.hub.subscribe(self, AddDataMessage,
                            handler=self._on_add_data_message)
         self.hub.subscribe(self, RemoveDataMessage,
                            handler=self._on_layers_changed)
 
+        # Plugins that defer their instantiation are created when first opened in the tray
+        self.state.add_callback('tray_items_open', self._on_tray_items_open)
+
         # Emit messages when icons are updated
         self.state.add_callback('viewer_icons',
                                 lambda value: self.hub.broadcast(IconsUpdatedMessage('viewer', value, sender=self)))  # noqa
         self.state.add_callback('layer_icons',
                                 lambda value: self.hub.broadcast(IconsUpdatedMessage('layer', value, sender=self)))  # noqa
 
+    def close(self):
+        """
+        Close the application widget, and shut down the background threads recomputing
+        live-updating plugin results.
+        """
+        # may be called by __del__ before __init__ completed
+        if hasattr(self, '_live_results'):
+            self._live_results.close()
+        super().close()
+
     def _on_plugin_table_added(self, msg):
         if msg.plugin._plugin_name is None:
             # plugin was instantiated after the app was created, ignore
@@ -501,17 +528,27 @@ class Application(VuetifyTemplate, HubListener):
                     continue
             yield (data, plugin_inputs)
 
+    def _new_live_plugin(self, data, plugin_inputs):
+        # make a new instance of the plugin to avoid changing any UI settings
+        plg = self._jdaviz_helper.plugins.get(data.meta.get('Plugin'))._obj.new()
+        if not plg.supports_auto_update:
+            raise NotImplementedError(f"{data.meta.get('Plugin')} does not support live-updates")  # noqa
+        plg.user_api.from_dict(plugin_inputs)
+        # keep auto-updating, even if the option is hidden from the user API
+        # (can remove this line if auto_update is exposed to the user API in the future)
+        plg.add_results.auto_update_result = True
+        return plg
+
     def _update_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
+        """
+        Recompute the live-updating plugin results depending on the given data or subset
+        immediately (see ``_schedule_live_plugin_results`` to schedule their recomputation).
+        """
         for data, plugin_inputs in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
+            # supersedes any scheduled recomputation
+            self._live_results.cancel(data.label)
             # update and overwrite data
-            # make a new instance of the plugin to avoid changing any UI settings
-            plg = self._jdaviz_helper.plugins.get(data.meta.get('Plugin'))._obj.new()
-            if not plg.supports_auto_update:
-                raise NotImplementedError(f"{data.meta.get('Plugin')} does not support live-updates")  # noqa
-            plg.user_api.from_dict(plugin_inputs)
-            # keep auto-updating, even if the option is hidden from the user API
-            # (can remove this line if auto_update is exposed to the user API in the future)
-            plg.add_results.auto_update_result = True
+            plg = self._new_live_plugin(data, plugin_inputs)
             try:
                 plg()
             except Exception as e:
@@ -519,8 +556,65 @@ class Application(VuetifyTemplate, HubListener):
                     f"Auto-update for {plugin_inputs['add_results']['label']} failed: {e}",
                     sender=self, color="error"))
 
+    def _schedule_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
+        """
+        Schedule the recomputation of the live-updating plugin results depending on the given
+        data or subset, see `~jdaviz.core.live_results.LiveResultsScheduler`.
+        """
+        for data, _ in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
+            def snapshot(label=data.label):
+                return self._snapshot_live_plugin_result(label)
+
+            def on_error(e, label=data.label):
+                self.hub.broadcast(SnackbarMessage(f"Auto-update for {label} failed: {e}",
+                                                   sender=self, color="error"))
+
+            self._live_results.request(data.label, self._compute_live_plugin_result,
+                                       self._apply_live_plugin_result,
+                                       on_error=on_error, snapshot=snapshot)
+
+    def _snapshot_live_plugin_result(self, label):
+        # runs in the main thread: sets up a new plugin with the inputs of the latest result,
+        # and reads the inputs of its computation (arrays of the data and masks of the subsets)
+        # from the state of the app.  Plugins support computing their results in a background
+        # thread by implementing _live_result_inputs, _compute_live_result (a staticmethod
+        # which must only depend on these inputs) and _apply_live_result.
+        if label not in self.data_collection:
+            # removed since the request
+            return None
+        data = self.data_collection[label]
+        plugin_inputs = data.meta.get('_update_live_plugin_results', None)
+        if plugin_inputs is None:
+            return None
+        plg = self._new_live_plugin(data, plugin_inputs)
+        if not hasattr(plg, '_live_result_inputs'):
+            # the plugin can only compute and add its results at once, when applied
+            return plg, None, None
+        return plg, plg._compute_live_result, plg._live_result_inputs()
+
+    def _compute_live_plugin_result(self, snapshot):
+        # may run in a background thread, so only computes the result from the snapshotted
+        # inputs, without accessing the plugin or the app
+        if snapshot is None:
+            return None
+        plg, compute, inputs = snapshot
+        if compute is None:
+            return plg, None
+        return plg, compute(inputs)
+
+    def _apply_live_plugin_result(self, computed):
+        # runs in the main thread: sets the traitlets of the plugin and replaces the result
+        if computed is None:
+            return
+        plg, result = computed
+        if not hasattr(plg, '_apply_live_result'):
+            plg()
+        else:
+            plg._apply_live_result(result)
+
     def _remove_live_plugin_results(self, trigger_data_lbl=None, trigger_subset=None):
         for data, plugin_inputs in self._iter_live_plugin_results(trigger_data_lbl, trigger_subset):
+            self._live_results.cancel(data.label)
             self.hub.broadcast(SnackbarMessage(
                 f"Removing {data.label} due to deletion of {trigger_subset.label if trigger_subset is not None else trigger_data_lbl}",  # noqa
                 sender=self, color="warning"))
@@ -528,13 +622,12 @@ class Application(VuetifyTemplate, HubListener):
 
     def _on_add_data_message(self, msg):
         self._on_layers_changed(msg)
-        self._update_live_plugin_results(trigger_data_lbl=msg.data.label)
+        self._schedule_live_plugin_results(trigger_data_lbl=msg.data.label)
 
     def _on_subset_update_message(self, msg):
         # NOTE: print statements in here will require the viewer output_widget
-        self._clear_object_cache(msg.subset.label)
         if msg.attribute == 'subset_state':
-            self._update_live_plugin_results(trigger_subset=msg.subset)
+            self._schedule_live_plugin_results(trigger_subset=msg.subset)
 
     def _on_subset_delete_message(self, msg):
         self._remove_live_plugin_results(trigger_subset=msg.subset)
@@ -617,8 +710,8 @@ class Application(VuetifyTemplate, HubListener):
         # * info lets everything through
         # * success, secondary, and primary are treated as info (not sure what they are used for)
         # * None is also treated as info (when color is not set)
-        logger_plg = self._jdaviz_helper.plugins.get('Logger', None)
-        logger_plg._obj.queue_message(msg, msg.color)
+        logger_plg = self._get_logger_plugin()
+        logger_plg.queue_message(msg, msg.color)
 
     def _on_layers_changed(self, msg):
         if hasattr(msg, 'data'):
@@ -2732,14 +2825,6 @@ class Application(VuetifyTemplate, HubListener):
 
         self._update_existing_data_in_dc(msg, data_added=True)
 
-    def _clear_object_cache(self, data_label=None):
-        if data_label is None:
-            self._get_object_cache.clear()
-        else:
-            # keys are (data_label, statistic) tuples
-            self._get_object_cache = {k: v for k, v in self._get_object_cache.items()
-                                      if k[0] != data_label}
-
     def _on_data_deleted(self, msg):
         """
         Callback for when data is removed from the internal ``DataCollection``.
@@ -2755,8 +2840,6 @@ class Application(VuetifyTemplate, HubListener):
             if data_item['name'] == msg.data.label:
                 self.state.data_items.remove(data_item)
 
-        self._clear_object_cache(msg.data.label)
-
         self._update_existing_data_in_dc(msg, data_added=False)
 
     def _create_data_item(self, data):
@@ -3180,8 +3263,9 @@ class Application(VuetifyTemplate, HubListener):
             for tray_registry_member in tray_registry.members_in_category(category):
                 if not tray_registry_member.get('overwrite', False):
                     try:
-                        tray_item = self.get_tray_item_from_name(
-                            tray_registry_member.get('name'), return_widget=False)
+                        tray_item = self._get_state_item_from_name(
+                            self.state.tray_items, tray_registry_member.get('name'),
+                            return_widget=False)
                     except KeyError:
                         create_new = True
                     else:
@@ -3201,6 +3285,22 @@ class Application(VuetifyTemplate, HubListener):
         self.state.tray_items = tray_items
 
     def _create_tray_item(self, tray_registry_member):
+        if getattr(tray_registry_member.get('cls'), '_defer_instantiation', False):
+            # the plugin will be instantiated on first open or first access through the API
+            return {
+                'name': tray_registry_member.get('name'),
+                'label': tray_registry_member.get('label'),
+                'sidebar': tray_registry_member.get('cls')._sidebar,
+                'subtab': tray_registry_member.get('cls')._subtab,
+                'tray_item_description': tray_registry_member.get('cls')._class_plugin_description(),  # noqa
+                'api_methods': tray_registry_member.get('cls')._class_api_methods(),
+                'is_relevant': tray_registry_member.get('cls')._class_is_relevant(),
+                'widget': None
+            }
+
+        return self._instantiate_tray_item(tray_registry_member)
+
+    def _instantiate_tray_item(self, tray_registry_member):
         tray_item_instance = tray_registry_member.get('cls')(app=self, tray_instance=True)
 
         # store a copy of the tray name in the instance so it can be accessed by the
@@ -3221,6 +3321,20 @@ class Application(VuetifyTemplate, HubListener):
         }
         return tray_item
 
+    def _instantiate_deferred_tray_item(self, index):
+        tray_item = self.state.tray_items[index]
+        if tray_item['widget'] is not None:
+            return tray_item
+        tray_registry_member = tray_registry.members.get(tray_item['name'])
+        tray_item = self._instantiate_tray_item(tray_registry_member)
+        self.state.tray_items[index] = tray_item
+        return tray_item
+
+    def _on_tray_items_open(self, tray_items_open):
+        for index in tray_items_open:
+            if index < len(self.state.tray_items) and self.state.tray_items[index]['widget'] is None:  # noqa
+                self._instantiate_deferred_tray_item(index)
+
     def update_new_viewers_from_registry(self):
         # TODO: implement jdaviz.new_viewers dictionary to instantiated items here
         if self.config != 'deconfigged':
@@ -3347,8 +3461,21 @@ class Application(VuetifyTemplate, HubListener):
         KeyError
             Name not found.
         """
+        for index, item in enumerate(self.state.tray_items):
+            if ((item.get('name') == name or item.get('label') == name)
+                    and item['widget'] is None):
+                self._instantiate_deferred_tray_item(index)
+                break
         return self._get_state_item_from_name(self.state.tray_items, name, return_widget)
 
+    def _get_logger_plugin(self):
+        # looked up by name rather than through the helper's plugins, which would
+        # instantiate any plugin that defers its instantiation
+        try:
+            return self.get_tray_item_from_name('logger')
+        except KeyError:
+            return None
+
     def _init_data_associations(self):
         # assume all Data are parents:
         data_associations = {
@@ -1,7 +1,25 @@
-from .cubeviz import *  # noqa
-from .default import *  # noqa
-from .imviz import *  # noqa
-from .mosviz import *  # noqa
-from .rampviz import * # noqa
-from .specviz import *  # noqa
-from .specviz2d import *  # noqa
+from importlib import import_module
+import sys
+
+# The configs are only imported when one of them (or a name they export) is first
+# accessed, so that importing a single config does not import all the others.  The
+# Application imports all of them with _import_configs, which populates the registries of
+# plugins, viewers and tools.
+_configs = ('cubeviz', 'default', 'imviz', 'mosviz', 'rampviz', 'specviz', 'specviz2d')
+
+
+def _import_configs():
+    for config in _configs:
+        import_module(f'{__name__}.{config}')
+
+
+def __getattr__(name):
+    # names exported by the configs, the last config taking precedence as when they
+    # were all star-imported here
+    if not name.startswith('_'):
+        _import_configs()
+        for config in reversed(_configs):
+            module = sys.modules[f'{__name__}.{config}']
+            if name in getattr(module, '__all__', dir(module)):
+                return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
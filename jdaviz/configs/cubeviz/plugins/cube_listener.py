@@ -13,7 +13,7 @@ except ImportError:
     pass
 
 from jdaviz.configs.default.plugins.model_fitting.fitting_backend import generate_spaxel_list
-from jdaviz.utils import parallelize_calculation
+from jdaviz.utils import parallelize_calculation, SharedArray, SharedArrayStore
 
 #  smallest fraction of the max audio amplitude that can be represented by a 16-bit signed integer
 INT_MAX = 2**15 - 1
@@ -135,26 +135,25 @@ class CubeListenerData:
 
         spaxels = generate_spaxel_list(self.cube, self.spectral_axis_index)
 
-        # Callback to collect results from workers into the cubes
+        # Signals are written directly into the shared output cube by the workers
         def collect_result(results):
-            for i in range(len(results['x'])):
-                x = results['x'][i]
-                y = results['y'][i]
-                sig = results['sig'][i]
+            pass
 
-                # Store fitted values
-                if self.spectral_axis_index in [2, -1]:
-                    self.sigcube[x, y, :] = sig
-                elif self.spectral_axis_index == 0:
-                    self.sigcube[:, y, x] = sig
+        # The cube and output are shared with the worker processes through
+        # memory-mapped buffers instead of being pickled into each of them.
+        with SharedArrayStore() as store:
+            cube = store.put(self.cube)
+            sigcube = store.zeros(self.sigcube.shape, dtype=self.sigcube.dtype)
 
-        # Workers for the parallelization pool.
-        workers = (SonifySpaxelWorker(self.cube, spx, lo2hi, self.dur, self.srate,
-                                      self.audfrqmin, self.audfrqmax, self.eln, self.maxval,
-                                      spectral_axis_index=self.spectral_axis_index)
-                   for spx in np.array_split(spaxels, self.n_cpu))
+            # Workers for the parallelization pool.
+            workers = (SonifySpaxelWorker(cube, spx, lo2hi, self.dur, self.srate,
+                                          self.audfrqmin, self.audfrqmax, self.eln, self.maxval,
+                                          spectral_axis_index=self.spectral_axis_index,
+                                          output=sigcube)
+                       for spx in np.array_split(spaxels, self.n_cpu))
 
-        parallelize_calculation(workers, collect_result, n_cpu=self.n_cpu)
+            parallelize_calculation(workers, collect_result, n_cpu=self.n_cpu)
+            self.sigcube[...] = sigcube.asarray()
 
         if self.spectral_axis_index == 2:
             self.cursig[:] = self.sigcube[0, 0, :]
@@ -192,7 +191,7 @@ class SonifySpaxelWorker:
     it still exists.
     """
     def __init__(self, flux_cube, spaxel_set, lo2hi, dur, srate, audfrqmin, audfrqmax,
-                 eln, maxval, spectral_axis_index=2):
+                 eln, maxval, spectral_axis_index=2, output=None):
         self.cube = flux_cube
         self.spaxel_set = spaxel_set
         self.lo2hi = lo2hi
@@ -203,17 +202,24 @@ class SonifySpaxelWorker:
         self.eln = eln
         self.maxval = maxval
         self.spectral_axis_index = spectral_axis_index
+        self.output = output
 
     def __call__(self):
         results = {'x': [], 'y': [], 'sig': []}
 
+        cube = self.cube.asarray() if isinstance(self.cube, SharedArray) else self.cube
+        output = (self.output.asarray(writeable=True) if isinstance(self.output, SharedArray)
+                  else self.output)
+
         for spaxel in self.spaxel_set:
             x = spaxel[0]
             y = spaxel[1]
             if self.spectral_axis_index in [2, -1]:
-                flux = self.cube[x, y, self.lo2hi]
+                flux = cube[x, y, self.lo2hi]
+                out_spaxel = (x, y, slice(None))
             elif self.spectral_axis_index == 0:
-                flux = self.cube[self.lo2hi, y, x]
+                flux = cube[self.lo2hi, y, x]
+                out_spaxel = (slice(None), y, x)
 
             if flux.any():
                 sig = sonify_spectrum(flux, self.dur,
@@ -227,6 +233,12 @@ class SonifySpaxelWorker:
 
             results['x'].append(x)
             results['y'].append(y)
-            results['sig'].append(sig)
+            if output is not None:
+                output[out_spaxel] = sig
+            else:
+                results['sig'].append(sig)
+
+        if isinstance(output, np.memmap):
+            output.flush()
 
         return results
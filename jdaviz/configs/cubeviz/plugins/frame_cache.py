@@ -0,0 +1,268 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from glue.core import HubListener
+from glue.core.message import (DataCollectionDeleteMessage, NumericalDataChangedMessage,
+                               ComponentsChangedMessage,
+                               ExternallyDerivableComponentsChangedMessage)
+from matplotlib.colors import Colormap
+
+from jdaviz.configs.default.plugins.export.movie import slice_composite
+
+__all__ = ['FrameCacheBudget', 'SliceFrameCache']
+
+
+class FrameCacheBudget:
+    """
+    Memory budget shared by several `SliceFrameCache` (e.g., of all the cube viewers of
+    an app).  Frames are evicted in least recently used order across all the caches
+    when their total size exceeds ``max_bytes``.  The caches sharing a budget also
+    share its ``lock``.
+
+    Parameters
+    ----------
+    max_bytes : int, optional
+        Memory budget of all the caches.
+    """
+    def __init__(self, max_bytes=256 * 1024**2):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        # (cache, key) -> size of the frame, in least recently used order
+        self._entries = OrderedDict()
+        self._nbytes = 0
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    # the methods below are called with ``lock`` acquired
+
+    def _add(self, cache, key, nbytes):
+        self._remove(cache, key)
+        self._entries[(cache, key)] = nbytes
+        self._nbytes += nbytes
+        # evict least recently used frames, but always keep the latest one
+        while self._nbytes > self.max_bytes and len(self._entries) > 1:
+            (evicted_cache, evicted_key), _ = self._entries.popitem(last=False)
+            self._nbytes -= evicted_cache._drop_frame(evicted_key)
+
+    def _touch(self, cache, key):
+        self._entries.move_to_end((cache, key))
+
+    def _remove(self, cache, key):
+        self._nbytes -= self._entries.pop((cache, key), 0)
+
+    def _remove_cache(self, cache):
+        for entry in [entry for entry in self._entries if entry[0] is cache]:
+            self._nbytes -= self._entries.pop(entry)
+
+
+class SliceFrameCache(HubListener):
+    """
+    Cache of the images composited by a cube viewer for each slice.
+
+    Instances replace ``viewer._composite`` as the array maker of the composite image
+    of the viewer, so that the fixed resolution buffers of the image layers, with the
+    stretches and colormaps applied, are only computed once per slice.  Frames are
+    keyed by the slice, the bounds of the image, and the visual attributes of the layers,
+    and evicted in least recently used order when the total size of the frames of all
+    the caches sharing its ``budget`` exceeds the budget.  When connected to a hub, all
+    the frames are dropped as soon as any data changes.
+
+    Frames of upcoming slices can be computed ahead of time in a background thread
+    with `prefetch` (e.g., during playback).
+
+    Parameters
+    ----------
+    viewer : `~jdaviz.configs.cubeviz.plugins.viewers.CubevizImageView`
+        The cube viewer.
+    hub : `~glue.core.hub.Hub`, optional
+        Hub to subscribe to for invalidating the frames.
+    budget : `FrameCacheBudget`, optional
+        Memory budget shared with other caches.  Defaults to a budget of its own.
+    """
+    def __init__(self, viewer, hub=None, budget=None):
+        self.viewer = viewer
+        self.composite = viewer._composite
+        self.budget = FrameCacheBudget() if budget is None else budget
+        self._frames = {}
+        self._nbytes = 0
+        self._pending = {}
+        self._lock = self.budget.lock
+        self._executor = None
+        self._bounds = None
+        # increased when the frames are dropped, so frames being computed are then discarded
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.prefetched = 0
+
+        if hub is not None:
+            for msg_cls in (DataCollectionDeleteMessage, NumericalDataChangedMessage,
+                            ComponentsChangedMessage,
+                            ExternallyDerivableComponentsChangedMessage):
+                hub.subscribe(self, msg_cls, handler=lambda msg: self.clear())
+
+    def _visual_key(self):
+        # everything besides the slice that the composited image depends on
+        state = self.viewer.state
+        artists = {getattr(artist, 'uuid', None): artist for artist in self.viewer.layers}
+        layers = []
+        for uuid in sorted(self.composite.layers, key=str):
+            params = self.composite.layers[uuid]
+            layer_state = getattr(artists.get(uuid), 'state', None)
+            layers.append((uuid, id(getattr(layer_state, 'layer', None)),
+                           getattr(layer_state, 'attribute', None))
+                          + tuple(_freeze(params[name]) for name in sorted(params)
+                                  if name not in ('array', 'shape')))
+        return (self.composite.mode, _freeze(self.composite.cmap_bad), state.x_att,
+                state.y_att, id(state.reference_data), tuple(layers))
+
+    def _key(self, slices, bounds, visual_key=None):
+        if visual_key is None:
+            visual_key = self._visual_key()
+        return (tuple(slices), _freeze(bounds), visual_key)
+
+    def __contains__(self, key):
+        return key in self._frames
+
+    def __len__(self):
+        return len(self._frames)
+
+    def __call__(self, bounds=None):
+        self._bounds = bounds
+        key = self._key(self.viewer.state.slices, bounds)
+        frame = self._get(key)
+        if frame is not None:
+            self.hits += 1
+            return frame
+
+        self.misses += 1
+        frame = self.composite(bounds=bounds)
+        if frame is None:
+            return None
+        frame = frame.astype(np.float32)
+        self._put(key, frame)
+        return frame
+
+    def _get(self, key):
+        with self._lock:
+            if key in self._frames:
+                self.budget._touch(self, key)
+                return self._frames[key]
+            future = self._pending.get(key)
+        if future is None:
+            return None
+        # waiting for the frame being prefetched is faster than computing it again
+        try:
+            return future.result()
+        except Exception:  # nosec
+            return None
+
+    def _put(self, key, frame, generation=None):
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return False
+            self._drop_frame(key)
+            self._frames[key] = frame
+            self._nbytes += frame.nbytes
+            self.budget._add(self, key, frame.nbytes)
+        return True
+
+    def _drop_frame(self, key):
+        # called with the lock acquired, returns the size of the dropped frame
+        frame = self._frames.pop(key, None)
+        if frame is None:
+            return 0
+        self._nbytes -= frame.nbytes
+        return frame.nbytes
+
+    def prefetch(self, slice_indices):
+        """
+        Compute the frames of ``slice_indices`` (along the slice axis of the viewer) in a
+        background thread, with the current bounds and visual attributes of the viewer.
+        Frames already cached or being computed are skipped.
+        """
+        if self._bounds is None:
+            # nothing displayed yet
+            return
+        bounds = self._bounds
+        visual_key = self._visual_key()
+        slice_axis = self.viewer.slice_index
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix='cubeviz-prefetch')
+        for slice_index in slice_indices:
+            slices = list(self.viewer.state.slices)
+            slices[slice_axis] = int(slice_index)
+            key = self._key(slices, bounds, visual_key=visual_key)
+            with self._lock:
+                if key in self._frames or key in self._pending:
+                    continue
+                # the layers are copied now, so the frame matches the key even if
+                # the visual attributes change before it is computed
+                composite = slice_composite(self.viewer, int(slice_index))
+                self._pending[key] = self._executor.submit(self._compute, key, composite,
+                                                           bounds, self._generation)
+
+    def _compute(self, key, composite, bounds, generation):
+        try:
+            frame = composite(bounds=bounds)
+            if frame is not None:
+                frame = frame.astype(np.float32)
+                if self._put(key, frame, generation=generation):
+                    self.prefetched += 1
+            return frame
+        finally:
+            with self._lock:
+                self._pending.pop(key, None)
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    @property
+    def max_bytes(self):
+        return self.budget.max_bytes
+
+    @property
+    def stats(self):
+        """
+        Dictionary of cache statistics: hits, misses, prefetched frames, number of
+        frames, and their size in bytes, along with the size of the frames of all the
+        caches sharing the budget.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'prefetched': self.prefetched,
+                'entries': len(self._frames), 'nbytes': self._nbytes,
+                'budget_nbytes': self.budget.nbytes, 'max_bytes': self.max_bytes}
+
+    def clear(self):
+        """
+        Drop all the frames (statistics are kept).
+        """
+        with self._lock:
+            self._generation += 1
+            for future in self._pending.values():
+                future.cancel()
+            self._pending.clear()
+            self._frames.clear()
+            self._nbytes = 0
+            self.budget._remove_cache(self)
+
+
+def _freeze(value):
+    # hashable version of the visual attributes of the layers
+    if isinstance(value, (str, bool, int, float, type(None))):
+        return value
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, (list, tuple, np.ndarray)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, Colormap):
+        return (type(value).__name__, id(value), value.name)
+    # e.g., stretches, whose parameters are changed in place
+    return (type(value).__name__, id(value),
+            tuple(sorted((name, repr(item)) for name, item in vars(value).items()))
+            if hasattr(value, '__dict__') else repr(value))
@@ -1,11 +1,14 @@
+from collections import OrderedDict
+
 import numpy as np
 import specutils
+from scipy.special import comb
 from astropy import units as u
 from astropy.nddata import CCDData
 from astropy.utils import minversion
 from astropy.wcs import WCS
 from traitlets import Bool, List, Unicode, observe
-from specutils import manipulation, analysis, Spectrum
+from specutils import manipulation, SpectralAxis
 
 from jdaviz.core.custom_traitlets import IntHandleEmpty, FloatHandleEmpty
 from jdaviz.core.events import SnackbarMessage, GlobalDisplayUnitChanged
@@ -29,6 +32,73 @@ moment_unit_options = {0: ["Surface Brightness"],
                        1: ["Velocity", "Spectral Unit"],
                        2: ["Velocity", "Velocity^N"]}
 
+# memory budget for the chunks of the cube streamed through the moment sums
+_MOMENT_CHUNK_BYTES = 64 * 1024**2
+# number of sets of moment sums kept by the plugin
+_MOMENT_SUMS_CACHE_SIZE = 4
+
+
+def _moment_sums(flux, x, dx, max_order, continuum=None, continuum_x=None):
+    """
+    Compute the sums of ``flux * dx * (x - x_ref)**k`` along the spectral (last) axis
+    of ``flux`` for ``k`` up to ``max_order``, streaming chunks of the first spatial
+    axis so the (continuum-subtracted) cube is never copied as a whole.
+
+    Parameters
+    ----------
+    flux : `~numpy.ndarray`
+        Flux cube, with the spectral axis last.
+    x, dx : `~numpy.ndarray`
+        Spectral axis values and bin widths.
+    max_order : int
+        Highest order of the sums.
+    continuum : `~jdaviz.core.template_mixin._PerPixelContinuum`, optional
+        Per-spaxel continuum to subtract from ``flux``.
+    continuum_x : `~numpy.ndarray`, optional
+        Spectral axis values to evaluate ``continuum`` at, if not ``x``.
+
+    Returns
+    -------
+    sums : `~numpy.ndarray`
+        Sums with the order along the first axis, followed by the spatial axes.
+    x_ref : float
+        Reference spectral value the sums are taken about.
+    """
+    x = np.asarray(x, dtype=float)
+    if continuum_x is None:
+        continuum_x = x
+    # sums about the center of the spectral axis, to keep the powers well-conditioned
+    x_ref = np.mean(x) if len(x) else 0.
+    weights = dx[:, None] * (x - x_ref)[:, None] ** np.arange(max_order + 1)
+
+    spatial_shape = flux.shape[:-1]
+    sums = np.empty(spatial_shape + (max_order + 1,))
+    row_bytes = max(np.prod(flux.shape[1:], dtype=int), 1) * 8
+    n_rows = max(1, _MOMENT_CHUNK_BYTES // row_bytes)
+    for start in range(0, max(spatial_shape[0], 1), n_rows):
+        chunk = slice(start, start + n_rows)
+        flux_chunk = np.asarray(flux[chunk], dtype=float)
+        if continuum is not None:
+            flux_chunk = flux_chunk - continuum.evaluate(continuum_x, chunk)
+        sums[chunk] = flux_chunk @ weights
+    return np.moveaxis(sums, -1, 0), x_ref
+
+
+def _moment_from_sums(sums, x_ref, order):
+    """
+    Compute the moment of the given order, as in `specutils.analysis.moment`, from
+    the sums returned by `_moment_sums`.
+    """
+    m0 = sums[0]
+    if order == 0:
+        return m0
+    mean = sums[1] / m0
+    if order == 1:
+        return x_ref + mean
+    # central moment from the sums about x_ref (binomial expansion about the mean)
+    return sum(comb(order, j) * (-mean) ** (order - j) * sums[j]
+               for j in range(order + 1)) / m0
+
 
 @tray_registry('cubeviz-moment-maps', label="Moment Maps")
 class MomentMap(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMixin,
@@ -93,6 +163,8 @@ class MomentMap(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMix
         self._plugin_description = 'Create a 2D image from a data cube.'
 
         self.moment = None
+        # moment sums of the recently used inputs (see _get_moment_sums)
+        self._moment_sums_cache = OrderedDict()
 
         self.continuum_dataset = DatasetSelect(self,
                                                'continuum_dataset_items',
@@ -260,37 +332,6 @@ class MomentMap(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMix
                              f"{moment_unit_options[unit_options_index]} for "
                              f"moment {self.n_moment}")
 
-        if self.continuum.selected == 'None':
-            if "_orig_spec" in self.dataset.selected_obj.meta:
-                cube = self.dataset.selected_obj.meta["_orig_spec"]
-            else:
-                cube = self.dataset.selected_obj
-        else:
-            _, _, cube = self._get_continuum(self.continuum_dataset,
-                                             self.spectral_subset,
-                                             update_marks=False,
-                                             per_pixel=True)
-
-        # slice out desired region
-        # TODO: should we add a warning for a composite spectral subset?
-        if self.spectral_subset.selected == "Entire Spectrum":
-            spec_reg = None
-        else:
-            spec_reg = self.app.get_subsets(self.spectral_subset.selected,
-                                            simplify_spectral=True,
-                                            use_display_units=True)
-        # We need to convert the spectral region to the display units
-
-        if spec_reg is None:
-            slab = cube
-        else:
-            slab = manipulation.extract_region(cube, spec_reg)
-
-        # Calculate the moment and convert to CCDData to add to the viewers
-        # Need transpose to align JWST mirror shape: This is because specutils
-        # arrange the array shape to be (nx, ny, nz) but 2D visualization
-        # assumes (ny, nx) as per row-major convention.
-
         # Extract 2D WCS from input cube.
         data = self.dataset.selected_dc_item
         # Similar to coords_info logic.
@@ -306,19 +347,23 @@ class MomentMap(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMix
                 raise ValueError("reference_wavelength must be set for output in velocity units.")
 
             ref_wavelength = self.reference_wavelength * u.Unit(self.dataset_spectral_unit)
-            slab_sa = slab.spectral_axis.to("km/s", doppler_convention="relativistic",
-                                            doppler_rest=ref_wavelength)
-            slab = Spectrum(slab.flux, slab_sa, uncertainty=slab.uncertainty,
-                            spectral_axis_index=cube.spectral_axis_index)
         # Otherwise convert spectral axis to display units, have to do frequency <-> wavelength
         # before calculating
         else:
-            slab_sa = slab.spectral_axis.to(self.app._get_display_unit('spectral'))
-            slab = Spectrum(slab.flux, slab_sa, uncertainty=slab.uncertainty,
-                            spectral_axis_index=cube.spectral_axis_index)
+            ref_wavelength = None
+
+        # The moments of all orders are computed from the same sums over the spectral axis,
+        # so these are cached and reused when only the order changes.  The sums depend on
+        # the spectral frame (velocity or display unit) they are computed in, which is
+        # part of their key: a change of output unit that changes the frame rescans the cube.
+        sums, x_ref, x_unit, flux_unit = self._get_moment_sums(ref_wavelength, n_moment)
 
         # Finally actually calculate the moment
-        self.moment = analysis.moment(slab, order=n_moment)
+        self.moment = _moment_from_sums(sums, x_ref, n_moment)
+        if n_moment == 0:
+            self.moment = self.moment * flux_unit * x_unit
+        else:
+            self.moment = self.moment * x_unit ** n_moment
         # If n>1 and velocity is desired, need to take nth root of result
         if n_moment > 0 and self.output_unit_selected.lower() == "velocity":
             self.moment = np.power(self.moment, 1/self.n_moment)
@@ -388,6 +433,79 @@ class MomentMap(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMix
 
         return self.moment
 
+    def _get_moment_sums(self, ref_wavelength, n_moment):
+        """
+        Return the moment sums (see `_moment_sums`) of the selected cube, spectral subset
+        and continuum, up to at least order ``n_moment``, along with the reference spectral
+        value, spectral unit and flux unit of the sums.  The spectral axis is converted to
+        velocity if ``ref_wavelength`` is given, or to the spectral display unit otherwise.
+        """
+        def subset_version(label):
+            for subset_group in self.app.data_collection.subset_groups:
+                if subset_group.label == label:
+                    return id(subset_group), self.app._object_cache.version(subset_group)
+            return None
+
+        data = self.dataset.selected_dc_item
+        key = (self.dataset_selected, data.uuid, self.app._object_cache.version(data),
+               self.spectral_subset.selected, subset_version(self.spectral_subset.selected),
+               self.continuum.selected, subset_version(self.continuum.selected),
+               self.continuum_width, self.continuum_dataset_selected,
+               self.app._get_display_unit('spectral'), self.app._get_display_unit('flux'),
+               self.app._get_display_unit('sb'),
+               None if ref_wavelength is None else ref_wavelength.to_string())
+        # the moments need the sums up to order 2 for the mean and variance anyway
+        max_order = max(n_moment, 2)
+        cached = self._moment_sums_cache.get(key)
+        if cached is not None and cached[0].shape[0] > max_order:
+            self._moment_sums_cache.move_to_end(key)
+            return cached
+
+        if self.continuum.selected == 'None':
+            if "_orig_spec" in self.dataset.selected_obj.meta:
+                cube = self.dataset.selected_obj.meta["_orig_spec"]
+            else:
+                cube = self.dataset.selected_obj
+            continuum = None
+        else:
+            # the continuum is fitted and subtracted per chunk of spaxels while computing
+            # the sums, rather than for the whole cube at once
+            cube, continuum, _ = self._get_continuum(self.continuum_dataset,
+                                                     self.spectral_subset,
+                                                     update_marks=False,
+                                                     per_pixel=True,
+                                                     evaluate=False)
+            if cube is None:
+                raise ValueError("could not compute the continuum with the selected inputs")
+
+        # slice out desired region
+        # TODO: should we add a warning for a composite spectral subset?
+        if self.spectral_subset.selected == "Entire Spectrum":
+            slab = cube
+        else:
+            spec_reg = self.app.get_subsets(self.spectral_subset.selected,
+                                            simplify_spectral=True,
+                                            use_display_units=True)
+            slab = manipulation.extract_region(cube, spec_reg)
+
+        if ref_wavelength is not None:
+            x = slab.spectral_axis.to("km/s", doppler_convention="relativistic",
+                                      doppler_rest=ref_wavelength)
+        else:
+            x = slab.spectral_axis.to(self.app._get_display_unit('spectral'), u.spectral())
+        dx = np.abs(np.diff(SpectralAxis(x).bin_edges.value))
+
+        flux = np.moveaxis(slab.flux.value, slab.spectral_axis_index, -1)
+        # the continuum is fitted against the spectral axis of the cube (in display units)
+        sums, x_ref = _moment_sums(flux, x.value, dx, max_order, continuum=continuum,
+                                   continuum_x=slab.spectral_axis.value)
+
+        result = (sums, x_ref, x.unit, slab.flux.unit)
+        self._moment_sums_cache[key] = result
+        while len(self._moment_sums_cache) > _MOMENT_SUMS_CACHE_SIZE:
+            self._moment_sums_cache.popitem(last=False)
+        return result
+
     @property
     def moment_zero_unit(self):
         if self.spectrum_viewer.state.x_display_unit is not None:
@@ -7,9 +7,11 @@ from astropy.nddata import CCDData
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.wcs import WCS
 from numpy.testing import assert_allclose
-from specutils import SpectralRegion
+from specutils import SpectralAxis, SpectralRegion, Spectrum, analysis
 
+from jdaviz.configs.cubeviz.plugins.moment_maps import moment_maps
 from jdaviz.core.custom_units_and_equivs import PIX2, SPEC_PHOTON_FLUX_DENSITY_UNITS
+from jdaviz.core.template_mixin import _batched_polyfit, _PerPixelContinuum
 from jdaviz.utils import cached_uri
 
 
@@ -429,3 +431,74 @@ def test_moment_zero_unit_flux_conversions(cubeviz_helper,
                                         {'event': 'mousemove',
                                          'domain': {'x': 0, 'y': 0}})
     assert m_orig == label_mouseover.as_text()[0]
+
+
+@pytest.mark.parametrize("with_continuum", [False, True])
+def test_moment_sums(monkeypatch, with_continuum):
+    rng = np.random.default_rng(42)
+    wav = np.linspace(4.6e-7, 4.7e-7, 30) * u.m
+    flux = rng.normal(10, 1, (5, 4, 30))
+    flux[..., 12:18] += 50
+    x = SpectralAxis(wav).to('km/s', doppler_convention='relativistic',
+                             doppler_rest=4.65e-7 * u.m)
+    dx = np.abs(np.diff(SpectralAxis(x).bin_edges.value))
+
+    if with_continuum:
+        continuum_mask = np.r_[0:5, 25:30]
+        continuum = _PerPixelContinuum(wav.value[continuum_mask] - wav.value[0],
+                                       flux[..., continuum_mask], wav.value[0], 2)
+        subtracted = flux - _batched_polyfit(wav.value[continuum_mask] - wav.value[0],
+                                             flux[..., continuum_mask],
+                                             wav.value - wav.value[0])
+    else:
+        continuum = None
+        subtracted = flux
+
+    # stream the cube one row at a time
+    monkeypatch.setattr(moment_maps, '_MOMENT_CHUNK_BYTES', 1)
+    sums, x_ref = moment_maps._moment_sums(flux, x.value, dx, 3, continuum=continuum,
+                                           continuum_x=wav.value)
+    assert sums.shape == (4, 5, 4)
+    expected_spec = Spectrum(subtracted * u.Jy, spectral_axis=x)
+    for order in range(4):
+        assert_allclose(moment_maps._moment_from_sums(sums, x_ref, order),
+                        analysis.moment(expected_spec, order=order).value, rtol=1e-8)
+
+
+def test_moment_sums_cache(cubeviz_helper, spectrum1d_cube_larger):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore", message="No observer defined on WCS.*")
+        cubeviz_helper.load_data(spectrum1d_cube_larger, data_label='test')
+
+    mm = cubeviz_helper.plugins['Moment Maps']
+    cache = mm._obj._moment_sums_cache
+    mm.continuum = 'Surrounding'
+    mm.continuum_width = 3
+    unit = u.Unit(cubeviz_helper.plugins['Unit Conversion'].spectral_unit.selected)
+    cubeviz_helper.plugins['Subset Tools'].import_region(
+        SpectralRegion(4.624e-07 * unit, 4.627e-07 * unit))
+    mm.spectral_subset = 'Subset 1'
+
+    mm.n_moment = 0
+    moment_0 = mm.calculate_moment(add_data=False)
+    assert len(cache) == 1
+    sums = next(iter(cache.values()))[0]
+
+    # other orders reuse the same sums
+    mm.n_moment = 2
+    mm.output_unit = 'Velocity^N'
+    mm.reference_wavelength = 4.6255e-7
+    mm.calculate_moment(add_data=False)
+    assert len(cache) == 2
+    mm.n_moment = 1
+    mm.output_unit = 'Spectral Unit'
+    mm.calculate_moment(add_data=False)
+    assert len(cache) == 2
+    assert list(cache.values())[-1][0] is sums
+
+    # editing the subset invalidates the sums
+    cubeviz_helper.plugins['Subset Tools'].import_region(
+        SpectralRegion(4.624e-07 * unit, 4.628e-07 * unit), edit_subset='Subset 1')
+    mm.n_moment = 0
+    assert not np.allclose(mm.calculate_moment(add_data=False).data, moment_0.data, atol=0)
+    assert len(cache) == 3
@@ -1,12 +1,13 @@
 import threading
 import time
 import warnings
+from collections import deque
 from functools import cached_property
 
 import numpy as np
 from astropy import units as u
 from astropy.units import UnitsWarning
-from traitlets import Bool, Int, Unicode, observe
+from traitlets import Bool, Float, Int, Unicode, observe
 
 from jdaviz.configs.cubeviz.plugins.viewers import (
     WithSliceIndicator, WithSliceSelection, CubevizImageView
@@ -46,6 +47,8 @@ class Slice(PluginTemplateMixin):
       Whether to show indicator in spectral viewer when slice tool is inactive.
     * ``show_value``
       Whether to show slice value in label to right of indicator.
+    * ``playback_fps``
+      Frame rate achieved by the latest playback (read-only).
     """
 
     cube_viewer_exists = Bool(True).tag(sync=True)
@@ -66,6 +69,7 @@ class Slice(PluginTemplateMixin):
 
     is_playing = Bool(False).tag(sync=True)
     play_interval = Int(200).tag(sync=True)  # milliseconds
+    playback_fps = Float(0).tag(sync=True)  # achieved frames per second
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -79,6 +83,8 @@ class Slice(PluginTemplateMixin):
 
         self._indicator_initialized = False
         self._player = None
+        # number of slices ahead of the playhead whose images are computed in advance
+        self.playback_prefetch = 4
 
         # Subscribe to requests from the helper to change the slice across all viewers
         self.session.hub.subscribe(self, SliceSelectSliceMessage,
@@ -184,7 +190,7 @@ class Slice(PluginTemplateMixin):
 
     @property
     def user_api(self):
-        expose = ['value', 'show_indicator', 'show_value']
+        expose = ['value', 'show_indicator', 'show_value', 'playback_fps']
         if self.allow_disable_snapping:
             expose += ['snap_to_slice']
         return PluginUserApi(self, expose=expose)
@@ -376,23 +382,46 @@ class Slice(PluginTemplateMixin):
         else:
             self.value = float(valid_values[current_ind + 1])
 
+    def _prefetch_slices(self, values):
+        # compute the images of the cube viewers for the slices of the given values
+        # in the background, so they are ready when the playhead gets there
+        for viewer in self.slice_selection_viewers:
+            frame_cache = getattr(viewer, '_frame_cache', None)
+            slice_values = viewer.slice_values
+            if frame_cache is None or not len(slice_values):
+                continue
+            frame_cache.prefetch([np.argmin(abs(slice_values - value)) for value in values])
+
+    def _play_next_frame(self, valid_values, frame_times, now=None):
+        # move the playhead to the next slice, prefetching the following ones, and update
+        # the achieved frame rate from the times of the latest frames (``frame_times``)
+        # recompute current_ind in case user has moved slider
+        # could optimize this by only recomputing after a select slice message
+        # (will only make a difference if argmin becomes approaches play_interval)
+        current_ind = np.argmin(abs(valid_values - self.value))
+        # wrap
+        next_ind = (current_ind + 1) % len(valid_values)
+        ahead = (next_ind + np.arange(1, self.playback_prefetch + 1)) % len(valid_values)
+        self._prefetch_slices(valid_values[ahead])
+        self.value = float(valid_values[next_ind])
+
+        frame_times.append(time.monotonic() if now is None else now)
+        if len(frame_times) > 1:
+            self.playback_fps = (len(frame_times) - 1) / (frame_times[-1] - frame_times[0])
+
     def _player_worker(self):
         ts = float(self.play_interval) * 1e-3  # ms to s
         valid_values = self.valid_values_sorted
         if not len(valid_values):
             self.is_playing = False
             return
+        # times of the latest frames, to report the achieved frame rate
+        frame_times = deque(maxlen=10)
         while self.is_playing:
-            # recompute current_ind in case user has moved slider
-            # could optimize this by only recomputing after a select slice message
-            # (will only make a difference if argmin becomes approaches play_interval)
-            current_ind = np.argmin(abs(valid_values - self.value))
-            if len(valid_values) <= current_ind + 1:
-                # wrap
-                self.value = float(valid_values[0])
-            else:
-                self.value = float(valid_values[current_ind + 1])
-            time.sleep(ts)
+            t_frame = time.monotonic()
+            self._play_next_frame(valid_values, frame_times)
+            # the time to display the frame counts towards the play interval
+            time.sleep(max(ts - (time.monotonic() - t_frame), 0))
 
     def vue_play_start_stop(self, *args):
         if self.is_playing:  # Stop
@@ -409,6 +438,7 @@ class Slice(PluginTemplateMixin):
             return
 
         # Start
+        self.playback_fps = 0
         self.is_playing = True
         self._player = threading.Thread(target=self._player_worker)
         self._player.start()
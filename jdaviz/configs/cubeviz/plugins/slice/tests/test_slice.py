@@ -1,8 +1,13 @@
 import warnings
+from collections import deque
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
+from jdaviz.configs.cubeviz.plugins.frame_cache import FrameCacheBudget, SliceFrameCache
 from jdaviz.configs.cubeviz.plugins.slice.slice import Slice
+from jdaviz.configs.default.plugins.export.movie import frame_bounds
 
 
 def test_slice(cubeviz_helper, spectrum1d_cube):
@@ -92,6 +97,86 @@ def test_slice(cubeviz_helper, spectrum1d_cube):
     assert not sl._player
     # NOTE: Hard to check sl.slice here because it is non-deterministic.
 
+    # each frame of the player moves to the next slice, and the achieved frame rate
+    # is measured over the latest frames
+    valid_values = sl.valid_values_sorted
+    frame_times = deque(maxlen=10)
+    sl.value = float(valid_values[0])
+    sl._play_next_frame(valid_values, frame_times, now=10.)
+    assert sl.value == valid_values[1 % len(valid_values)]
+    sl._play_next_frame(valid_values, frame_times, now=10.25)
+    sl._play_next_frame(valid_values, frame_times, now=10.5)
+    assert sl.value == valid_values[3 % len(valid_values)]
+    assert sl.playback_fps == pytest.approx(4)
+
+
+def test_slice_frame_cache(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
+    sl = cubeviz_helper.plugins['Slice']._obj
+    viewer = cubeviz_helper.app.get_viewer('flux-viewer')
+    frame_cache = viewer._frame_cache
+    assert viewer._composite_image.array_maker is frame_cache
+    bounds = frame_bounds(viewer)
+
+    # the image of the displayed slice is computed once
+    frame = frame_cache(bounds=bounds)
+    np.testing.assert_array_equal(frame, viewer._composite(bounds=bounds).astype(np.float32))
+    assert frame_cache(bounds=bounds) is frame
+    assert frame_cache.stats['misses'] == 1
+    assert frame_cache.stats['hits'] == 1
+
+    # the image of the other slice is prefetched in the background
+    other_slice = 1 - viewer.slice
+    sl._prefetch_slices([viewer.slice_values[other_slice]])
+    for future in list(frame_cache._pending.values()):
+        future.result()
+    assert frame_cache.stats['prefetched'] == 1
+    sl.value = float(viewer.slice_values[other_slice])
+    assert viewer.slice == other_slice
+    np.testing.assert_array_equal(frame_cache(bounds=bounds),
+                                  viewer._composite(bounds=bounds).astype(np.float32))
+    assert frame_cache.stats['misses'] == 1
+    assert frame_cache.stats['hits'] == 2
+
+    # scrubbing back reuses the image of the first slice
+    sl.value = float(viewer.slice_values[1 - other_slice])
+    assert frame_cache(bounds=bounds) is frame
+
+    # changing the visual attributes of the layers does not reuse images
+    viewer.layers[0].state.stretch = 'sqrt'
+    frame_cache(bounds=bounds)
+    assert frame_cache.stats['misses'] == 2
+
+    # and changing the data drops them
+    data = cubeviz_helper.app.data_collection['test[FLUX]']
+    data.update_components({data.id['flux']: data['flux'] * 2})
+    assert len(frame_cache) == 0
+
+    # the frame caches of all the cube viewers share one memory budget
+    uncert_cache = cubeviz_helper.app.get_viewer('uncert-viewer')._frame_cache
+    assert uncert_cache.budget is frame_cache.budget
+
+
+def test_frame_cache_budget():
+    budget = FrameCacheBudget(max_bytes=3 * 800)
+    caches = [SliceFrameCache(SimpleNamespace(_composite=None), budget=budget)
+              for _ in range(2)]
+    frames = [np.zeros(100) for _ in range(4)]  # 800 bytes each
+
+    caches[0]._put('a', frames[0])
+    caches[1]._put('b', frames[1])
+    caches[1]._put('c', frames[2])
+    assert caches[0]._get('a') is frames[0]
+    # the least recently used frame of any cache is evicted
+    caches[0]._put('d', frames[3])
+    assert 'b' not in caches[1] and 'c' in caches[1]
+    assert 'a' in caches[0] and 'd' in caches[0]
+    assert budget.nbytes == 3 * 800
+    assert caches[1].nbytes == 800
+
+    caches[0].clear()
+    assert budget.nbytes == 800
+
 
 def test_indicator_settings(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube, data_label='test')
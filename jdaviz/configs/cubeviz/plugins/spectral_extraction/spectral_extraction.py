@@ -451,9 +451,10 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
     def bg_area_along_spectral(self):
         return np.sum(self.bg_weight_mask, axis=self.spatial_axes)
 
-    def _extract_from_aperture(self, cube, uncert_cube, mask_cube, aperture,
-                               weight_mask, wavelength_dependent,
-                               selected_func, **kwargs):
+    def _aperture_inputs(self, cube, uncert_cube, mask_cube, aperture, weight_mask):
+        # Reads the fluxes, uncertainties and mask of the cube within the aperture from the
+        # state of the app, to be collapsed by _collapse_aperture.
+        #
         # This plugin collapses over the *spatial axes* (optionally over a spatial subset,
         # defaults to ``No Subset``). Since the Cubeviz parser puts the fluxes
         # and uncertainties in different glue Data objects, we translate the spectral
@@ -522,107 +523,80 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
             mask_from_cube[np.where(np.isnan(mask_from_cube))] = 0
             mask = np.logical_or(mask, mask_from_cube.astype('bool'))
 
-        nddata_reshaped = NDDataArray(
-            flux, mask=mask, uncertainty=uncertainties, wcs=wcs, meta=nddata.meta
-        )
-        # by default we want to use operation_ignores_mask=True in nddata:
-        kwargs.setdefault("operation_ignores_mask", True)
-        # by default we want to propagate uncertainties:
-        kwargs.setdefault("propagate_uncertainties", True)
-
-        if selected_func == 'mean':
-            # Use built-in sum function to collapse NDDataArray
-            collapsed_sum_for_mean = nddata_reshaped.sum(axis=self.spatial_axes, **kwargs)
-            # But we still need the mean function for everything except flux
-            collapsed_as_mean = nddata_reshaped.mean(axis=self.spatial_axes, **kwargs)
-
-            # Then normalize the flux based on the fractional pixel array
-            flux_for_mean = (collapsed_sum_for_mean.data /
-                             np.sum(weight_mask, axis=self.spatial_axes)) << nddata_reshaped.unit
-            # Combine that information into a new NDDataArray
-            collapsed_nddata = NDDataArray(flux_for_mean, mask=collapsed_as_mean.mask,
-                                           uncertainty=collapsed_as_mean.uncertainty,
-                                           wcs=collapsed_as_mean.wcs,
-                                           meta=collapsed_as_mean.meta)
-        elif selected_func == 'sum':
-            collapsed_nddata = getattr(nddata_reshaped, selected_func)(
-                axis=self.spatial_axes, **kwargs
-            )  # returns an NDDataArray
-
-            # Remove per solid angle denominator to turn sb into flux
-            sq_angle_unit = check_if_unit_is_per_solid_angle(collapsed_nddata.unit,
-                                                             return_unit=True)
-            if sq_angle_unit is not None:
-                # convert aperture area in steradians to the selected square angle unit
-                # NOTE: just forcing these units for now!! this is in steradians and
-                # needs to be converted to the selected square angle unit but for now just
-                # force to correct units
-                if sq_angle_unit == u.sr:
-                    aperture_area = self.cube.meta.get('PIXAR_SR', 1.0) * sq_angle_unit
-                else:
-                    aperture_area = 1 * sq_angle_unit
-                collapsed_nddata = collapsed_nddata.multiply(aperture_area,
-                                                             propagate_uncertainties=True)
-        else:
-            collapsed_nddata = getattr(nddata_reshaped, selected_func)(
-                axis=self.spatial_axes, **kwargs
-            )  # returns an NDDataArray
+        return {'flux': flux, 'mask': mask, 'uncertainty': uncertainties, 'wcs': wcs,
+                'meta': dict(nddata.meta), 'weight_mask': weight_mask}
 
-        return self._return_extracted(cube, wcs, collapsed_nddata)
+    def _cube_inputs(self):
+        # properties of the cube needed to convert the collapsed data to a spectrum
+        return {'coords': self.cube.coords,
+                'shape': self.cube.shape,
+                'spectral_axis_index': self.spectral_axis_index,
+                'spatial_axes': self.spatial_axes,
+                'pixel_scale_factor': self.cube.meta.get('PIXAR_SR', 1.0)}
 
-    def _return_extracted(self, cube, wcs, collapsed_nddata, pass_spectral_axis=False):
-        # Convert to Spectrum, with the spectral axis in correct units:
-        if hasattr(cube.coords, 'spectral_wcs'):
-            target_wave_unit = cube.coords.spectral_wcs.world_axis_units[0]
-            wcs = cube.coords.spectral_wcs
-        elif hasattr(cube.coords, 'spectral'):
-            target_wave_unit = cube.coords.spectral.world_axis_units[0]
-            wcs = cube.coords.spectral
+    def _live_result_inputs(self, **kwargs):
+        # Reads all the inputs of the extraction from the state of the app (which is not
+        # thread-safe, so must run in the main thread), see _compute_live_result.
+        if self.conflicting_aperture_and_function:
+            raise ValueError(self.conflicting_aperture_error_message)
+        if self.aperture.selected == self.background.selected:
+            raise ValueError("aperture and background cannot be set to the same subset")
+
+        if self.background.selected != self.background.default_text:
+            bg_inputs = self._aperture_inputs(self.cube, self.uncert_cube, self.mask_cube,
+                                              self.background, self.bg_weight_mask)
         else:
-            target_wave_unit = None
-            # Can't split out spectral from GWCS
-            wcs = cube.coords
-            pass_spectral_axis = True
-
-        if target_wave_unit == '':
-            target_wave_unit = 'pix'
-
-        flux = collapsed_nddata.data << collapsed_nddata.unit
-        mask = collapsed_nddata.mask
-        uncertainty = collapsed_nddata.uncertainty
-
-        if pass_spectral_axis:
-            wcs_args = [0, 0, 0]
-            spec_indices = np.arange(cube.shape[self.spectral_axis_index])
-            wcs_args[self.spectral_axis_index] = spec_indices
-            wcs_args.reverse()
-            spectral_and_spatial = wcs.pixel_to_world(*wcs_args)
-            spectral_axis = [x for x in spectral_and_spatial if isinstance(x, SpectralCoord)]
-            if len(spectral_axis):
-                spectral_axis = spectral_axis[0]
-            else:
-                # In this case we have a pixel spectral axis
-                world_index = cube.ndim - 1 - cube.meta['spectral_axis_index']
-                spectral_axis = spectral_and_spatial[world_index]
-                if spectral_axis.unit == "":
-                    spectral_axis = spectral_axis * u.pixel
-
-            collapsed_spec = _return_spectrum_with_correct_units(
-                flux, wcs, collapsed_nddata.meta, data_type='flux',
-                target_wave_unit=target_wave_unit,
-                uncertainty=uncertainty,
-                mask=mask,
-                spectral_axis=spectral_axis
-            )
+            bg_inputs = None
+
+        return {'aperture': self._aperture_inputs(self.cube, self.uncert_cube, self.mask_cube,
+                                                  self.aperture, self.aperture_weight_mask),
+                'background': bg_inputs,
+                'cube': self._cube_inputs(),
+                'function': self.function_selected.lower(),
+                'kwargs': kwargs}
+
+    @staticmethod
+    def _compute_live_result(inputs):
+        # Extracts the spectrum (and background) from the inputs read by _live_result_inputs
+        # only, so can run in a background thread, see _apply_live_result.
+        cube_inputs, function = inputs['cube'], inputs['function']
+        spec = _extract_spectrum(inputs['aperture'], cube_inputs, function, **inputs['kwargs'])
+
+        if inputs['background'] is not None:
+            aperture_area = np.sum(inputs['aperture']['weight_mask'],
+                                   axis=cube_inputs['spatial_axes'])
+            bg_spec = _background_spectrum(inputs['background'], cube_inputs, function,
+                                           aperture_area)
+            spec = spec - bg_spec
         else:
-            collapsed_spec = _return_spectrum_with_correct_units(
-                flux, wcs, collapsed_nddata.meta, data_type='flux',
-                target_wave_unit=target_wave_unit,
-                uncertainty=uncertainty,
-                mask=mask
-            )
+            bg_spec = None
+
+        # per https://jwst-docs.stsci.edu/jwst-near-infrared-camera/nircam-performance/nircam-absolute-flux-calibration-and-zeropoints # noqa
+        spec.meta['_pixel_scale_factor'] = cube_inputs['pixel_scale_factor']
+        return spec, bg_spec
+
+    def _apply_live_result(self, result, add_data=True):
+        # Swaps in the spectrum computed by _compute_live_result, in the main thread.
+        spec, bg_spec = result
+
+        # stuff for exporting to file
+        self.extracted_spec = spec
+        self.extraction_available = True
+        fname_label = self.dataset_selected.replace("[", "_").replace("]", "")
+        self.filename = f"extracted_{self.function_selected.lower()}_{fname_label}.fits"
 
-        return collapsed_spec
+        if add_data:
+            if default_color := self.aperture.selected_item.get('color', None):
+                spec.meta['_default_color'] = default_color
+            self.add_results.add_results_from_plugin(spec)
+
+            snackbar_message = SnackbarMessage(
+                f"{self.resulting_product_name.title()} extracted successfully.",
+                color="success",
+                sender=self)
+            self.hub.broadcast(snackbar_message)
+
+        return spec
 
     def _preview_x_from_extracted(self, extracted):
         return extracted.spectral_axis
@@ -659,41 +633,8 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
             Additional keyword arguments passed to the NDDataArray collapse operation.
             Examples include ``propagate_uncertainties`` and ``operation_ignores_mask``.
         """
-        if self.conflicting_aperture_and_function:
-            raise ValueError(self.conflicting_aperture_error_message)
-        if self.aperture.selected == self.background.selected:
-            raise ValueError("aperture and background cannot be set to the same subset")
-
-        selected_func = self.function_selected.lower()
-        spec = self._extract_from_aperture(self.cube, self.uncert_cube, self.mask_cube,
-                                           self.aperture, self.aperture_weight_mask,
-                                           self.wavelength_dependent,
-                                           selected_func, **kwargs)
-
-        bg_spec = self.extract_bg_spectrum(add_data=False, bg_spec_per_spaxel=False)
-        if bg_spec is not None:
-            spec = spec - bg_spec
-
-        # per https://jwst-docs.stsci.edu/jwst-near-infrared-camera/nircam-performance/nircam-absolute-flux-calibration-and-zeropoints # noqa
-        pix_scale_factor = self.cube.meta.get('PIXAR_SR', 1.0)
-        spec.meta['_pixel_scale_factor'] = pix_scale_factor
-
-        # stuff for exporting to file
-        self.extracted_spec = spec
-        self.extraction_available = True
-        fname_label = self.dataset_selected.replace("[", "_").replace("]", "")
-        self.filename = f"extracted_{selected_func}_{fname_label}.fits"
-
-        if add_data:
-            if default_color := self.aperture.selected_item.get('color', None):
-                spec.meta['_default_color'] = default_color
-            self.add_results.add_results_from_plugin(spec)
-
-            snackbar_message = SnackbarMessage(
-                f"{self.resulting_product_name.title()} extracted successfully.",
-                color="success",
-                sender=self)
-            self.hub.broadcast(snackbar_message)
+        spec, bg_spec = self._compute_live_result(self._live_result_inputs(**kwargs))
+        spec = self._apply_live_result((spec, bg_spec), add_data=add_data)
 
         if return_bg:
             return spec, bg_spec
@@ -719,15 +660,15 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
         # allow internal calls to override the behavior of the bg_spec_per_spaxel traitlet
         bg_spec_per_spaxel = kwargs.pop('bg_spec_per_spaxel', self.bg_spec_per_spaxel)
         if self.background.selected != self.background.default_text:
-            bg_spec = self._extract_from_aperture(self.cube, self.uncert_cube, self.mask_cube,
-                                                  self.background, self.bg_weight_mask,
-                                                  self.bg_wavelength_dependent,
-                                                  self.function_selected.lower(), **kwargs)
-            if self.function_selected.lower() == 'sum':
-                if not bg_spec_per_spaxel:
-                    # then scale according to aperture areas across the spectral axis (allowing for
-                    # independent wavelength-dependence btwn the aperture and background)
-                    bg_spec *= self.aperture_area_along_spectral / self.bg_area_along_spectral
+            function = self.function_selected.lower()
+            bg_inputs = self._aperture_inputs(self.cube, self.uncert_cube, self.mask_cube,
+                                              self.background, self.bg_weight_mask)
+            if function == 'sum' and not bg_spec_per_spaxel:
+                aperture_area = self.aperture_area_along_spectral
+            else:
+                aperture_area = None
+            bg_spec = _background_spectrum(bg_inputs, self._cube_inputs(), function,
+                                           aperture_area, **kwargs)
         else:
             bg_spec = None
 
@@ -830,3 +771,133 @@ class SpectralExtraction3D(PluginTemplateMixin, ApertureSubsetSelectMixin,
         else:
             self.marks['bg_extract'].update_xy(self._preview_x_from_extracted(bg_extract),
                                                self._preview_y_from_extracted(bg_extract))
+
+
+def _collapse_aperture(aperture_inputs, cube_inputs, function, **kwargs):
+    # Collapses the inputs read by SpectralExtraction3D._aperture_inputs over the spatial axes
+    # (only depends on its arguments, so can run in a background thread).
+    spatial_axes = cube_inputs['spatial_axes']
+    weight_mask = aperture_inputs['weight_mask']
+    nddata_reshaped = NDDataArray(
+        aperture_inputs['flux'], mask=aperture_inputs['mask'],
+        uncertainty=aperture_inputs['uncertainty'], wcs=aperture_inputs['wcs'],
+        meta=aperture_inputs['meta']
+    )
+    # by default we want to use operation_ignores_mask=True in nddata:
+    kwargs.setdefault("operation_ignores_mask", True)
+    # by default we want to propagate uncertainties:
+    kwargs.setdefault("propagate_uncertainties", True)
+
+    if function == 'mean':
+        # Use built-in sum function to collapse NDDataArray
+        collapsed_sum_for_mean = nddata_reshaped.sum(axis=spatial_axes, **kwargs)
+        # But we still need the mean function for everything except flux
+        collapsed_as_mean = nddata_reshaped.mean(axis=spatial_axes, **kwargs)
+
+        # Then normalize the flux based on the fractional pixel array
+        flux_for_mean = (collapsed_sum_for_mean.data /
+                         np.sum(weight_mask, axis=spatial_axes)) << nddata_reshaped.unit
+        # Combine that information into a new NDDataArray
+        collapsed_nddata = NDDataArray(flux_for_mean, mask=collapsed_as_mean.mask,
+                                       uncertainty=collapsed_as_mean.uncertainty,
+                                       wcs=collapsed_as_mean.wcs,
+                                       meta=collapsed_as_mean.meta)
+    elif function == 'sum':
+        collapsed_nddata = getattr(nddata_reshaped, function)(
+            axis=spatial_axes, **kwargs
+        )  # returns an NDDataArray
+
+        # Remove per solid angle denominator to turn sb into flux
+        sq_angle_unit = check_if_unit_is_per_solid_angle(collapsed_nddata.unit,
+                                                         return_unit=True)
+        if sq_angle_unit is not None:
+            # convert aperture area in steradians to the selected square angle unit
+            # NOTE: just forcing these units for now!! this is in steradians and
+            # needs to be converted to the selected square angle unit but for now just
+            # force to correct units
+            if sq_angle_unit == u.sr:
+                aperture_area = cube_inputs['pixel_scale_factor'] * sq_angle_unit
+            else:
+                aperture_area = 1 * sq_angle_unit
+            collapsed_nddata = collapsed_nddata.multiply(aperture_area,
+                                                         propagate_uncertainties=True)
+    else:
+        collapsed_nddata = getattr(nddata_reshaped, function)(
+            axis=spatial_axes, **kwargs
+        )  # returns an NDDataArray
+
+    return collapsed_nddata
+
+
+def _spectrum_from_collapsed(collapsed_nddata, cube_inputs, pass_spectral_axis=False):
+    # Convert to Spectrum, with the spectral axis in correct units:
+    coords, shape = cube_inputs['coords'], cube_inputs['shape']
+    spectral_axis_index = cube_inputs['spectral_axis_index']
+    if hasattr(coords, 'spectral_wcs'):
+        target_wave_unit = coords.spectral_wcs.world_axis_units[0]
+        wcs = coords.spectral_wcs
+    elif hasattr(coords, 'spectral'):
+        target_wave_unit = coords.spectral.world_axis_units[0]
+        wcs = coords.spectral
+    else:
+        target_wave_unit = None
+        # Can't split out spectral from GWCS
+        wcs = coords
+        pass_spectral_axis = True
+
+    if target_wave_unit == '':
+        target_wave_unit = 'pix'
+
+    flux = collapsed_nddata.data << collapsed_nddata.unit
+    mask = collapsed_nddata.mask
+    uncertainty = collapsed_nddata.uncertainty
+
+    if pass_spectral_axis:
+        wcs_args = [0, 0, 0]
+        spec_indices = np.arange(shape[spectral_axis_index])
+        wcs_args[spectral_axis_index] = spec_indices
+        wcs_args.reverse()
+        spectral_and_spatial = wcs.pixel_to_world(*wcs_args)
+        spectral_axis = [x for x in spectral_and_spatial if isinstance(x, SpectralCoord)]
+        if len(spectral_axis):
+            spectral_axis = spectral_axis[0]
+        else:
+            # In this case we have a pixel spectral axis
+            world_index = len(shape) - 1 - spectral_axis_index
+            spectral_axis = spectral_and_spatial[world_index]
+            if spectral_axis.unit == "":
+                spectral_axis = spectral_axis * u.pixel
+
+        collapsed_spec = _return_spectrum_with_correct_units(
+            flux, wcs, collapsed_nddata.meta, data_type='flux',
+            target_wave_unit=target_wave_unit,
+            uncertainty=uncertainty,
+            mask=mask,
+            spectral_axis=spectral_axis
+        )
+    else:
+        collapsed_spec = _return_spectrum_with_correct_units(
+            flux, wcs, collapsed_nddata.meta, data_type='flux',
+            target_wave_unit=target_wave_unit,
+            uncertainty=uncertainty,
+            mask=mask
+        )
+
+    return collapsed_spec
+
+
+def _extract_spectrum(aperture_inputs, cube_inputs, function, **kwargs):
+    collapsed_nddata = _collapse_aperture(aperture_inputs, cube_inputs, function, **kwargs)
+    return _spectrum_from_collapsed(collapsed_nddata, cube_inputs)
+
+
+def _background_spectrum(bg_inputs, cube_inputs, function, aperture_area, **kwargs):
+    # aperture_area: area of the aperture along the spectral axis, to scale the background
+    # spectrum to when function is 'sum' (None to not scale, i.e. background per spaxel)
+    bg_spec = _extract_spectrum(bg_inputs, cube_inputs, function, **kwargs)
+    if function == 'sum' and aperture_area is not None:
+        # then scale according to aperture areas across the spectral axis (allowing for
+        # independent wavelength-dependence btwn the aperture and background)
+        bg_spec *= aperture_area / np.sum(bg_inputs['weight_mask'],
+                                          axis=cube_inputs['spatial_axes'])
+    return bg_spec
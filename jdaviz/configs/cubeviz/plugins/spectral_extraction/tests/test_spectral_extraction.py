@@ -7,7 +7,6 @@ from astropy.io import fits
 from astropy.nddata import NDDataArray, StdDevUncertainty
 from astropy.table import QTable
 from astropy.tests.helper import assert_quantity_allclose
-from astropy.utils.exceptions import AstropyUserWarning
 from glue.core.roi import CircularROI, RectangularROI
 from numpy.testing import assert_allclose, assert_array_equal
 from regions import (CirclePixelRegion, CircleAnnulusPixelRegion, EllipsePixelRegion,
@@ -71,10 +70,7 @@ def test_gauss_smooth_before_spec_extract(cubeviz_helper, spectrum1d_cube_with_u
     gs_plugin.mode_selected = 'Spatial'
     gs_plugin.stddev = 3
 
-    with pytest.warns(
-            AstropyUserWarning,
-            match='The following attributes were set on the data object, but will be ignored'):
-        gs_plugin.vue_apply()
+    gs_plugin.vue_apply()
 
     gs_data_label = cubeviz_helper.app.data_collection[3].label
     cubeviz_helper.app.add_data_to_viewer('flux-viewer', gs_data_label)
@@ -450,6 +446,65 @@ def test_autoupdate_results(cubeviz_helper, spectrum1d_cube_largest):
 #    assert new_med_flux > orig_med_flux
 
 
+def test_autoupdate_results_in_background(cubeviz_helper, spectrum1d_cube_largest):
+    cubeviz_helper.load_data(spectrum1d_cube_largest)
+    cubeviz_helper.plugins['Subset Tools'].import_region(
+        CircularROI(xc=5, yc=5, radius=2))
+
+    extract_plg = cubeviz_helper.plugins['3D Spectral Extraction']
+    extract_plg.aperture = 'Subset 1'
+    extract_plg.add_results.label = 'extracted'
+    extract_plg.add_results._obj.auto_update_result = True
+    _ = extract_plg.extract()
+    orig_data = cubeviz_helper.app.data_collection['extracted']
+
+    # recompute live results in background threads, as when running in a kernel (without
+    # a kernel, the results are swapped in by wait)
+    live_results = cubeviz_helper.app._live_results
+    live_results.asynchronous = True
+    cubeviz_helper.plugins['Subset Tools'].combination_mode = 'replace'
+    cubeviz_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=3))
+    live_results.wait(60)
+    assert not live_results.running
+
+    # the result was swapped in, with the inputs of the original result
+    new_data = cubeviz_helper.app.data_collection['extracted']
+    assert new_data is not orig_data
+    assert (new_data.meta['_update_live_plugin_results']['aperture'] ==
+            orig_data.meta['_update_live_plugin_results']['aperture'])
+
+
+def test_autoupdate_results_snapshot(cubeviz_helper, spectrum1d_cube_largest):
+    cubeviz_helper.load_data(spectrum1d_cube_largest)
+    cubeviz_helper.plugins['Subset Tools'].import_region(
+        CircularROI(xc=5, yc=5, radius=2))
+
+    extract_plg = cubeviz_helper.plugins['3D Spectral Extraction']
+    extract_plg.aperture = 'Subset 1'
+    extract_plg.add_results.label = 'extracted'
+    extract_plg.add_results._obj.auto_update_result = True
+    orig_spec = extract_plg.extract()
+
+    app = cubeviz_helper.app
+    snapshot = app._snapshot_live_plugin_result('extracted')
+    plg = snapshot[0]
+
+    # the computation only depends on the arrays read in the snapshot, not on later changes
+    # of the subset, and does not set the traitlets of the plugin
+    cubeviz_helper.plugins['Subset Tools'].combination_mode = 'replace'
+    cubeviz_helper.plugins['Subset Tools'].import_region(CircularROI(xc=5, yc=5, radius=3))
+    computed = app._compute_live_plugin_result(snapshot)
+    spec, bg_spec = computed[1]
+    assert_quantity_allclose(spec.flux, orig_spec.flux)
+    assert bg_spec is None
+    assert not plg.extraction_available
+
+    app._apply_live_plugin_result(computed)
+    assert plg.extraction_available
+    assert plg.extracted_spec is spec
+    assert app.data_collection['extracted'].meta['Plugin'] == '3D Spectral Extraction'
+
+
 def test_aperture_composite_detection(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube)
     subset_plugin = cubeviz_helper.plugins['Subset Tools']
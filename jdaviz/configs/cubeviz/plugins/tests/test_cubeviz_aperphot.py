@@ -3,7 +3,6 @@ import pytest
 from astropy import units as u
 from astropy.table import Table
 from astropy.tests.helper import assert_quantity_allclose
-from astropy.utils.exceptions import AstropyUserWarning
 from numpy.testing import assert_allclose
 from regions import RectanglePixelRegion, PixCoord
 
@@ -108,8 +107,7 @@ def test_cubeviz_aperphot_generated_3d_gaussian_smooth(cubeviz_helper, image_cub
 
     gauss_plg = cubeviz_helper.plugins["Gaussian Smooth"]._obj
     gauss_plg.mode_selected = "Spatial"
-    with pytest.warns(AstropyUserWarning, match="The following attributes were set on the data"):
-        _ = gauss_plg.smooth()
+    _ = gauss_plg.smooth()
 
     # Need this to make it available for photometry data drop-down.
     cubeviz_helper.app.add_data_to_viewer("uncert-viewer", "test[FLUX] spatial-smooth stddev-1.0")
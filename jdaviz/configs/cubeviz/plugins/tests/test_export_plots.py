@@ -1,13 +1,14 @@
 import os
 
+import numpy as np
 import pytest
 
 from jdaviz.configs.default.plugins.export.export import HAS_OPENCV
+from jdaviz.configs.default.plugins.export.movie import (composite_on_background, frame_bounds,
+                                                         render_slice_frame)
 
 
-# TODO: Remove skip when https://github.com/bqplot/bqplot/pull/1397/files#r726500097 is resolved.
-@pytest.mark.skip(reason="Cannot test due to async JS callback")
-# @pytest.mark.skipif(not HAS_OPENCV, reason="opencv-python is not installed")
+@pytest.mark.skipif(not HAS_OPENCV, reason="opencv-python is not installed")
 def test_export_movie(cubeviz_helper, spectrum1d_cube, tmp_path):
     orig_path = os.getcwd()
     os.chdir(tmp_path)
@@ -17,13 +18,51 @@ def test_export_movie(cubeviz_helper, spectrum1d_cube, tmp_path):
         assert plugin._obj.i_start == 0
         assert plugin._obj.i_end == 1
 
-        plugin.viewer_format = 'mp4'
-        plugin._obj.export()
+        # the frames are rendered without a frontend, so the movie can be written
+        # in this thread instead of the one started by export
+        viewer = cubeviz_helper.app.get_viewer("flux-viewer")
+        orig_slice = viewer.slice
+        plugin._obj._save_movie(viewer, 0, 1, 5, "mymovie.mp4", None, None)
         assert os.path.isfile("mymovie.mp4"), tmp_path
+        # the displayed slice is not changed
+        assert viewer.slice == orig_slice
     finally:
         os.chdir(orig_path)
 
 
+def test_composite_on_background():
+    rgba = np.array([[[1, 0, 0, 1], [1, 0, 0, 0.5], [0, 0, 1, 0]]])
+    np.testing.assert_allclose(composite_on_background(rgba),
+                               [[[1, 0, 0], [1, 0.5, 0.5], [1, 1, 1]]])
+    np.testing.assert_allclose(composite_on_background(rgba, background='black'),
+                               [[[1, 0, 0], [0.5, 0, 0], [0, 0, 0]]])
+
+
+def test_render_slice_frame(cubeviz_helper, spectrum1d_cube):
+    cubeviz_helper.load_data(spectrum1d_cube, data_label="test")
+    viewer = cubeviz_helper.app.get_viewer("flux-viewer")
+    orig_slice = viewer.slice
+
+    # one frame pixel per data pixel without a frontend
+    bounds = frame_bounds(viewer)
+    assert [b[2] for b in bounds] == [2, 4]
+    frames = [render_slice_frame(viewer, i, bounds) for i in range(2)]
+    for frame in frames:
+        assert frame.shape == (2, 4, 3)
+        assert frame.dtype == np.uint8
+    assert not np.array_equal(frames[0], frames[1])
+    # rendering does not change the displayed slice
+    assert viewer.slice == orig_slice
+    # and the frame of the displayed slice is the displayed image, over the background
+    displayed = composite_on_background(viewer._composite(bounds=bounds)[::-1])
+    np.testing.assert_array_equal(
+        render_slice_frame(viewer, viewer.state.slices[viewer.slice_index], bounds),
+        np.round(displayed * 255).astype(np.uint8))
+
+    frame = render_slice_frame(viewer, 0, frame_bounds(viewer, width='40px', height='30px'))
+    assert frame.shape == (30, 40, 3)
+
+
 @pytest.mark.skipif(HAS_OPENCV, reason="opencv-python is installed")
 def test_no_opencv(cubeviz_helper, spectrum1d_cube):
     cubeviz_helper.load_data(spectrum1d_cube, data_label="test")
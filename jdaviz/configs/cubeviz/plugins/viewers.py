@@ -10,6 +10,7 @@ from jdaviz.configs.default.plugins.viewers import JdavizViewerMixin
 from jdaviz.configs.specviz.plugins.viewers import Spectrum1DViewer
 from jdaviz.core.freezable_state import FreezableBqplotImageViewerState
 from jdaviz.configs.cubeviz.plugins.cube_listener import MINVOL
+from jdaviz.configs.cubeviz.plugins.frame_cache import FrameCacheBudget, SliceFrameCache
 from jdaviz.core.sonified_layers import (SonifiedDataLayerArtist,
                                          SonifiedLayerStateWidget,
                                          SonifiedLayerState)
@@ -63,6 +64,15 @@ class CubevizImageView(JdavizViewerMixin, WithSliceSelection, BqplotImageView):
 
         self._layer_style_widget_cls[SonifiedDataLayerArtist] = SonifiedLayerStateWidget
 
+        # reuse the composited image of each slice during playback and scrubbing,
+        # within a memory budget shared by all the cube viewers of the app
+        app = self.jdaviz_app
+        if app._frame_cache_budget is None:
+            app._frame_cache_budget = FrameCacheBudget()
+        self._frame_cache = SliceFrameCache(self, hub=self.session.hub,
+                                            budget=app._frame_cache_budget)
+        self._composite_image.array_maker = self._frame_cache
+
     @property
     def _sonify_plugin(self):
         if self.jdaviz_helper is not None and 'Sonify Data' in self.jdaviz_helper.plugins:
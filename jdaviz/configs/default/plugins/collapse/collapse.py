@@ -37,6 +37,10 @@ class Collapse(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMixi
     * :meth:`collapse`
     """
     template_file = __file__, "collapse.vue"
+    _defer_instantiation = True
+    _user_api_expose = ('dataset', 'function', 'spectral_subset', 'add_results', 'collapse')
+    # description displayed under plugin title in tray
+    _plugin_description = Unicode('Collapse a spectral cube along one axis.').tag(sync=True)
     function_items = List().tag(sync=True)
     function_selected = Unicode('Sum').tag(sync=True)
     filename = Unicode().tag(sync=True)
@@ -67,17 +71,13 @@ class Collapse(PluginTemplateMixin, DatasetSelectMixin, SpectralSubsetSelectMixi
             # on the user's machine, so export support in cubeviz should be disabled
             self.export_enabled = False
 
-        # description displayed under plugin title in tray
-        self._plugin_description = 'Collapse a spectral cube along one axis.'
-
     @property
     def _default_spectrum_viewer_reference_name(self):
         return self.jdaviz_helper._default_spectrum_viewer_reference_name
 
     @property
     def user_api(self):
-        return PluginUserApi(self, expose=('dataset', 'function', 'spectral_subset',
-                                           'add_results', 'collapse'))
+        return PluginUserApi(self, expose=self._user_api_expose)
 
     @observe("dataset_selected", "dataset_items")
     def _set_default_results_label(self, event={}):
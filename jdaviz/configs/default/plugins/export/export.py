@@ -1,10 +1,12 @@
+import multiprocessing as mp
 import os
-import time
 from pathlib import Path
 import threading
 
+import numpy as np
 from astropy import units as u
 from astropy.nddata import CCDData
+from astropy.utils.decorators import deprecated_renamed_argument
 from glue.core.message import SubsetCreateMessage, SubsetDeleteMessage, SubsetUpdateMessage
 from glue_jupyter.bqplot.image import BqplotImageView
 from regions import CircleSkyRegion, EllipseSkyRegion
@@ -22,6 +24,8 @@ from jdaviz.core.template_mixin import (PluginTemplateMixin, SelectPluginCompone
 from jdaviz.core.events import AddDataMessage, SnackbarMessage
 from jdaviz.core.user_api import PluginUserApi
 from jdaviz.core.region_translators import region2stcs_string
+from jdaviz.configs.default.plugins.export.movie import frame_bounds, RenderFrameWorker
+from jdaviz.utils import parallelize_calculation
 
 try:
     import cv2
@@ -130,6 +134,9 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         # description displayed under plugin title in tray
         self._plugin_description = 'Export data/plots and other outputs to a file.'
 
+        # Number of threads to render movie frames with (defaults to the number of CPU cores - 1)
+        self.parallel_n_cpu = None
+
         # NOTE: if adding export support for non-plugin products, also update the language
         # in the UI as well as in _set_dataset_not_supported_msg
         self.dataset.filters = ['is_not_wcs_only', 'not_child_layer',
@@ -698,78 +705,68 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
             raise ValueError(f"Unsupported filetype={filetype} for save_figure")
 
     @with_spinner('movie_recording')
-    def _save_movie(self, viewer, i_start, i_end, fps, filename, rm_temp_files, width, height):
-        # NOTE: All the stuff here has to be in the same thread but
-        #       separate from main app thread to work.
+    def _save_movie(self, viewer, i_start, i_end, fps, filename, width, height):
+        # NOTE: this runs in a separate thread from the main app thread.
 
         if not self.movie_enabled:
             if not HAS_OPENCV:
                 raise ImportError("Please install opencv-python")
             raise ValueError("movie support disabled")
 
+        # Frames are rendered server-side, without changing the displayed slice,
+        # so the slice of each movie frame is looked up from the slice plugin values.
         slice_plg = self.app._jdaviz_helper.plugins["Slice"]._obj
-        orig_slice = viewer.slice
-        temp_png_files = []
-        i = i_start
+        frame_values = np.asarray(slice_plg.valid_values_sorted[i_start:i_end + 1])
+        slice_indices = np.abs(np.asarray(viewer.slice_values)[np.newaxis, :]
+                               - frame_values[:, np.newaxis]).argmin(axis=1)
+
+        bounds = frame_bounds(viewer, width=width, height=height)
+        frame_size = (bounds[1][2], bounds[0][2])
         video = None
-        slice_plg.value = slice_plg.valid_values_sorted[i_start]
 
-        # TODO: Expose to users?
-        i_step = 1  # Need n_frames check if we allow tweaking
+        def write_frame(frame):
+            if frame is None:
+                frame = np.zeros(frame_size[::-1] + (3,), dtype=np.uint8)
+            # OpenCV expects BGR frames
+            video.write(np.ascontiguousarray(frame[:, :, ::-1]))
+            return self.movie_interrupt
 
         try:
-            while i <= i_end:
-                if self.movie_interrupt:
-                    break
-
-                slice_plg.vue_play_next()
-                cur_pngfile = Path(f"._cubeviz_movie_frame_{i}.png")
-                # TODO: skip success snackbars when exporting temp movie frames?
-                self.save_figure(viewer, filename=cur_pngfile, filetype="png", show_dialog=False,
-                                 width=width, height=height)
-                temp_png_files.append(cur_pngfile)
-                i += i_step
-
-                # Wait for the roundtrip to the frontend to complete.
-                while viewer.figure._upload_png_callback is not None:
-                    time.sleep(0.05)
-
-            if not self.movie_interrupt:
-                # Grab frame size.
-                frame_shape = cv2.imread(temp_png_files[0]).shape
-                frame_size = (frame_shape[1], frame_shape[0])
-
-                video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps, frame_size, True)  # noqa: E501
-                for cur_pngfile in temp_png_files:
-                    video.write(cv2.imread(cur_pngfile))
+            video = cv2.VideoWriter(filename, cv2.VideoWriter_fourcc(*'mp4v'), fps, frame_size, True)  # noqa: E501
+            workers = (RenderFrameWorker(viewer, slice_index, bounds)
+                       for slice_index in slice_indices)
+            n_cpu = self.parallel_n_cpu
+            if n_cpu is None:
+                n_cpu = max(mp.cpu_count() - 1, 1)
+            if n_cpu > 1:
+                # the frames are rendered in threads, and written in order as they complete
+                parallelize_calculation(workers, write_frame, n_cpu=n_cpu, stream=True,
+                                        prefer='threads')
+            else:
+                for worker in workers:
+                    if write_frame(worker()):
+                        break
         except Exception as e:
             self.hub.broadcast(SnackbarMessage(
                 f"Error saving {filename}: {e!r}", sender=self, color="error", traceback=e))
         finally:
-            cv2.destroyAllWindows()
             if video:
                 video.release()
-            slice_plg.value = slice_plg.valid_values_sorted[orig_slice]
-
-        if rm_temp_files or self.movie_interrupt:
-            for cur_pngfile in temp_png_files:
-                if os.path.exists(cur_pngfile):
-                    os.remove(cur_pngfile)
 
         if self.movie_interrupt:
             if os.path.exists(filename):
                 os.remove(filename)
             self.movie_interrupt = False
 
+    @deprecated_renamed_argument('rm_temp_files', None, since='4.5')
     def save_movie(self, viewer, filename, filetype, i_start=None, i_end=None, fps=None,
-                   rm_temp_files=True, width=None, height=None):
+                   rm_temp_files=None, width=None, height=None):
         """Save selected slices as a movie.
 
-        This method creates a PNG file per frame (``._cubeviz_movie_frame_<n>.png``)
-        in the working directory before stitching all the frames into a movie.
-        Please make sure you have sufficient memory for this operation.
-        PNG files are deleted after the movie is created unless otherwise specified.
-        If another PNG file with the same name already exists, it will be silently replaced.
+        The frames are rendered server-side from the image layers of the viewer, with
+        their current colormaps, stretches, limits and opacities, in parallel threads (see
+        ``parallel_n_cpu``), and written directly into the movie, so no frontend is needed.
+        Subsets, marks and axes are not included.  The displayed slice is not changed.
 
         Parameters
         ----------
@@ -793,13 +790,15 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
             of other format(s).
 
         rm_temp_files : bool
-            Remove temporary PNG files after movie creation. Default is `True`.
+            Deprecated and ignored, since no temporary files are created anymore.
 
         width : str, optional
-            Width of the exported image. Required if height is provided.
+            Width of the movie frames. Required if height is provided.
+            Defaults to the displayed width of the viewer, or to the number of data
+            pixels across the viewer if it is not displayed.
 
         height : str, optional
-            Height of the exported image. Required if width is provided.
+            Height of the movie frames. Required if width is provided.
 
         Returns
         -------
@@ -816,8 +815,8 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
         if filetype != "mp4":
             raise NotImplementedError(f"filetype={filetype} not supported")
 
-        if viewer.shape is None:
-            raise ValueError("Selected viewer has no display shape.")
+        if (width is None) != (height is None):
+            raise ValueError("Both width and height must be provided")
 
         if fps is None:
             fps = float(self.movie_fps)
@@ -841,8 +840,7 @@ class Export(PluginTemplateMixin, ViewerSelectMixin, SubsetSelectMixin,
             raise ValueError(f"No frames to write: i_start={i_start}, i_end={i_end}")
 
         threading.Thread(
-            target=lambda: self._save_movie(viewer, i_start, i_end, fps, filename, rm_temp_files,
-                                            width, height)
+            target=lambda: self._save_movie(viewer, i_start, i_end, fps, filename, width, height)
         ).start()
 
         return filename
@@ -0,0 +1,139 @@
+import numpy as np
+from glue.core.data import BaseData
+from glue.viewers.image.composite_array import CompositeArray
+from matplotlib.colors import to_rgb
+
+__all__ = ['frame_bounds', 'slice_composite', 'render_slice_frame', 'composite_on_background']
+
+
+def frame_bounds(viewer, width=None, height=None):
+    """
+    Bounds of the frames rendered from ``viewer`` by `render_slice_frame`: the current
+    limits of the viewer, sampled on ``width`` x ``height`` pixels (which can be given
+    as strings, e.g., ``'800px'``).  Defaults to the displayed size of the viewer or,
+    without a frontend, to one pixel per data pixel.
+    """
+    state = viewer.state
+    if width is not None and height is not None:
+        nx, ny = (int(str(size).strip().removesuffix('px')) for size in (width, height))
+    elif getattr(viewer, 'shape', None) is not None:
+        ny, nx = viewer.shape
+    else:
+        nx = max(int(round(abs(state.x_max - state.x_min))), 1)
+        ny = max(int(round(abs(state.y_max - state.y_min))), 1)
+    return [(state.y_min, state.y_max, ny), (state.x_min, state.x_max, nx)]
+
+
+def _sliced_image(layer_state, slice_axis, slice_index, bounds=None):
+    # same as layer_state.get_sliced_data(bounds=bounds), but for the given slice instead of
+    # the one displayed, and without the fixed resolution buffer cache which is not
+    # thread-safe
+    viewer_state = layer_state.viewer_state
+    x_axis, y_axis = viewer_state.x_att.axis, viewer_state.y_att.axis
+    full_view = list(viewer_state.slices)
+    full_view[slice_axis] = slice_index
+    full_view[y_axis], full_view[x_axis] = bounds
+    if not isinstance(layer_state.layer, BaseData):
+        return None
+    image = layer_state.layer.compute_fixed_resolution_buffer(
+        full_view, target_data=viewer_state.reference_data, target_cid=layer_state.attribute,
+        broadcast=False)
+    return image.T if y_axis > x_axis else image
+
+
+def slice_composite(viewer, slice_index):
+    """
+    Copy of the composite image of ``viewer`` (``viewer._composite``), with the current
+    visual attributes of its layers, but with the arrays of slice ``slice_index``.
+    The copy can be called with ``bounds`` from another thread than the one updating
+    the viewer.
+
+    Parameters
+    ----------
+    viewer : `~glue_jupyter.bqplot.image.BqplotImageView`
+        Cube viewer.
+    slice_index : int
+        Index of the slice along the slice axis of the viewer (``viewer.slice_index``).
+
+    Returns
+    -------
+    composite : `~glue.viewers.image.composite_array.CompositeArray`
+    """
+    composite = CompositeArray()
+    composite.mode = viewer._composite.mode
+    composite.cmap_bad = viewer._composite.cmap_bad
+    slice_axis = viewer.slice_index
+    for layer_artist in viewer.layers:
+        params = viewer._composite.layers.get(getattr(layer_artist, 'uuid', None))
+        if params is None:
+            continue
+        params = dict(params, shape=None,
+                      array=lambda bounds=None, state=layer_artist.state: _sliced_image(
+                          state, slice_axis, slice_index, bounds=bounds))
+        composite.layers[layer_artist.uuid] = params
+    return composite
+
+
+def composite_on_background(rgba, background='white'):
+    """
+    Composite the (non-premultiplied) RGBA image ``rgba``, with values between 0 and 1,
+    onto a ``background`` color, as it is displayed over the viewer.
+
+    Returns
+    -------
+    rgb : `~numpy.ndarray`
+        Opaque RGB image.
+    """
+    rgb = np.clip(rgba[..., :3], 0, 1)
+    if rgba.shape[-1] < 4:
+        return rgb
+    alpha = np.clip(rgba[..., 3:], 0, 1)
+    return rgb * alpha + np.asarray(to_rgb(background)) * (1 - alpha)
+
+
+def _viewer_background(viewer):
+    # color the images are displayed over, white unless set on the figure
+    figure = getattr(viewer, 'figure', None)
+    return getattr(figure, 'background_style', {}).get('fill', 'white')
+
+
+def render_slice_frame(viewer, slice_index, bounds):
+    """
+    Render slice ``slice_index`` of the image layers of ``viewer`` server-side, with
+    their current colormaps (or colors), stretches, limits and opacities, and without
+    changing the slice displayed by the viewer.  Transparent pixels are composited onto
+    the background of the viewer.  Subsets, marks and axes are not rendered.
+
+    Parameters
+    ----------
+    viewer : `~glue_jupyter.bqplot.image.BqplotImageView`
+        Cube viewer.
+    slice_index : int
+        Index of the slice along the slice axis of the viewer (``viewer.slice_index``).
+    bounds : list
+        Bounds of the frame, as returned by `frame_bounds`.
+
+    Returns
+    -------
+    frame : `~numpy.ndarray` or `None`
+        RGB frame (with the top of the image first) of ``uint8`` values, or `None`
+        if no layer is visible.
+    """
+    rgba = slice_composite(viewer, slice_index)(bounds=bounds)
+    if rgba is None:
+        return None
+    rgb = composite_on_background(rgba[::-1], _viewer_background(viewer))
+    return np.round(rgb * 255).astype(np.uint8)
+
+
+class RenderFrameWorker:
+    """
+    A class with callable instances that render a frame with `render_slice_frame`.
+    """
+    def __init__(self, viewer, slice_index, bounds):
+        self.viewer = viewer
+        self.slice_index = slice_index
+        self.bounds = bounds
+
+    def __call__(self):
+        return render_slice_frame(self.viewer, self.slice_index, self.bounds)
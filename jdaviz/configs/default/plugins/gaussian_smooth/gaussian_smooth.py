@@ -1,11 +1,12 @@
 import numpy as np
 
-from astropy.convolution import convolve, Gaussian2DKernel
 from specutils import Spectrum
 from specutils.manipulation import gaussian_smooth
 from traitlets import List, Unicode, Bool, observe
 
 from jdaviz.core.custom_traitlets import FloatHandleEmpty
+from jdaviz.configs.default.plugins.gaussian_smooth.smoothing_backend import (
+    spatial_gaussian_smooth)
 from jdaviz.core.events import SnackbarMessage
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import (PluginTemplateMixin, DatasetSelectMixin,
@@ -33,6 +34,9 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
       Only available for Cubeviz.  Whether to use spatial or spectral smoothing.
     * :attr:`stddev`:
       Standard deviation of the gaussian to use for smoothing.
+    * ``spatial_float32``:
+      Only available for Cubeviz.  Whether to compute spatial smoothing in single precision,
+      halving its memory usage.
     * ``add_results`` (:class:`~jdaviz.core.template_mixin.AddResults`)
     * :meth:`smooth`
     """
@@ -41,6 +45,7 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
     show_modes = Bool(False).tag(sync=True)
     mode_items = List().tag(sync=True)
     mode_selected = Unicode().tag(sync=True)
+    spatial_float32 = Bool(False).tag(sync=True)
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -72,6 +77,10 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
         # description displayed under plugin title in tray
         self._plugin_description = 'Smooth data with a Gaussian kernel.'
 
+        # number of processes for spatial smoothing (defaults to the number of cores - 1
+        # for large cubes)
+        self.parallel_n_cpu = None
+
         if self.app.config == 'deconfigged':
             self.observe_traitlets_for_relevancy(traitlets_to_observe=['dataset_items'])
 
@@ -91,7 +100,7 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
     def user_api(self):
         expose = ['dataset', 'stddev', 'add_results', 'smooth']
         if self.config == "cubeviz":
-            expose += ['mode']
+            expose += ['mode', 'spatial_float32']
         return PluginUserApi(self, expose=expose)
 
     @observe("dataset_selected", "stddev", "mode_selected")
@@ -212,8 +221,9 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
     @with_spinner('spinner')
     def spatial_smooth(self):
         """
-        Use astropy convolution machinery to smooth the spatial dimensions of
-        the data cube.  To add the resulting cube into
+        Smooth the spatial dimensions of the data cube, with two 1D passes or with FFTs
+        (for large kernels), in parallel for large cubes.  NaN and masked values are
+        interpolated as in `astropy.convolution.convolve`.  To add the resulting cube into
         the app, set label options and use :meth:`smooth` instead.
 
         Returns
@@ -224,11 +234,12 @@ class GaussianSmooth(PluginTemplateMixin, DatasetSelectMixin, AddResultsMixin):
         cube = self.dataset.selected_obj
         flux_unit = cube.flux.unit
 
-        # Extend the 2D kernel to have a length 1 spectral dimension, so that
-        # we can do "3d" convolution to the whole cube
-        kernel = np.expand_dims(Gaussian2DKernel(self.stddev), cube.meta['spectral_axis_index'])
-
-        convolved_data = convolve(cube, kernel)
+        convolved_data = spatial_gaussian_smooth(
+            cube.flux, self.stddev,
+            spectral_axis_index=cube.meta['spectral_axis_index'],
+            mask=cube.mask,
+            dtype=np.float32 if self.spatial_float32 else np.float64,
+            n_cpu=self.parallel_n_cpu)
 
         # Copy 3D WCS from input cube.
         data = self.dataset.selected_dc_item
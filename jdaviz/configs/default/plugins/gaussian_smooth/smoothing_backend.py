@@ -0,0 +1,156 @@
+import multiprocessing as mp
+
+import numpy as np
+from astropy.convolution import Gaussian1DKernel
+from scipy.ndimage import correlate1d
+from scipy.signal import fftconvolve
+
+from jdaviz.utils import parallelize_calculation, SharedArray, SharedArrayStore
+
+__all__ = ['spatial_gaussian_smooth']
+
+# kernel length (in pixels) above which FFT convolution is faster than two 1D passes
+FFT_MIN_KERNEL_SIZE = 49
+# cubes smaller than this (in bytes) are not worth dispatching to worker processes
+PARALLEL_MIN_NBYTES = 64 * 1024**2
+# memory budget for the slices smoothed at once by each worker
+CHUNK_NBYTES = 64 * 1024**2
+
+
+def spatial_gaussian_smooth(flux, stddev, spectral_axis_index=2, mask=None, method='auto',
+                            dtype=np.float64, n_cpu=None):
+    """
+    Smooth every spatial slice of a cube with a 2D Gaussian kernel.
+
+    The result matches `astropy.convolution.convolve` with a
+    `~astropy.convolution.Gaussian2DKernel` (and its default options): values outside
+    the cube are zero, and NaN or masked values are interpolated by normalizing the
+    convolution with the convolved map of valid values.
+
+    Parameters
+    ----------
+    flux : array-like
+        Flux cube.
+    stddev : float
+        Standard deviation of the Gaussian kernel, in pixels.
+    spectral_axis_index : int, optional
+        Index of the spectral axis of ``flux``.
+    mask : array-like, optional
+        Values of ``flux`` to ignore (where `True`).
+    method : {'auto', 'separable', 'fft'}, optional
+        Whether to convolve with two 1D passes along the spatial axes, or with FFTs.
+        ``'auto'`` uses FFTs for kernels larger than ``FFT_MIN_KERNEL_SIZE`` pixels.
+    dtype : `numpy.dtype`, optional
+        Data type to compute and return the result in (e.g., ``np.float32`` to halve
+        the memory usage of large cubes).
+    n_cpu : int, optional
+        Number of processes to smooth chunks of slices in parallel.  Defaults to the
+        number of available CPU cores - 1, for cubes larger than ``PARALLEL_MIN_NBYTES``.
+
+    Returns
+    -------
+    smoothed : `~numpy.ndarray`
+        Smoothed cube.
+    """
+    flux = np.asarray(getattr(flux, 'value', flux))
+    if flux.ndim != 3:
+        raise ValueError("flux must be a 3D cube")
+    kernel = Gaussian1DKernel(stddev).array.astype(dtype)
+    kernel /= kernel.sum()
+    if method == 'auto':
+        method = 'fft' if len(kernel) > FFT_MIN_KERNEL_SIZE else 'separable'
+    elif method not in ('separable', 'fft'):
+        raise ValueError("method must be one of 'auto', 'separable' or 'fft'")
+
+    if n_cpu is None:
+        n_cpu = mp.cpu_count() - 1 if flux.nbytes > PARALLEL_MIN_NBYTES else 1
+    n_slices = flux.shape[spectral_axis_index]
+    n_chunks = max(n_cpu, int(np.ceil(flux.size * np.dtype(dtype).itemsize / CHUNK_NBYTES)))
+    n_chunks = min(n_chunks, n_slices)
+    chunks = [slice(indices[0], indices[-1] + 1)
+              for indices in np.array_split(np.arange(n_slices), n_chunks) if len(indices)]
+
+    if n_cpu > 1 and len(chunks) > 1:
+        # The cube, mask and output are shared with the worker processes
+        # through memory-mapped buffers instead of being pickled into each of them.
+        with SharedArrayStore() as store:
+            shared_flux = store.put(flux)
+            shared_mask = store.put(mask) if mask is not None else None
+            output = store.zeros(flux.shape, dtype=dtype)
+            workers = (SmoothSlicesWorker(shared_flux, kernel, chunk, method,
+                                          spectral_axis_index=spectral_axis_index,
+                                          mask=shared_mask, output=output)
+                       for chunk in chunks)
+            parallelize_calculation(workers, lambda result: None, n_cpu=n_cpu)
+            return np.array(output.asarray())
+
+    smoothed = np.empty(flux.shape, dtype=dtype)
+    for chunk in chunks:
+        SmoothSlicesWorker(flux, kernel, chunk, method,
+                           spectral_axis_index=spectral_axis_index,
+                           mask=mask, output=smoothed)()
+    return smoothed
+
+
+class SmoothSlicesWorker:
+    """
+    A class with callable instances that smooth a chunk of spatial slices of a cube
+    (see `spatial_gaussian_smooth`), writing the result into ``output``.
+
+    ``flux_cube``, ``mask`` and ``output`` can be given as
+    `~jdaviz.utils.SharedArray` handles.
+    """
+    def __init__(self, flux_cube, kernel, chunk, method, spectral_axis_index=2, mask=None,
+                 output=None):
+        self.cube = flux_cube
+        self.kernel = kernel
+        self.chunk = chunk
+        self.method = method
+        self.spectral_axis_index = spectral_axis_index
+        self.mask = mask
+        self.output = output
+
+    def __call__(self):
+        cube, mask, output = (
+            arr.asarray(writeable=arr is self.output) if isinstance(arr, SharedArray) else arr
+            for arr in (self.cube, self.mask, self.output))
+
+        index = [slice(None)] * 3
+        index[self.spectral_axis_index] = self.chunk
+        index = tuple(index)
+        dtype = self.kernel.dtype
+
+        values = np.asarray(cube[index], dtype=dtype)
+        valid = np.isfinite(values)
+        if mask is not None:
+            valid &= ~np.asarray(mask[index], dtype=bool)
+        values = np.where(valid, values, 0)
+        weights = valid.astype(dtype)
+
+        # normalized convolution: the convolved values divided by the convolved weights,
+        # where values outside the cube are zero with full weight
+        spatial_axes = tuple(axis for axis in range(3) if axis != self.spectral_axis_index)
+        smoothed = self._convolve(values, spatial_axes, fill_value=0)
+        if valid.all():
+            # only the boundaries are affected, and all the weights there are one
+            normalization = 1
+        else:
+            normalization = self._convolve(weights, spatial_axes, fill_value=1)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            output[index] = smoothed / normalization
+        if isinstance(self.output, SharedArray):
+            output.flush()
+
+    def _convolve(self, array, axes, fill_value):
+        if self.method == 'separable':
+            for axis in axes:
+                array = correlate1d(array, self.kernel, axis=axis, mode='constant',
+                                    cval=fill_value)
+            return array
+
+        half_size = len(self.kernel) // 2
+        pad_width = [(half_size, half_size) if axis in axes else (0, 0) for axis in range(3)]
+        kernel = np.multiply.outer(self.kernel, self.kernel)
+        kernel = np.expand_dims(kernel, self.spectral_axis_index)
+        return fftconvolve(np.pad(array, pad_width, constant_values=fill_value), kernel,
+                           mode='valid', axes=axes)
@@ -1,8 +1,12 @@
 import numpy as np
 import pytest
-from astropy.utils.exceptions import AstropyUserWarning
+from astropy.convolution import convolve, Gaussian2DKernel
+from numpy.testing import assert_allclose
 from specutils import Spectrum
 
+from jdaviz.configs.default.plugins.gaussian_smooth.smoothing_backend import (
+    spatial_gaussian_smooth)
+
 
 def test_linking_after_spectral_smooth(cubeviz_helper, spectrum1d_cube):
     app = cubeviz_helper.app
@@ -114,10 +118,7 @@ def test_spatial_convolution(cubeviz_helper, spectrum1d_cube):
     gs.dataset_selected = f'{data_label}[FLUX]'
     gs.stddev = 3
     assert gs.results_label == f'{data_label}[FLUX] spatial-smooth stddev-3.0'
-    with pytest.warns(
-            AstropyUserWarning,
-            match='The following attributes were set on the data object, but will be ignored'):
-        gs.vue_apply()
+    gs.vue_apply()
 
     assert len(dc) == 3
     assert dc[-1].label == f'{data_label}[FLUX] spatial-smooth stddev-3.0'
@@ -127,6 +128,37 @@ def test_spatial_convolution(cubeviz_helper, spectrum1d_cube):
             == (2, 2, 4))
 
 
+@pytest.mark.parametrize(('stddev', 'method', 'spectral_axis_index'),
+                         [(1.5, 'auto', 2), (1.5, 'fft', 0), (7, 'auto', 0), (7, 'separable', 2)])
+def test_spatial_gaussian_smooth(stddev, method, spectral_axis_index):
+    rng = np.random.default_rng(0)
+    flux = rng.normal(10, 2, (40, 30, 6))
+    flux[3, 4] = np.nan
+    flux[10:20, 10:15, 2] = np.nan
+    mask = np.zeros(flux.shape, dtype=bool)
+    mask[25, 5:8] = True
+    flux = np.moveaxis(flux, 2, spectral_axis_index)
+    mask = np.moveaxis(mask, 2, spectral_axis_index)
+
+    kernel = np.expand_dims(Gaussian2DKernel(stddev), spectral_axis_index)
+    expected = convolve(np.where(mask, np.nan, flux), kernel)
+
+    assert_allclose(spatial_gaussian_smooth(flux, stddev, spectral_axis_index=spectral_axis_index,
+                                            mask=mask, method=method),
+                    expected, rtol=1e-10)
+    smoothed32 = spatial_gaussian_smooth(flux, stddev, spectral_axis_index=spectral_axis_index,
+                                         mask=mask, method=method, dtype=np.float32)
+    assert smoothed32.dtype == np.float32
+    assert_allclose(smoothed32, expected, rtol=1e-5)
+
+
+def test_spatial_gaussian_smooth_parallel():
+    flux = np.random.default_rng(0).normal(10, 2, (6, 20, 30))
+    flux[2, 5, 5] = np.nan
+    expected = spatial_gaussian_smooth(flux, 2, spectral_axis_index=0, n_cpu=1)
+    assert_allclose(spatial_gaussian_smooth(flux, 2, spectral_axis_index=0, n_cpu=2), expected)
+
+
 def test_specviz_smooth(specviz_helper, spectrum1d):
     data_label = 'test'
     dc = specviz_helper.app.data_collection
@@ -19,8 +19,7 @@ from jdaviz.core.events import (AddDataMessage,
                                 SnackbarMessage,
                                 RedshiftMessage,
                                 SpectralMarksChangedMessage)
-from jdaviz.core.linelists import load_preset_linelist, get_linelist_metadata
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.linelists import get_linelist_metadata, get_preset_linelist_index
 from jdaviz.core.registries import tray_registry
 from jdaviz.core.template_mixin import (PluginTemplateMixin, ViewerSelectMixin,
                                         CustomToolbarToggleMixin)
@@ -86,6 +85,10 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
                                          "color": "#FF0000FF",
                                          "medium": "Unknown (Custom)"}}
         self.line_mark_dict = {}
+        # preset list name -> mask of the lines (sorted by rest value) loaded so far
+        self._preset_lines_loaded = {}
+        # preset list name -> whether lines loaded later are shown (as set by show/hide all)
+        self._preset_lines_show = {}
         self._units = {}
         self._bounds = {}
         self._global_redshift = 0
@@ -314,12 +317,10 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         # update all lines, self._global_redshift, and emit message back to Specviz helper
         z = u.Quantity(self.rs_redshift)
 
-        for mark in self.spectrum_viewer.figure.marks:
-            # update ALL to this redshift, if adding support for per-line redshift
-            # this logic will need to change to not affect ALL lines
-            if not isinstance(mark, SpectralLine):
-                continue
-
+        # update ALL lines to this redshift at once, if adding support for per-line
+        # redshift this logic will need to change to not affect ALL lines
+        mark = self.spectrum_viewer.spectral_lines_mark
+        if mark is not None:
             mark.redshift = z
 
     @observe('rs_slider')
@@ -370,6 +371,9 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
             msg = RedshiftMessage("redshift", value, sender=self)
             self.app.hub.broadcast(msg)
 
+            # the redshift changes the rest values within the viewer limits
+            self._load_preset_lines_in_range()
+
     def _update_line_list_obs(self, *args):
         for list_name, line_list in self.list_contents.items():
             for i, line in enumerate(line_list['lines']):
@@ -461,6 +465,9 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         # Also update the slider range
         self._auto_slider_range()
 
+        # and load the lines of the preset lists that are now within the limits
+        self._load_preset_lines_in_range()
+
     def _auto_slider_range(self, event=None):
         """
         Automatically adjusts the Redshift slider range to the values of the
@@ -574,9 +581,10 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
 
     def update_line_mark_dict(self):
         self.line_mark_dict = {}
-        for m in self.spectrum_viewer.figure.marks:
-            if isinstance(m, SpectralLine):
-                self.line_mark_dict[m.table_index] = m
+        mark = self.spectrum_viewer.spectral_lines_mark
+        if mark is not None:
+            for line in mark.lines:
+                self.line_mark_dict[line.table_index] = line
 
         n_lines_shown = len(self.line_mark_dict)
 
@@ -608,39 +616,13 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         # Don't need to reload an already loaded list
         if self.list_to_load in self.loaded_lists:
             return
-        temp_table = load_preset_linelist(self.list_to_load)
-
-        # Also store basic list contents in a form that vuetify can handle
-        # Adds line style parameters that can be changed on the front end
-        temp_table["colors"] = "#FF0000FF"
-
-        # Load the table into the main astropy table and get it back, to make
-        # sure all values match between the main table and local plugin
-        temp_table = self.spectrum_viewer.load_line_list(temp_table,
-                                                         return_table=True,
-                                                         show=False)
 
         metadata = get_linelist_metadata()
         list_medium = metadata[self.list_to_load].get('medium', 'Unknown').capitalize()
 
-        line_list_dict = {"lines": [], "color": "#FF000080", "medium": list_medium}
-        # extra_fields = [x for x in temp_table.colnames if x not in
-        #                ("linename", "rest", "name_rest")]
-
-        for row in temp_table:
-            temp_dict = {"linename": row["linename"],
-                         "rest": row["rest"].value,
-                         "obs": self._rest_to_obs(row["rest"].value),
-                         "unit": str(row["rest"].unit),
-                         "colors": row["colors"],
-                         "show": False,
-                         "name_rest": str(row["name_rest"])}
-            # for field in extra_fields:
-            #     temp_dict[field] = row[field]
-            line_list_dict["lines"].append(temp_dict)
-
         list_contents = self.list_contents
-        list_contents[self.list_to_load] = line_list_dict
+        list_contents[self.list_to_load] = {"lines": [], "color": "#FF000080",
+                                            "medium": list_medium}
         self.list_contents = {}
         self.list_contents = list_contents
 
@@ -648,8 +630,10 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         self.loaded_lists = []
         self.loaded_lists = loaded_lists
 
-        self.spectrum_viewer.plot_spectral_lines(global_redshift=self._global_redshift)
-        self.update_line_mark_dict()
+        n_lines = get_preset_linelist_index().n_lines(self.list_to_load)
+        self._preset_lines_loaded[self.list_to_load] = np.zeros(n_lines, dtype=bool)
+        self._preset_lines_show[self.list_to_load] = False
+        self._load_preset_lines_in_range([self.list_to_load])
 
         msg_text = ("Spectral lines loaded from preset. Lines can be shown/hidden"
                     f" in the {self.list_to_load} dropdown in the Line Lists plugin")
@@ -657,6 +641,77 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
                                                color="success", timeout=15000)
         self.hub.broadcast(lines_loaded_message)
 
+    def _preset_lines_range(self):
+        """
+        Range of rest values (in Angstrom) within the limits of the spectrum viewer at the
+        current redshift, or `None` if the limits are not known yet.
+        """
+        sv = self.spectrum_viewer
+        if (sv is None or sv.state.x_min is None or sv.state.x_max is None
+                or not sv.state.x_display_unit):
+            return None
+        obs_range = [sv.state.x_min, sv.state.x_max] * u.Unit(sv.state.x_display_unit)
+        obs_range = obs_range.to(u.Angstrom, equivalencies=u.spectral())
+        return obs_range / (1 + float(self._global_redshift))
+
+    def _load_preset_lines_in_range(self, listnames=None):
+        """
+        Load the lines of the preset lists (all loaded preset lists by default) that are
+        within the limits of the spectrum viewer and were not loaded yet.  Lines outside of
+        the limits are only loaded once the viewer is panned or zoomed to them, and are
+        shown if all the lines of their list were last shown.
+        """
+        if listnames is None:
+            listnames = list(self._preset_lines_loaded)
+        if not len(listnames):
+            return
+
+        index = get_preset_linelist_index()
+        spectral_range = self._preset_lines_range()
+        list_contents = self.list_contents
+        any_loaded = False
+        for listname in listnames:
+            loaded = self._preset_lines_loaded[listname]
+            in_range = np.zeros_like(loaded)
+            in_range[index.query(listname, spectral_range)] = True
+            to_load = np.flatnonzero(in_range & ~loaded)
+            if not len(to_load):
+                continue
+            loaded[to_load] = True
+            any_loaded = True
+            show = self._preset_lines_show.get(listname, False)
+
+            temp_table = index.table(listname, indices=to_load)
+            # Also store basic list contents in a form that vuetify can handle
+            # Adds line style parameters that can be changed on the front end
+            temp_table["colors"] = "#FF0000FF"
+
+            # Load the table into the main astropy table and get it back, to make
+            # sure all values match between the main table and local plugin
+            temp_table = self.spectrum_viewer.load_line_list(temp_table,
+                                                             return_table=True,
+                                                             show=show)
+
+            lines = list_contents[listname]["lines"]
+            for row in temp_table:
+                lines.append({"linename": row["linename"],
+                              "rest": row["rest"].value,
+                              "obs": self._rest_to_obs(row["rest"].value),
+                              "unit": str(row["rest"].unit),
+                              "colors": row["colors"],
+                              "show": show,
+                              "name_rest": str(row["name_rest"])})
+            lines.sort(key=lambda line: line["rest"])
+
+        if not any_loaded:
+            return
+
+        self.list_contents = {}
+        self.list_contents = list_contents
+
+        self.spectrum_viewer.plot_spectral_lines(global_redshift=self._global_redshift)
+        self.update_line_mark_dict()
+
     def vue_add_custom_line(self, event):
         """
         Add a line to the "Custom" line list from UI input
@@ -697,6 +752,8 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         Toggle all lines in list to be visible
         """
         lc = self.list_contents
+        if listname in self._preset_lines_show:
+            self._preset_lines_show[listname] = True
         for line in lc[listname]["lines"]:
             line["show"] = True
             self.spectrum_viewer.spectral_lines.loc[line["name_rest"]]["show"] = True
@@ -711,6 +768,8 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         """
         Toggle all lines in list to be hidden
         """
+        if listname in self._preset_lines_show:
+            self._preset_lines_show[listname] = False
         name_rests = []
         for line in self.list_contents[listname]["lines"]:
             line["show"] = False
@@ -730,6 +789,7 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
                                            sender=self, color="error")
             self.hub.broadcast(warn_message)
             return
+        self._preset_lines_show = {listname: True for listname in self._preset_lines_show}
         for listname in self.list_contents:
             for line in self.list_contents[listname]["lines"]:
                 line["show"] = True
@@ -749,6 +809,7 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
                                            sender=self, color="error")
             self.hub.broadcast(warn_message)
             return
+        self._preset_lines_show = {listname: False for listname in self._preset_lines_show}
         for listname in self.list_contents:
             for line in self.list_contents[listname]["lines"]:
                 line["show"] = False
@@ -842,14 +903,17 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
 
             self.list_contents[listname]["color"] = color
 
+            name_rests = []
             for line in self.list_contents[listname]["lines"]:
                 line["colors"] = color
                 # Update the astropy table entry
                 name_rest = line["name_rest"]
                 self.spectrum_viewer.spectral_lines.loc[name_rest]["colors"] = color
-                # Update the color on the plot
-                if name_rest in self.line_mark_dict:
-                    self.line_mark_dict[name_rest].colors = [color]
+                name_rests.append(name_rest)
+            # Update the color of all the lines on the plot at once
+            mark = self.spectrum_viewer.spectral_lines_mark
+            if mark is not None:
+                mark.set_colors(name_rests, color)
 
             self.send_state('list_contents')
 
@@ -870,7 +934,12 @@ class LineListTool(PluginTemplateMixin, ViewerSelectMixin, CustomToolbarToggleMi
         self.update_line_mark_dict()
 
         self.loaded_lists = [x for x in self.loaded_lists if x != listname]
+        self._preset_lines_loaded.pop(listname, None)
+        self._preset_lines_show.pop(listname, None)
         self.list_contents = {k: v for k, v in self.list_contents.items() if k != listname}
+        if self.spectrum_viewer.spectral_lines is None:
+            # nothing was loaded from this list (e.g., no preset line within the limits)
+            return
         row_inds = [i for i, ln in
                     enumerate(self.spectrum_viewer.spectral_lines['listname'])
                     if ln != listname]
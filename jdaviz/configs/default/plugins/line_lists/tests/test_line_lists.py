@@ -1,3 +1,5 @@
+from importlib import resources
+
 import numpy as np
 from numpy.testing import assert_allclose
 import pytest
@@ -6,8 +8,9 @@ import astropy.units as u
 from astropy.table import QTable
 from specutils import Spectrum
 
-from jdaviz.core.marks import SpectralLine
-from jdaviz.core.linelists import get_available_linelists
+from jdaviz.core.marks import SpectralLines
+from jdaviz.core.linelists import (get_available_linelists, get_preset_linelist_index,
+                                   load_preset_linelist)
 
 
 def test_line_lists(specviz_helper):
@@ -123,6 +126,73 @@ def test_load_available_preset_lists(specviz_helper, spectrum1d):
         assert 'medium' in list
 
 
+def test_preset_linelist_index():
+    index = get_preset_linelist_index()
+    assert get_preset_linelist_index() is index
+
+    # the lines are loaded in the order of the list file, but sorted in the index
+    full = load_preset_linelist("Galactic 2000A-11000A")
+    csv = QTable.read(resources.files('jdaviz').joinpath(
+        'data/linelists/Common_Galactic_2000A-11000A.csv'))
+    assert list(full['linename']) == list(csv['Line Name'])
+    assert np.all(np.diff(index.table("Galactic 2000A-11000A")['rest'].to_value(u.AA)) >= 0)
+
+    # ranges can be given in any spectral unit (and in any order)
+    windowed = load_preset_linelist("Galactic 2000A-11000A", [0.8, 0.6]*u.micron)
+    in_range = (full['rest'] >= 6000*u.AA) & (full['rest'] <= 8000*u.AA)
+    assert 0 < len(windowed) < len(full)
+    assert list(windowed['linename']) == list(full['linename'][in_range])
+    assert windowed['rest'].unit == u.AA
+
+    with pytest.raises(ValueError, match="Line name not in available set"):
+        load_preset_linelist("not a list")
+
+
+def test_load_preset_list_in_viewer_range(specviz_helper, spectrum1d):
+    specviz_helper.load_data(spectrum1d)
+    sv = specviz_helper.app.get_viewer(specviz_helper._default_spectrum_viewer_reference_name)
+    ll_plugin = specviz_helper.plugins['Line Lists']._obj
+
+    listname = "Galactic 2000A-11000A"
+    ll_plugin.vue_list_selected(listname)
+    ll_plugin.vue_load_list(listname)
+
+    # only the lines within the limits of the viewer are loaded
+    full = load_preset_linelist(listname)
+    rest = full['rest'].to_value(u.AA)
+    lines = ll_plugin.list_contents[listname]['lines']
+    n_in_range = np.count_nonzero((rest >= sv.state.x_min) & (rest <= sv.state.x_max))
+    assert len(lines) == n_in_range < len(full)
+    assert len(sv.spectral_lines) == n_in_range
+
+    # panning the viewer loads the lines now within its limits
+    sv.state.x_min, sv.state.x_max = 3000, 8000
+    lines = ll_plugin.list_contents[listname]['lines']
+    n_in_range = np.count_nonzero((rest >= 3000) & (rest <= sv.state.x_max))
+    assert len(lines) == n_in_range
+    assert [line['rest'] for line in lines] == sorted(line['rest'] for line in lines)
+    assert len(sv.spectral_lines_mark) == n_in_range
+
+    # lines loaded later are shown if all the lines of the list were shown
+    ll_plugin.vue_show_all_in_list(listname)
+    sv.state.x_max = 10000
+    lines = ll_plugin.list_contents[listname]['lines']
+    assert len(lines) > n_in_range
+    assert all(line['show'] for line in lines)
+    assert np.all(sv.spectral_lines['show'])
+    n_in_range = len(lines)
+
+    # so does a redshift, which moves the lines (at rest) within the limits
+    ll_plugin.vue_hide_all_in_list(listname)
+    specviz_helper.set_redshift(1)
+    lines = ll_plugin.list_contents[listname]['lines']
+    assert len(lines) > n_in_range
+    assert not any(line['show'] for line in lines)
+
+    ll_plugin.vue_remove_list(listname)
+    assert listname not in ll_plugin._preset_lines_loaded
+
+
 def test_line_identify(specviz_helper, spectrum1d):
     specviz_helper.load_data(spectrum1d)
 
@@ -143,6 +213,69 @@ def test_line_identify(specviz_helper, spectrum1d):
     assert line.get('identify', False) is False
 
 
+def test_single_mark_for_all_lines(specviz_helper, spectrum1d):
+    specviz_helper.load_data(spectrum1d)
+    viewer = specviz_helper.app.get_viewer(specviz_helper._default_spectrum_viewer_reference_name)
+
+    rest = np.linspace(6000, 8000, 1000)
+    lt = QTable()
+    lt['linename'] = [f'L{i}' for i in range(len(rest))]
+    lt['rest'] = rest * u.AA
+    lt['listname'] = 'Dense List'
+    specviz_helper.load_line_list(lt)
+    ll_plugin = specviz_helper.plugins['Line Lists']._obj
+    ll_plugin.vue_set_color({'listname': 'Dense List', 'color': '#FF0000FF'})
+    specviz_helper.plot_spectral_line(specviz_helper.spectral_lines['name_rest'][0])
+
+    # all lines are drawn by one mark (and the one highlighting the identified line)
+    marks = [mark for mark in viewer.figure.marks if isinstance(mark, SpectralLines)]
+    assert len(marks) == 1
+    mark = marks[0]
+    assert mark.identified_mark in viewer.figure.marks
+    assert len(mark.lines) == len(rest)
+    assert len(ll_plugin.line_mark_dict) == len(rest)
+    # one row of NaN-separated segments per color (bqplot squeezes a single row)
+    assert mark.colors == ['#FF0000FF']
+    assert mark.x.shape == (3 * len(rest),)
+    assert_allclose(mark.x[::3], rest)
+    assert np.all(np.isnan(mark.y[2::3]))
+
+    # redshift is applied to all lines at once
+    specviz_helper.set_redshift(0.01)
+    assert mark.redshift == 0.01
+    assert_allclose(mark.x[::3], rest * 1.01)
+    assert_allclose([line.obs_value for line in mark.lines[:3]], rest[:3] * 1.01)
+
+    # per-line color, identify and show states
+    name_rest = mark.table_indices[1]
+    ll_plugin.line_mark_dict[name_rest].colors = ['#0000FFFF']
+    assert mark.colors == ['#FF0000FF', '#0000FFFF']
+    assert mark.x.shape == (2, 3 * (len(rest) - 1))
+    assert np.isnan(mark.x[1, 3:]).all()
+
+    ll_plugin.vue_set_identify(('Dense List', ll_plugin.list_contents['Dense List']['lines'][1], 1))
+    assert mark.identify.sum() == 1
+    assert mark.identified_mark.visible
+    assert_allclose(mark.identified_mark.x, rest[1] * 1.01)
+    assert mark.identified_mark.colors == ['#0000FFFF']
+
+    viewer.erase_spectral_lines(name_rest=name_rest)
+    assert not mark.identified_mark.visible
+    assert mark.colors == ['#FF0000FF']
+    assert len(mark.lines) == len(rest) - 1
+
+    # unit conversion of the spectral axis converts the rest values of all lines
+    uc_plugin = specviz_helper.plugins['Unit Conversion']
+    uc_plugin.spectral_unit = 'micron'
+    assert mark.xunit == u.micron
+    assert_allclose(mark.rest_values, rest * 1e-4)
+    assert_allclose(mark.x[3::3], rest[2:] * 1.01e-4)
+
+    specviz_helper.erase_spectral_lines()
+    assert len(mark.lines) == 0
+    assert mark.x.size == 0
+
+
 def test_global_redshift_applied(specviz_helper, spectrum1d):
     specviz_helper.load_data(spectrum1d)
 
@@ -160,9 +293,8 @@ def test_global_redshift_applied(specviz_helper, spectrum1d):
     # Load second line, redshift should also be applied to it
     specviz_helper.plot_spectral_line("O III")
 
-    viewer_lines = [mark for mark in specviz_helper.app.get_viewer(
-        specviz_helper._default_spectrum_viewer_reference_name).figure.marks
-        if isinstance(mark, SpectralLine)]
+    viewer_lines = specviz_helper.app.get_viewer(
+        specviz_helper._default_spectrum_viewer_reference_name).spectral_lines_mark.lines
 
     assert np.allclose([line.redshift for line in viewer_lines], 0.01)
 
@@ -185,8 +317,7 @@ def test_global_redshift_applied_to_all(specviz_helper, spectrum1d):
     # Load remaining lines
     specviz_helper.plot_spectral_lines(global_redshift)
 
-    viewer_lines = [mark for mark in specviz_helper.app.get_viewer(
-        specviz_helper._default_spectrum_viewer_reference_name).figure.marks
-        if isinstance(mark, SpectralLine)]
+    viewer_lines = specviz_helper.app.get_viewer(
+        specviz_helper._default_spectrum_viewer_reference_name).spectral_lines_mark.lines
 
     assert np.allclose([line.redshift for line in viewer_lines], 0.01)
@@ -1,19 +1,24 @@
 from asteval import Interpreter
 import multiprocessing as mp
+import time
 import numpy as np
 
+from astropy import units as u
 from astropy.modeling import fitting
+from astropy.modeling.core import CompoundModel
+from astropy.nddata import StdDevUncertainty
 from specutils import Spectrum
 from specutils.fitting import fit_lines
 
-from jdaviz.utils import parallelize_calculation
+from jdaviz.utils import parallelize_calculation, SharedArray, SharedArrayStore
 
 __all__ = ['fit_model_to_spectrum', 'generate_spaxel_list']
 
 
 def fit_model_to_spectrum(spectrum, component_list, expression,
                           run_fitter=False, fitter=fitting.TRFLSQFitter(calc_uncertainties=True),
-                          window=None, n_cpu=None, **kwargs):
+                          window=None, n_cpu=None, batched=False, progress_callback=None,
+                          warm_start=False, **kwargs):
     """Fits a `~astropy.modeling.CompoundModel` to a
     `~specutils.Spectrum` instance.
 
@@ -52,24 +57,57 @@ def fit_model_to_spectrum(spectrum, component_list, expression,
         If `None`, it will use max cores minus one.
         Set this to 1 for debugging.
 
+    batched : bool
+        **This is only used for spectral cube fitting.**
+        When `True`, all spaxels are fit simultaneously as one batched
+        Levenberg-Marquardt problem with vectorized model evaluation
+        instead of calling ``fitter`` once per spaxel. ``fitter`` and
+        ``n_cpu`` are ignored in that case (except for ``maxiter`` passed
+        through ``kwargs``).
+
+    progress_callback : `None` or callable
+        **This is only used for spectral cube fitting.**
+        Called as ``progress_callback(n_done, n_total, partial_results)``
+        every time a chunk of spaxels has been fit, where ``partial_results``
+        has the same format as ``output_model`` but only covers the spaxels
+        fitted so far. If the callback returns `True`, the fit is
+        interrupted and the partial results are returned.
+
+    warm_start : bool
+        **This is only used for spectral cube fitting.**
+        When `True`, spaxels are fit in rings of increasing distance from
+        the brightest spaxel, and each spaxel starts from the median of the
+        parameters already fitted for its neighbors (or from the initial
+        model if none of them has been fitted yet). Spaxels within a ring
+        are still fit in parallel (or batched).
+
     Returns
     -------
-    output_model : `~astropy.modeling.CompoundModel` or list
+    output_model : `~astropy.modeling.CompoundModel`, list, or dict
         The model resulting from the fit. In the case of a 1D input
         spectrum, a single model instance is returned. In case of a
-        3D spectral cube input, instead o model instances for every
-        spaxel, a list with 2D arrays, each one storing fitted parameter
-        values for all spaxels, is returned.
+        3D spectral cube input, a list of dictionaries storing the
+        ``x``, ``y`` and fitted ``model`` of every spaxel is returned.
+        If ``batched`` is `True`, a dictionary mapping each parameter
+        name to a 2D `~astropy.units.Quantity` array of the fitted values
+        for all spaxels (NaN where no fit was done) is returned instead.
 
     output_spectrum : `~specutils.Spectrum`
         The realization of the fitted model as a spectrum. The spectrum
-        will be 1D or 3D depending on the shape of input spectrum.
+        will be 1D or 3D depending on the shape of input spectrum. For
+        cubes, ``meta['fit_iterations']`` stores the 2D map of the number
+        of iterations done for every spaxel (NaN where unknown).
     """
     # Initial guess for the fit.
     initial_model = _build_model(component_list, expression)
 
     if len(spectrum.shape) > 1:
-        return _fit_3D(initial_model, spectrum, fitter=fitter, window=window, n_cpu=n_cpu, **kwargs)
+        if batched:
+            return _fit_3D_batched(initial_model, spectrum, window=window,
+                                   progress_callback=progress_callback,
+                                   warm_start=warm_start, **kwargs)
+        return _fit_3D(initial_model, spectrum, fitter=fitter, window=window, n_cpu=n_cpu,
+                       progress_callback=progress_callback, warm_start=warm_start, **kwargs)
     else:
         return _fit_1D(initial_model, spectrum, run_fitter, fitter=fitter, window=window, **kwargs)
 
@@ -121,12 +159,17 @@ def _fit_1D(initial_model, spectrum, run_fitter, fitter, window=None, **kwargs):
     return output_model, output_spectrum
 
 
-def _fit_3D(initial_model, spectrum, fitter, window=None, n_cpu=None, **kwargs):
+def _fit_3D(initial_model, spectrum, fitter, window=None, n_cpu=None, progress_callback=None,
+            warm_start=False, **kwargs):
     """
     Fits an astropy CompoundModel to every spaxel in a cube
     using a multiprocessor pool running in parallel. Computes
     realizations of the models over each spaxel.
 
+    Spaxels are dispatched in chunks whose size adapts to the measured
+    fitting time per spaxel, and results are collected as soon as each
+    chunk completes.
+
     Parameters
     ----------
     initial_model : :class: `astropy.modeling.CompoundModel`
@@ -142,88 +185,224 @@ def _fit_3D(initial_model, spectrum, fitter, window=None, n_cpu=None, **kwargs):
         Using all the cores at once is not recommended.
         If `None`, it will use max cores minus one.
         Set this to 1 for debugging.
+    progress_callback : `None` or callable
+        See `fit_model_to_spectrum`.
+    warm_start : bool
+        See `fit_model_to_spectrum`.
 
     Returns
     -------
-    output_model : :list: a list that stores 2D arrays. Each array contains one
-        parameter from `astropy.modeling.CompoundModel` instances
-        fitted to every spaxel in the input cube.
+    output_model : :list: a list of dictionaries storing the ``x``, ``y``,
+        fitted ``model`` and number of iterations ``n_iter`` of every
+        spaxel in the input cube.
     output_spectrum : :class:`specutils.Spectrum`
         The spectrum that stores the fitted model values in its 'flux'
-        attribute.
+        attribute, and the map of iterations in ``meta['fit_iterations']``.
     """
     if n_cpu is None:
         n_cpu = mp.cpu_count() - 1
 
     # Generate list of all spaxels to be fitted
     spaxels = generate_spaxel_list(spectrum)
+    n_x, n_y = _to_spaxel_order(spectrum.flux, spectrum.spectral_axis_index).shape[:2]
+    chunks = _AdaptiveChunks(n_cpu)
+
+    if warm_start and len(spaxels):
+        xy = np.array(spaxels)
+        groups = [xy[ring] for ring in _warm_start_rings(xy[:, 0], xy[:, 1],
+                                                         _spaxel_brightness(spectrum))]
+    else:
+        groups = [spaxels]
 
     fitted_models = []
+    iterations = np.full((n_x, n_y), np.nan)
+    # Fitted parameters indexed as [x, y], used to seed the following rings
+    parameter_maps = np.full((n_x, n_y, len(initial_model.parameters)), np.nan)
+    parameter_units = None
 
     # Build cube with empty arrays, one per input spaxel. These
     # will store the flux values corresponding to the fitted
-    # model realization over each spaxel.
+    # model realization over each spaxel, written directly by the workers.
     output_flux_cube = np.zeros(shape=spectrum.flux.shape)
 
-    # Callback to collect results from workers into the cubes
+    # Callback to collect fitted models from workers as each chunk completes.
+    # Returns True to request the remaining chunks to be cancelled.
     def collect_result(results):
-        for i in range(len(results['x'])):
-            x = results['x'][i]
-            y = results['y'][i]
-            model = results['fitted_model'][i]
-            fitted_values = results['fitted_values'][i]
-
-            # Store fitted model parameters
-            fitted_models.append({"x": x, "y": y, "model": model})
-
-            # Store fitted values
-            if spectrum.spectral_axis_index in [2, -1]:
-                output_flux_cube[x, y, :] = fitted_values
-            elif spectrum.spectral_axis_index == 0:
-                output_flux_cube[:, y, x] = fitted_values
-
-    # Allow selecting a futures-based streaming backend via
-    # the `use_futures` kwarg. This preserves callback-like
-    # behavior by processing results as each worker finishes.
+        nonlocal parameter_units
+        for x, y, model, n_iter in zip(results['x'], results['y'], results['fitted_model'],
+                                       results['n_iter']):
+            fitted_models.append({"x": x, "y": y, "model": model, "n_iter": n_iter})
+            iterations[x, y] = n_iter
+            if warm_start:
+                parameter_maps[x, y] = model.parameters
+                if parameter_units is None:
+                    parameter_units = [getattr(model, name).unit for name in model.param_names]
+        chunks.update(len(results['x']), results['elapsed'])
+        if progress_callback is not None:
+            return progress_callback(len(fitted_models), len(spaxels), fitted_models)
+
+    def seeds_for(group):
+        if not warm_start:
+            return None
+        return _neighbor_seeds(parameter_maps, group[:, 0], group[:, 1])
+
     if n_cpu > 1:
-        # Build workers (one per chunk) same as the Pool chunking
-        workers = (
-            SpaxelWorker(spectrum.flux,
-                         spectrum.spectral_axis,
-                         initial_model,
-                         fitter=fitter,
-                         param_set=spx,
-                         window=window,
-                         mask=spectrum.mask,
-                         spectral_axis_index=spectrum.spectral_axis_index,
-                         **kwargs)
-            for spx in np.array_split(spaxels, n_cpu))
-
-        parallelize_calculation(workers, collect_result, n_cpu=n_cpu)
+        # The cube, mask and output are shared with the worker processes
+        # through memory-mapped buffers instead of being pickled into each of them.
+        with SharedArrayStore() as store:
+            flux = store.put(spectrum.flux)
+            mask = store.put(spectrum.mask) if spectrum.mask is not None else None
+            output = store.zeros(output_flux_cube.shape)
+
+            for group in groups:
+                seeds = seeds_for(group)
+                # Workers are only built as the pool dispatches them,
+                # so that chunk sizes follow the measured cost.
+                workers = (
+                    SpaxelWorker(flux,
+                                 spectrum.spectral_axis,
+                                 initial_model,
+                                 fitter=fitter,
+                                 param_set=group[chunk],
+                                 window=window,
+                                 mask=mask,
+                                 spectral_axis_index=spectrum.spectral_axis_index,
+                                 flux_unit=spectrum.flux.unit,
+                                 output=output,
+                                 initial_parameters=None if seeds is None else seeds[chunk],
+                                 parameter_units=parameter_units,
+                                 **kwargs)
+                    for chunk in chunks.split(len(group)))
+
+                if not parallelize_calculation(workers, collect_result, n_cpu=n_cpu,
+                                               stream=True):
+                    break
+            output_flux_cube[...] = output.asarray()
 
     # This route is only for dev debugging because it is very slow
     # but exceptions will not get swallowed up by joblib.
     else:  # pragma: no cover
-        worker = SpaxelWorker(spectrum.flux,
-                              spectrum.spectral_axis,
-                              initial_model,
-                              fitter=fitter,
-                              param_set=spaxels,
-                              window=window,
-                              mask=spectrum.mask,
-                              spectral_axis_index=spectrum.spectral_axis_index,
-                              **kwargs)
-        collect_result(worker())
+        interrupted = False
+        for group in groups:
+            seeds = seeds_for(group)
+            for chunk in chunks.split(len(group)):
+                worker = SpaxelWorker(spectrum.flux,
+                                      spectrum.spectral_axis,
+                                      initial_model,
+                                      fitter=fitter,
+                                      param_set=group[chunk],
+                                      window=window,
+                                      mask=spectrum.mask,
+                                      spectral_axis_index=spectrum.spectral_axis_index,
+                                      output=output_flux_cube,
+                                      initial_parameters=None if seeds is None else seeds[chunk],
+                                      parameter_units=parameter_units,
+                                      **kwargs)
+                if collect_result(worker()):
+                    interrupted = True
+                    break
+            if interrupted:
+                break
 
     # Build output 3D spectrum. Don't need spectral_axis_index because we use the WCS
     funit = spectrum.flux.unit
     output_spectrum = Spectrum(wcs=spectrum.wcs,
                                flux=output_flux_cube * funit,
-                               mask=spectrum.mask)
+                               mask=spectrum.mask,
+                               meta={'fit_iterations': iterations})
 
     return fitted_models, output_spectrum
 
 
+class _AdaptiveChunks:
+    """
+    Splits sequences of spaxels into chunks. The first chunks are small; their
+    measured fitting time (reported through `update`) is then used to size the
+    following chunks so that each takes about ``target_duration`` seconds,
+    while keeping enough chunks to occupy all ``n_cpu`` processes.
+    """
+    def __init__(self, n_cpu, target_duration=1.0, initial_size=8):
+        self.n_cpu = max(n_cpu, 1)
+        self.target_duration = target_duration
+        self.initial_size = initial_size
+        self.chunk_size = None
+        self._cost = None
+
+    def split(self, n_items):
+        """
+        Yield slices covering ``range(n_items)``, sized from the latest estimate.
+        """
+        if self.chunk_size is None:
+            self.chunk_size = max(1, min(self.initial_size, n_items // (2 * self.n_cpu)))
+        start = 0
+        while start < n_items:
+            remaining = n_items - start
+            size = min(self.chunk_size, max(1, -(-remaining // self.n_cpu)))
+            yield slice(start, start + size)
+            start += size
+
+    def update(self, n_spaxels, elapsed):
+        """
+        Update the estimated time per spaxel from a completed chunk.
+        """
+        if n_spaxels == 0:
+            return
+        cost = elapsed / n_spaxels
+        # exponential moving average to smooth out outliers
+        self._cost = cost if self._cost is None else 0.5 * (self._cost + cost)
+        self.chunk_size = max(1, int(self.target_duration / max(self._cost, 1e-6)))
+
+
+def _spaxel_brightness(spectrum):
+    """
+    Sum of the valid flux of every spaxel, indexed as ``[x, y]``.
+    """
+    flux = np.asarray(spectrum.flux.value, dtype=float)
+    if spectrum.mask is not None:
+        flux = np.where(spectrum.mask, np.nan, flux)
+    return np.nansum(_to_spaxel_order(flux, spectrum.spectral_axis_index), axis=2)
+
+
+def _warm_start_rings(x, y, brightness):
+    """
+    Group the spaxels at coordinates ``x, y`` into rings of increasing
+    Chebyshev distance from the brightest one. Returns a list of index arrays.
+    """
+    values = np.nan_to_num(brightness[x, y], nan=-np.inf)
+    start = np.argmax(values)
+    distance = np.maximum(np.abs(x - x[start]), np.abs(y - y[start]))
+    order = np.argsort(distance, kind='stable')
+    return np.split(order, np.flatnonzero(np.diff(distance[order])) + 1)
+
+
+def _neighbor_seeds(parameter_maps, x, y):
+    """
+    Median of the fitted parameters of the 8 neighbors of each spaxel at
+    coordinates ``x, y``, from ``parameter_maps`` indexed as ``[x, y, parameter]``
+    with NaN for spaxels not fitted yet. Rows are NaN for spaxels without any
+    fitted neighbor.
+    """
+    padded = np.pad(parameter_maps, ((1, 1), (1, 1), (0, 0)), constant_values=np.nan)
+    neighbors = np.stack([padded[x + 1 + dx, y + 1 + dy]
+                          for dx in (-1, 0, 1) for dy in (-1, 0, 1)
+                          if dx or dy])
+    neighbors[~np.all(np.isfinite(neighbors), axis=2)] = np.nan
+    seeds = np.full(neighbors.shape[1:], np.nan)
+    seeded = np.any(np.isfinite(neighbors[..., 0]), axis=0)
+    seeds[seeded] = np.nanmedian(neighbors[:, seeded], axis=0)
+    return seeds
+
+
+def _fit_iterations(fit_info):
+    """
+    Number of iterations reported by an astropy fitter, or NaN if unknown.
+    """
+    for key in ('njev', 'numiter', 'nfev'):
+        if fit_info.get(key) is not None:
+            return fit_info[key]
+    return np.nan
+
+
 class SpaxelWorker:
     """
     A class with callable instances that perform fitting over a
@@ -237,9 +416,19 @@ class SpaxelWorker:
     modify parameter values in an already built CompoundModel
     instance. We need to use the current model instance while
     it still exists.
+
+    ``flux_cube``, ``mask`` and ``output`` can be given as
+    `~jdaviz.utils.SharedArray` handles, in which case ``flux_unit``
+    must be set. When ``output`` is given, the fitted values are
+    written into it instead of being returned.
+
+    ``initial_parameters`` optionally gives one row of starting parameter
+    values (in ``parameter_units``) per spaxel of ``param_set``; rows with
+    NaN values start from ``initial_model`` instead.
     """
     def __init__(self, flux_cube, wave_array, initial_model, fitter, param_set, window=None,
-                 mask=None, spectral_axis_index=2, **kwargs):
+                 mask=None, spectral_axis_index=2, flux_unit=None, output=None,
+                 initial_parameters=None, parameter_units=None, **kwargs):
         self.cube = flux_cube
         self.wave = wave_array
         self.model = initial_model
@@ -248,12 +437,21 @@ class SpaxelWorker:
         self.window = window
         self.mask = mask
         self.spectral_axis_index = spectral_axis_index
+        self.flux_unit = flux_unit
+        self.output = output
+        self.initial_parameters = initial_parameters
+        self.parameter_units = parameter_units
         self.kw = kwargs
 
     def __call__(self):
-        results = {'x': [], 'y': [], 'fitted_model': [], 'fitted_values': []}
+        start_time = time.perf_counter()
+        results = {'x': [], 'y': [], 'fitted_model': [], 'fitted_values': [], 'n_iter': []}
+
+        cube, mask_cube, output = (
+            arr.asarray(writeable=arr is self.output) if isinstance(arr, SharedArray) else arr
+            for arr in (self.cube, self.mask, self.output))
 
-        for parameters in self.param_set:
+        for i, parameters in enumerate(self.param_set):
             x = parameters[0]
             y = parameters[1]
 
@@ -266,17 +464,19 @@ class SpaxelWorker:
             # to execute. This behavior was seen also with other functions
             # passed to the callable.
             if self.spectral_axis_index in [2, -1]:
-                flux = self.cube[x, y, :]
-                if self.mask is not None:
-                    mask = self.mask[x, y, :]
+                spaxel = (x, y, slice(None))
             elif self.spectral_axis_index == 0:
-                flux = self.cube[:, y, x]
-                if self.mask is not None:
-                    mask = self.mask[:, y, x]
+                spaxel = (slice(None), y, x)
+
+            flux = cube[spaxel]
+            if self.flux_unit is not None:
+                flux = u.Quantity(flux, self.flux_unit)
 
-            if self.mask is None:
+            if mask_cube is not None:
+                mask = mask_cube[spaxel]
+            else:
                 # If no mask is provided:
-                mask = np.zeros_like(flux.value).astype(bool)
+                mask = np.zeros(flux.shape, dtype=bool)
 
             sp = Spectrum(spectral_axis=self.wave, flux=flux, mask=mask)
 
@@ -284,7 +484,15 @@ class SpaxelWorker:
                 weights = 'unc'
             else:
                 weights = None
-            fitted_model = fit_lines(sp, self.model, fitter=self.fitter, window=self.window,
+            model = self.model
+            if (self.initial_parameters is not None
+                    and np.all(np.isfinite(self.initial_parameters[i]))):
+                model = self.model.copy()
+                for name, value, unit in zip(model.param_names, self.initial_parameters[i],
+                                             self.parameter_units):
+                    setattr(model, name, value if unit is None else u.Quantity(value, unit))
+
+            fitted_model = fit_lines(sp, model, fitter=self.fitter, window=self.window,
                                      weights=weights, **self.kw)
 
             fitted_values = fitted_model(self.wave)
@@ -292,11 +500,366 @@ class SpaxelWorker:
             results['x'].append(x)
             results['y'].append(y)
             results['fitted_model'].append(fitted_model)
-            results['fitted_values'].append(fitted_values)
+            results['n_iter'].append(_fit_iterations(self.fitter.fit_info))
+            if output is not None:
+                output[spaxel] = getattr(fitted_values, 'value', fitted_values)
+            else:
+                results['fitted_values'].append(fitted_values)
 
+        if isinstance(output, np.memmap):
+            output.flush()
+
+        results['elapsed'] = time.perf_counter() - start_time
         return results
 
 
+# Approximate number of float64 elements allowed in the Jacobian of one batch
+# of spaxels in `_fit_3D_batched`, to keep memory usage bounded for large cubes.
+_BATCH_ELEMENTS = 2 ** 24
+
+
+def _fit_3D_batched(initial_model, spectrum, window=None, maxiter=100, acc=1e-7,
+                    progress_callback=None, warm_start=False, **kwargs):
+    """
+    Fits an astropy CompoundModel to every spaxel in a cube by solving
+    all spaxels together as one batched Levenberg-Marquardt problem.
+    Model evaluations and Jacobians are vectorized over spaxels, so no
+    per-spaxel `~specutils.Spectrum` or model instances are created.
+
+    Parameters
+    ----------
+    initial_model : :class: `astropy.modeling.CompoundModel`
+        Initial guess for the model to be fitted. Tied parameters are
+        not supported.
+    spectrum : :class:`specutils.Spectrum`
+        The spectrum that stores the cube in its 'flux' attribute.
+    window : `None` or :class:`specutils.spectra.SpectralRegion`
+        Only fit the data within this spectral region.
+    maxiter : int
+        Maximum number of iterations for every spaxel.
+    acc : float
+        Relative improvement of the sum of squared residuals below which
+        the fit of a spaxel is considered converged.
+    progress_callback : `None` or callable
+        See `fit_model_to_spectrum`. Called after each batch of spaxels.
+    warm_start : bool
+        See `fit_model_to_spectrum`. Every ring of spaxels is fit as its
+        own batch (or batches).
+    **kwargs
+        Other fitter keyword arguments (e.g., ``filter_non_finite``) are
+        ignored; non-finite and masked values are always excluded.
+
+    Returns
+    -------
+    output_parameters : dict
+        Maps every parameter name of ``initial_model`` to a 2D
+        `~astropy.units.Quantity` array indexed as ``[x, y]``, with NaN
+        for spaxels that were not fitted (fully masked).
+    output_spectrum : :class:`specutils.Spectrum`
+        The spectrum that stores the fitted model values in its 'flux'
+        attribute, and the map of iterations in ``meta['fit_iterations']``.
+    """
+    spectral_axis_index = spectrum.spectral_axis_index
+
+    # Work with 2D (spaxel, wavelength) arrays, with spaxels ordered
+    # following the same (x, y) convention as SpaxelWorker.
+    flux = _to_spaxel_order(spectrum.flux.value, spectral_axis_index)
+    n_x, n_y, n_wave = flux.shape
+    flux = flux.reshape(-1, n_wave)
+
+    valid = np.isfinite(flux)
+    if spectrum.mask is not None:
+        mask = _to_spaxel_order(np.asarray(spectrum.mask), spectral_axis_index)
+        valid &= ~mask.reshape(-1, n_wave)
+    if window is not None:
+        in_window = np.zeros(n_wave, dtype=bool)
+        for subregion in window:
+            lower, upper = sorted([subregion.lower.to_value(spectrum.spectral_axis.unit,
+                                                            u.spectral()),
+                                   subregion.upper.to_value(spectrum.spectral_axis.unit,
+                                                            u.spectral())])
+            in_window |= ((spectrum.spectral_axis.value >= lower)
+                          & (spectrum.spectral_axis.value <= upper))
+        valid &= in_window
+
+    # Residuals are weighted by the inverse uncertainties, as fit_lines does with
+    # weights='unc' for single spectra
+    weights = np.ones_like(flux)
+    if spectrum.uncertainty is not None and not np.all(spectrum.uncertainty.array == 0):
+        sigma = spectrum.uncertainty.represent_as(StdDevUncertainty).array
+        sigma = _to_spaxel_order(sigma, spectral_axis_index).reshape(-1, n_wave)
+        with np.errstate(divide='ignore'):
+            weights = 1. / sigma
+        valid &= np.isfinite(weights)
+
+    # Skip spaxels without any valid data point (as generate_spaxel_list does for masks)
+    to_fit = np.flatnonzero(np.any(valid, axis=1))
+
+    if initial_model._has_units:
+        model = initial_model.without_units_for_data(x=spectrum.spectral_axis,
+                                                     y=spectrum.flux)
+    else:
+        model = initial_model
+
+    if any(model.tied.values()):
+        raise ValueError("tied parameters are not supported by batched cube fitting")
+
+    param_names = model.param_names
+    free = np.array([not model.fixed[name] for name in param_names])
+    lower = np.array([-np.inf if model.bounds[name][0] is None else model.bounds[name][0]
+                      for name in param_names])
+    upper = np.array([np.inf if model.bounds[name][1] is None else model.bounds[name][1]
+                      for name in param_names])
+
+    if initial_model._has_units:
+        units_model = model.with_units_from_data(x=spectrum.spectral_axis, y=spectrum.flux)
+        units = [getattr(units_model, name).unit for name in param_names]
+    else:
+        units = [None] * len(param_names)
+
+    # Parameter maps are filled batch by batch, so that partial results can be
+    # passed to progress_callback.
+    output_parameters = {name: u.Quantity(np.full((n_x, n_y), np.nan), unit)
+                         for name, unit in zip(param_names, units)}
+    spaxel_xy = np.unravel_index(to_fit, (n_x, n_y))
+
+    iterations = np.full((n_x, n_y), np.nan)
+
+    # Fitted (unitless) parameters indexed as [x, y], used to seed the following rings
+    parameter_maps = np.full((n_x, n_y, len(param_names)), np.nan)
+    if warm_start and len(to_fit):
+        groups = [to_fit[ring] for ring in _warm_start_rings(*spaxel_xy,
+                                                             _spaxel_brightness(spectrum))]
+    else:
+        groups = [to_fit]
+
+    wave = spectrum.spectral_axis.value
+    output_flux = np.zeros_like(flux)
+
+    batch_size = max(1, _BATCH_ELEMENTS // (n_wave * (np.count_nonzero(free) + 1)))
+    n_done = 0
+    for rows in (group[start:start + batch_size] for group in groups
+                 for start in range(0, len(group), batch_size)):
+        xy = np.unravel_index(rows, (n_x, n_y))
+        params = np.tile(model.parameters, (len(rows), 1))
+        if warm_start:
+            seeds = _neighbor_seeds(parameter_maps, *xy)
+            params = np.where(np.isfinite(seeds), seeds, params)
+
+        params, iterations[xy] = _batched_levmar(model, wave, flux[rows], valid[rows], params,
+                                                 free, lower, upper, maxiter=maxiter, acc=acc,
+                                                 weights=weights[rows])
+        output_flux[rows] = _evaluate_batch(model, wave, params)
+        parameter_maps[xy] = params
+        for i, name in enumerate(param_names):
+            output_parameters[name].value[xy] = params[:, i]
+
+        n_done += len(rows)
+        if (progress_callback is not None
+                and progress_callback(n_done, len(to_fit), output_parameters)):
+            break
+
+    output_flux = _to_spaxel_order(output_flux.reshape(n_x, n_y, n_wave), spectral_axis_index)
+
+    # Build output 3D spectrum. Don't need spectral_axis_index because we use the WCS
+    output_spectrum = Spectrum(wcs=spectrum.wcs,
+                               flux=output_flux * spectrum.flux.unit,
+                               mask=spectrum.mask,
+                               meta={'fit_iterations': iterations})
+
+    return output_parameters, output_spectrum
+
+
+def _to_spaxel_order(array, spectral_axis_index):
+    """
+    Reorder a cube to be indexed as ``[x, y, spectral]``, following the same
+    spaxel convention as `SpaxelWorker`. The operation is its own inverse.
+    """
+    if spectral_axis_index == 0:
+        return np.transpose(array, (2, 1, 0))
+    return array
+
+
+def _evaluate_batch(model, x, params):
+    """
+    Evaluate ``model`` over ``x`` for every row of the 2D ``params`` array
+    at once, relying on the broadcasting of the model ``evaluate`` method.
+    Returns an array of shape ``(len(params), len(x))``.
+    """
+    values = model.evaluate(x[np.newaxis, :],
+                            *(params[:, i:i + 1] for i in range(params.shape[1])))
+    return np.broadcast_to(values, (params.shape[0], x.size))
+
+
+def _leaf_signs(model):
+    """
+    Return the signs (+1 or -1) with which every leaf model contributes to
+    a compound model built only with additions and subtractions, or `None`
+    if the compound model uses any other operator.
+    """
+    if not isinstance(model, CompoundModel):
+        return [1]
+    if model.op not in ('+', '-'):
+        return None
+    left, right = _leaf_signs(model.left), _leaf_signs(model.right)
+    if left is None or right is None:
+        return None
+    if model.op == '-':
+        right = [-sign for sign in right]
+    return left + right
+
+
+def _batched_jacobian(model, x, params, model_values, free_idx, upper):
+    """
+    Jacobian of ``model`` with respect to the free parameters, for every row
+    of ``params``, as an array of shape ``(len(params), len(x), len(free_idx))``.
+
+    Analytic derivatives (``fit_deriv``) of the component models are used when
+    all of them provide one and they are only added or subtracted, otherwise
+    the Jacobian is estimated with forward finite differences.
+    """
+    n_spectra = len(params)
+    leaves = model._leaflist if isinstance(model, CompoundModel) else [model]
+    signs = _leaf_signs(model)
+
+    if signs is not None and all(leaf.fit_deriv is not None
+                                 and (leaf.col_fit_deriv or leaf.linear)
+                                 for leaf in leaves):
+        derivatives = []
+        start = 0
+        for leaf, sign in zip(leaves, signs):
+            n_params = len(leaf.param_names)
+            if leaf.linear:
+                # derivatives of linear models do not depend on the parameter values
+                leaf_derivatives = np.asarray(leaf.fit_deriv(x, *leaf.parameters))
+                if not leaf.col_fit_deriv:
+                    leaf_derivatives = leaf_derivatives.T
+                leaf_derivatives = leaf_derivatives[:, np.newaxis, :]
+            else:
+                leaf_derivatives = leaf.fit_deriv(
+                    x[np.newaxis, :],
+                    *(params[:, i:i + 1] for i in range(start, start + n_params)))
+            derivatives += [sign * np.broadcast_to(d, (n_spectra, x.size))
+                            for d in leaf_derivatives]
+            start += n_params
+        return np.stack([derivatives[i] for i in free_idx], axis=-1)
+
+    jacobian = np.empty((n_spectra, x.size, len(free_idx)))
+    step_size = np.sqrt(np.finfo(float).eps)
+    for k, i in enumerate(free_idx):
+        h = step_size * np.where(params[:, i] != 0, np.abs(params[:, i]), 1.)
+        # step backwards if the forward step would leave the bounds
+        h = np.where(params[:, i] + h > upper[i], -h, h)
+        shifted = params.copy()
+        shifted[:, i] += h
+        jacobian[:, :, k] = (_evaluate_batch(model, x, shifted) - model_values) / h[:, np.newaxis]
+    return jacobian
+
+
+def _solve_batch(system, rhs):
+    """
+    Solve the stacked linear systems ``system @ step = rhs``, returning NaN
+    steps for the singular systems instead of failing for the whole batch.
+    """
+    try:
+        return np.linalg.solve(system, rhs[..., np.newaxis])[..., 0]
+    except np.linalg.LinAlgError:
+        step = np.full(rhs.shape, np.nan)
+        for i in range(len(system)):
+            try:
+                step[i] = np.linalg.solve(system[i], rhs[i])
+            except np.linalg.LinAlgError:
+                continue
+        return step
+
+
+def _batched_levmar(model, x, y, valid, params, free, lower, upper, maxiter=100, acc=1e-7,
+                    weights=None):
+    """
+    Levenberg-Marquardt minimization of the squared (weighted) residuals of
+    ``model`` for a batch of spectra (rows of ``y``) simultaneously. Every
+    spectrum keeps its own damping factor and stops iterating independently
+    once converged. The normal equations of all spectra are solved in a single
+    stacked call; steps of singular systems are rejected, which increases the
+    damping of these spectra only.
+
+    Returns the 2D array of fitted parameters, one row per spectrum, and
+    the number of iterations done for every spectrum.
+    """
+    params = params.copy()
+    free_idx = np.flatnonzero(free)
+    n_spectra, n_free = len(params), len(free_idx)
+    n_iter = np.zeros(n_spectra, dtype=int)
+    if n_spectra == 0 or n_free == 0:
+        return params, n_iter
+
+    weights = np.where(valid, 1. if weights is None else weights, 0.)
+    y = np.where(valid, y, 0)
+
+    model_values = np.array(_evaluate_batch(model, x, params))
+    chi2 = np.sum(((y - model_values) * weights) ** 2, axis=1)
+
+    damping = np.full(n_spectra, 1e-3)
+    curvature = np.zeros((n_spectra, n_free, n_free))
+    gradient = np.zeros((n_spectra, n_free))
+    needs_jacobian = np.ones(n_spectra, dtype=bool)
+    active = np.isfinite(chi2)
+
+    for _ in range(maxiter):
+        # Jacobians are only recomputed for spectra whose previous step was accepted,
+        # rejected steps are retried with a larger damping factor.
+        rows = np.flatnonzero(active & needs_jacobian)
+        if len(rows):
+            jacobian = _batched_jacobian(model, x, params[rows], model_values[rows],
+                                         free_idx, upper) * weights[rows][..., np.newaxis]
+            residuals = (y[rows] - model_values[rows]) * weights[rows]
+            curvature[rows] = np.einsum('nwk,nwl->nkl', jacobian, jacobian)
+            gradient[rows] = np.einsum('nwk,nw->nk', jacobian, residuals)
+            needs_jacobian[rows] = False
+
+            invalid = ~(np.all(np.isfinite(curvature[rows]), axis=(1, 2))
+                        & np.all(np.isfinite(gradient[rows]), axis=1))
+            active[rows[invalid]] = False
+
+        rows = np.flatnonzero(active)
+        if not len(rows):
+            break
+        n_iter[rows] += 1
+
+        diag = np.diagonal(curvature[rows], axis1=1, axis2=2)
+        diag = np.maximum(diag, 1e-12 * np.max(diag, axis=1, keepdims=True))
+        diag = np.where(diag > 0, diag, 1.)
+        system = curvature[rows] + damping[rows, np.newaxis, np.newaxis] * (
+            np.eye(n_free) * diag[:, np.newaxis, :])
+        step = _solve_batch(system, gradient[rows])
+
+        trial = params[rows].copy()
+        trial[:, free_idx] += step
+        trial_values = _evaluate_batch(model, x, trial)
+        trial_chi2 = np.sum(((y[rows] - trial_values) * weights[rows]) ** 2, axis=1)
+
+        # steps leaving the parameter bounds are rejected like steps that do not
+        # improve the fit, so that the damping shrinks them on the next try
+        in_bounds = np.all((trial >= lower) & (trial <= upper), axis=1)
+        improved = in_bounds & (trial_chi2 < chi2[rows])
+        accepted = rows[improved]
+        rel_change = ((chi2[accepted] - trial_chi2[improved])
+                      / np.maximum(chi2[accepted], np.finfo(float).tiny))
+        params[accepted] = trial[improved]
+        model_values[accepted] = trial_values[improved]
+        chi2[accepted] = trial_chi2[improved]
+        damping[accepted] /= 10.
+        needs_jacobian[accepted] = True
+        active[accepted[rel_change < acc]] = False
+
+        rejected = rows[~improved]
+        damping[rejected] *= 10.
+        # no descent direction left within the numerical precision
+        active[rejected[damping[rejected] > 1e10]] = False
+
+    return params, n_iter
+
+
 def _build_model(component_list, expression):
     """
     Builds an astropy CompoundModel from a list of components
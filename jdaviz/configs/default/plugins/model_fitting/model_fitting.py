@@ -1,4 +1,5 @@
 import re
+import time
 import numpy as np
 from copy import deepcopy
 
@@ -7,7 +8,7 @@ from astropy.modeling import fitting
 from specutils import Spectrum
 from specutils.fitting import fit_lines
 from specutils.utils import QuantityModel
-from traitlets import Bool, List, Dict, Any, Unicode, observe
+from traitlets import Bool, Float, List, Dict, Any, Unicode, observe
 
 from jdaviz.configs.default.plugins.model_fitting.fitting_backend import fit_model_to_spectrum
 from jdaviz.configs.default.plugins.model_fitting.initializers import (MODELS,
@@ -59,6 +60,13 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     * ``cube_fit``
       Only exposed for Cubeviz.  Whether to fit the model to the cube instead of to the
       collapsed spectrum.
+    * ``cube_fit_batched``
+      Only exposed for Cubeviz.  Whether to fit all spaxels of the cube at once as a single
+      batched problem (much faster for large cubes, but ignores the selected fitter).
+      :meth:`fitted_models` then stores 2D parameter maps instead of one model per spaxel.
+    * ``cube_fit_warm_start``
+      Only exposed for Cubeviz.  Whether to fit the spaxels outward from the brightest one,
+      starting each spaxel from the parameters already fitted for its neighbors.
     * ``dataset`` (:class:`~jdaviz.core.template_mixin.DatasetSelect`):
       Dataset to fit the model.
     * ``spectral_subset`` (:class:`~jdaviz.core.template_mixin.SubsetSelect`)
@@ -110,6 +118,11 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     display_order = Bool(False).tag(sync=True)
 
     cube_fit = Bool(False).tag(sync=True)
+    cube_fit_batched = Bool(False).tag(sync=True)
+    cube_fit_warm_start = Bool(False).tag(sync=True)
+    # progress (in percent) and estimated remaining time (in seconds) of a running cube fit
+    cube_fit_progress = Float(0).tag(sync=True)
+    cube_fit_eta = Float(0).tag(sync=True)
 
     # residuals (non-cube fit only)
     residuals_calculate = Bool(False).tag(sync=True)
@@ -229,7 +242,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
     def user_api(self):
         expose = ['dataset']
         if self.config == "cubeviz":
-            expose += ['cube_fit']
+            expose += ['cube_fit', 'cube_fit_batched', 'cube_fit_warm_start']
         expose += ['spectral_subset', 'model_component',
                    'poly_order', 'model_component_label', 'model_components',
                    'valid_model_components', 'create_model_component',
@@ -1003,6 +1016,13 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
             else:
                 find_label = model_label
 
+            # Parameter maps from batched cube fits are not split per spaxel,
+            # so match them on their label only.
+            if isinstance(models[label], dict):
+                if label == find_label:
+                    selected_models[label] = models[label]
+                continue
+
             # If x and y are set, return keys that match the model plus that
             # coordinate pair. If only x or y is set, return keys that fit
             # that value for the appropriate coordinate.
@@ -1054,6 +1074,25 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         elif models is None:
             models = self.fitted_models
 
+        # Parameter maps from batched cube fits are already in the output format,
+        # only (x, y) need to be applied.
+        parameters_cube = {}
+        for label, param_maps in models.items():
+            if not isinstance(param_maps, dict):
+                continue
+            if x is not None and y is not None:
+                spaxels = (x, y)
+            elif x is not None:
+                spaxels = (x,)
+            elif y is not None:
+                spaxels = (slice(None), y)
+            else:
+                spaxels = ()
+            parameters_cube[label] = {name: values[spaxels]
+                                      for name, values in param_maps.items()}
+        models = {label: model for label, model in models.items()
+                  if label not in parameters_cube}
+
         data_shapes = {}
         for label in models:
             data_label = label.split(" (")[0]
@@ -1061,7 +1100,6 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
                 data_shapes[data_label] = self.app.data_collection[data_label].data.shape
 
         param_dict = {}
-        parameters_cube = {}
         param_x_y = {}
         param_units = {}
 
@@ -1145,7 +1183,7 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
         # Convert values of parameters_cube[key][param_name] into u.Quantity
         # objects that contain the appropriate unit set in
         # param_units[key][param_name]
-        for key in parameters_cube:
+        for key in param_units:
             for param_name in parameters_cube[key]:
                 parameters_cube[key][param_name] = u.Quantity(
                     parameters_cube[key][param_name],
@@ -1457,6 +1495,36 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
               if param['type'] == 'call'}
         init_kw = {param['name']: param['value'] for param in self.fitter_parameters['parameters']
                    if param['type'] == 'init'}
+
+        results_label = self.results_label
+        n_stored = 0
+        start_time = time.time()
+        self.cube_fit_progress = 0
+        self.cube_fit_eta = 0
+
+        def store_fitted_models(fitted_model):
+            # Save fitted 3D model in a way that the cubeviz helper can access it.
+            # This is also called with partial results while fitting, so that the
+            # parameters of the spaxels fitted so far can already be previewed.
+            nonlocal n_stored
+            if not add_data:
+                return
+            if self.cube_fit_batched:
+                # batched fits return a dictionary of 2D parameter maps
+                self._fitted_models[results_label] = fitted_model
+                return
+            for m in fitted_model[n_stored:]:
+                temp_label = "{} ({}, {})".format(results_label, m["x"], m["y"])
+                self._fitted_models[temp_label] = m["model"]
+            n_stored = len(fitted_model)
+
+        def on_progress(n_done, n_total, partial_results):
+            fraction = n_done / n_total
+            elapsed = time.time() - start_time
+            self.cube_fit_progress = 100 * fraction
+            self.cube_fit_eta = elapsed * (1 - fraction) / fraction
+            store_fitted_models(partial_results)
+
         try:
             fitted_model, fitted_spectrum = fit_model_to_spectrum(
                 spec,
@@ -1466,6 +1534,9 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
                 run_fitter=True,
                 window=None,
                 n_cpu=self.parallel_n_cpu,
+                batched=self.cube_fit_batched,
+                progress_callback=on_progress,
+                warm_start=self.cube_fit_warm_start,
                 **kw
             )
         except ValueError as e:
@@ -1474,13 +1545,17 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
                 color='error', loading=False, sender=self, traceback=e)
             self.hub.broadcast(snackbar_message)
             raise
+        except KeyboardInterrupt:
+            # interrupting the kernel stops the remaining workers; the partial
+            # parameters stay available in fitted_models, but the incomplete
+            # cube is not added to the app
+            snackbar_message = SnackbarMessage(
+                "Cube fitting interrupted",
+                color='warning', loading=False, sender=self)
+            self.hub.broadcast(snackbar_message)
+            return
 
-        # Save fitted 3D model in a way that the cubeviz
-        # helper can access it.
-        if add_data:
-            for m in fitted_model:
-                temp_label = "{} ({}, {})".format(self.results_label, m["x"], m["y"])
-                self._fitted_models[temp_label] = m["model"]
+        store_fitted_models(fitted_model)
 
         output_cube = Spectrum(flux=fitted_spectrum.flux, wcs=fitted_spectrum.wcs)
 
@@ -1493,9 +1568,13 @@ class ModelFitting(PluginTemplateMixin, DatasetSelectMixin,
             self.add_results.add_results_from_plugin(output_cube)
             self._set_default_results_label()
 
+        iterations = fitted_spectrum.meta.get('fit_iterations')
+        if iterations is not None and np.any(np.isfinite(iterations)):
+            msg = f"Finished cube fitting ({np.nanmean(iterations):.1f} iterations per spaxel)"
+        else:
+            msg = "Finished cube fitting"
         snackbar_message = SnackbarMessage(
-            "Finished cube fitting",
-            color='success', loading=False, sender=self)
+            msg, color='success', loading=False, sender=self)
         self.hub.broadcast(snackbar_message)
 
         return fitted_model, output_cube
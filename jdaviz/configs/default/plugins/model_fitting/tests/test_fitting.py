@@ -6,7 +6,7 @@ import numpy as np
 import pytest
 from astropy import units as u
 from astropy.io import fits
-from astropy.modeling import models
+from astropy.modeling import fitting, models
 from astropy.nddata import StdDevUncertainty
 from astropy.tests.helper import assert_quantity_allclose
 from astropy.wcs import WCS
@@ -14,6 +14,7 @@ from glue.core.roi import XRangeROI
 from numpy.testing import assert_allclose, assert_array_equal
 from specutils.spectra import Spectrum
 from specutils import SpectralRegion
+from specutils.fitting import fit_lines
 from traitlets import TraitError
 
 from jdaviz.configs.default.plugins.model_fitting import fitting_backend as fb
@@ -173,7 +174,8 @@ def test_model_ids(cubeviz_helper, spectral_cube_wcs):
         plugin.vue_add_model({})
 
 
-def test_parameter_retrieval(cubeviz_helper, spectral_cube_wcs):
+@pytest.mark.parametrize('batched', [False, True])
+def test_parameter_retrieval(cubeviz_helper, spectral_cube_wcs, batched):
 
     flux_unit = u.nJy
     sb_unit = flux_unit / PIX2
@@ -198,9 +200,11 @@ def test_parameter_retrieval(cubeviz_helper, spectral_cube_wcs):
     # NOTE: Hardcoding n_cpu=1 to run in serial, it's slower to spool up
     # multiprocessing for the size of the cube
     plugin._obj.parallel_n_cpu = 1
+    plugin.cube_fit_batched = batched
     with warnings.catch_warnings():
         warnings.filterwarnings('ignore', message='Model is linear in parameters*')
         plugin.calculate_fit()
+    assert plugin._obj.cube_fit_progress == 100
 
     params = cubeviz_helper.plugins['Model Fitting'].get_model_parameters()
     slope_res = np.zeros((3, 4))
@@ -215,6 +219,11 @@ def test_parameter_retrieval(cubeviz_helper, spectral_cube_wcs):
     assert_quantity_allclose(params['model']['intercept'], intercept_res,
                              atol=1e-10 * sb_unit)
 
+    if batched:
+        params = plugin.get_model_parameters(x=2, y=2)
+        assert_quantity_allclose(params['model']['slope'], 1.0 * sb_unit / wav_unit,
+                                 atol=1e-10 * sb_unit / wav_unit)
+
 
 @pytest.mark.parametrize(
     ('n_cpu', 'unc'), [
@@ -411,6 +420,155 @@ def test_cube_fitting_backend(cubeviz_helper, unc, n_cpu, tmp_path):
     assert_array_equal(flux_mask.data, mask)
 
 
+@pytest.mark.parametrize(('n_cpu', 'batched'), [(1, False), (2, False), (1, True)])
+def test_cube_fitting_backend_progress(n_cpu, batched):
+    np.random.seed(42)
+
+    x, y = build_spectrum()
+    flux_cube = np.tile(y, (6, 5, 1))
+    spectrum = Spectrum(flux=flux_cube*u.Jy, spectral_axis=x*u.um)
+    model_list = [models.Gaussian1D(2.0*u.Jy, 5.55*u.um, 0.3*u.um, name='g'),
+                  models.Const1D(4.*u.Jy, name='c')]
+
+    progress = []
+
+    def progress_callback(n_done, n_total, partial_results):
+        progress.append((n_done, n_total))
+
+    fitted_parameters, _ = fb.fit_model_to_spectrum(
+        spectrum, model_list, "g + c", n_cpu=n_cpu, batched=batched,
+        progress_callback=progress_callback)
+
+    assert progress[-1] == (30, 30)
+    assert [n_done for n_done, _ in progress] == sorted(n_done for n_done, _ in progress)
+    if not batched:
+        # chunks start small for their cost to be measured
+        assert len(progress) > n_cpu
+
+    # interrupt after the first chunk
+    def interrupt_callback(n_done, n_total, partial_results):
+        return True
+
+    fitted_parameters, fitted_spectrum = fb.fit_model_to_spectrum(
+        spectrum, model_list, "g + c", n_cpu=n_cpu, batched=batched,
+        progress_callback=interrupt_callback)
+    if batched:
+        # all spaxels fit in a single batch for such a small cube
+        assert not np.any(np.isnan(fitted_parameters['amplitude_0']))
+    else:
+        assert 0 < len(fitted_parameters) < 30
+        assert np.any(fitted_spectrum.flux == 0)
+
+
+@pytest.mark.parametrize('spectral_axis_index', [0, 2])
+def test_cube_fitting_backend_batched(spectral_axis_index):
+    np.random.seed(42)
+
+    IMAGE_SIZE_X = 5
+    IMAGE_SIZE_Y = 4
+
+    x, _ = build_spectrum()
+    flux_cube = np.zeros((IMAGE_SIZE_X, IMAGE_SIZE_Y, SPECTRUM_SIZE))
+    for i in range(IMAGE_SIZE_X):
+        for j in range(IMAGE_SIZE_Y):
+            flux_cube[i, j] = build_spectrum(sigma=0.01)[1]
+
+    mask = np.zeros_like(flux_cube).astype(bool)
+    mask[..., :SPECTRUM_SIZE // 10] = True
+    # fully masked spaxel is skipped
+    mask[1, 3, :] = True
+
+    if spectral_axis_index == 0:
+        flux_cube = flux_cube.transpose(2, 1, 0)
+        mask = mask.transpose(2, 1, 0)
+
+    spectrum = Spectrum(flux=flux_cube*u.Jy, spectral_axis=x*u.um, mask=mask,
+                        spectral_axis_index=spectral_axis_index)
+
+    g1f = models.Gaussian1D(0.7*u.Jy, 4.65*u.um, 0.3*u.um, name='g1')
+    g2f = models.Gaussian1D(2.0*u.Jy, 5.55*u.um, 0.3*u.um, name='g2')
+    g3f = models.Gaussian1D(-2.*u.Jy, 8.15*u.um, 0.2*u.um, name='g3')
+    zero_level = models.Const1D(4.*u.Jy, name='const1d', fixed={'amplitude': True})
+
+    model_list = [g1f, g2f, g3f, zero_level]
+    expression = "g1 + g2 + g3 + const1d"
+
+    fitted_parameters, fitted_spectrum = fb.fit_model_to_spectrum(
+        spectrum, model_list, expression, batched=True)
+
+    assert isinstance(fitted_parameters, dict)
+    assert fitted_parameters['amplitude_0'].shape == (IMAGE_SIZE_X, IMAGE_SIZE_Y)
+    assert fitted_parameters['amplitude_0'].unit == u.Jy
+    assert fitted_parameters['mean_1'].unit == u.um
+
+    fitted = np.ones((IMAGE_SIZE_X, IMAGE_SIZE_Y), dtype=bool)
+    fitted[1, 3] = False
+    for name in fitted_parameters:
+        assert np.all(np.isnan(fitted_parameters[name].value[~fitted]))
+
+    # fixed parameters are not changed by the fit
+    assert_allclose(fitted_parameters['amplitude_3'].value[fitted], 4.)
+
+    expected = {'amplitude_1': 2.5, 'mean_1': 5.5, 'stddev_1': 0.1,
+                'amplitude_2': -1.7, 'mean_2': 8.2, 'stddev_2': 0.1}
+    for name, value in expected.items():
+        assert_allclose(fitted_parameters[name].value[fitted], value, atol=0.1)
+
+    assert fitted_spectrum.shape == spectrum.shape
+    assert_array_equal(fitted_spectrum.mask, mask)
+    if spectral_axis_index == 0:
+        assert np.all(fitted_spectrum.flux[:, 3, 1] == 0)
+    else:
+        assert np.all(fitted_spectrum.flux[1, 3] == 0)
+
+
+def test_cube_fitting_backend_batched_uncertainty():
+    np.random.seed(42)
+
+    x, _ = build_spectrum()
+    flux_cube = np.array([[build_spectrum(sigma=0.1)[1] for j in range(2)] for i in range(3)])
+    # uncertainties vary along the spectrum, so the weighted fit differs from the unweighted one
+    unc = np.broadcast_to(np.linspace(0.05, 1, SPECTRUM_SIZE), flux_cube.shape).copy()
+
+    spectrum = Spectrum(flux=flux_cube*u.Jy, spectral_axis=x*u.um,
+                        uncertainty=StdDevUncertainty(unc*u.Jy))
+
+    model_list = [models.Gaussian1D(2.0*u.Jy, 5.55*u.um, 0.3*u.um, name='g'),
+                  models.Const1D(4.*u.Jy, name='c')]
+
+    batched_parameters, _ = fb.fit_model_to_spectrum(
+        spectrum, model_list, "g + c", batched=True)
+    unweighted_parameters, _ = fb.fit_model_to_spectrum(
+        Spectrum(flux=flux_cube*u.Jy, spectral_axis=x*u.um), model_list, "g + c",
+        batched=True)
+
+    # reference: weighted fit of every spaxel on its own
+    initial_model = fb._build_model(model_list, "g + c")
+    for i in range(flux_cube.shape[0]):
+        for j in range(flux_cube.shape[1]):
+            spaxel = Spectrum(flux=flux_cube[i, j]*u.Jy, spectral_axis=x*u.um,
+                              uncertainty=StdDevUncertainty(unc[i, j]*u.Jy))
+            fitted = fit_lines(spaxel, initial_model, fitter=fitting.LevMarLSQFitter(),
+                               weights='unc')
+            for name in initial_model.param_names:
+                assert_quantity_allclose(batched_parameters[name][i, j],
+                                         getattr(fitted, name).quantity, rtol=1e-3)
+
+    # the uncertainties change the fit
+    assert not np.allclose(batched_parameters['mean_0'].value,
+                           unweighted_parameters['mean_0'].value, rtol=1e-6)
+
+
+def test_solve_batch_singular():
+    system = np.array([np.eye(2), np.zeros((2, 2)), 2 * np.eye(2)])
+    rhs = np.ones((3, 2))
+
+    # a singular system doesn't prevent solving the others
+    step = fb._solve_batch(system, rhs)
+    assert_allclose(step[[0, 2]], [[1, 1], [0.5, 0.5]])
+    assert np.all(np.isnan(step[1]))
+
+
 def test_results_table(specviz_helper, spectrum1d):
     data_label = 'test'
     specviz_helper.load_data(spectrum1d, data_label=data_label)
@@ -784,3 +942,70 @@ def test_specviz2d_linking(specviz2d_helper):
     assert data_x_min <= fit_x_min <= fit_x_max <= data_x_max, (
         f"Fit range [{fit_x_min},{fit_x_max}] isn't within data range [{data_x_min},{data_x_max}]"
     )
+
+
+@pytest.mark.parametrize(('n_cpu', 'batched'), [(1, False), (2, False), (1, True)])
+def test_cube_fitting_backend_warm_start(n_cpu, batched):
+    np.random.seed(42)
+
+    x = np.linspace(4., 7., 200)
+    # line amplitude peaking at spaxel (3, 1) and decreasing outward
+    xx, yy = np.meshgrid(np.arange(5), np.arange(4), indexing='ij')
+    amplitude = 3. - 0.3 * np.hypot(xx - 3, yy - 1)
+    flux_cube = (amplitude[..., np.newaxis] * np.exp(-0.5 * ((x - 5.5) / 0.1) ** 2) + 1.
+                 + np.random.normal(0., 0.01, (5, 4, x.size)))
+    spectrum = Spectrum(flux=flux_cube*u.Jy, spectral_axis=x*u.um)
+    model_list = [models.Gaussian1D(1.*u.Jy, 5.4*u.um, 0.2*u.um, name='g'),
+                  models.Const1D(0.5*u.Jy, name='c')]
+
+    results = {}
+    for warm_start in (False, True):
+        results[warm_start] = fb.fit_model_to_spectrum(
+            spectrum, model_list, "g + c", n_cpu=n_cpu, batched=batched, warm_start=warm_start)
+
+    fitted_parameters, fitted_spectrum = results[True]
+    if batched:
+        assert_allclose(fitted_parameters['amplitude_0'].value, amplitude, atol=0.05)
+        assert_allclose(fitted_parameters['mean_0'].value, 5.5, atol=0.01)
+    else:
+        # spaxels are fit outward from the brightest one
+        assert (fitted_parameters[0]['x'], fitted_parameters[0]['y']) == (3, 1)
+        distance = [max(abs(m['x'] - 3), abs(m['y'] - 1)) for m in fitted_parameters]
+        assert distance == sorted(distance)
+        for m in fitted_parameters:
+            assert_allclose(m['model'].mean_0.value, 5.5, atol=0.01)
+            assert_allclose(m['model'].amplitude_0.value, amplitude[m['x'], m['y']], atol=0.05)
+
+    iterations = {warm_start: spectrum.meta['fit_iterations']
+                  for warm_start, (_, spectrum) in results.items()}
+    assert iterations[True].shape == (5, 4)
+    assert np.all(iterations[True] > 0)
+    # neighbors start close to their solution
+    assert np.mean(iterations[True]) < np.mean(iterations[False])
+
+
+def test_warm_start_seeds():
+    x, y = np.meshgrid(np.arange(4), np.arange(3), indexing='ij')
+    x, y = x.ravel(), y.ravel()
+    brightness = np.zeros((4, 3))
+    brightness[2, 1] = 10.
+
+    rings = fb._warm_start_rings(x, y, brightness)
+    assert [len(ring) for ring in rings] == [1, 8, 3]
+    assert (x[rings[0][0]], y[rings[0][0]]) == (2, 1)
+
+    parameter_maps = np.full((4, 3, 2), np.nan)
+    parameter_maps[2, 1] = [1., 10.]
+    parameter_maps[1, 1] = [3., 30.]
+    seeds = fb._neighbor_seeds(parameter_maps, np.array([0, 3, 0]), np.array([1, 1, 0]))
+    assert_allclose(seeds[0], [3., 30.])
+    assert_allclose(seeds[1], [1., 10.])
+    assert_allclose(seeds[2], [3., 30.])
+
+    parameter_maps[0, 1] = [5., 50.]
+    seeds = fb._neighbor_seeds(parameter_maps, np.array([0]), np.array([0]))
+    assert_allclose(seeds[0], [4., 40.])
+
+    # no fitted neighbor
+    parameter_maps[:] = np.nan
+    assert np.all(np.isnan(fb._neighbor_seeds(parameter_maps, np.array([3]), np.array([2]))))
@@ -672,6 +672,7 @@ class JdavizProfileView(JdavizViewerMixin, BqplotProfileView):
         statistic = getattr(self.state, 'function', None)
         data = []
 
+        object_cache = self.jdaviz_app._object_cache
         for layer_state in self.state.layers:
             if hasattr(layer_state, 'layer'):
                 lyr = layer_state.layer
@@ -681,16 +682,16 @@ class JdavizProfileView(JdavizViewerMixin, BqplotProfileView):
                     _class = cls or self.default_class
 
                     if _class is not None:
-                        cache_key = (lyr.label, statistic)
-                        if cache_key in self.jdaviz_app._get_object_cache:
-                            layer_data = self.jdaviz_app._get_object_cache[cache_key]
+                        # If spectrum, collapse via the defined statistic
+                        if _class == Spectrum:
+                            cache_key = object_cache.key(lyr, cls=_class, statistic=statistic)
+                            layer_data = object_cache.get_or_translate(
+                                cache_key,
+                                lambda: lyr.get_object(cls=_class, statistic=statistic))
                         else:
-                            # If spectrum, collapse via the defined statistic
-                            if _class == Spectrum:
-                                layer_data = lyr.get_object(cls=_class, statistic=statistic)
-                            else:
-                                layer_data = lyr.get_object(cls=_class)
-                            self.jdaviz_app._get_object_cache[cache_key] = layer_data
+                            cache_key = object_cache.key(lyr, cls=_class)
+                            layer_data = object_cache.get_or_translate(
+                                cache_key, lambda: lyr.get_object(cls=_class))
 
                         data.append(layer_data)
 
@@ -699,11 +700,15 @@ class JdavizProfileView(JdavizViewerMixin, BqplotProfileView):
                     layer_data = lyr
 
                     if _class is not None:
-                        handler, _ = data_translator.get_handler_for(_class)
-                        try:
-                            layer_data = handler.to_object(layer_data, statistic=statistic)
-                        except IncompatibleAttribute:
-                            continue
+                        cache_key = object_cache.key(lyr, cls=_class, statistic=statistic)
+                        layer_data = object_cache.get(cache_key)
+                        if layer_data is None:
+                            handler, _ = data_translator.get_handler_for(_class)
+                            try:
+                                layer_data = handler.to_object(lyr, statistic=statistic)
+                            except IncompatibleAttribute:
+                                continue
+                            object_cache[cache_key] = layer_data
                     data.append(layer_data)
 
         return data
@@ -1,12 +1,17 @@
+import multiprocessing as mp
 import os
+import pickle
 import warnings
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime, timezone
 
 import numpy as np
 from astropy import units as u
+from astropy.coordinates import SkyCoord
 from astropy.modeling.fitting import TRFLSQFitter
 from astropy.modeling import Parameter
 from astropy.modeling.models import Gaussian1D
+from astropy.table import vstack
 from astropy.time import Time
 from glue.core.message import SubsetUpdateMessage
 from ipywidgets import widget_serialization
@@ -29,10 +34,15 @@ from jdaviz.core.unit_conversion_utils import (all_flux_unit_conversion_equivs,
                                                flux_conversion_general,
                                                handle_squared_flux_unit_conversions)
 from jdaviz.core.user_api import PluginUserApi
-from jdaviz.utils import PRIHDR_KEY
+from jdaviz.utils import PRIHDR_KEY, parallelize_calculation, SharedArray, SharedArrayStore
 
 __all__ = ['SimpleAperturePhotometry']
 
+# batches with at least this many apertures are processed in parallel across datasets
+PARALLEL_MIN_APERTURES = 1000
+# apertures with shape parameters equal to this many decimals are evaluated together
+SHAPE_DECIMALS = 8
+
 
 @tray_registry('imviz-aper-phot-simple', label="Aperture Photometry",
                category="data:analysis")
@@ -147,6 +157,9 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
         self.current_plot_type = self.plot_types[0]
         self._fitted_models = {}
         self._fitted_model_name = 'phot_radial_profile'
+        # number of processes for batch photometry across datasets (see
+        # PARALLEL_MIN_APERTURES if None)
+        self.parallel_n_cpu = None
 
         # override default plot styling
         self.plot.figure.fig_margin = {'top': 60, 'bottom': 60, 'left': 65, 'right': 15}
@@ -598,47 +611,10 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                 color='error', sender=self,
                 traceback=e))
 
-    @with_spinner()
-    def calculate_photometry(self, dataset=None, aperture=None, background=None,
-                             background_value=None, pixel_area=None, counts_factor=None,
-                             flux_scaling=None, add_to_table=True, update_plots=True):
-        """
-        Calculate aperture photometry given the values set in the plugin or
-        any overrides provided as arguments here (which will temporarily
-        override plugin values for this calculation only).
-
-        Note: Values set in the plugin in Cubeviz are in the selected display unit
-        from the Unit conversion plugin. Overrides are, as the docstrings note,
-        assumed to be in the units of the selected dataset.
-
-        Parameters
-        ----------
-        dataset : str, optional
-            Dataset to use for photometry.
-        aperture : str, optional
-            Subset to use as the aperture.
-        background : str, optional
-            Subset to use to calculate the background.
-        background_value : float, optional
-            Background to subtract, same unit as data.  Automatically computed if ``background``
-            is set to a subset.
-        pixel_area : float, optional
-            Pixel area in arcsec squared, only used if data unit is a surface brightness unit.
-        counts_factor : float, optional
-            Factor to convert data unit to counts, in unit of flux/counts.
-        flux_scaling : float, optional
-            Same unit as data, used in -2.5 * log(flux / flux_scaling).
-        add_to_table : bool, optional
-        update_plots : bool, optional
-
-        Returns
-        -------
-        table row, fit results
-        """
-
-        if self.multiselect and (dataset is None or aperture is None):  # pragma: no cover
-            raise ValueError("for batch mode, use calculate_batch_photometry")
-
+    def _photometry_setup(self, dataset=None, background=None, background_value=None,
+                          pixel_area=None, counts_factor=None, flux_scaling=None):
+        # Resolve the inputs shared by all the apertures photometry is calculated for on a
+        # single dataset: the image (or cube slice), background and conversion factors.
         if dataset is not None:
             if dataset not in self.dataset.choices:  # pragma: no cover
                 raise ValueError(f"dataset must be one of {self.dataset.choices}")
@@ -647,34 +623,14 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             # we can use the pre-cached value
             data = self.dataset.selected_dc_item
 
+        is_cube = self.config == "cubeviz" and data.ndim > 2
         if data.ndim > 2:
             if "spectral_axis_index" in getattr(data, "meta", {}):
                 spectral_axis_index = data.meta["spectral_axis_index"]
             else:
                 spectral_axis_index = 0
-
-        if aperture is not None:
-            if aperture not in self.aperture.choices:
-                raise ValueError(f"aperture must be one of {self.aperture.choices}")
-
-        if aperture is not None or dataset is not None:
-            reg = self.aperture._get_spatial_region(subset=aperture if aperture is not None else self.aperture.selected,  # noqa
-                                                    dataset=dataset if dataset is not None else self.dataset.selected)  # noqa
-            # determine if a valid aperture (since selected_validity only applies to selected entry)
-            _, _, validity = self.aperture._get_mark_coords_and_validate(selected=aperture)
-            if not validity.get('is_aperture'):
-                raise ValueError(f"Selected aperture {aperture} is not valid: {validity.get('aperture_message')}")  # noqa
         else:
-            # use the pre-cached value
-            if not self.aperture.selected_validity.get('is_aperture'):
-                raise ValueError(f"Selected aperture is not valid: {self.aperture.selected_validity.get('aperture_message')}")  # noqa
-            reg = self.aperture.selected_spatial_region
-
-        # Reset last fitted model
-        fit_model = None
-        # TODO: remove _fitted_model_name cache?
-        if self._fitted_model_name in self._fitted_models:
-            del self._fitted_models[self._fitted_model_name]
+            spectral_axis_index = None
 
         comp = data.get_component(data.main_components[0])
         if comp.units:
@@ -735,7 +691,7 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
         except ValueError:  # Clearer error message
             raise ValueError('Missing or invalid background value')
 
-        if self.config == "cubeviz" and data.ndim > 2:
+        if is_cube:
             if spectral_axis_index == 0:
                 comp_data = comp.data[self._cubeviz_slice_ind, :, :]
             else:
@@ -749,31 +705,7 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             comp_data = comp.data  # ny, nx
             w = data.coords
 
-        if hasattr(reg, 'to_pixel'):
-            sky_center = reg.center
-            if self.config == "cubeviz" and data.ndim > 2:
-                ycenter, xcenter = w.world_to_pixel(self._cube_wave, sky_center)[1]
-            else:  # "imviz"
-                xcenter, ycenter = w.world_to_pixel(sky_center)
-        else:
-            xcenter = reg.center.x
-            ycenter = reg.center.y
-            if data.coords is not None:
-                if self.config == "cubeviz" and data.ndim > 2:
-                    if spectral_axis_index == 0:
-                        sky = w.pixel_to_world(xcenter, ycenter, self._cubeviz_slice_ind)
-                    else:
-                        sky = w.pixel_to_world(self._cubeviz_slice_ind, ycenter, xcenter)
-                    sky_center = [coord for coord in sky if hasattr(coord, "icrs")][0]
-                else:  # "imviz"
-                    sky_center = w.pixel_to_world(xcenter, ycenter)
-            else:
-                sky_center = None
-
-        aperture = regions2aperture(reg)
-        include_pixarea_fac = False
-        include_counts_fac = False
-        include_flux_scale = False
+        pixarea = ctfac = flux_scale = None
         if comp.units:
 
             # work for now in units of currently selected dataset (which may or
@@ -789,8 +721,8 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                     pixarea = float(pixel_area if pixel_area is not None else self.pixel_area)
                 except ValueError:  # Clearer error message
                     raise ValueError('Missing or invalid pixel area')
-                if not np.allclose(pixarea, 0):
-                    include_pixarea_fac = True
+                if np.allclose(pixarea, 0):
+                    pixarea = None
             if img_unit != u.count:
                 try:
                     ctfac = float(counts_factor if counts_factor is not None else self.counts_factor)  # noqa: E501
@@ -800,8 +732,8 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                     if ctfac < 0:
                         raise ValueError('Counts conversion factor cannot be negative '
                                          f'but got {ctfac}.')
-                if not np.allclose(ctfac, 0):
-                    include_counts_fac = True
+                if np.allclose(ctfac, 0):
+                    ctfac = None
 
             # if cubeviz and flux_scaling is provided as override, it is in the data units
             # if set in the app, it is in the display units and needs to be converted
@@ -822,24 +754,87 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                 flux_scale = float(flux_scaling if flux_scaling is not None else self.flux_scaling)
             except ValueError:  # Clearer error message
                 raise ValueError('Missing or invalid flux scaling')
-            if not np.allclose(flux_scale, 0):
-                include_flux_scale = True
-
-            # from now, we will just need the image unit as a string for display
-            img_unit = img_unit.to_string()
+            if np.allclose(flux_scale, 0):
+                flux_scale = None
 
-        else:
-            img_unit = None
+        return {'data': data, 'comp': comp, 'comp_data': comp_data, 'wcs': w, 'bg': bg,
+                'is_cube': is_cube, 'spectral_axis_index': spectral_axis_index,
+                'pixarea': pixarea, 'ctfac': ctfac, 'flux_scale': flux_scale}
 
-        phot_aperstats = ApertureStats(comp_data, aperture, wcs=data.coords, local_bkg=bg)
-        phot_table = phot_aperstats.to_table(columns=(
-            'id', 'sum', 'sum_aper_area',
-            'min', 'max', 'mean', 'median', 'mode', 'std', 'mad_std', 'var',
-            'biweight_location', 'biweight_midvariance', 'fwhm', 'semimajor_sigma',
-            'semiminor_sigma', 'orientation', 'eccentricity'))  # Some cols excluded, add back as needed.  # noqa
-        rawsum = phot_table['sum'][0]
+    def _photometry_region(self, dataset=None, aperture=None):
+        # Spatial region of an aperture on a dataset, raising if it is not a valid aperture.
+        if aperture is not None:
+            if aperture not in self.aperture.choices:
+                raise ValueError(f"aperture must be one of {self.aperture.choices}")
 
-        if include_pixarea_fac:
+        if aperture is not None or dataset is not None:
+            reg = self.aperture._get_spatial_region(subset=aperture if aperture is not None else self.aperture.selected,  # noqa
+                                                    dataset=dataset if dataset is not None else self.dataset.selected)  # noqa
+            # determine if a valid aperture (since selected_validity only applies to selected entry)
+            _, _, validity = self.aperture._get_mark_coords_and_validate(selected=aperture)
+            if not validity.get('is_aperture'):
+                raise ValueError(f"Selected aperture {aperture} is not valid: {validity.get('aperture_message')}")  # noqa
+        else:
+            # use the pre-cached value
+            if not self.aperture.selected_validity.get('is_aperture'):
+                raise ValueError(f"Selected aperture is not valid: {self.aperture.selected_validity.get('aperture_message')}")  # noqa
+            reg = self.aperture.selected_spatial_region
+        return reg
+
+    def _aperture_centers(self, setup, regs):
+        # Pixel and sky centers of the regions, converted with one WCS call for all of them.
+        data, w = setup['data'], setup['wcs']
+        xcenter = np.zeros(len(regs))
+        ycenter = np.zeros(len(regs))
+        is_sky = np.array([hasattr(reg, 'to_pixel') for reg in regs], dtype=bool)
+
+        sky_center = None
+        if is_sky.any():
+            sky_center = np.concatenate([np.atleast_1d(reg.center)
+                                         for reg, sky in zip(regs, is_sky) if sky])
+            if setup['is_cube']:
+                for i, center in zip(np.flatnonzero(is_sky), sky_center):
+                    ycenter[i], xcenter[i] = w.world_to_pixel(self._cube_wave, center)[1]
+            else:  # "imviz"
+                xcenter[is_sky], ycenter[is_sky] = w.world_to_pixel(sky_center)
+        if not is_sky.all():
+            xcenter[~is_sky] = [reg.center.x for reg, sky in zip(regs, is_sky) if not sky]
+            ycenter[~is_sky] = [reg.center.y for reg, sky in zip(regs, is_sky) if not sky]
+            if data.coords is not None:
+                if setup['is_cube']:
+                    n_pix = np.count_nonzero(~is_sky)
+                    slice_ind = np.full(n_pix, self._cubeviz_slice_ind)
+                    if setup['spectral_axis_index'] == 0:
+                        sky = w.pixel_to_world(xcenter[~is_sky], ycenter[~is_sky], slice_ind)
+                    else:
+                        sky = w.pixel_to_world(slice_ind, ycenter[~is_sky], xcenter[~is_sky])
+                    pix_sky_center = [coord for coord in sky if hasattr(coord, "icrs")][0]
+                else:  # "imviz"
+                    pix_sky_center = w.pixel_to_world(xcenter[~is_sky], ycenter[~is_sky])
+                if sky_center is None:
+                    sky_center = pix_sky_center
+                else:
+                    # restore the order of the regions
+                    order = np.argsort(np.concatenate([np.flatnonzero(is_sky),
+                                                       np.flatnonzero(~is_sky)]))
+                    sky_center = np.concatenate([sky_center,
+                                                 np.atleast_1d(pix_sky_center)])[order]
+
+        return xcenter, ycenter, sky_center
+
+    def _photometry_table(self, setup, regs, stats_table=None):
+        # Photometry table with one row per region.  ``stats_table`` are the statistics
+        # of the apertures from `_ApertureStatsWorker`, if already calculated.
+        data, comp, bg = setup['data'], setup['comp'], setup['bg']
+        xcenter, ycenter, sky_center = self._aperture_centers(setup, regs)
+        if stats_table is None:
+            stats_table = _ApertureStatsWorker(setup['comp_data'],
+                                               [regions2aperture(reg) for reg in regs],
+                                               wcs=data.coords, local_bkg=bg)()
+        phot_table = stats_table
+        rawsum = phot_table['sum']
+
+        if setup['pixarea'] is not None:
             # convert pixarea, which is in arcsec2/pix2 to the display solid angle unit / pix2
 
             if self.config in ('imviz', 'deconfigged'):
@@ -859,18 +854,18 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             if display_solid_angle_unit == PIX2:
                 pixarea_fac = 1 * PIX2
             else:
-                pixarea = pixarea * (u.arcsec * u.arcsec / PIX2)
+                pixarea = setup['pixarea'] * (u.arcsec * u.arcsec / PIX2)
                 # NOTE: Sum already has npix value encoded, so we simply apply the npix unit here.
                 # don't need to go though flux_conversion_general since these units
                 # arent per-pixel and won't need a workaround.
                 pixarea_fac = PIX2 * pixarea.to(display_solid_angle_unit / PIX2)
 
-            phot_table['sum'] = [rawsum * pixarea_fac]
+            phot_table['sum'] = rawsum * pixarea_fac
         else:
             pixarea_fac = None
 
-        if include_counts_fac:
-            ctfac = ctfac * (rawsum.unit / u.count)
+        if setup['ctfac'] is not None:
+            ctfac = setup['ctfac'] * (rawsum.unit / u.count)
             sum_ct = rawsum / ctfac
             sum_ct_err = np.sqrt(sum_ct.value) * sum_ct.unit
         else:
@@ -878,9 +873,9 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             sum_ct = None
             sum_ct_err = None
 
-        if include_flux_scale:
-            flux_scale = flux_scale * phot_table['sum'][0].unit
-            sum_mag = -2.5 * np.log10(phot_table['sum'][0] / flux_scale) * u.mag
+        if setup['flux_scale'] is not None:
+            flux_scale = setup['flux_scale'] * phot_table['sum'].unit
+            sum_mag = -2.5 * np.log10(phot_table['sum'] / flux_scale) * u.mag
         else:
             flux_scale = None
             sum_mag = None
@@ -889,7 +884,7 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
         phot_table.add_columns(
             [xcenter * u.pix, ycenter * u.pix, sky_center,
              bg, pixarea_fac, sum_ct, sum_ct_err, ctfac, sum_mag, flux_scale, data.label,
-             reg.meta.get('label', ''), Time(datetime.now(tz=timezone.utc))],
+             [reg.meta.get('label', '') for reg in regs], Time(datetime.now(tz=timezone.utc))],
             names=['xcenter', 'ycenter', 'sky_center', 'background', 'pixarea_tot',
                    'aperture_sum_counts', 'aperture_sum_counts_err', 'counts_fac',
                    'aperture_sum_mag', 'flux_scaling',
@@ -923,7 +918,7 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                         phot_table['background'] = bg_conv
 
                     phot_sum = phot_table['sum']
-                    if include_pixarea_fac:
+                    if pixarea_fac is not None:
                         if phot_sum.unit != (display_unit * pixarea_fac).unit:
                             phot_table['sum'] = flux_conversion_general(phot_sum.value,
                                                                         phot_sum.unit,
@@ -955,113 +950,190 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                                                                         equivs)
                             phot_table[key] = conv
 
-        if add_to_table:
-            try:
-                phot_table['id'][0] = self.table._qtable['id'].max() + 1
-                self.table.add_item(phot_table)
-            except Exception:  # Discard incompatible QTable
-                self.table.clear_table()
-                phot_table['id'][0] = 1
-                self.table.add_item(phot_table)
+        return phot_table
+
+    def _add_photometry_rows(self, phot_table):
+        try:
+            phot_table['id'] = self.table._qtable['id'].max() + 1 + np.arange(len(phot_table))
+            self.table.add_items(phot_table)
+        except Exception:  # Discard incompatible QTable
+            self.table.clear_table()
+            phot_table['id'] = 1 + np.arange(len(phot_table))
+            self.table.add_items(phot_table)
+
+        # User wants 'sum' as scientific notation.
+        self.table._qtable['sum'].info.format = '.6e'
+
+    @with_spinner()
+    def calculate_photometry(self, dataset=None, aperture=None, background=None,
+                             background_value=None, pixel_area=None, counts_factor=None,
+                             flux_scaling=None, add_to_table=True, update_plots=True):
+        """
+        Calculate aperture photometry given the values set in the plugin or
+        any overrides provided as arguments here (which will temporarily
+        override plugin values for this calculation only).
+
+        Note: Values set in the plugin in Cubeviz are in the selected display unit
+        from the Unit conversion plugin. Overrides are, as the docstrings note,
+        assumed to be in the units of the selected dataset.
+
+        Parameters
+        ----------
+        dataset : str, optional
+            Dataset to use for photometry.
+        aperture : str, optional
+            Subset to use as the aperture.
+        background : str, optional
+            Subset to use to calculate the background.
+        background_value : float, optional
+            Background to subtract, same unit as data.  Automatically computed if ``background``
+            is set to a subset.
+        pixel_area : float, optional
+            Pixel area in arcsec squared, only used if data unit is a surface brightness unit.
+        counts_factor : float, optional
+            Factor to convert data unit to counts, in unit of flux/counts.
+        flux_scaling : float, optional
+            Same unit as data, used in -2.5 * log(flux / flux_scaling).
+        add_to_table : bool, optional
+        update_plots : bool, optional
+
+        Returns
+        -------
+        table row, fit results
+        """
+
+        if self.multiselect and (dataset is None or aperture is None):  # pragma: no cover
+            raise ValueError("for batch mode, use calculate_batch_photometry")
+
+        if dataset is not None and dataset not in self.dataset.choices:  # pragma: no cover
+            raise ValueError(f"dataset must be one of {self.dataset.choices}")
+        reg = self._photometry_region(dataset=dataset, aperture=aperture)
+
+        # Reset last fitted model
+        # TODO: remove _fitted_model_name cache?
+        if self._fitted_model_name in self._fitted_models:
+            del self._fitted_models[self._fitted_model_name]
+
+        setup = self._photometry_setup(dataset=dataset, background=background,
+                                       background_value=background_value,
+                                       pixel_area=pixel_area, counts_factor=counts_factor,
+                                       flux_scaling=flux_scaling)
+        phot_table = self._photometry_table(setup, [reg])
 
-            # User wants 'sum' as scientific notation.
-            self.table._qtable['sum'].info.format = '.6e'
+        if add_to_table:
+            self._add_photometry_rows(phot_table)
 
-        # Plots.
         if update_plots:
+            fit_model = self._update_photometry_plots(setup, reg, phot_table[0])
+        else:
+            fit_model = None
+        self._update_photometry_results(setup, phot_table[0], fit_model, update_plots)
+
+        return phot_table, fit_model
+
+    def _update_photometry_plots(self, setup, reg, phot_row):
+        data, comp_data, bg = setup['data'], setup['comp_data'], setup['bg']
+        xcenter, ycenter = phot_row['xcenter'].value, phot_row['ycenter'].value
+        img_unit = u.Unit(setup['comp'].units).to_string() if setup['comp'].units else None
+        aperture = regions2aperture(reg)
+        pixarea_fac = phot_row['pixarea_tot']
+        fit_model = None
 
-            # for cubeviz unit conversion display units
-            if self.display_unit != '':
-                plot_display_unit = self.display_unit
+        # for cubeviz unit conversion display units
+        if self.display_unit != '':
+            plot_display_unit = self.display_unit
+        else:
+            plot_display_unit = None
+
+        if self.current_plot_type == "Curve of Growth":
+            if setup['is_cube']:
+                self.plot.figure.title = f'Curve of growth from aperture center at {self._cube_wave:.4e}'  # noqa: E501
+                eqv = u.spectral_density(self._cube_wave)
+            else:
+                self.plot.figure.title = 'Curve of growth from aperture center'
+                eqv = []
+            x_arr, sum_arr, x_label, y_label = _curve_of_growth(
+                comp_data, (xcenter, ycenter), aperture, wcs=data.coords, background=bg,
+                pixarea_fac=pixarea_fac, image_unit=img_unit, display_unit=plot_display_unit,
+                equivalencies=eqv)
+            self.plot._update_data('profile', x=x_arr, y=sum_arr, reset_lims=True)
+            self.plot.update_style('profile', line_visible=True, color='gray', size=32)
+            self.plot.update_style('fit', visible=False)
+            self.plot.figure.axes[0].label = x_label
+            self.plot.figure.axes[1].label = y_label
+
+        else:  # Radial profile
+            bbox = ApertureStats(comp_data, aperture, wcs=data.coords).bbox
+            self.plot.figure.axes[0].label = 'pix'
+            if plot_display_unit:
+                self.plot.figure.axes[1].label = plot_display_unit
             else:
-                plot_display_unit = None
+                self.plot.figure.axes[1].label = img_unit or 'Value'
 
-            if self.current_plot_type == "Curve of Growth":
-                if self.config == "cubeviz" and data.ndim > 2:
-                    self.plot.figure.title = f'Curve of growth from aperture center at {slice_val:.4e}'  # noqa: E501
+            if self.current_plot_type == "Radial Profile":
+                if setup['is_cube']:
+                    self.plot.figure.title = f'Radial profile from aperture center at {self._cube_wave:.4e}'  # noqa: E501
                     eqv = u.spectral_density(self._cube_wave)
                 else:
-                    self.plot.figure.title = 'Curve of growth from aperture center'
+                    self.plot.figure.title = 'Radial profile from aperture center'
                     eqv = []
-                x_arr, sum_arr, x_label, y_label = _curve_of_growth(
-                    comp_data, (xcenter, ycenter), aperture, wcs=data.coords, background=bg,
-                    pixarea_fac=pixarea_fac, image_unit=img_unit, display_unit=plot_display_unit,
-                    equivalencies=eqv)
-                self.plot._update_data('profile', x=x_arr, y=sum_arr, reset_lims=True)
+                x_data, y_data = _radial_profile(
+                    comp_data, bbox, (xcenter, ycenter),
+                    raw=False, image_unit=img_unit, display_unit=plot_display_unit,
+                    equivalencies=eqv, background=bg)
+                self.plot._update_data('profile', x=x_data, y=y_data, reset_lims=True)
                 self.plot.update_style('profile', line_visible=True, color='gray', size=32)
-                self.plot.update_style('fit', visible=False)
-                self.plot.figure.axes[0].label = x_label
-                self.plot.figure.axes[1].label = y_label
 
-            else:  # Radial profile
-                self.plot.figure.axes[0].label = 'pix'
-                if plot_display_unit:
-                    self.plot.figure.axes[1].label = plot_display_unit
+            else:  # Radial Profile (Raw)
+                if setup['is_cube']:
+                    self.plot.figure.title = f'Raw radial profile from aperture center at {self._cube_wave:.4e}'  # noqa: E501
                 else:
-                    self.plot.figure.axes[1].label = img_unit or 'Value'
+                    self.plot.figure.title = 'Raw radial profile from aperture center'
+                x_data, y_data = _radial_profile(
+                    comp_data, bbox, (xcenter, ycenter), raw=True,
+                    image_unit=img_unit, display_unit=plot_display_unit, background=bg)
+
+                self.plot._update_data('profile', x=x_data, y=y_data, reset_lims=True)
+                self.plot.update_style('profile', line_visible=False, color='gray', size=10)
+
+            # Fit Gaussian1D to radial profile data.
+            # Even though photutils radial profile has gaussian fit option, the fit is done
+            # before Jdaviz unit conversion, so we do our own fit here after unit conversion.
+            if self.fit_radial_profile:
+                fitter = TRFLSQFitter()
+                y_max = np.nanmax(y_data)
+                x_mean = np.nanmean(x_data[np.where(y_data == y_max)])
+                std = 0.5 * (phot_row['semimajor_sigma'] + phot_row['semiminor_sigma'])
+                if isinstance(std, u.Quantity):
+                    std = std.value
+                gs = Gaussian1D(amplitude=y_max, mean=x_mean, stddev=std,
+                                fixed={'amplitude': True},
+                                bounds={'amplitude': (y_max * 0.5, y_max)})
+                with warnings.catch_warnings(record=True) as warns:
+                    fit_model = fitter(gs, x_data, y_data, filter_non_finite=True)
+                if len(warns) > 0:
+                    msg = os.linesep.join([str(w.message) for w in warns])
+                    self.hub.broadcast(SnackbarMessage(
+                        f"Radial profile fitting: {msg}", color='warning', sender=self))
+                y_fit = fit_model(x_data)
+                self._fitted_models[self._fitted_model_name] = fit_model
+                self.plot._update_data('fit', x=x_data, y=y_fit, reset_lims=True)
+                self.plot.update_style('fit', color='magenta',
+                                       markers_visible=False, line_visible=True)
+            else:
+                self.plot.update_style('fit', visible=False)
 
-                if self.current_plot_type == "Radial Profile":
-                    if self.config == "cubeviz" and data.ndim > 2:
-                        self.plot.figure.title = f'Radial profile from aperture center at {slice_val:.4e}'  # noqa: E501
-                        eqv = u.spectral_density(self._cube_wave)
-                    else:
-                        self.plot.figure.title = 'Radial profile from aperture center'
-                        eqv = []
-                    x_data, y_data = _radial_profile(
-                        comp_data, phot_aperstats.bbox, (xcenter, ycenter),
-                        raw=False, image_unit=img_unit, display_unit=plot_display_unit,
-                        equivalencies=eqv, background=bg)
-                    self.plot._update_data('profile', x=x_data, y=y_data, reset_lims=True)
-                    self.plot.update_style('profile', line_visible=True, color='gray', size=32)
-
-                else:  # Radial Profile (Raw)
-                    if self.config == "cubeviz" and data.ndim > 2:
-                        self.plot.figure.title = f'Raw radial profile from aperture center at {slice_val:.4e}'  # noqa: E501
-                    else:
-                        self.plot.figure.title = 'Raw radial profile from aperture center'
-                    x_data, y_data = _radial_profile(
-                        comp_data, phot_aperstats.bbox, (xcenter, ycenter), raw=True,
-                        image_unit=img_unit, display_unit=plot_display_unit, background=bg)
-
-                    self.plot._update_data('profile', x=x_data, y=y_data, reset_lims=True)
-                    self.plot.update_style('profile', line_visible=False, color='gray', size=10)
-
-                # Fit Gaussian1D to radial profile data.
-                # Even though photutils radial profile has gaussian fit option, the fit is done
-                # before Jdaviz unit conversion, so we do our own fit here after unit conversion.
-                if self.fit_radial_profile:
-                    fitter = TRFLSQFitter()
-                    y_max = np.nanmax(y_data)
-                    x_mean = np.nanmean(x_data[np.where(y_data == y_max)])
-                    std = 0.5 * (phot_table['semimajor_sigma'][0] +
-                                 phot_table['semiminor_sigma'][0])
-                    if isinstance(std, u.Quantity):
-                        std = std.value
-                    gs = Gaussian1D(amplitude=y_max, mean=x_mean, stddev=std,
-                                    fixed={'amplitude': True},
-                                    bounds={'amplitude': (y_max * 0.5, y_max)})
-                    with warnings.catch_warnings(record=True) as warns:
-                        fit_model = fitter(gs, x_data, y_data, filter_non_finite=True)
-                    if len(warns) > 0:
-                        msg = os.linesep.join([str(w.message) for w in warns])
-                        self.hub.broadcast(SnackbarMessage(
-                            f"Radial profile fitting: {msg}", color='warning', sender=self))
-                    y_fit = fit_model(x_data)
-                    self._fitted_models[self._fitted_model_name] = fit_model
-                    self.plot._update_data('fit', x=x_data, y=y_fit, reset_lims=True)
-                    self.plot.update_style('fit', color='magenta',
-                                           markers_visible=False, line_visible=True)
-                else:
-                    self.plot.update_style('fit', visible=False)
+        return fit_model
 
+    def _update_photometry_results(self, setup, phot_row, fit_model=None, update_plots=True):
         # Parse results for GUI.
         tmp = []
-        for key in phot_table.colnames:
+        for key in phot_row.colnames:
             if key in ('id', 'data_label', 'subset_label', 'background', 'pixarea_tot',
                        'counts_fac', 'aperture_sum_counts_err', 'flux_scaling', 'timestamp'):
                 continue
 
-            x = phot_table[key][0]
+            x = phot_row[key]
 
             if isinstance(x, u.Quantity):  # split up unit and value to put in different cols
                 unit = x.unit.to_string()
@@ -1085,12 +1157,13 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
                 tmp.append({'function': key, 'result': f'{x:.1f}', 'unit': unit})
             elif key == 'aperture_sum_counts' and x is not None:
                 tmp.append({'function': key, 'result':
-                            f'{x:.4e} ({phot_table["aperture_sum_counts_err"][0]:.4e})',
+                            f'{x:.4e} ({phot_row["aperture_sum_counts_err"]:.4e})',
                             'unit': unit})
             elif key == 'aperture_sum_mag' and x is not None:
                 tmp.append({'function': key, 'result': f'{x:.3f}', 'unit': unit})
             elif key == 'slice_wave':
-                if data.ndim > 2:
+                if setup['data'].ndim > 2:
+                    slice_val = phot_row['slice_wave']
                     tmp.append({'function': key, 'result': f'{slice_val.value:.4e}', 'unit': slice_val.unit.to_string()})  # noqa: E501
             else:
                 tmp.append({'function': key, 'result': str(x), 'unit': unit})
@@ -1112,8 +1185,6 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             self.fit_results = fit_tmp
             self.plot_available = True
 
-        return phot_table, fit_model
-
     def vue_do_aper_phot(self, *args, **kwargs):
         if self.dataset_selected == '' or self.aperture_selected == '':
             self.hub.broadcast(SnackbarMessage(
@@ -1240,6 +1311,12 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
         To provide a list of values per-input, use `unpack_batch_options` to and pass that as input
         here.
 
+        Options that only differ by ``aperture`` are calculated together: their data,
+        background and conversion factors are only resolved once, the statistics of their
+        apertures are calculated in one pass over the image, and the results of all the
+        options are added to the table at once.  Large batches over several datasets are
+        processed in parallel.
+
         Parameters
         ----------
         options : list
@@ -1263,10 +1340,13 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             # unpack the batch options as provided in the app
             options = self.unpack_batch_options()
 
-        failed_iters, exceptions = [], []
+        failures = {}
+
+        # group the options that only differ by aperture, so that the inputs shared by
+        # the apertures (data, background, conversion factors) are resolved once per group
+        # and the statistics of all of its apertures are calculated together
+        groups = {}
         for i, option in enumerate(options):
-            # only update plots on the last iteration
-            this_update_plots = i == len(options) and update_plots
             defaults = self._get_defaults_from_metadata(option.get('dataset',
                                                                    self.dataset.selected))
             if self.pixel_area_multi_auto:
@@ -1274,19 +1354,117 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
             if self.flux_scaling_multi_auto:
                 option.setdefault('flux_scaling', defaults.get('flux_scaling', 0))
 
+            shared = {k: v for k, v in option.items() if k != 'aperture'}
+            key = tuple(sorted(shared.items(), key=lambda item: item[0]))
+            try:
+                hash(key)
+            except TypeError:
+                key = i
+            groups.setdefault(key, (shared, []))[1].append((i, option.get('aperture')))
+
+        batches = []
+        for shared, apertures in groups.values():
+            try:
+                setup = self._photometry_setup(**shared)
+            except Exception as e:
+                failures.update({i: e for i, _ in apertures})
+                continue
+
+            batch = {'setup': setup, 'regs': [], 'indices': []}
+            for i, aperture in apertures:
+                try:
+                    reg = self._photometry_region(dataset=shared.get('dataset'),
+                                                  aperture=aperture)
+                except Exception as e:
+                    failures[i] = e
+                else:
+                    batch['regs'].append(reg)
+                    batch['indices'].append(i)
+            if len(batch['regs']):
+                batch['worker'] = _ApertureStatsWorker(
+                    setup['comp_data'], [regions2aperture(reg) for reg in batch['regs']],
+                    wcs=setup['data'].coords, local_bkg=setup['bg'])
+                batches.append(batch)
+
+        # the apertures of different datasets are processed in parallel
+        n_cpu = self.parallel_n_cpu
+        if n_cpu is None:
+            n_apertures = sum(len(batch['regs']) for batch in batches)
+            n_cpu = mp.cpu_count() - 1 if n_apertures >= PARALLEL_MIN_APERTURES else 1
+        stats_tables = []
+        if n_cpu > 1 and len(batches) > 1:
+            try:
+                # the images are shared with the worker processes through memory-mapped
+                # buffers instead of being pickled into every task
+                with SharedArrayStore() as store:
+                    shared_images = {}
+                    workers = []
+                    for batch in batches:
+                        image = batch['setup']['comp_data']
+                        if id(image) not in shared_images:
+                            shared_images[id(image)] = store.put(image)
+                        workers.append(batch['worker'].with_data(shared_images[id(image)]))
+                    parallelize_calculation(workers, stats_tables.append, n_cpu=n_cpu)
+            except (pickle.PicklingError, TypeError, AttributeError, BrokenProcessPool) as e:
+                # e.g., a WCS that cannot be sent to the worker processes,
+                # fall back on calculating them here
+                self.hub.broadcast(SnackbarMessage(
+                    f"Could not calculate photometry in parallel ({e!r}), "
+                    "calculating it sequentially", color='warning', sender=self))
+                stats_tables = []
+        if len(stats_tables) == len(batches):
+            for batch, stats_table in zip(batches, stats_tables):
+                batch['stats'] = stats_table
+
+        phot_batches = []
+        for batch in batches:
             try:
-                self.calculate_photometry(add_to_table=add_to_table,
-                                          update_plots=this_update_plots,
-                                          **option)
+                if 'stats' not in batch:
+                    batch['stats'] = batch['worker']()
+                elif isinstance(batch['stats'], Exception):
+                    raise batch['stats']
+                batch['table'] = self._photometry_table(batch['setup'], batch['regs'],
+                                                        stats_table=batch['stats'])
             except Exception as e:
-                failed_iters.append(i)
-                if full_exceptions:
-                    exceptions.append(e)
+                failures.update({i: e for i in batch['indices']})
+            else:
+                phot_batches.append(batch)
 
-        if len(failed_iters):
+        if len(phot_batches):
+            if add_to_table:
+                # write all the rows at once, in the order of the options
+                try:
+                    phot_table = vstack([batch['table'] for batch in phot_batches],
+                                        join_type='exact', metadata_conflicts='silent')
+                except Exception:
+                    # e.g., datasets with different units, add the rows one by one,
+                    # still in the order of the options
+                    rows = sorted((i, batch['table'], row)
+                                  for batch in phot_batches
+                                  for row, i in enumerate(batch['indices']))
+                    for _, table, row in rows:
+                        self._add_photometry_rows(table[row:row + 1])
+                else:
+                    order = np.argsort(np.concatenate([batch['indices']
+                                                       for batch in phot_batches]))
+                    self._add_photometry_rows(phot_table[order])
+
+            # show the results (and plots) of the last successful option
+            last = max(phot_batches, key=lambda batch: batch['indices'][-1])
+            fit_model = None
+            if update_plots:
+                if self._fitted_model_name in self._fitted_models:
+                    del self._fitted_models[self._fitted_model_name]
+                fit_model = self._update_photometry_plots(last['setup'], last['regs'][-1],
+                                                          last['table'][-1])
+            self._update_photometry_results(last['setup'], last['table'][-1], fit_model,
+                                            update_plots)
+
+        if len(failures):
+            failed_iters = sorted(failures)
             err_msg = f"inputs {failed_iters} failed and were skipped."
             if full_exceptions:
-                err_msg += f"  Exception messages: {exceptions}"
+                err_msg += f"  Exception messages: {[failures[i] for i in failed_iters]}"
             else:
                 err_msg += "  To see full exceptions, run individually or pass full_exceptions=True"  # noqa
             raise RuntimeError(err_msg)
@@ -1295,6 +1473,94 @@ class SimpleAperturePhotometry(PluginTemplateMixin, ApertureSubsetSelectMixin,
 # NOTE: These are hidden because the APIs are for internal use only
 # but we need them as a separate functions for unit testing.
 
+def _stack_apertures(apertures):
+    """Combine apertures of the same class and shape into apertures with multiple positions.
+
+    Parameters
+    ----------
+    apertures : list
+        ``photutils`` apertures, each with a single position.
+
+    Returns
+    -------
+    stacks : list of tuple
+        The indices in ``apertures`` of each combined aperture, and the aperture.
+
+    """
+    stacks = {}
+    for i, aperture in enumerate(apertures):
+        shape = {name: getattr(aperture, name)
+                 for name in aperture._params if name != 'positions'}
+        # shapes that only differ by round-off (e.g., sky apertures of regions drawn with
+        # the same pixel shape) are combined, with the shape of the first aperture
+        key = (type(aperture), isinstance(aperture.positions, SkyCoord),
+               tuple((name, str(getattr(value, 'unit', '')),
+                      round(float(getattr(value, 'value', value)), SHAPE_DECIMALS))
+                     for name, value in shape.items()))
+        stacks.setdefault(key, (shape, []))[1].append(i)
+
+    result = []
+    for (cls, is_sky, _), (shape, indices) in stacks.items():
+        if is_sky:
+            positions = np.concatenate([np.atleast_1d(apertures[i].positions)
+                                        for i in indices])
+        else:
+            positions = np.array([apertures[i].positions for i in indices])
+        result.append((indices, cls(positions, **shape)))
+    return result
+
+
+class _ApertureStatsWorker:
+    """Callable calculating the ``ApertureStats`` table of many apertures on one image.
+
+    Apertures of the same shape are evaluated together (see `_stack_apertures`), and
+    the rows are returned in the order of ``apertures``.  ``data`` can be given as a
+    `~jdaviz.utils.SharedArray` handle (see `with_data`), in which case the exception
+    raised by the calculation, if any, is returned instead of raised, so that the
+    other workers run in parallel are not cancelled.
+
+    """
+    columns = ('id', 'sum', 'sum_aper_area',
+               'min', 'max', 'mean', 'median', 'mode', 'std', 'mad_std', 'var',
+               'biweight_location', 'biweight_midvariance', 'fwhm', 'semimajor_sigma',
+               'semiminor_sigma', 'orientation', 'eccentricity')  # Some cols excluded, add back as needed.  # noqa
+
+    def __init__(self, data, apertures, wcs=None, local_bkg=0, unit=None):
+        self.data = data
+        self.apertures = apertures
+        self.wcs = wcs
+        self.local_bkg = local_bkg
+        self.unit = unit
+
+    def with_data(self, data):
+        """Return the same worker for ``data`` (e.g., a shared copy of the image)."""
+        return _ApertureStatsWorker(data, self.apertures, wcs=self.wcs,
+                                    local_bkg=self.local_bkg,
+                                    unit=getattr(self.data, 'unit', self.unit))
+
+    def __call__(self):
+        if not isinstance(self.data, SharedArray):
+            return self._calculate(self.data)
+        data = self.data.asarray()
+        if self.unit is not None:
+            data = data << self.unit
+        try:
+            return self._calculate(data)
+        except Exception as e:
+            return e
+
+    def _calculate(self, data):
+        tables, indices = [], []
+        for stack_indices, aperture in _stack_apertures(self.apertures):
+            phot_aperstats = ApertureStats(data, aperture, wcs=self.wcs,
+                                           local_bkg=self.local_bkg)
+            tables.append(phot_aperstats.to_table(columns=self.columns))
+            indices += stack_indices
+        if len(tables) == 1:
+            return tables[0][np.argsort(indices)]
+        return vstack(tables, metadata_conflicts='silent')[np.argsort(indices)]
+
+
 def _radial_profile(data, reg_bb, centroid, raw=False,
                     image_unit=None, display_unit=None, equivalencies=[], background=0):
     """Calculate radial profile.
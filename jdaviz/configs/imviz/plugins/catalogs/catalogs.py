@@ -19,6 +19,7 @@ from jdaviz.core.marks import CatalogMark
 from jdaviz.core.template_mixin import Table, TableMixin
 from jdaviz.core.user_api import PluginUserApi
 from jdaviz.utils import get_top_layer_index
+from jdaviz.configs.imviz.plugins.catalogs.tile_cache import CatalogTileCache
 
 __all__ = ['Catalogs']
 
@@ -40,6 +41,9 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
     * :meth:`zoom_to_selected`
     * :meth:`search`
     * :attr:`max_sources`
+    * ``cache_queries``:
+      Whether to serve SDSS and Gaia searches from a local on-disk cache of sky tiles, only
+      querying the tiles not fetched before.  Disabled by default.
     * ``catalog`` (:class:`~jdaviz.core.template_mixin.SelectPluginComponent`)
     * ``table`` (:class:`~jdaviz.core.template_mixin.Table`):
       Table containing all search results.
@@ -53,6 +57,7 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
     results_available = Bool(False).tag(sync=True)
     number_of_results = Int(0).tag(sync=True)
     max_sources = IntHandleEmpty(1000).tag(sync=True)
+    cache_queries = Bool(False).tag(sync=True)
 
     # setting the default table headers and values
     _default_table_values = {
@@ -97,6 +102,9 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
         # set the custom file parser for importing catalogs
         self.catalog._file_parser = self._file_parser
         self._marker_name = 'catalog_results'
+        # on-disk caches of catalog queries, by catalog
+        self._tile_caches = {}
+        self._tile_cache_dir = None
 
         # initializing the headers in the table that is displayed in the UI
         self.table.headers_avail = self.headers
@@ -146,7 +154,7 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
         return PluginUserApi(self, expose=('clear_table', 'export_table', 'import_catalog',
                                            'zoom_to_selected', 'select_rows',
                                            'select_all', 'select_none',
-                                           'catalog', 'max_sources', 'search',
+                                           'catalog', 'max_sources', 'cache_queries', 'search',
                                            'table', 'table_selected'))
 
     @staticmethod
@@ -182,6 +190,41 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
             self.table.selected_rows += [item]
         self._table_selection_changed()
 
+    def _get_tile_cache(self, catalog):
+        if catalog in self._tile_caches:
+            return self._tile_caches[catalog]
+
+        if catalog == 'SDSS':
+            from astroquery.sdss import SDSS
+
+            def query_func(center, radius):
+                return SDSS.query_region(center, radius=radius, data_release=17)
+
+            # SDSS cone searches are limited to a radius of 3 arcmin
+            cache = CatalogTileCache(query_func, key='SDSS-dr17', tile_size=2.5 * u.arcmin,
+                                     cache_dir=self._tile_cache_dir)
+        elif catalog == 'Gaia':
+            from astroquery.gaia import Gaia
+
+            def query_func(center, radius):
+                # tiles must be complete to be cached, without changing the row limit
+                # of other Gaia queries
+                row_limit, Gaia.ROW_LIMIT = Gaia.ROW_LIMIT, -1
+                try:
+                    return Gaia.query_object(center, radius=radius,
+                                             columns=('source_id', 'ra', 'dec'))
+                finally:
+                    Gaia.ROW_LIMIT = row_limit
+
+            cache = CatalogTileCache(query_func, key=f'Gaia-{Gaia.MAIN_GAIA_TABLE}-source_id,ra,dec',  # noqa
+                                     tile_size=0.2 * u.deg, cache_dir=self._tile_cache_dir)
+        else:
+            raise ValueError(f"{catalog} queries cannot be cached, "
+                             "only SDSS and Gaia queries can")
+
+        self._tile_caches[catalog] = cache
+        return cache
+
     @with_spinner()
     def search(self, error_on_fail=False):
         """Search the catalog, display markers on the viewer, and return results if available.
@@ -246,8 +289,13 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
                         f"{zoom_radius.to(u.arcmin)}, using {r_max}.",
                         color='warning', sender=self))
                     zoom_radius = r_max
-                query_region_result = SDSS.query_region(skycoord_center, radius=zoom_radius,
-                                                        data_release=17)
+                if self.cache_queries:
+                    query_region_result = self._get_tile_cache('SDSS').query(skycoord_center,
+                                                                             zoom_radius)
+                else:
+                    query_region_result = SDSS.query_region(skycoord_center,
+                                                            radius=zoom_radius,
+                                                            data_release=17)
                 if len(query_region_result) > self.max_sources:
                     query_region_result = query_region_result[:self.max_sources]
                     max_sources_used = True
@@ -275,16 +323,27 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
         elif self.catalog_selected == 'Gaia':
             from astroquery.gaia import Gaia
 
-            Gaia.ROW_LIMIT = self.max_sources
-            sources = Gaia.query_object(skycoord_center, radius=zoom_radius,
-                                        columns=('source_id', 'ra', 'dec')
-                                        )
+            if self.cache_queries:
+                sources = self._get_tile_cache('Gaia').query(skycoord_center, zoom_radius)
+                if sources is None:
+                    sources = AstropyTable(names=('source_id', 'ra', 'dec', 'dist'))
+                # cached tiles have all the sources, closest ones first
+                sources['dist'] = skycoord_center.separation(
+                    SkyCoord(sources['ra'], sources['dec'], unit='deg')).deg
+                if len(sources) >= self.max_sources:
+                    sources = sources[:self.max_sources]
+                    max_sources_used = True
+            else:
+                Gaia.ROW_LIMIT = self.max_sources
+                sources = Gaia.query_object(skycoord_center, radius=zoom_radius,
+                                            columns=('source_id', 'ra', 'dec')
+                                            )
+                if len(sources) == self.max_sources:
+                    max_sources_used = True
             if "SOURCE_ID" in sources.colnames:  # Case could flip non-deterministically
                 src_id_colname = "SOURCE_ID"
             else:
                 src_id_colname = "source_id"
-            if len(sources) == self.max_sources:
-                max_sources_used = True
             self.app._catalog_source_table = sources
 
         elif self.catalog_selected == 'From File...':
@@ -327,68 +386,56 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
         elif self.catalog_selected in ["From File..."]:
             skycoords = self.app._catalog_source_table['sky_centroid']
 
-        pixel_table = viewer.state.reference_data.coords.world_to_pixel(skycoords)
-        self.app._catalog_source_table['x_coord'] = pixel_table[0]
-        self.app._catalog_source_table['y_coord'] = pixel_table[1]
-        x_coordinates = []
-        y_coordinates = []
+        # single WCS transform for all sources, then a boolean mask of those in view
+        x_coords, y_coords = viewer.state.reference_data.coords.world_to_pixel(skycoords)
+        in_view = ~((x_coords < zoom_x_min) | (x_coords > zoom_x_max) |
+                    (y_coords < zoom_y_min) | (y_coords > zoom_y_max))
         source_table = self.app._catalog_source_table
-        mask = ((source_table['x_coord'] < zoom_x_min) |
-                (source_table['x_coord'] > zoom_x_max) |
-                (source_table['y_coord'] < zoom_y_min) |
-                (source_table['y_coord'] > zoom_y_max))
-        self.app._catalog_source_table = self.app._catalog_source_table[~mask]
-        skycoords = skycoords[~mask]
+        source_table['x_coord'] = x_coords
+        source_table['y_coord'] = y_coords
+        self.app._catalog_source_table = source_table = source_table[in_view]
+        skycoords = skycoords[in_view]
 
+        # build the table rows column by column and add them all at once
+        row_ids = np.arange(len(self.table), len(self.table) + len(source_table))
         if self.catalog_selected in ["SDSS", "Gaia"]:
-            for row in self.app._catalog_source_table:
-                x_coordinates.append(row['x_coord'])
-                y_coordinates.append(row['y_coord'])
-                row_id = row[src_id_colname]
-                # Check if the row contains the required keys
-                row_info = {'Right Ascension (degrees)': row['ra'],
-                            'Declination (degrees)': row['dec'],
-                            'Object ID': row_id.astype(str),
-                            'id': len(self.table),
-                            'x_coord': row['x_coord'],
-                            'y_coord': row['y_coord']}
-                self.table.add_item(row_info)
-
-        # NOTE: If performance becomes a problem, see
-        # https://docs.astropy.org/en/stable/table/index.html#performance-tips
+            rows = QTable({'Right Ascension (degrees)': _column_values(source_table['ra']),
+                           'Declination (degrees)': _column_values(source_table['dec']),
+                           'Object ID': _column_values(source_table[src_id_colname]).astype(str),
+                           'id': row_ids,
+                           'x_coord': _column_values(source_table['x_coord']),
+                           'y_coord': _column_values(source_table['y_coord'])})
+
         elif self.catalog_selected in ["From File..."]:
-            for row in self.app._catalog_source_table:  # noqa:E501
-                row_info = {
-                    'Right Ascension (degrees)': row['sky_centroid'].ra.deg,
-                    'Declination (degrees)': row['sky_centroid'].dec.deg,
-                    'Object ID': str(row.get('label', f"{len(self.table) + 1}")),
-                    'id': len(self.table),
-                    'x_coord': row['x_coord'],
-                    'y_coord': row['y_coord'],
-                }
-                x_coordinates.append(row['x_coord'])
-                y_coordinates.append(row['y_coord'])
-                # Add sky_centroid and label explicitly to row_info
-                row_info['sky_centroid'] = row['sky_centroid']
-                row_info['label'] = row_info['Object ID']
-                for col in table.colnames:
-                    if col not in self.headers:  # Skip already processed columns
-                        row_info[col] = row[col]
-
-                self.table.add_item(row_info)
-
-        filtered_skycoords = viewer.state.reference_data.coords.pixel_to_world(x_coordinates,
-                                                                               y_coordinates)
+            if 'label' in source_table.colnames:
+                object_ids = _column_values(source_table['label']).astype(str)
+            else:
+                object_ids = (row_ids + 1).astype(str)
+            rows = QTable({'Right Ascension (degrees)': skycoords.ra.deg,
+                           'Declination (degrees)': skycoords.dec.deg,
+                           'Object ID': object_ids,
+                           'id': row_ids,
+                           'x_coord': _column_values(source_table['x_coord']),
+                           'y_coord': _column_values(source_table['y_coord']),
+                           'sky_centroid': skycoords,
+                           'label': object_ids})
+            # all other columns of the input table are added as is
+            for col in table.colnames:
+                if col not in self.headers:
+                    rows[col] = source_table[col]
+
+        self.table.add_items(rows)
 
         # QTable stores all the filtered sky coordinate points to be marked
-        catalog_results = QTable({'coord': filtered_skycoords})
+        catalog_results = QTable({'coord': skycoords})
 
         self.number_of_results = len(catalog_results)
         # markers are added to the viewer based on the table
         viewer.marker = {'color': 'blue', 'alpha': 0.8, 'markersize': 30, 'fill': False}
         viewer.add_markers(table=catalog_results, use_skycoord=True, marker_name=self._marker_name)
 
-        if "_orig_colnames_for_jdaviz_export" in self.catalog._cached_obj:
+        if (self.table._qtable is not None
+                and "_orig_colnames_for_jdaviz_export" in self.catalog._cached_obj):
             self.table._qtable.meta["_orig_colnames_for_jdaviz_export"] = self.catalog._cached_obj["_orig_colnames_for_jdaviz_export"]  # noqa: E501
 
         msg = CatalogResultsChangedMessage(sender=self)
@@ -536,3 +583,11 @@ class Catalogs(PluginTemplateMixin, ViewerSelectMixin,
     def vue_do_search(self, *args, **kwargs):
         # calls self.search() which handles all of the searching logic
         self.search()
+
+
+def _column_values(column):
+    """
+    Plain array of values of a table column, without units, as they would
+    appear in the rows of a `~astropy.table.Table`.
+    """
+    return np.asarray(getattr(column, 'value', column))
@@ -0,0 +1,189 @@
+import hashlib
+import os
+import warnings
+
+import numpy as np
+from astropy import units as u
+from astropy.config import get_cache_dir
+from astropy.coordinates import SkyCoord
+from astropy.table import Table, vstack
+
+__all__ = ['CatalogTileCache']
+
+
+class CatalogTileCache:
+    """
+    On-disk cache of catalog cone searches, tiled on the sky.
+
+    The sky is divided into declination zones of height ``tile_size``, and each
+    zone into right ascension segments at least ``tile_size`` wide on the sky.
+    Every tile is fetched at most once, through a cone search covering it, and
+    stored on disk.  Cone searches are then answered from the tiles overlapping
+    the cone, so that repeated and overlapping searches (e.g., after panning or
+    zooming) only query the tiles that were not fetched yet.
+
+    Parameters
+    ----------
+    query_func : callable
+        Called as ``query_func(center, radius)`` with a `~astropy.coordinates.SkyCoord`
+        and a `~astropy.units.Quantity` radius, and returning an `~astropy.table.Table`
+        of all sources in that cone (or `None` if there are none), with right
+        ascension and declination in degrees in ``ra`` and ``dec`` columns
+        (case-insensitive).
+    key : str
+        Identifies the catalog and query options (e.g., catalog name, data release
+        and columns).  Tiles are only shared between caches with the same key.
+    tile_size : `~astropy.units.Quantity`
+        Height of the declination zones and minimum width of the tiles.
+    cache_dir : str or `None`
+        Directory to store the tiles in.  Defaults to a ``jdaviz/catalog_tiles``
+        directory in the astropy cache directory.
+    """
+    def __init__(self, query_func, key, tile_size=0.2 * u.deg, cache_dir=None):
+        self.query_func = query_func
+        self.tile_size = tile_size.to_value(u.deg)
+        if cache_dir is None:
+            cache_dir = os.path.join(get_cache_dir(), 'jdaviz', 'catalog_tiles')
+        digest = hashlib.sha256(f"{key}-{self.tile_size}".encode()).hexdigest()[:16]
+        self.cache_dir = os.path.join(cache_dir, digest)
+        os.makedirs(self.cache_dir, exist_ok=True)
+
+        # index of the tiles available on disk, and of those already loaded in memory
+        self._on_disk = {self._tile_from_filename(filename)
+                         for filename in os.listdir(self.cache_dir)
+                         if filename.endswith('.ecsv')}
+        self._loaded = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def _tile_from_filename(filename):
+        zone, segment = os.path.splitext(filename)[0].split('_')
+        return int(zone), int(segment)
+
+    def _filename(self, tile):
+        return os.path.join(self.cache_dir, f"{tile[0]}_{tile[1]}.ecsv")
+
+    @property
+    def n_zones(self):
+        return int(np.ceil(180 / self.tile_size))
+
+    def _n_segments(self, zone):
+        # segments are sized along the edge of the zone closest to the equator
+        lower, upper = self._zone_bounds(zone)
+        min_abs_dec = 0. if lower <= 0 <= upper else min(abs(lower), abs(upper))
+        return max(1, int(np.floor(360 * np.cos(np.radians(min_abs_dec)) / self.tile_size)))
+
+    def _zone_bounds(self, zone):
+        lower = -90 + zone * self.tile_size
+        return lower, min(lower + self.tile_size, 90.)
+
+    def tile_bounds(self, tile):
+        """
+        Return the ``(ra_min, ra_max, dec_min, dec_max)`` bounds of a tile, in degrees.
+        """
+        zone, segment = tile
+        width = 360 / self._n_segments(zone)
+        return (segment * width, (segment + 1) * width) + self._zone_bounds(zone)
+
+    def tiles_for_cone(self, center, radius):
+        """
+        Return the (zone, segment) indices of all the tiles overlapping a cone.
+        """
+        ra, dec = center.icrs.ra.deg, center.icrs.dec.deg
+        radius = radius.to_value(u.deg)
+        zones = range(max(0, int(np.floor((dec - radius + 90) / self.tile_size))),
+                      min(self.n_zones, int(np.floor((dec + radius + 90) / self.tile_size)) + 1))
+        tiles = []
+        for zone in zones:
+            n_segments = self._n_segments(zone)
+            lower, upper = self._zone_bounds(zone)
+            max_abs_dec = min(90., max(abs(max(lower, dec - radius)),
+                                       abs(min(upper, dec + radius))))
+            cos_dec = np.cos(np.radians(max_abs_dec))
+            if cos_dec <= 0 or radius / cos_dec >= 180:
+                segments = range(n_segments)
+            else:
+                width = 360 / n_segments
+                half_width = radius / cos_dec
+                first = int(np.floor((ra - half_width) / width))
+                last = int(np.floor((ra + half_width) / width))
+                segments = sorted({segment % n_segments for segment in range(first, last + 1)})
+            tiles += [(zone, segment) for segment in segments]
+        return tiles
+
+    def _fetch_tile(self, tile):
+        ra_min, ra_max, dec_min, dec_max = self.tile_bounds(tile)
+        center = SkyCoord(0.5 * (ra_min + ra_max), 0.5 * (dec_min + dec_max), unit='deg')
+        corners = SkyCoord([ra_min, ra_min, ra_max, ra_max],
+                           [dec_min, dec_max, dec_min, dec_max], unit='deg')
+        radius = center.separation(corners).max()
+
+        table = self.query_func(center, radius)
+        if table is None:
+            table = Table()
+        else:
+            # only keep the sources within the tile, so that tiles do not overlap
+            ra, dec = _radec(table)
+            in_dec = (dec >= dec_min) & ((dec < dec_max) | (dec_max == 90))
+            table = table[(ra >= ra_min) & (ra < ra_max) & in_dec]
+            table.meta.clear()
+
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore')
+                table.write(self._filename(tile), format='ascii.ecsv', overwrite=True)
+        except (OSError, TypeError, ValueError):  # pragma: no cover
+            # the tile is still kept in memory, but will be fetched again next session
+            pass
+        else:
+            self._on_disk.add(tile)
+        return table
+
+    def _get_tile(self, tile):
+        if tile in self._loaded:
+            self.hits += 1
+        elif tile in self._on_disk:
+            self.hits += 1
+            self._loaded[tile] = Table.read(self._filename(tile), format='ascii.ecsv')
+        else:
+            self.misses += 1
+            self._loaded[tile] = self._fetch_tile(tile)
+        return self._loaded[tile]
+
+    def query(self, center, radius):
+        """
+        Return all the sources within ``radius`` of ``center``, sorted by increasing
+        separation, or `None` if there are none.  Only tiles that have not been
+        fetched before are queried through ``query_func``.
+        """
+        tables = [table for table in (self._get_tile(tile)
+                                      for tile in self.tiles_for_cone(center, radius))
+                  if len(table)]
+        if not tables:
+            return None
+        table = vstack(tables, metadata_conflicts='silent') if len(tables) > 1 else tables[0]
+
+        ra, dec = _radec(table)
+        separation = center.separation(SkyCoord(ra, dec, unit='deg'))
+        order = np.argsort(separation)
+        order = order[separation[order] <= radius]
+        if not len(order):
+            return None
+        return table[order]
+
+    def clear(self):
+        """
+        Remove all the tiles of this cache from the disk and memory.
+        """
+        for tile in self._on_disk:
+            if os.path.exists(self._filename(tile)):
+                os.remove(self._filename(tile))
+        self._on_disk = set()
+        self._loaded = {}
+
+
+def _radec(table):
+    colnames = {colname.lower(): colname for colname in table.colnames}
+    return (np.asarray(getattr(table[colnames['ra']], 'value', table[colnames['ra']])),
+            np.asarray(getattr(table[colnames['dec']], 'value', table[colnames['dec']])))
@@ -6,6 +6,7 @@ from astropy import units as u
 from bqplot import LinearScale
 from glue.core import BaseData
 from glue_jupyter.bqplot.image.layer_artist import BqplotImageSubsetLayerArtist
+from specutils import Spectrum
 
 from jdaviz.configs.cubeviz.plugins.viewers import CubevizImageView
 from jdaviz.configs.imviz.plugins.viewers import ImvizImageView
@@ -691,6 +692,32 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
                 else:
                     self.marks[matched_marker_id].visible = False
 
+    def _spectrum_in_display_units(self, viewer, data):
+        # Cache should have been populated when spectrum was first plotted.
+        # But if not (maybe user changed statistic), we cache it here too.
+        cache_key = self.app._object_cache.key(data, cls=Spectrum)
+        sp = self.app._object_cache.get_or_translate(
+            cache_key, lambda: self._specviz_helper.get_data(data_label=data.label))
+
+        disp_wave = sp.spectral_axis.to_value(viewer.state.x_display_unit, u.spectral())
+
+        # temporarily here, may be removed after upstream units handling
+        # or will be generalized for any sb <-> flux
+        # Create list of potentially needed equivalencies for flux/sb unit conversions
+        pixar_sr = self.app.data_collection[0].meta.get('PIXAR_SR', 1)
+        equivalencies = all_flux_unit_conversion_equivs(pixar_sr,
+                                                        sp.spectral_axis)
+
+        if sp.flux.unit is not None and viewer.state.y_display_unit is not None:
+            disp_flux = flux_conversion_general(sp.flux.value,
+                                                sp.flux.unit,
+                                                viewer.state.y_display_unit,
+                                                equivalencies, with_unit=False)
+        else:
+            disp_flux = sp.flux.value
+
+        return np.array([disp_wave, disp_flux])
+
     def _spectrum_viewer_update(self, viewer, x, y, mouseevent=True):
         def _cursor_fallback():
             self._dict['axes_x'] = x
@@ -724,7 +751,6 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
             return
 
         # Snap to the closest data point, not the actual mouse location.
-        sp = None
         closest_i = None
         closest_wave = None
         closest_flux = None
@@ -738,35 +764,15 @@ class CoordsInfo(TemplateMixin, DatasetSelectMixin):
 
             if ((not isinstance(lyr.layer, BaseData)) or (lyr.layer.ndim not in (1, 3))):
                 continue
-            data_label = lyr.layer.label
 
             try:
-                # Cache should have been populated when spectrum was first plotted.
-                # But if not (maybe user changed statistic), we cache it here too.
-                cache_key = lyr.layer.label
-                if cache_key in self.app._get_object_cache:
-                    sp = self.app._get_object_cache[cache_key]
-                else:
-                    sp = self._specviz_helper.get_data(data_label=data_label)
-                    self.app._get_object_cache[cache_key] = sp
-
-                # Calculations have to happen in the frame of viewer display units.
-                disp_wave = sp.spectral_axis.to_value(viewer.state.x_display_unit, u.spectral())
-
-                # temporarily here, may be removed after upstream units handling
-                # or will be generalized for any sb <-> flux
-                # Create list of potentially needed equivalencies for flux/sb unit conversions
-                pixar_sr = self.app.data_collection[0].meta.get('PIXAR_SR', 1)
-                equivalencies = all_flux_unit_conversion_equivs(pixar_sr,
-                                                                sp.spectral_axis)
-
-                if sp.flux.unit is not None and viewer.state.y_display_unit is not None:
-                    disp_flux = flux_conversion_general(sp.flux.value,
-                                                        sp.flux.unit,
-                                                        viewer.state.y_display_unit,
-                                                        equivalencies, with_unit=False)  # noqa: E501
-                else:
-                    disp_flux = sp.flux
+                # Calculations have to happen in the frame of viewer display units,
+                # the converted values are cached until the data or display units change.
+                display_units = (viewer.state.x_display_unit, viewer.state.y_display_unit)
+                cache_key = self.app._object_cache.key(lyr.layer, cls=np.ndarray,
+                                                       units=display_units)
+                disp_wave, disp_flux = self.app._object_cache.get_or_translate(
+                    cache_key, lambda: self._spectrum_in_display_units(viewer, lyr.layer))
 
                 # Out of range in spectral axis.
                 if (self.dataset.selected != lyr.layer.label and
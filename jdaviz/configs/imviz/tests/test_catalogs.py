@@ -25,11 +25,14 @@ import numpy as np
 from numpy.testing import assert_allclose
 import pytest
 
+from astropy import units as u
 from astropy.coordinates import SkyCoord
 from astropy.io import fits
 from astropy.nddata import NDData
 from astropy.table import Table, QTable
 
+from jdaviz.configs.imviz.plugins.catalogs.tile_cache import CatalogTileCache
+
 
 @pytest.mark.remote_data
 class TestCatalogs:
@@ -535,3 +538,101 @@ def test_select_catalog_table_rows(imviz_helper, image_2d_wcs):
     # test select_none
     catalogs_plugin.select_none()
     assert len(plugin_table.selected_rows) == 0
+
+
+def test_large_catalog_search(imviz_helper, image_2d_wcs):
+    ndd = NDData(np.ones((100, 100)), wcs=image_2d_wcs)
+    imviz_helper.load_data(ndd, data_label='data_with_wcs')
+    viewer = imviz_helper.default_viewer._obj.glue_viewer
+    viewer.state.x_min, viewer.state.x_max = -0.5, 49.5
+
+    n_sources = 20000
+    rng = np.random.default_rng(42)
+    x = rng.uniform(0, 99, n_sources)
+    y = rng.uniform(0, 99, n_sources)
+    tbl = QTable({'sky_centroid': image_2d_wcs.pixel_to_world(x, y),
+                  'label': np.arange(n_sources),
+                  'flux': rng.uniform(0, 1, n_sources)})
+
+    catalogs_plugin = imviz_helper.plugins['Catalog Search']
+    catalogs_plugin.max_sources = n_sources
+    catalogs_plugin.import_catalog(tbl)
+    out_skycoords = catalogs_plugin.search(error_on_fail=True)
+
+    in_view = x <= 49.5
+    plugin_table = catalogs_plugin.table._obj
+    assert catalogs_plugin._obj.number_of_results == np.count_nonzero(in_view)
+    assert len(out_skycoords) == len(plugin_table) == np.count_nonzero(in_view)
+    # large tables only send the visible page to the UI
+    assert plugin_table.virtualized
+
+    qtable = plugin_table._qtable
+    assert_allclose(qtable['x_coord'], x[in_view])
+    assert_allclose(qtable['y_coord'], y[in_view])
+    assert_allclose(qtable['flux'], tbl['flux'][in_view])
+    assert list(qtable['Object ID'][:3]) == [str(i) for i in np.flatnonzero(in_view)[:3]]
+    assert list(qtable['id']) == list(range(len(qtable)))
+
+    # sky coordinates are formatted as the single-row path would
+    for i in (0, len(qtable) // 2, len(qtable) - 1):
+        assert plugin_table.items[i]['sky_centroid'] == out_skycoords[i].to_string(
+            'hmsdms', precision=4)
+
+
+@pytest.mark.parametrize(('ra', 'dec'), [(150.1, 2.2), (0.05, -30), (200, 89.9)])
+def test_catalog_tile_cache(tmp_path, ra, dec):
+    rng = np.random.default_rng(0)
+    n_sources = 5000
+    sky = SkyCoord((ra + rng.uniform(-0.5, 0.5, n_sources)) % 360,
+                   np.clip(dec + rng.uniform(-0.5, 0.5, n_sources), -90, 90), unit='deg')
+    sources = Table({'source_id': np.arange(n_sources), 'RA': sky.ra.deg, 'DEC': sky.dec.deg})
+    queried = []
+
+    def query_func(center, radius):
+        queried.append(center)
+        return sources[center.separation(sky) <= radius]
+
+    def expected(center, radius):
+        return sorted(np.flatnonzero(center.separation(sky) <= radius))
+
+    cache = CatalogTileCache(query_func, key='test', tile_size=0.1 * u.deg, cache_dir=tmp_path)
+    center = SkyCoord(ra, dec, unit='deg')
+    result = cache.query(center, 0.2 * u.deg)
+    assert sorted(result['source_id']) == expected(center, 0.2 * u.deg)
+    sep = center.separation(SkyCoord(result['RA'], result['DEC'], unit='deg'))
+    assert np.all(np.diff(sep) >= 0)
+    n_queries = len(queried)
+    assert cache.misses == n_queries > 0
+
+    # a smaller, overlapping cone is answered from the cached tiles
+    center2 = center.directional_offset_by(45 * u.deg, 0.05 * u.deg)
+    result = cache.query(center2, 0.1 * u.deg)
+    assert sorted(result['source_id']) == expected(center2, 0.1 * u.deg)
+    assert len(queried) == n_queries
+    assert cache.hits > 0
+
+    # tiles persist on disk across cache instances
+    cache = CatalogTileCache(query_func, key='test', tile_size=0.1 * u.deg, cache_dir=tmp_path)
+    result = cache.query(center, 0.2 * u.deg)
+    assert sorted(result['source_id']) == expected(center, 0.2 * u.deg)
+    assert len(queried) == n_queries
+    assert cache.misses == 0
+
+    # a different key does not share tiles
+    other = CatalogTileCache(query_func, key='other', tile_size=0.1 * u.deg, cache_dir=tmp_path)
+    assert other.query(SkyCoord(ra, dec, unit='deg'), 0.01 * u.deg) is not None
+    assert other.misses > 0
+
+    cache.clear()
+    assert cache.query(center, 0.2 * u.deg) is not None
+    assert len(queried) > n_queries
+
+
+def test_catalog_tile_cache_empty(tmp_path):
+    cache = CatalogTileCache(lambda center, radius: None, key='empty', tile_size=0.1 * u.deg,
+                             cache_dir=tmp_path)
+    assert cache.query(SkyCoord(10, 10, unit='deg'), 0.1 * u.deg) is None
+    cache = CatalogTileCache(lambda center, radius: None, key='empty', tile_size=0.1 * u.deg,
+                             cache_dir=tmp_path)
+    assert cache.query(SkyCoord(10, 10, unit='deg'), 0.1 * u.deg) is None
+    assert cache.misses == 0
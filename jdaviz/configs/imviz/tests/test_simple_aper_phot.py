@@ -14,9 +14,10 @@ from regions import (CircleAnnulusPixelRegion, CirclePixelRegion, EllipsePixelRe
                      RectanglePixelRegion, PixCoord)
 
 from jdaviz.configs.imviz.plugins.aper_phot_simple.aper_phot_simple import (
-    _curve_of_growth, _radial_profile)
+    _ApertureStatsWorker, _curve_of_growth, _radial_profile)
 from jdaviz.configs.imviz.tests.utils import BaseImviz_WCS_WCS, BaseImviz_WCS_NoWCS
 from jdaviz.core.custom_units_and_equivs import PIX2
+from jdaviz.utils import SharedArrayStore
 
 
 class TestSimpleAperPhot(BaseImviz_WCS_WCS):
@@ -245,6 +246,72 @@ class TestSimpleAperPhot(BaseImviz_WCS_WCS):
         phot_plugin._obj.vue_do_aper_phot()
         assert len(phot_plugin.table._obj) == 5
 
+    def test_batch_phot_vectorized(self):
+        self.imviz.link_data(align_by='wcs')
+        st = self.imviz.plugins['Subset Tools']
+        for x, y in ((4.3, 4.6), (2.2, 3.1), (6.1, 5.3)):
+            st.import_region(CirclePixelRegion(center=PixCoord(x=x, y=y), radius=1.7),
+                             combination_mode='new')
+        st.import_region(EllipsePixelRegion(center=PixCoord(x=4.5, y=2.0), width=9.0, height=4.0),
+                         combination_mode='new')
+
+        phot_plugin = self.imviz.plugins['Aperture Photometry']
+        options = phot_plugin.unpack_batch_options(
+            dataset=['has_wcs_1[SCI,1]', 'has_wcs_2[SCI,1]'],
+            aperture=['Subset 1', 'Subset 4', 'Subset 2', 'Subset 3'])
+
+        expected = []
+        for option in options:
+            tbl, _ = phot_plugin.calculate_photometry(add_to_table=False, update_plots=False,
+                                                      **option)
+            expected.append(tbl)
+
+        for n_cpu in (1, 2):
+            phot_plugin.clear_table()
+            phot_plugin._obj.parallel_n_cpu = n_cpu
+            phot_plugin.calculate_batch_photometry(options)
+            tbl = phot_plugin.export_table()
+            assert_array_equal(tbl['id'], np.arange(1, 9))
+            # rows are in the order of the options
+            assert_array_equal(tbl['data_label'], [o['dataset'] for o in options])
+            assert_array_equal(tbl['subset_label'], [o['aperture'] for o in options])
+            for row, exp in zip(tbl, expected):
+                for colname in ('xcenter', 'ycenter', 'sum', 'sum_aper_area', 'mean', 'fwhm'):
+                    assert_quantity_allclose(row[colname], exp[colname][0])
+                assert_allclose(row['sky_center'].ra.deg, exp['sky_center'][0].ra.deg)
+
+        # failed options are skipped without affecting the others of their dataset
+        phot_plugin.clear_table()
+        with pytest.raises(RuntimeError, match=r"inputs \[1\] failed"):
+            phot_plugin.calculate_batch_photometry(
+                [{'dataset': 'has_wcs_1[SCI,1]', 'aperture': 'Subset 1'},
+                 {'dataset': 'has_wcs_1[SCI,1]', 'aperture': 'DNE'},
+                 {'dataset': 'has_wcs_1[SCI,1]', 'aperture': 'Subset 2'}])
+        assert_array_equal(phot_plugin.export_table()['subset_label'], ['Subset 1', 'Subset 2'])
+
+
+def test_aperture_stats_worker():
+    data = make_4gaussians_image()
+    apertures = [CircularAperture((150, 25), 10), EllipticalAperture((90, 60), 20, 10, theta=0.5),
+                 CircularAperture((35, 50), 10), CircularAperture((125, 75), 5)]
+    stats = _ApertureStatsWorker(data, apertures, local_bkg=5)()
+    assert len(stats) == len(apertures)
+    for row, aperture in zip(stats, apertures):
+        expected = ApertureStats(data, aperture, local_bkg=5)
+        assert_allclose(row['sum'], expected.sum)
+        assert_allclose(row['fwhm'].value, expected.fwhm.value)
+
+    # same results from an image shared with the worker processes
+    with SharedArrayStore() as store:
+        shared_worker = _ApertureStatsWorker(data, apertures, local_bkg=5).with_data(
+            store.put(data))
+        shared_stats = shared_worker()
+        assert_allclose(shared_stats['sum'], stats['sum'])
+
+        # errors are returned rather than raised, not to cancel the other workers
+        assert isinstance(_ApertureStatsWorker(data, [None]).with_data(store.put(data))(),
+                          AttributeError)
+
 
 class TestSimpleAperPhot_NoWCS(BaseImviz_WCS_NoWCS):
     def test_plugin_no_wcs(self):
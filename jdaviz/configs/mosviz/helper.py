@@ -19,6 +19,7 @@ from jdaviz.configs.specviz2d import Specviz2d
 from jdaviz.configs.mosviz.plugins import jwst_header_to_skyregion
 from jdaviz.configs.mosviz.plugins.parsers import (
     FALLBACK_NAME, mos_spec1d_parser, mos_spec2d_parser)
+from jdaviz.configs.mosviz.plugins.row_loader import MosvizRowLoader
 from jdaviz.configs.default.plugins.line_lists.line_list_mixin import LineListMixin
 
 __all__ = ['Mosviz']
@@ -75,6 +76,11 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         self._update_in_progress = False
 
+        # reads the data of the rows loaded with lazy=True when they are selected
+        self._row_loader = MosvizRowLoader(self.app)
+        # (file, seconds) spent reading each file, see ingest_timings
+        self._ingest_timings = []
+
         self._initialize_table()
         self._default_visible_columns = []
 
@@ -99,6 +105,7 @@ class Mosviz(ConfigHelper, LineListMixin):
         self._freeze_states_on_row_change = msg.is_locked
 
     def _on_row_selected_begin(self, event):
+        self._row_loader.load_row(event['new'])
         self._redshift_cache = self.get_column("Redshift")[event['new']]
 
         if not self._freeze_states_on_row_change:
@@ -245,16 +252,23 @@ class Mosviz(ConfigHelper, LineListMixin):
             except IncompatibleAttribute:
                 sp1_val = None
             else:
-                sp1 = self.app.data_collection[sp1_name].get_object()
-                sp1_val = getattr(sp1, attr, None)
+                # spectra of lazily loaded rows are not read for this
+                if sp1_name in self.app.data_collection:
+                    sp1 = self.app.data_collection[sp1_name].get_object()
+                    sp1_val = getattr(sp1, attr, None)
+                else:
+                    sp1_val = None
 
             try:
                 sp2_name = table_data['2D Spectra'][row]
             except IncompatibleAttribute:
                 sp2_val = None
             else:
-                sp2 = self.app.data_collection[sp2_name].get_object()
-                sp2_val = getattr(sp2, attr, sp1_val)
+                if sp2_name in self.app.data_collection:
+                    sp2 = self.app.data_collection[sp2_name].get_object()
+                    sp2_val = getattr(sp2, attr, sp1_val)
+                else:
+                    sp2_val = sp1_val
 
             if sp1_val is not None and sp1_val != sp2_val:
                 # then there was a conflict
@@ -275,7 +289,8 @@ class Mosviz(ConfigHelper, LineListMixin):
 
     def load_data(self, spectra_1d=None, spectra_2d=None, images=None,
                   spectra_1d_label=None, spectra_2d_label=None,
-                  images_label=None, directory=None, instrument=None):
+                  images_label=None, directory=None, instrument=None, lazy=False,
+                  max_resident_rows=20):
         """
         Load and parse a set of MOS spectra and images.
 
@@ -318,10 +333,22 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         instrument : {'niriss', 'nircam', 'nirspec'}, optional
             Required and only used if ``directory`` is specified. Value is not case sensitive.
+
+        lazy : bool, optional
+            If `True`, the table is built from the file headers only, and the spectra
+            and image of a row are read when the row is selected (with its neighbors
+            read in the background).  NIRISS and NIRCam directories, whose files each
+            hold many sources, are always read up front.
+
+        max_resident_rows : int, optional
+            With ``lazy=True``, the number of rows whose data are kept in the data
+            collection before the least recently selected ones are removed.
         """
         # Link data after everything is loaded
         self.app.auto_link = False
-        allow_link_table = True
+        allow_link_table = not lazy
+        self._ingest_timings = []
+        self._row_loader.max_resident_rows = max_resident_rows
 
         if isinstance(instrument, str):
             instrument = instrument.lower()
@@ -340,7 +367,8 @@ class Mosviz(ConfigHelper, LineListMixin):
                         "Ambiguous MOS Instrument: Only JWST NIRSpec, NIRCam, and "
                         f"NIRISS folder parsing are currently supported but got '{instrument}'")
                 if instrument == "nirspec":
-                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser")
+                    super().load_data(directory, parser_reference="mosviz-nirspec-directory-parser",
+                                      lazy=lazy)
                 else:  # niriss or nircam
                     self.load_jwst_directory(directory, instrument=instrument)
             else:
@@ -350,8 +378,8 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         elif (spectra_1d is not None and spectra_2d is not None
                 and images is not None):
-            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
+            self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
 
             # If we have a single image for multiple spectra, tell the table viewer.
             if single_image:
@@ -360,19 +388,19 @@ class Mosviz(ConfigHelper, LineListMixin):
                 if n_specs > 1:
                     self.load_images(images, images_label, share_image=n_specs)
                 else:
-                    self.load_images(images, images_label)
+                    self.load_images(images, images_label, lazy=lazy)
             else:
-                self.load_images(images, images_label)
+                self.load_images(images, images_label, lazy=lazy)
 
             self.load_metadata()
 
         elif spectra_1d is not None and spectra_2d is not None:
-            self.load_1d_spectra(spectra_1d, spectra_1d_label)
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
+            self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
             self.load_metadata()
 
         elif spectra_1d and images:
-            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label)
+            n_specs = self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
 
             # If we have a single image for multiple spectra, tell the table viewer.
             if single_image:
@@ -381,14 +409,14 @@ class Mosviz(ConfigHelper, LineListMixin):
                 if n_specs > 1:
                     self.load_images(images, images_label, share_image=n_specs)
                 else:
-                    self.load_images(images, images_label)
+                    self.load_images(images, images_label, lazy=lazy)
             else:
-                self.load_images(images, images_label)
+                self.load_images(images, images_label, lazy=lazy)
 
             allow_link_table = False
 
         elif spectra_2d and images:
-            n_specs = self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            n_specs = self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
 
             # If we have a single image for multiple spectra, tell the table viewer.
             if single_image:
@@ -397,18 +425,18 @@ class Mosviz(ConfigHelper, LineListMixin):
                 if n_specs > 1:
                     self.load_images(images, images_label, share_image=n_specs)
                 else:
-                    self.load_images(images, images_label)
+                    self.load_images(images, images_label, lazy=lazy)
             else:
-                self.load_images(images, images_label)
+                self.load_images(images, images_label, lazy=lazy)
 
             allow_link_table = False
 
         elif spectra_1d:
-            self.load_1d_spectra(spectra_1d, spectra_1d_label)
+            self.load_1d_spectra(spectra_1d, spectra_1d_label, lazy=lazy)
             allow_link_table = False
 
         elif spectra_2d:
-            self.load_2d_spectra(spectra_2d, spectra_2d_label)
+            self.load_2d_spectra(spectra_2d, spectra_2d_label, lazy=lazy)
             allow_link_table = False
 
         else:
@@ -508,7 +536,8 @@ class Mosviz(ConfigHelper, LineListMixin):
         """
         self.app.load_data(file_obj=None, parser_reference="mosviz-metadata-parser")
 
-    def load_1d_spectra(self, data_obj, data_labels=None, add_redshift_column=False):
+    def load_1d_spectra(self, data_obj, data_labels=None, add_redshift_column=False,
+                        lazy=False):
         """
         Load and parse a set of 1D spectra objects.
 
@@ -524,6 +553,8 @@ class Mosviz(ConfigHelper, LineListMixin):
             for each item in ``data_obj`` if  ``data_obj`` is a list.
         add_redshift_column : bool
             Add redshift column to Mosviz table.
+        lazy : bool
+            Read each spectrum only when its row is selected.
 
         Returns
         -------
@@ -531,12 +562,13 @@ class Mosviz(ConfigHelper, LineListMixin):
             Number of data objects loaded.
 
         """
-        n_specs = mos_spec1d_parser(self.app, data_obj, data_labels=data_labels)
+        n_specs = mos_spec1d_parser(self.app, data_obj, data_labels=data_labels, lazy=lazy)
         if add_redshift_column:
             self._add_redshift_column()
         return n_specs
 
-    def load_2d_spectra(self, data_obj, data_labels=None, add_redshift_column=False):
+    def load_2d_spectra(self, data_obj, data_labels=None, add_redshift_column=False,
+                        lazy=False):
         """
         Load and parse a set of 2D spectra objects.
 
@@ -552,6 +584,8 @@ class Mosviz(ConfigHelper, LineListMixin):
             for each item in ``data_obj`` if  ``data_obj`` is a list.
         add_redshift_column : bool
             Add redshift column to Mosviz table.
+        lazy : bool
+            Read each spectrum only when its row is selected.
 
         Returns
         -------
@@ -559,7 +593,7 @@ class Mosviz(ConfigHelper, LineListMixin):
             Number of data objects loaded.
 
         """
-        n_specs = mos_spec2d_parser(self.app, data_obj, data_labels=data_labels)
+        n_specs = mos_spec2d_parser(self.app, data_obj, data_labels=data_labels, lazy=lazy)
         if add_redshift_column:
             self._add_redshift_column()
         return n_specs
@@ -577,7 +611,8 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         self.app.auto_link = True
 
-    def load_images(self, data_obj, data_labels=None, share_image=0, add_redshift_column=False):
+    def load_images(self, data_obj, data_labels=None, share_image=0, add_redshift_column=False,
+                    lazy=False):
         """
         Load and parse a set of image objects. If providing a file path, it
         must be readable by ``astropy.io.fits``.
@@ -600,9 +635,11 @@ class Mosviz(ConfigHelper, LineListMixin):
             spectra.
         add_redshift_column : bool
             Add redshift column to Mosviz table.
+        lazy : bool
+            Read each image only when its row is selected.
         """
         super().load_data(data_obj, parser_reference="mosviz-image-parser",
-                          data_labels=data_labels, share_image=share_image)
+                          data_labels=data_labels, share_image=share_image, lazy=lazy)
         if add_redshift_column:
             self._add_redshift_column()
 
@@ -878,6 +915,23 @@ class Mosviz(ConfigHelper, LineListMixin):
 
         table_df.to_csv(filename, index_label="Table Index")
 
+    @property
+    def ingest_timings(self):
+        """
+        Time spent reading each file during the last call to `load_data`, for
+        diagnostics.  Files are read in parallel when there are many of them, so the
+        times can add up to more than the loading time.
+
+        Returns
+        -------
+        timings : `~astropy.table.QTable`
+            Table with the ``file`` names and their ``read_time``.
+        """
+        files = [file for file, _ in self._ingest_timings]
+        read_times = [read_time for _, read_time in self._ingest_timings] * u.s
+        return QTable([files, read_times], names=('file', 'read_time'),
+                      dtype=(str, float))
+
     @property
     def specviz(self):
         """
@@ -909,6 +963,7 @@ class Mosviz(ConfigHelper, LineListMixin):
             raise ValueError(f"row must be between 0 and {len(data_labels)-1}")
 
         data_label = data_labels[row]
+        self._row_loader.load_row(row, select=False)
         spectra = self.app.data_collection[data_label].get_object()
         if not apply_slider_redshift:
             return spectra
@@ -1,5 +1,6 @@
 from .viewers import *  # noqa
 from .parsers import *  # noqa
+from .row_loader import *  # noqa
 from .tools import *  # noqa
 from .slit_overlay.slit_overlay import *  # noqa
 from .row_lock.row_lock import * # noqa
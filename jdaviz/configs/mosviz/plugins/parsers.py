@@ -1,7 +1,10 @@
 from collections.abc import Iterable
 import csv
+from functools import partial
+import multiprocessing as mp
 import os
 from pathlib import Path
+import time
 import warnings
 
 from astropy import units as u
@@ -16,7 +19,8 @@ from specutils.io.default_loaders.jwst_reader import identify_jwst_s2d_multi_fit
 from jdaviz.configs.imviz.plugins.parsers import get_image_data_iterator
 from jdaviz.core.registries import data_parser_registry
 from jdaviz.core.events import SnackbarMessage
-from jdaviz.utils import standardize_metadata, PRIHDR_KEY, download_uri_to_path
+from jdaviz.utils import (standardize_metadata, PRIHDR_KEY, download_uri_to_path,
+                          parallelize_calculation)
 
 __all__ = ['mos_spec1d_parser', 'mos_spec2d_parser', 'mos_image_parser']
 
@@ -28,6 +32,8 @@ EXPECTED_FILES = {"niriss": ['1D Spectra C', '1D Spectra R',
                              '2D Spectra C', '2D Spectra R',
                              'Direct Image'],
                   "nirspec": ['1D Spectra', '2D Spectra']}
+# directories with fewer files than this are read serially
+PARALLEL_MIN_FILES = 8
 
 
 def _add_to_table(app, data, comp_label, table_viewer_reference_name='table-viewer'):
@@ -67,6 +73,90 @@ def _check_is_file(path):
     return isinstance(path, str) and Path(path).is_file()
 
 
+def _header_metadata(data_obj, ext=None):
+    """
+    Metadata of a file or HDUList from its headers only, laid out as in the
+    parsed data: the header of extension ``ext`` (or of the first extension
+    with a 2D array, by default), with the primary header under ``PRIHDR_KEY``.
+    Other objects return their standardized ``meta``.
+    """
+    if _check_is_file(data_obj):
+        with fits.open(data_obj) as hdulist:
+            return _header_metadata(hdulist, ext=ext)
+    elif isinstance(data_obj, fits.HDUList):
+        if ext is None:
+            ext = next((i for i, hdu in enumerate(data_obj)
+                        if hdu.header.get('NAXIS', 0) >= 2), 0)
+        elif ext >= len(data_obj):
+            ext = 0
+        meta = standardize_metadata(data_obj[ext].header)
+        meta[PRIHDR_KEY] = standardize_metadata(data_obj[0].header)
+        return meta
+
+    meta = getattr(data_obj, 'meta', None)
+    return standardize_metadata(meta) if isinstance(meta, (dict, fits.Header)) else {}
+
+
+class _ReadFileWorker:
+    """
+    A class with callable instances that read a file with ``read(path)``, returning
+    the result and the time it took (see `_read_files`).
+    """
+    def __init__(self, read, path):
+        self.read = read
+        self.path = path
+
+    def __call__(self):
+        start = time.perf_counter()
+        result = self.read(self.path)
+        return result, time.perf_counter() - start
+
+
+def _read_files(app, read, paths, n_cpu=None, prefer='threads'):
+    """
+    Read each of ``paths`` with ``read(path)`` in a pool of threads (or processes,
+    see ``prefer``), and return the results in the same order.  The time spent reading
+    each file is appended to the ``ingest_timings`` of the Mosviz helper.
+
+    ``n_cpu`` defaults to the number of available CPU cores - 1 for at least
+    ``PARALLEL_MIN_FILES`` files, below which the files are read serially.
+    """
+    if n_cpu is None:
+        n_cpu = mp.cpu_count() - 1 if len(paths) >= PARALLEL_MIN_FILES else 1
+    workers = [_ReadFileWorker(read, path) for path in paths]
+    if n_cpu > 1 and len(workers) > 1:
+        results = []
+        parallelize_calculation(workers, results.append, n_cpu=n_cpu, prefer=prefer)
+    else:
+        results = [worker() for worker in workers]
+
+    timings = getattr(app._jdaviz_helper, '_ingest_timings', None)
+    if timings is not None:
+        timings += [(str(path), elapsed) for path, (_, elapsed) in zip(paths, results)]
+    return [result for result, _ in results]
+
+
+def _lazy_row_loader(app):
+    return app._jdaviz_helper._row_loader
+
+
+def _read_spectrum1d(data_obj, row):
+    data = Spectrum.read(data_obj) if _check_is_file(data_obj) else data_obj
+    data.meta = standardize_metadata(data.meta)
+    data.meta['mosviz_row'] = row
+    return data
+
+
+def _read_image(data_obj, label, row, app):
+    if isinstance(data_obj, str):
+        data = _load_fits_image_from_filename(data_obj, app)[0]
+    else:
+        data = next(get_image_data_iterator(app, data_obj, "Image", ext=None))[0]
+    data.label = label
+    data.meta['mosviz_row'] = row
+    return data
+
+
 def _warn_if_not_found(app, files_by_labels):
     """
     Take a list of labels and associated file lists/strings and send a
@@ -146,7 +236,7 @@ def link_data_in_table(app, data_obj=None):
 
 
 @data_parser_registry("mosviz-nirspec-directory-parser")
-def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
+def mos_nirspec_directory_parser(app, data_obj, data_labels=None, lazy=False):
 
     spectra_1d = []
     spectra_2d = []
@@ -160,8 +250,8 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
         elif 's2d' in file_path:
             spectra_2d.append(file_path)
 
-    n_specs = mos_spec1d_parser(app, spectra_1d)
-    mos_spec2d_parser(app, spectra_2d)
+    n_specs = mos_spec1d_parser(app, spectra_1d, lazy=lazy)
+    mos_spec2d_parser(app, spectra_2d, lazy=lazy)
 
     # Load images, if present
     image_path = None
@@ -187,7 +277,7 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
                 kwargs = {}
             mos_image_parser(app, str(images[0]), **kwargs)
         elif n_images == n_specs:
-            mos_image_parser(app, list(map(str, images)))
+            mos_image_parser(app, list(map(str, images)), lazy=lazy)
         else:
             app.hub.broadcast(SnackbarMessage(
                 "The number of images in this directory does not match the "
@@ -199,7 +289,7 @@ def mos_nirspec_directory_parser(app, data_obj, data_labels=None):
 
 @data_parser_registry("mosviz-spec1d-parser")
 def mos_spec1d_parser(app, data_obj, data_labels=None,
-                      table_viewer_reference_name='table-viewer'):
+                      table_viewer_reference_name='table-viewer', lazy=False):
     """
     Attempts to parse a 1D spectrum object.
 
@@ -212,6 +302,10 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
         the mosviz table.
     data_labels : str, optional
         The label applied to the glue data component.
+    lazy : bool, optional
+        If `True`, only the headers are read now, and each spectrum is read
+        when its row is selected (see `~jdaviz.configs.mosviz.plugins.MosvizRowLoader`).
+        A single file, which may hold several spectra, is always read.
 
     Returns
     -------
@@ -226,14 +320,18 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
     if not isinstance(data_obj, (list, tuple, SpectrumCollection)):
         data_obj = [data_obj]
 
-    # If the file has multiple objects in it, the Spectrum read machinery
-    # will fail to find a reader for it, and we fall back on SpectrumList
-    try:
-        data_obj = [Spectrum.read(x) if _check_is_file(x) else x for x in data_obj]
-    except IORegistryError:
-        if len(data_obj) == 1:
-            if _check_is_file(data_obj[0]):
-                data_obj = SpectrumList.read(data_obj[0])
+    lazy = lazy and len(data_obj) > 1
+    if not lazy:
+        # If the file has multiple objects in it, the Spectrum read machinery
+        # will fail to find a reader for it, and we fall back on SpectrumList
+        try:
+            files = [x for x in data_obj if _check_is_file(x)]
+            read = iter(_read_files(app, Spectrum.read, files))
+            data_obj = [next(read) if _check_is_file(x) else x for x in data_obj]
+        except IORegistryError:
+            if len(data_obj) == 1:
+                if _check_is_file(data_obj[0]):
+                    data_obj = SpectrumList.read(data_obj[0])
 
     if data_labels is None:
         data_labels = [f"1D Spectrum {i}" for i in range(len(data_obj))]
@@ -245,11 +343,16 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
     with app.data_collection.delay_link_manager_update():
 
         for i, (cur_data, cur_label) in enumerate(zip(data_obj, data_labels)):
-            # Make metadata layout conform with other viz.
-            cur_data.meta = standardize_metadata(cur_data.meta)
-            cur_data.meta['mosviz_row'] = i
-
-            app.add_data(cur_data, cur_label, notify_done=False)
+            if lazy:
+                meta = _header_metadata(cur_data, ext=1)
+                meta['mosviz_row'] = i
+                _lazy_row_loader(app).register(
+                    cur_label, partial(_read_spectrum1d, cur_data, i),
+                    partial(app.add_data, data_label=cur_label, notify_done=False),
+                    meta=meta)
+            else:
+                # Make metadata layout conform with other viz.
+                app.add_data(_read_spectrum1d(cur_data, i), cur_label, notify_done=False)
 
         _add_to_table(app, data_labels, '1D Spectra',
                       table_viewer_reference_name=table_viewer_reference_name)
@@ -260,7 +363,7 @@ def mos_spec1d_parser(app, data_obj, data_labels=None,
 @data_parser_registry("mosviz-spec2d-parser")
 def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
                       show_in_viewer=False, ext=1, transpose=False,
-                      cache=None, local_path=None, timeout=None):
+                      cache=None, local_path=None, timeout=None, lazy=False):
     """
     Attempts to parse a 2D spectrum object.
 
@@ -293,6 +396,10 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         remote requests in seconds (passed to
         `~astropy.utils.data.download_file` or
         `~astroquery.mast.Conf.timeout`).
+    lazy : bool, optional
+        If `True`, only the headers are read now, and each spectrum is read
+        when its row is selected (see `~jdaviz.configs.mosviz.plugins.MosvizRowLoader`).
+        A single file, which may hold several spectra, is always read.
 
     Returns
     -------
@@ -307,30 +414,8 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         getattr(app._jdaviz_helper, '_default_table_viewer_reference_name', None)
     )
 
-    # Note: This is also used by Specviz2D
-    def _parse_as_spectrum1d(hdulist, ext, transpose):
-        # Parse as a FITS file and assume the WCS is correct
-        data = hdulist[ext].data
-        header = hdulist[ext].header
-        metadata = standardize_metadata(header)
-        metadata[PRIHDR_KEY] = standardize_metadata(hdulist[0].header)
-        wcs = WCS(header, hdulist)
-        if transpose:
-            data = data.T
-            wcs = wcs.swapaxes(0, 1)
-
-        try:
-            data_unit = u.Unit(header['BUNIT'])
-        except Exception:
-            data_unit = u.count
-
-        # FITS WCS is invalid, so ignore it.
-        if wcs.spectral.naxis == 0:
-            kw = {}
-        else:
-            kw = {'wcs': wcs}
-
-        return Spectrum(flux=data * data_unit, meta=metadata, **kw)
+    def _add_spectrum2d(data, label):
+        app.data_collection[label] = data
 
     # Coerce into list-like object
     if (not isinstance(data_obj, (list, tuple, SpectrumCollection)) or
@@ -354,39 +439,31 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
         else:
             data_labels = ['2D Spectrum']
 
-    with app.data_collection.delay_link_manager_update():
-        for index, data in enumerate(data_obj):
-            # If we got a filepath, first try and parse using the Spectrum and
-            # SpectrumList parsers, and then fall back to parsing it as a generic
-            # FITS file.
-
-            # try parsing file_obj as a URI/URL:
-            data = download_uri_to_path(data, cache=cache, local_path=local_path, timeout=timeout)
-
-            if _check_is_file(data):
-                try:
-                    if ext != 1 or transpose:
-                        with fits.open(data) as hdulist:
-                            data = _parse_as_spectrum1d(hdulist, ext, transpose)
-                    else:
-                        data = Spectrum.read(data)
-                except IORegistryError:
-                    with fits.open(data) as hdulist:
-                        data = _parse_as_spectrum1d(hdulist, ext, transpose)
-            elif isinstance(data, fits.HDUList):
-                data = _parse_as_spectrum1d(data, ext, transpose)
-
-            # Make metadata layout conform with other viz.
-            data.meta = standardize_metadata(data.meta)
+    lazy = lazy and add_to_table and len(data_obj) > 1
 
-            # Set the instrument
-            # TODO: this should not be set to nirspec for all datasets
-            data.meta['INSTRUME'] = 'nirspec'
+    # try parsing file_obj as a URI/URL:
+    data_obj = [download_uri_to_path(data, cache=cache, local_path=local_path, timeout=timeout)
+                for data in data_obj]
+    if not lazy:
+        files = [data for data in data_obj if _check_is_file(data)]
+        read = iter(_read_files(app, partial(_read_spectrum2d, ext=ext, transpose=transpose),
+                                files))
+        data_obj = [next(read) if _check_is_file(data) else data for data in data_obj]
 
-            data.meta['mosviz_row'] = index
+    with app.data_collection.delay_link_manager_update():
+        for index, data in enumerate(data_obj):
             # Get the corresponding label for this data product
             label = data_labels[index]
-            app.data_collection[label] = data
+            if lazy:
+                meta = _header_metadata(data, ext=ext)
+                meta['INSTRUME'] = 'nirspec'
+                meta['mosviz_row'] = index
+                _lazy_row_loader(app).register(
+                    label, partial(_read_spectrum2d, data, index, ext=ext, transpose=transpose),
+                    partial(_add_spectrum2d, label=label), meta=meta)
+            else:
+                data = _read_spectrum2d(data, index, ext=ext, transpose=transpose)
+                _add_spectrum2d(data, label)
 
         if add_to_table:
             _add_to_table(
@@ -403,6 +480,60 @@ def mos_spec2d_parser(app, data_obj, data_labels=None, add_to_table=True,
     return len(data_obj)
 
 
+def _parse_as_spectrum1d(hdulist, ext, transpose):
+    # Parse as a FITS file and assume the WCS is correct
+    data = hdulist[ext].data
+    header = hdulist[ext].header
+    metadata = standardize_metadata(header)
+    metadata[PRIHDR_KEY] = standardize_metadata(hdulist[0].header)
+    wcs = WCS(header, hdulist)
+    if transpose:
+        data = data.T
+        wcs = wcs.swapaxes(0, 1)
+
+    try:
+        data_unit = u.Unit(header['BUNIT'])
+    except Exception:
+        data_unit = u.count
+
+    # FITS WCS is invalid, so ignore it.
+    if wcs.spectral.naxis == 0:
+        kw = {}
+    else:
+        kw = {'wcs': wcs}
+
+    return Spectrum(flux=data * data_unit, meta=metadata, **kw)
+
+
+def _read_spectrum2d(data, index=None, ext=1, transpose=False):
+    # If we got a filepath, first try and parse using the Spectrum and
+    # SpectrumList parsers, and then fall back to parsing it as a generic
+    # FITS file.
+    if _check_is_file(data):
+        try:
+            if ext != 1 or transpose:
+                with fits.open(data) as hdulist:
+                    data = _parse_as_spectrum1d(hdulist, ext, transpose)
+            else:
+                data = Spectrum.read(data)
+        except IORegistryError:
+            with fits.open(data) as hdulist:
+                data = _parse_as_spectrum1d(hdulist, ext, transpose)
+    elif isinstance(data, fits.HDUList):
+        data = _parse_as_spectrum1d(data, ext, transpose)
+
+    # Make metadata layout conform with other viz.
+    data.meta = standardize_metadata(data.meta)
+
+    # Set the instrument
+    # TODO: this should not be set to nirspec for all datasets
+    data.meta['INSTRUME'] = 'nirspec'
+
+    if index is not None:
+        data.meta['mosviz_row'] = index
+    return data
+
+
 def _load_fits_image_from_filename(filename, app):
     with fits.open(filename) as hdulist:
         # We do not use the generated labels
@@ -412,7 +543,7 @@ def _load_fits_image_from_filename(filename, app):
 
 @data_parser_registry("mosviz-image-parser")
 def mos_image_parser(app, data_obj, data_labels=None, share_image=0,
-                     image_viewer_reference_name="image-viewer"):
+                     image_viewer_reference_name="image-viewer", lazy=False):
     """
     Attempts to parse an image-like object or list of images.
 
@@ -431,19 +562,43 @@ def mos_image_parser(app, data_obj, data_labels=None, share_image=0,
         different row in the table does not reload the displayed image.
         Currently, if non-zero, the provided number must match the number of
         spectra.
+    lazy : bool, optional
+        If `True`, only the headers are read now, and each image (the first
+        image extension of each file) is read when its row is selected (see
+        `~jdaviz.configs.mosviz.plugins.MosvizRowLoader`).  A shared image is
+        always read.
     """
 
     if data_obj is None:
         return
 
+    if lazy and isinstance(data_obj, (list, tuple)) and len(data_obj) > 1 and share_image == 0:
+        if data_labels is None:
+            data_labels = [f"Image {i}" for i in range(len(data_obj))]
+        elif isinstance(data_labels, str):
+            data_labels = [f"{data_labels} {i}" for i in range(len(data_obj))]
+
+        for i, (cur_data_obj, cur_label) in enumerate(zip(data_obj, data_labels)):
+            meta = _header_metadata(cur_data_obj)
+            meta['mosviz_row'] = i
+            _lazy_row_loader(app).register(
+                cur_label, partial(_read_image, cur_data_obj, cur_label, i, app),
+                partial(app.add_data, data_label=cur_label, notify_done=False),
+                meta=meta)
+
+        _add_to_table(app, data_labels, 'Images')
+        return
+
     # The label does not matter here. We overwrite later.
     if isinstance(data_obj, str):
         data_obj = _load_fits_image_from_filename(data_obj, app)
     elif isinstance(data_obj, (list, tuple)) and share_image == 0:
+        read = iter(_read_files(app, partial(_load_fits_image_from_filename, app=app),
+                                [x for x in data_obj if isinstance(x, str)]))
         temp_data = []
         for cur_data_obj in data_obj:
             if isinstance(cur_data_obj, str):
-                temp_data += _load_fits_image_from_filename(cur_data_obj, app)
+                temp_data += next(read)
             else:
                 data_iter = get_image_data_iterator(app, cur_data_obj, "Image", ext=None)
                 temp_data += [d[0] for d in data_iter]
@@ -572,8 +727,13 @@ def query_metadata_by_component(app, keys, data_type, fallback=FALLBACK_NAME):
     if not isinstance(keys, Iterable) or isinstance(keys, str):
         keys = [keys]
 
+    row_loader = getattr(app._jdaviz_helper, '_row_loader', None)
     for data in app._jdaviz_helper.get_column(data_type):
-        meta = app.data_collection[data].meta
+        if data not in app.data_collection and row_loader is not None and data in row_loader:
+            # data of lazily loaded rows that have not been read yet
+            meta = row_loader.get_meta(data)
+        else:
+            meta = app.data_collection[data].meta
 
         # Search all given keys to see if they exist. Return the first hit
         key_found = False
@@ -771,6 +931,139 @@ def _id_files_by_datamodl(label_dict, filepaths, catalog_key=None):
     return label_dict
 
 
+def _jwst_filter_name(fname, instrument):
+    # NIRISS files are labeled by their pupil, NIRCam files by their filter
+    header = fits.getheader(fname, ext=0)
+    return header.get('PUPIL') if instrument == "niriss" else header.get('FILTER')
+
+
+def _read_jwst_image(image_file, instrument, app):
+    """
+    Read the direct image of a NIRISS or NIRCam file, returning its filter
+    name and its data (labeled for the table viewer).
+    """
+    im_split = image_file.stem.split("_")[0]
+    pupil = _jwst_filter_name(image_file, instrument)
+
+    with fits.open(image_file) as temp:
+        data_iter = get_image_data_iterator(app, temp, "Image", ext=None)
+        data_obj = [d[0] for d in data_iter]  # We do not use the generated labels
+        if len(data_obj) > 1:
+            raise ValueError(f"Found {len(data_obj)} direct images, expected 1.")
+        image_data = data_obj[0]
+
+    image_data.label = f"Image {im_split} {pupil}"
+    return pupil, image_data
+
+
+def _read_jwst_spectra2d(fname, flabel, instrument, cat_id_dict=None):
+    """
+    Read the first-order 2D spectra of the sources of a NIRISS or NIRCam file
+    (those in ``cat_id_dict``, if given), returning a list of their filter name,
+    label and spectrum.
+    """
+    filter_name = _jwst_filter_name(fname, instrument)
+    # Orientation denoted by "C", "R", or "C+R" for combined spectra
+    orientation = flabel.split()[-1]
+
+    spectra = []
+    # save HDUs in file that correspond with sources in catalog
+    with fits.open(fname, memmap=False) as temp:
+        sci_hdus = []
+        wav_hdus = {}
+        for i in range(len(temp)):
+            if "EXTNAME" in temp[i].header:
+                if temp[i].header["EXTNAME"] == "SCI":
+                    if cat_id_dict is not None:
+                        if (temp[i].header["SOURCEID"] not in cat_id_dict.keys()):
+                            continue
+                    sci_hdus.append(i)
+                    wav_hdus[i] = ('WAVELENGTH', temp[i].header['EXTVER'])
+
+        for sci in sci_hdus:
+            if temp[sci].header["SPORDER"] == 1:
+                data = temp[sci].data
+                meta = standardize_metadata(temp[sci].header)
+                meta[PRIHDR_KEY] = standardize_metadata(temp[0].header)
+
+                # The wavelength is stored in a WAVELENGTH HDU. This is
+                # a 2D array, but in order to be able to use Spectrum
+                # we use the average wavelength for all image rows
+
+                if data.shape[0] > data.shape[1]:
+                    # then the input data needs to be transposed, and wavelength
+                    # needs to be averaged over axis=1 instead of axis=0
+                    data = data.T
+                    wav = temp[wav_hdus[sci]].data.mean(axis=1) * u.micron
+                else:
+                    wav = temp[wav_hdus[sci]].data.mean(axis=0) * u.micron
+
+                spec2d = Spectrum(data * u.one, spectral_axis=wav, meta=meta)
+                spec2d.meta['INSTRUME'] = instrument.upper()
+
+                label = (f"{filter_name} Source "
+                         f"{temp[sci].header['SOURCEID']} spec2d "
+                         f"{orientation}")  # noqa
+
+                if cat_id_dict is not None:
+                    # Store catalog's RA/Dec entry to be available later
+                    ra, dec = cat_id_dict[temp[sci].header["SOURCEID"]]
+                    spec2d.meta['catalog_ra'] = ra
+                    spec2d.meta['catalog_dec'] = dec
+
+                spectra.append((filter_name, label, spec2d))
+
+    return spectra
+
+
+def _read_jwst_spectra1d(fname, flabel, instrument, cat_id_dict=None):
+    """
+    Read the first-order 1D spectra of the sources of a NIRISS or NIRCam file
+    (those in ``cat_id_dict``, if given), returning a list of their label and
+    spectrum (with standardized metadata).
+    """
+    with fits.open(fname, memmap=False) as temp:
+        # Filter out HDUs we care about
+        if cat_id_dict is not None:
+            filtered_hdul = fits.HDUList([hdu for hdu in temp if (
+                (hdu.name in ('PRIMARY', 'ASDF')) or
+                (hdu.header.get('SOURCEID', None) in cat_id_dict.keys()))])
+        else:
+            filtered_hdul = temp
+
+        # SRCTYPE is required for the specutils JWST x1d reader. The reader will
+        # force this to POINT if not set. Under known cases, this field will be set
+        # for NIRISS programs; if it's not, something's gone wrong. Catch this
+        # warning and reraise as an error to warn users.
+        try:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("error",
+                                        category=UserWarning,
+                                        message=".*SRCTYPE is missing or UNKNOWN*")
+                specs = SpectrumList.read(filtered_hdul, format="JWST x1d multi")
+        except UserWarning as e:
+            raise KeyError(f"The SRCTYPE keyword in the header of file {fname} "
+                           "is not populated (expected values: EXTENDED or POINT)") from e
+
+    filter_name = _jwst_filter_name(fname, instrument)
+    # Orientation denoted by "C", "R", or "C+R" for combined spectra
+    orientation = flabel.split()[-1]
+
+    spectra = []
+    for sp in specs:
+        if (
+            sp.meta['header']['SPORDER'] == 1
+            and sp.meta['header']['EXTNAME'] == 'EXTRACT1D'
+        ):
+            sp.meta = standardize_metadata(sp.meta)
+            label = (f"{filter_name} Source "
+                     f"{sp.meta['SOURCEID']} spec1d "
+                     f"{orientation}")
+            spectra.append((label, sp))
+
+    return spectra
+
+
 @data_parser_registry("mosviz-niriss-parser")
 def mos_niriss_parser(app, data_dir, instrument=None,
                       table_viewer_reference_name='table-viewer'):
@@ -839,27 +1132,12 @@ def mos_niriss_parser(app, data_dir, instrument=None,
 
     if "Direct Image" in files_by_labels:
         print("Loading: Images")
-        for image_file in files_by_labels["Direct Image"]:
+        images = _read_files(app, partial(_read_jwst_image, instrument=instrument, app=app),
+                             files_by_labels["Direct Image"])
+        for pupil, image_data in images:
             # save label for table viewer
-            im_split = image_file.stem.split("_")[0]
-            if instrument == "niriss":
-                pupil = fits.getheader(image_file, ext=0).get('PUPIL')
-            elif instrument == "nircam":
-                pupil = fits.getheader(image_file, ext=0).get('FILTER')
-
-            image_label = f"Image {im_split} {pupil}"
-            image_dict[pupil] = image_label
-
-            # save information from data file
-            with fits.open(image_file) as temp:
-                data_iter = get_image_data_iterator(app, temp, "Image", ext=None)
-                data_obj = [d[0] for d in data_iter]  # We do not use the generated labels
-                if len(data_obj) > 1:
-                    raise ValueError(f"Found {len(data_obj)} direct images, expected 1.")
-                image_data = data_obj[0]
-
-            image_data.label = image_label
-            add_to_glue[image_label] = image_data
+            image_dict[pupil] = image_data.label
+            add_to_glue[image_data.label] = image_data
 
     # initialize lists of data to be shown in table viewer
     ras = []
@@ -872,122 +1150,40 @@ def mos_niriss_parser(app, data_dir, instrument=None,
     file_labels_2d = [k for k in files_by_labels.keys() if k.startswith("2D")]
 
     for flabel in file_labels_2d:
-        for fname in files_by_labels[flabel]:
-            print(f"Loading: {flabel} sources")
-            if flabel in ('2D Spectra R', '2D Spectra C'):
-                if instrument == "niriss":
-                    filter_name = fits.getheader(fname, ext=0).get('PUPIL')
-                elif instrument == "nircam":
-                    filter_name = fits.getheader(fname, ext=0).get('FILTER')
-
-                # Orientation denoted by "C", "R", or "C+R" for combined spectra
-                orientation = flabel.split()[-1]
-
-            # save HDUs in file that correspond with sources in catalog
-            with fits.open(fname, memmap=False) as temp:
-                sci_hdus = []
-                wav_hdus = {}
-                for i in range(len(temp)):
-                    if "EXTNAME" in temp[i].header:
-                        if temp[i].header["EXTNAME"] == "SCI":
-                            if cat_id_dict is not None:
-                                if (temp[i].header["SOURCEID"] not in cat_id_dict.keys()):
-                                    continue
-                            sci_hdus.append(i)
-                            wav_hdus[i] = ('WAVELENGTH', temp[i].header['EXTVER'])
-
-                for sci in sci_hdus:
-                    if temp[sci].header["SPORDER"] == 1:
-                        data = temp[sci].data
-                        meta = standardize_metadata(temp[sci].header)
-                        meta[PRIHDR_KEY] = standardize_metadata(temp[0].header)
-
-                        # The wavelength is stored in a WAVELENGTH HDU. This is
-                        # a 2D array, but in order to be able to use Spectrum
-                        # we use the average wavelength for all image rows
-
-                        if data.shape[0] > data.shape[1]:
-                            # then the input data needs to be transposed, and wavelength
-                            # needs to be averaged over axis=1 instead of axis=0
-                            data = data.T
-                            wav = temp[wav_hdus[sci]].data.mean(axis=1) * u.micron
-                        else:
-                            wav = temp[wav_hdus[sci]].data.mean(axis=0) * u.micron
-
-                        spec2d = Spectrum(data * u.one, spectral_axis=wav, meta=meta)
-                        spec2d.meta['INSTRUME'] = instrument.upper()
-                        spec2d.meta['mosviz_row'] = len(spec_labels_2d)
-
-                        label = (f"{filter_name} Source "
-                                 f"{temp[sci].header['SOURCEID']} spec2d "
-                                 f"{orientation}")  # noqa
-                        add_to_glue[label] = spec2d
-
-                        # update labels for table viewer
-                        if cat_id_dict is not None:
-                            ra, dec = cat_id_dict[temp[sci].header["SOURCEID"]]
-                            # Store catalog's RA/Dec entry to be available later
-                            spec2d.meta['catalog_ra'] = ra
-                            spec2d.meta['catalog_dec'] = dec
-                            ras.append(ra)
-                            decs.append(dec)
-
-                        if filter_name in image_dict:
-                            image_add.append(image_dict[filter_name])
-
-                        spec_labels_2d.append(label)
+        print(f"Loading: {flabel} sources")
+        spectra = _read_files(app, partial(_read_jwst_spectra2d, flabel=flabel,
+                                           instrument=instrument, cat_id_dict=cat_id_dict),
+                              files_by_labels[flabel])
+        for filter_name, label, spec2d in (item for file_items in spectra for item in file_items):
+            spec2d.meta['mosviz_row'] = len(spec_labels_2d)
+            add_to_glue[label] = spec2d
+
+            # update labels for table viewer
+            if cat_id_dict is not None:
+                ras.append(spec2d.meta['catalog_ra'])
+                decs.append(spec2d.meta['catalog_dec'])
+
+            if filter_name in image_dict:
+                image_add.append(image_dict[filter_name])
+
+            spec_labels_2d.append(label)
 
     # Parse 1D spectra
     file_labels_1d = [k for k in files_by_labels.keys() if k.startswith("1D")]
 
     for flabel in file_labels_1d:
-        for fname in files_by_labels[flabel]:
-            print(f"Loading: {flabel} sources")
-
-            with fits.open(fname, memmap=False) as temp:
-                # Filter out HDUs we care about
-                if cat_id_dict is not None:
-                    filtered_hdul = fits.HDUList([hdu for hdu in temp if (
-                        (hdu.name in ('PRIMARY', 'ASDF')) or
-                        (hdu.header.get('SOURCEID', None) in cat_id_dict.keys()))])
-                else:
-                    filtered_hdul = temp
-
-                # SRCTYPE is required for the specutils JWST x1d reader. The reader will
-                # force this to POINT if not set. Under known cases, this field will be set
-                # for NIRISS programs; if it's not, something's gone wrong. Catch this
-                # warning and reraise as an error to warn users.
-                try:
-                    with warnings.catch_warnings():
-                        warnings.filterwarnings("error",
-                                                category=UserWarning,
-                                                message=".*SRCTYPE is missing or UNKNOWN*")
-                        specs = SpectrumList.read(filtered_hdul, format="JWST x1d multi")
-                except UserWarning as e:
-                    raise KeyError(f"The SRCTYPE keyword in the header of file {fname} "
-                                   "is not populated (expected values: EXTENDED or POINT)") from e
-
-                if instrument == "niriss":
-                    filter_name = fits.getheader(fname, ext=0).get('PUPIL')
-                elif instrument == "nircam":
-                    filter_name = fits.getheader(fname, ext=0).get('FILTER')
-
-                # Orientation denoted by "C", "R", or "C+R" for combined spectra
-                orientation = flabel.split()[-1]
-
-                # update 1D labels and standardize metadata for table viewer
-                for sp in specs:
-                    if (
-                        sp.meta['header']['SPORDER'] == 1
-                        and sp.meta['header']['EXTNAME'] == 'EXTRACT1D'
-                    ):
-                        sp.meta = standardize_metadata(sp.meta)
-                        sp.meta['mosviz_row'] = len(spec_labels_1d)
-                        label = (f"{filter_name} Source "
-                                 f"{sp.meta['SOURCEID']} spec1d "
-                                 f"{orientation}")
-                        spec_labels_1d.append(label)
-                        add_to_glue[label] = sp
+        print(f"Loading: {flabel} sources")
+        # the files are read in separate processes since their reader turns warnings into
+        # errors, and warning filters are shared by threads
+        spectra = _read_files(app, partial(_read_jwst_spectra1d, flabel=flabel,
+                                           instrument=instrument, cat_id_dict=cat_id_dict),
+                              files_by_labels[flabel], prefer='processes')
+
+        # update 1D labels for table viewer
+        for label, sp in (item for file_items in spectra for item in file_items):
+            sp.meta['mosviz_row'] = len(spec_labels_1d)
+            spec_labels_1d.append(label)
+            add_to_glue[label] = sp
 
     # Add the datasets to glue - we do this in one step so that we can easily
     # optimize by avoiding recomputing the full link graph at every add
@@ -0,0 +1,192 @@
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from glue.core.link_helpers import LinkSameWithUnits
+
+__all__ = ['MosvizRowLoader']
+
+# columns of the MOS table that hold the labels of the data of each row
+ROW_COLUMNS = ('1D Spectra', '2D Spectra', 'Images')
+
+_LazyData = namedtuple('_LazyData', ['read', 'add', 'meta'])
+
+
+class MosvizRowLoader:
+    """
+    Loader of the data of Mosviz table rows on demand.
+
+    The parsers register the data of each row (see `register`) instead of adding it to
+    the data collection, so that the MOS table can be built from the header metadata
+    only.  The data of a row are then read and added when the row is selected (see
+    `load_row`), while the neighboring rows are read in a background thread, and the
+    least recently selected rows are removed from the data collection beyond
+    ``max_resident_rows``.
+
+    Parameters
+    ----------
+    app : `~jdaviz.app.Application`
+        The Mosviz application.
+    max_resident_rows : int, optional
+        Maximum number of rows with data in the data collection.
+    prefetch : int, optional
+        Number of rows to read ahead on each side of the selected row.
+    """
+    def __init__(self, app, max_resident_rows=20, prefetch=1):
+        self.app = app
+        self.max_resident_rows = max_resident_rows
+        self.prefetch = prefetch
+        self._lazy_data = {}
+        self._futures = {}
+        self._resident = OrderedDict()
+        self._current_row = None
+        self._executor = None
+
+    @property
+    def max_resident_rows(self):
+        return self._max_resident_rows
+
+    @max_resident_rows.setter
+    def max_resident_rows(self, value):
+        # the selected row and the one being deselected are both needed by the viewers
+        if value < 2:
+            raise ValueError("max_resident_rows must be at least 2")
+        self._max_resident_rows = value
+
+    def register(self, label, read, add, meta=None):
+        """
+        Register data to load on demand.
+
+        Parameters
+        ----------
+        label : str
+            Label of the data, as listed in the MOS table.
+        read : callable
+            Function returning the parsed data object.  It is called in a background
+            thread when the row is prefetched, so it should not modify the application.
+        add : callable
+            Function adding the object returned by ``read`` to the data collection.
+        meta : dict, optional
+            Metadata of the data (e.g., from the file headers), available before the
+            data are read.
+        """
+        self._lazy_data[label] = _LazyData(read, add, meta or {})
+
+    def __contains__(self, label):
+        return label in self._lazy_data
+
+    def __len__(self):
+        return len(self._lazy_data)
+
+    @property
+    def resident_rows(self):
+        """
+        Rows with data in the data collection, from the least recently used.
+        """
+        return list(self._resident)
+
+    def get_meta(self, label):
+        """
+        Return the registered metadata of the data ``label``.
+        """
+        return self._lazy_data[label].meta
+
+    def row_labels(self, row):
+        """
+        Return the labels of the registered data of ``row``.
+        """
+        table = self.app.data_collection['MOS Table']
+        columns = [comp.label for comp in table.main_components]
+        return [table[column][row] for column in ROW_COLUMNS
+                if column in columns and table[column][row] in self._lazy_data]
+
+    def _read(self, label):
+        future = self._futures.pop(label, None)
+        if future is not None and not future.cancelled():
+            try:
+                return future.result()
+            except Exception:  # nosec
+                # read again below so that errors are raised here
+                pass
+        return self._lazy_data[label].read()
+
+    def load_row(self, row, select=True):
+        """
+        Read and add the data of ``row`` that are not in the data collection yet.
+
+        Parameters
+        ----------
+        row : int
+            Index of the row in the MOS table.
+        select : bool, optional
+            Whether ``row`` becomes the selected row, whose neighbors are prefetched.
+        """
+        if not len(self._lazy_data):
+            return
+        labels = self.row_labels(row)
+        dc = self.app.data_collection
+        missing = [label for label in labels if label not in dc]
+        if missing:
+            # the data of the row are only linked together, as in `link_data_in_table`
+            auto_link, self.app.auto_link = self.app.auto_link, False
+            try:
+                with dc.delay_link_manager_update():
+                    for label in missing:
+                        self._lazy_data[label].add(self._read(label))
+                    self._link_row(row)
+            finally:
+                self.app.auto_link = auto_link
+
+        self._resident[row] = labels
+        self._resident.move_to_end(row)
+        self._evict(keep=(row, self._current_row))
+        if select:
+            self._current_row = row
+            self._prefetch(row)
+
+    def _link_row(self, row):
+        table = self.app.data_collection['MOS Table']
+        columns = [comp.label for comp in table.main_components]
+        if '1D Spectra' not in columns or '2D Spectra' not in columns:
+            return
+        dc = self.app.data_collection
+        spec_1d, spec_2d = table['1D Spectra'][row], table['2D Spectra'][row]
+        if spec_1d not in dc or spec_2d not in dc:
+            return
+        dc.add_link(LinkSameWithUnits(dc[spec_1d].world_component_ids[0],
+                                      dc[spec_2d].world_component_ids[1]))
+
+    def _evict(self, keep=()):
+        dc = self.app.data_collection
+        for row in list(self._resident):
+            if len(self._resident) <= self.max_resident_rows:
+                break
+            if row in keep:
+                continue
+            for label in self._resident.pop(row):
+                if label not in dc:
+                    continue
+                data = dc[label]
+                dc.remove_link([link for link in dc.external_links
+                                if getattr(link, 'data1', None) is data
+                                or getattr(link, 'data2', None) is data])
+                dc.remove(data)
+
+    def _prefetch(self, row):
+        if self.prefetch < 1:
+            return
+        n_rows = self.app.data_collection['MOS Table'].size
+        rows = [r for offset in range(1, self.prefetch + 1) for r in (row + offset, row - offset)
+                if 0 <= r < n_rows]
+        labels = [label for r in rows for label in self.row_labels(r)
+                  if label not in self.app.data_collection]
+
+        # drop the reads of rows that are not neighbors anymore
+        for label in [label for label in self._futures if label not in labels]:
+            self._futures.pop(label).cancel()
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1,
+                                                thread_name_prefix='mosviz-prefetch')
+        for label in labels:
+            if label not in self._futures:
+                self._futures[label] = self._executor.submit(self._lazy_data[label].read)
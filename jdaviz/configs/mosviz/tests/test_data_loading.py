@@ -4,6 +4,7 @@ from zipfile import ZipFile
 
 import numpy as np
 import pytest
+from astropy.io import fits
 from astropy.nddata import CCDData
 from specutils import Spectrum
 
@@ -258,3 +259,50 @@ def test_invalid_inputs(mosviz_helper):
 
     with pytest.raises(NotImplementedError, match="Please set valid values"):
         mosviz_helper.load_data()
+
+
+def test_load_lazy(mosviz_helper, spectrum1d, mos_spectrum2d, mos_image, tmp_path):
+    spectra1d, spectra2d, images = [], [], []
+    for i in range(5):
+        spectrum1d.meta = {'header': fits.Header({'SOURCEID': f"Source {i}"})}
+        spectra1d.append(str(tmp_path / f"spec1d_{i}.fits"))
+        spectrum1d.write(spectra1d[-1], format='tabular-fits')
+        primary = fits.PrimaryHDU()
+        primary.header.update({'FILTER': 'F170LP', 'GRATING': 'G235M'})
+        hdu = fits.ImageHDU(mos_spectrum2d.flux.value, header=mos_spectrum2d.wcs.to_header())
+        spectra2d.append(str(tmp_path / f"spec2d_{i}.fits"))
+        fits.HDUList([primary, hdu]).writeto(spectra2d[-1])
+        images.append(str(tmp_path / f"image_{i}.fits"))
+        mos_image.write(images[-1])
+
+    mosviz_helper.load_data(spectra1d, spectra2d, images=images, lazy=True, max_resident_rows=2)
+    dc = mosviz_helper.app.data_collection
+    row_loader = mosviz_helper._row_loader
+
+    # the table is built from the headers, and only the selected row is read
+    qtable = mosviz_helper.to_table()
+    assert list(qtable["Identifier"]) == [f"Source {i}" for i in range(5)]
+    assert list(qtable["Filter/Grating"]) == ["F170LP/G235M"] * 5
+    assert dc.labels == ["MOS Table", "1D Spectrum 0", "2D Spectrum 0", "Image 0"]
+    assert row_loader.resident_rows == [0]
+    assert len(dc.external_links) == 1
+
+    # the least recently selected rows are removed beyond max_resident_rows
+    table = mosviz_helper.app.get_viewer(mosviz_helper._default_table_viewer_reference_name)
+    table.select_row(3)
+    table.select_row(2)
+    assert row_loader.resident_rows == [3, 2]
+    assert sorted(dc.labels) == ["1D Spectrum 2", "1D Spectrum 3", "2D Spectrum 2",
+                                 "2D Spectrum 3", "Image 2", "Image 3", "MOS Table"]
+    assert len(dc.external_links) == 2
+    spectrum_viewer = mosviz_helper.app.get_viewer(
+        mosviz_helper._default_spectrum_viewer_reference_name)
+    assert [layer.layer.label for layer in spectrum_viewer.layers] == ["1D Spectrum 2"]
+    image_viewer = mosviz_helper.app.get_viewer(mosviz_helper._default_image_viewer_reference_name)
+    assert image_viewer.data(cls=CCDData)[0].shape == (55, 55)
+
+    # other rows are read on access
+    spec2d = mosviz_helper.get_spectrum_2d(row=4, apply_slider_redshift=False)
+    assert spec2d.shape[-1] == mos_spectrum2d.shape[-1]
+    assert spec2d.meta['mosviz_row'] == 4
+    assert row_loader.resident_rows == [2, 4]
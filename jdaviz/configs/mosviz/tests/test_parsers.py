@@ -2,8 +2,12 @@ from zipfile import ZipFile
 
 import pytest
 from numpy.testing import assert_allclose
+from astropy import units as u
+from astropy.io import fits
 from astropy.utils.data import download_file
+from specutils import Spectrum
 
+from jdaviz.configs.mosviz.plugins import parsers
 from jdaviz.utils import PRIHDR_KEY, COMMENTCARD_KEY
 
 
@@ -226,3 +230,50 @@ def test_missing_srctype(mosviz_helper, tmp_path):
     with pytest.raises(KeyError, match=r".*The SRCTYPE keyword.*is not populated.*"):
         mosviz_helper.load_data(directory=(tmp_path / 'NIRISS_for_parser_p0171'),
                                 instrument="niriss")
+
+
+def test_nirspec_parser_parallel_ingest(mosviz_helper, spectrum1d, mos_spectrum2d, tmp_path,
+                                        monkeypatch):
+    n_sources = 4
+    for i in range(n_sources):
+        spectrum1d.meta = {'header': fits.Header({'SOURCEID': f"Source {i}"})}
+        spectrum1d.write(tmp_path / f"source{i}_x1d.fits", format='tabular-fits')
+        hdu = fits.ImageHDU(mos_spectrum2d.flux.value * (i + 1),
+                            header=mos_spectrum2d.wcs.to_header())
+        fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(tmp_path / f"source{i}_s2d.fits")
+
+    # read the files in parallel even for this small directory
+    monkeypatch.setattr(parsers, 'PARALLEL_MIN_FILES', 2)
+    monkeypatch.setattr(parsers.mp, 'cpu_count', lambda: 3)
+    mosviz_helper.load_data(directory=tmp_path, instrument='nirspec')
+
+    # the rows are in the order of the files
+    assert list(mosviz_helper.to_table()["Identifier"]) == [f"Source {i}"
+                                                            for i in range(n_sources)]
+    for i in range(n_sources):
+        spec2d = mosviz_helper.app.data_collection[f"2D Spectrum {i}"]
+        assert spec2d.meta['mosviz_row'] == i
+        assert_allclose(spec2d.get_object(cls=Spectrum, statistic=None).flux.value,
+                        mos_spectrum2d.flux.value * (i + 1))
+
+    timings = mosviz_helper.ingest_timings
+    assert len(timings) == 2 * n_sources
+    assert list(timings['file']) == ([str(tmp_path / f"source{i}_x1d.fits")
+                                      for i in range(n_sources)]
+                                     + [str(tmp_path / f"source{i}_s2d.fits")
+                                        for i in range(n_sources)])
+    assert timings['read_time'].unit == u.s
+    assert all(timings['read_time'] > 0)
+
+
+def test_read_files():
+    class FakeHelper:
+        _ingest_timings = []
+
+    class FakeApp:
+        _jdaviz_helper = FakeHelper()
+
+    paths = [f"file{i}" for i in range(10)]
+    app = FakeApp()
+    assert parsers._read_files(app, str.upper, paths, n_cpu=3) == [p.upper() for p in paths]
+    assert [file for file, _ in app._jdaviz_helper._ingest_timings] == paths
@@ -1,5 +1,7 @@
 from numbers import Number
 
+from glue.core.message import NumericalDataChangedMessage
+
 from jdaviz.core.events import SliceSelectSliceMessage, NewViewerMessage
 from jdaviz.core.helpers import CubeConfigHelper
 from jdaviz.configs.rampviz.plugins.viewers import RampvizImageView
@@ -74,6 +76,47 @@ class Rampviz(CubeConfigHelper):
         msg = SliceSelectSliceMessage(value=int(group_index), sender=self)
         self.app.hub.broadcast(msg)
 
+    @property
+    def n_integrations(self):
+        """
+        Number of integrations of the loaded ramps.
+        """
+        return max([getattr(cube.data, 'n_integrations', 1)
+                    for cube in self.cube_cache.values()], default=0)
+
+    @property
+    def integration(self):
+        """
+        Index of the integration of the loaded ramps that is shown and extracted from.
+        """
+        for cube in self.cube_cache.values():
+            if hasattr(cube.data, 'integration'):
+                return cube.data.integration
+        return 0
+
+    def select_integration(self, integration):
+        """
+        Select the integration of the loaded ramps to show and extract from.  Only the
+        groups and pixels needed for the viewers are then read from the ramp.
+
+        Parameters
+        ----------
+        integration : int
+            Index of the integration.
+        """
+        if not isinstance(integration, Number):
+            raise TypeError("integration must be convertible to an integer")
+        if not 0 <= integration < self.n_integrations:
+            raise ValueError(f"integration must be between 0 and {self.n_integrations - 1}")
+
+        for data_label, cube in self.cube_cache.items():
+            if getattr(cube.data, 'n_integrations', 1) <= integration:
+                continue
+            cube.data.integration = int(integration)
+            data = self.app.data_collection[data_label]
+            self.app.hub.broadcast(NumericalDataChangedMessage(data))
+            self.app._update_live_plugin_results(trigger_data_lbl=data_label)
+
     def get_data(self, data_label=None, spatial_subset=None,
                  temporal_subset=None, cls=None, use_display_units=False):
         """
@@ -5,6 +5,8 @@ import numpy as np
 import astropy.units as u
 from astropy.io import fits
 from astropy.nddata import NDData, NDDataArray
+from glue.core import Data
+from glue.core.component import Component
 from stdatamodels.jwst.datamodels import Level1bModel
 
 from jdaviz.core.registries import data_parser_registry
@@ -139,7 +141,7 @@ def parse_data(app, file_obj, data_type=None, data_label=None,
         })
 
         _parse_ramp_cube(
-            app, file_obj.data[integration], u.DN,
+            app, RampArray(file_obj.data, integration), u.DN,
             data_label or file_obj.__class__.__name__,
             group_viewer_reference_name,
             diff_viewer_reference_name,
@@ -165,6 +167,247 @@ def move_group_axis_last(x):
     return np.transpose(x, (1, 2, 0))
 
 
+class RampArray:
+    """
+    Read-only array of one integration of a 4D ramp (integrations, groups, y, x), with
+    the group axis last.  The ramp can be memory-mapped, in which case only the indexed
+    pixels and groups are read, and the selected ``integration`` can be changed without
+    reading any data.
+
+    Parameters
+    ----------
+    ramps : array-like
+        4D ramp (possibly memory-mapped and not scaled, see ``bscale`` and ``bzero``).
+    integration : int, optional
+        Index of the integration.
+    bscale, bzero : float, optional
+        Scaling of the stored values of ``ramps``, as in FITS.  Values stored as signed
+        integers with the usual offset (e.g., ``bzero=32768`` for 16-bit integers) are
+        returned as unsigned integers, other scaled values as floats.
+    """
+    def __init__(self, ramps, integration=0, bscale=1, bzero=0):
+        if np.ndim(ramps) != 4:
+            raise ValueError("ramps must have 4 dimensions (integrations, groups, y, x)")
+        self.ramps = ramps
+        self.bscale = bscale
+        self.bzero = bzero
+        self.integration = integration
+
+        raw_dtype = np.dtype(ramps.dtype)
+        if bscale == 1 and bzero == 0:
+            self.dtype = raw_dtype
+        elif (raw_dtype.kind == 'i' and bscale == 1
+                and bzero == 2 ** (8 * raw_dtype.itemsize - 1)):
+            self.dtype = np.dtype(f'u{raw_dtype.itemsize}')
+        else:
+            self.dtype = np.dtype(float)
+
+    @property
+    def n_integrations(self):
+        return self.ramps.shape[0]
+
+    @property
+    def integration(self):
+        return self._integration
+
+    @integration.setter
+    def integration(self, integration):
+        if not 0 <= integration < self.n_integrations:
+            raise ValueError(f"integration must be between 0 and {self.n_integrations - 1}")
+        self._integration = int(integration)
+
+    def for_integration(self, integration):
+        """
+        Return the array of another integration of the same ramp.
+        """
+        return RampArray(self.ramps, integration, bscale=self.bscale, bzero=self.bzero)
+
+    @property
+    def shape(self):
+        n_groups, ny, nx = self.ramps.shape[1:]
+        return (ny, nx, n_groups)
+
+    @property
+    def ndim(self):
+        return 3
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self[...], dtype=dtype)
+
+    def __getitem__(self, key):
+        # indexing the transposed (memory-mapped) view only reads the indexed values
+        values = move_group_axis_last(self.ramps[self.integration])[key]
+        if self.bscale == 1 and self.bzero == 0:
+            return values
+        if self.dtype.kind == 'u':
+            return (np.asarray(values, dtype=np.int64) + self.bzero).astype(self.dtype)
+        return np.asarray(values, dtype=float) * self.bscale + self.bzero
+
+
+class GroupDiffArray:
+    """
+    Read-only array of the differences between consecutive groups of a ramp cube
+    (with the group axis last), starting with a group of zeros so that it has the same
+    shape as the ramp.  Differences are only computed, as floats, for the indexed
+    pixels and groups, so the ramp can stay in its native (e.g., unsigned) data type.
+
+    Parameters
+    ----------
+    ramp : array-like
+        Ramp cube, with the group axis last.
+    """
+    dtype = np.dtype(float)
+
+    def __init__(self, ramp):
+        self.ramp = ramp
+
+    @property
+    def n_integrations(self):
+        return getattr(self.ramp, 'n_integrations', 1)
+
+    @property
+    def integration(self):
+        return getattr(self.ramp, 'integration', 0)
+
+    @integration.setter
+    def integration(self, integration):
+        self.ramp.integration = integration
+
+    def for_integration(self, integration):
+        """
+        Return the group differences of another integration of the same ramp.
+        """
+        return GroupDiffArray(self.ramp.for_integration(integration))
+
+    @property
+    def shape(self):
+        return self.ramp.shape
+
+    @property
+    def ndim(self):
+        return len(self.shape)
+
+    @property
+    def size(self):
+        return int(np.prod(self.shape))
+
+    def __len__(self):
+        return self.shape[0]
+
+    def __array__(self, dtype=None, copy=None):
+        return np.asarray(self[...], dtype=dtype)
+
+    def _split_key(self, key):
+        # split ``key`` into the index of the pixels and the index of the groups,
+        # or return None if the group axis is not indexed on its own
+        key = key if isinstance(key, tuple) else (key,)
+        n_ellipsis = sum(k is Ellipsis for k in key)
+        if n_ellipsis > 1 or any(k is None for k in key):
+            return None
+
+        def n_axes(k):
+            # number of axes indexed by ``k`` (boolean masks can index several)
+            return np.ndim(k) if getattr(k, 'dtype', None) == bool else 1
+
+        n_indexed = sum(n_axes(k) for k in key if k is not Ellipsis)
+        if n_indexed > self.ndim:
+            return None
+        fill = (slice(None),) * (self.ndim - n_indexed)
+        if n_ellipsis:
+            i = [k is Ellipsis for k in key].index(True)
+            key = key[:i] + fill + key[i + 1:]
+        else:
+            key = key + fill
+        if n_axes(key[-1]) != 1:
+            return None
+        return key[:-1], key[-1]
+
+    def __getitem__(self, key):
+        split_key = self._split_key(key)
+        if split_key is None:
+            # e.g., a boolean mask over all the axes
+            return np.asarray(self)[key]
+        pixels, groups = split_key
+        n_groups = self.shape[-1]
+        group_indices = np.arange(n_groups)[groups]
+        previous = np.maximum(group_indices - 1, 0)
+
+        if np.ndim(groups) and any(np.ndim(k) for k in pixels):
+            # groups indexed by an array, together with arrays indexing the pixels, are
+            # indexed point-wise (broadcast together, as numpy does).  The first group has
+            # itself as predecessor, so its difference is zero.
+            return (np.asarray(self.ramp[pixels + (group_indices,)], dtype=float)
+                    - np.asarray(self.ramp[pixels + (previous,)], dtype=float))
+
+        # index the pixels and read the range of groups covering the requested ones and
+        # their predecessors, the groups then being the last axis
+        start = int(np.min(previous)) if np.size(previous) else 0
+        stop = int(np.max(group_indices)) + 1 if np.size(group_indices) else 0
+        block = np.asarray(self.ramp[pixels + (slice(start, stop),)], dtype=float)
+        diff = np.diff(block, axis=-1, prepend=block[..., :1])
+        return diff[..., group_indices - start]
+
+
+class LazyComponent(Component):
+    """
+    Glue component of an array computed or read on demand for the requested views
+    (e.g., `RampArray` or `GroupDiffArray`).  Views are computed from the array
+    until the full array is requested (through ``data``), which is then computed
+    once and kept until the selected integration changes, unless it is larger than
+    ``max_cached_bytes``, in which case it is computed again when requested.
+    """
+    # full arrays larger than this are not kept, so that large ramps are not duplicated
+    max_cached_bytes = 256 * 1024**2
+
+    def __init__(self, array, units=None):
+        super().__init__(array, units=units)
+        # (integration, full array) once the full array was requested
+        self._materialized = None
+
+    def _materialized_array(self):
+        if (self._materialized is not None
+                and self._materialized[0] == getattr(self._data, 'integration', 0)):
+            return self._materialized[1]
+        return None
+
+    @property
+    def data(self):
+        array = self._materialized_array()
+        if array is None:
+            array = np.asarray(self._data)
+            if array.nbytes <= self.max_cached_bytes:
+                self._materialized = (getattr(self._data, 'integration', 0), array)
+        return array
+
+    def __getitem__(self, key):
+        array = self._materialized_array()
+        if array is not None:
+            return array[key]
+        return self._data[key]
+
+    @property
+    def numeric(self):
+        return True
+
+
+def _add_lazy_data(app, array, unit, data_label, meta=None):
+    # add ``array`` (e.g., a `RampArray` or `GroupDiffArray`) to the app as a component
+    # computed on demand, and return the cube sharing the same array
+    data = Data(label=data_label)
+    data.add_component(LazyComponent(array, units=str(unit)), 'data')
+    if meta is not None:
+        data.meta.update(meta)
+    app.add_data(data, data_label)
+    return NDDataArray(array, unit=unit, meta=meta)
+
+
 def _roman_3d_to_glue_data(
     app, file_obj, data_label,
     group_viewer_reference_name=None,
@@ -183,52 +426,36 @@ def _roman_3d_to_glue_data(
     if data_label is None:
         data_label = app.return_data_label(file_obj)
 
-    # last axis is the group axis, first two are spatial axes:
-    diff_data = np.vstack([
-        # begin with a group of zeros, so
-        # that `diff_data.ndim == data.ndim`
-        np.zeros((1, *data[0].shape)),
-        np.diff(data, axis=0)
-    ])
-
     ramp_cube_data_label = f"{data_label}[DATA]"
     ramp_diff_data_label = f"{data_label}[DIFF]"
 
+    # last axis is the group axis, first two are spatial axes:
     data_reshaped = move_group_axis_last(data)
-    diff_data_reshaped = move_group_axis_last(diff_data)
 
     # if the ramp cube has no units, assume DN:
     if getattr(data_reshaped, 'unit', None) is None:
-        assumed_unit = u.DN
-        data_reshaped <<= assumed_unit
-        diff_data_reshaped <<= assumed_unit
-
-    # load these cubes into the cache:
-    app._jdaviz_helper.cube_cache[ramp_cube_data_label] = NDDataArray(
-        data_reshaped
-    )
-    app._jdaviz_helper.cube_cache[ramp_diff_data_label] = NDDataArray(
-        diff_data_reshaped
-    )
+        data_reshaped <<= u.DN
 
     if meta is not None:
         meta = standardize_roman_metadata(file_obj)
 
-    # load these cubes into the app:
+    # load these cubes into the app, and into the cache (sharing the same arrays).
+    # The group differences are computed on demand for the requested views:
+    ramp_cube = NDDataArray(data_reshaped, meta=meta)
+    app._jdaviz_helper.cube_cache[ramp_cube_data_label] = ramp_cube
     _parse_ndarray(
         app,
-        file_obj=data_reshaped,
+        file_obj=ramp_cube,
         data_label=ramp_cube_data_label,
         viewer_reference_name=group_viewer_reference_name,
         meta=meta
     )
-    _parse_ndarray(
-        app,
-        file_obj=diff_data_reshaped,
-        data_label=ramp_diff_data_label,
-        viewer_reference_name=diff_viewer_reference_name,
+    app._jdaviz_helper.cube_cache[ramp_diff_data_label] = _add_lazy_data(
+        app, GroupDiffArray(data_reshaped.value), data_reshaped.unit, ramp_diff_data_label,
         meta=meta
     )
+    app.add_data_to_viewer(diff_viewer_reference_name, ramp_diff_data_label)
+    app._jdaviz_helper._loaded_flux_cube = app.data_collection[ramp_diff_data_label]
 
     # the default collapse function in the profile viewer is "sum",
     # but for ramp files, "median" is more useful:
@@ -284,9 +511,10 @@ def _parse_hdulist(
         warnings.warn("Invalid BUNIT, using DN as data unit", UserWarning)
         flux_unit = u.DN
 
-    # index the ramp array by the integration to load. returns all groups and pixels.
-    # cast from uint16 to integers:
-    ramp_cube = hdu.data[integration].astype(int)
+    # expose all the integrations, with only the indexed groups and pixels of the selected
+    # integration read (as needed) from the memory-mapped file, in their native data type
+    # (the group differences are computed as floats):
+    ramp_cube = _ramp_array(hdulist, hdu, integration or 0)
 
     metadata = standardize_metadata(hdu.header)
     if hdu.name != 'PRIMARY' and 'PRIMARY' in hdulist:
@@ -300,32 +528,40 @@ def _parse_hdulist(
     )
 
 
+def _ramp_array(hdulist, hdu, integration):
+    filename = hdulist.filename()
+    if filename is None:
+        # the data are already in memory
+        return RampArray(hdu.data, integration)
+
+    # map the stored values, and scale them only as they are read
+    with fits.open(filename, memmap=True, do_not_scale_image_data=True) as raw_hdulist:
+        raw_hdu = raw_hdulist[hdulist.index(hdu)]
+        return RampArray(raw_hdu.data, integration,
+                         bscale=raw_hdu.header.get('BSCALE', 1),
+                         bzero=raw_hdu.header.get('BZERO', 0))
+
+
 def _parse_ramp_cube(app, ramp_cube_data, flux_unit, file_name,
                      group_viewer_reference_name, diff_viewer_reference_name,
                      meta=None):
     # last axis is the group axis, first two are spatial axes:
-    diff_data = np.vstack([
-        # begin with a group of zeros, so
-        # that `diff_data.ndim == data.ndim`
-        np.zeros((1, *ramp_cube_data[0].shape)),
-        np.diff(ramp_cube_data, axis=0)
-    ])
-
-    ramp_cube = NDDataArray(move_group_axis_last(ramp_cube_data), unit=flux_unit, meta=meta)
-    diff_cube = NDDataArray(move_group_axis_last(diff_data), unit=flux_unit, meta=meta)
+    if not isinstance(ramp_cube_data, RampArray):
+        ramp_cube_data = move_group_axis_last(ramp_cube_data)
 
     group_data_label = app.return_data_label(file_name, ext="DATA")
     diff_data_label = app.return_data_label(file_name, ext="DIFF")
 
-    for data_entry, data_label, viewer_ref in zip(
-            (ramp_cube, diff_cube),
+    for data_label, viewer_ref, array in zip(
             (group_data_label, diff_data_label),
-            (group_viewer_reference_name, diff_viewer_reference_name)
+            (group_viewer_reference_name, diff_viewer_reference_name),
+            # the group differences are computed on demand for the requested views
+            (ramp_cube_data, GroupDiffArray(ramp_cube_data))
     ):
-        app.add_data(data_entry, data_label)
+        data_entry = _add_lazy_data(app, array, flux_unit, data_label, meta=meta)
         app.add_data_to_viewer(viewer_ref, data_label)
 
-        # load these cubes into the cache:
+        # load these cubes into the cache (sharing the arrays of the loaded data):
         app._jdaviz_helper.cube_cache[data_label] = data_entry
 
         # set as reference data in this viewer
@@ -49,6 +49,7 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
       Method to use for extracting a ramp profile
     * ``add_results`` (:class:`~jdaviz.core.template_mixin.AddResults`)
     * :meth:`extract`
+    * :meth:`extract_integrations`
     """
     template_file = __file__, "ramp_extraction.vue"
     uses_active_status = Bool(True).tag(sync=True)
@@ -224,7 +225,8 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
     @property
     def user_api(self):
         expose = [
-            'dataset', 'function', 'aperture', 'add_results', 'extract'
+            'dataset', 'function', 'aperture', 'add_results', 'extract',
+            'extract_integrations'
         ]
 
         return PluginUserApi(self, expose=expose)
@@ -321,41 +323,60 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
 
         return np.ones(cube_shape[:-1]).astype(bool)
 
-    def _extract_from_aperture(self, **kwargs):
+    def _aperture_inputs(self, nddata=None):
+        # Reads the ramps of the pixels within the aperture from the state of the app, to be
+        # collapsed by _collapse_ramps.
+        #
         # This plugin collapses over the *spatial axes* (optionally over a spatial subset,
-        # defaults to ``No Subset``). Since the Cubeviz parser puts the fluxes
-        # and uncertainties in different glue Data objects, we translate the ramp
-        # cube and its uncertainties into separate NDDataArrays, then combine them:
-        selected_func = self.function_selected.lower()
-
+        # defaults to ``No Subset``).
         if not isinstance(self.aperture, ApertureSubsetSelect):
             raise ValueError("aperture must be an ApertureSubsetSelect object")
 
-        nddata = self.cube
+        if nddata is None:
+            nddata = self.cube
         mask = self.aperture_weight_mask
 
         if nddata.mask is not None:
             mask = mask & ~nddata.mask
 
-        collapsed = getattr(np, selected_func)(
-            nddata.data[mask],
-            # after the fancy indexing above, axis=1 corresponds to groups, and
-            # operations over axis=0 corresponds to individual pixels:
-            axis=0
-        )
-        if nddata.unit is not None:
-            collapsed <<= nddata.unit
-
-        def expand(x):
-            # put the resulting 1D profile (counts vs. groups) into the
-            # third dimension, which is the group dimension in the
-            # original 3D cube:
-            return np.expand_dims(x, axis=(0, 1))
-
-        return NDDataArray(
-            data=expand(collapsed),
-            meta=nddata.meta
-        )
+        return {'ramps': nddata.data[mask], 'unit': nddata.unit, 'meta': dict(nddata.meta),
+                'function': self.function_selected.lower()}
+
+    def _extract_from_aperture(self, nddata=None, **kwargs):
+        return _collapse_ramps(self._aperture_inputs(nddata=nddata))
+
+    def _live_result_inputs(self, **kwargs):
+        # Reads all the inputs of the extraction from the state of the app (which is not
+        # thread-safe, so must run in the main thread), see _compute_live_result.
+        if self.conflicting_aperture_and_function:
+            raise ValueError(self.conflicting_aperture_error_message)
+        return self._aperture_inputs()
+
+    @staticmethod
+    def _compute_live_result(inputs):
+        # Extracts the ramp profile from the inputs read by _live_result_inputs only, so can
+        # run in a background thread, see _apply_live_result.
+        return _collapse_ramps(inputs)
+
+    def _apply_live_result(self, result, add_data=True):
+        # Swaps in the ramp profile computed by _compute_live_result, in the main thread.
+        self.extracted_ramp = result
+        self.extraction_available = True
+        fname_label = self.dataset_selected.replace("[", "_").replace("]", "")
+        self.filename = f"extracted_{self.function_selected.lower()}_{fname_label}.fits"
+
+        if add_data:
+            if default_color := self.aperture.selected_item.get('color', None):
+                result.meta['_default_color'] = default_color
+            self.add_results.add_results_from_plugin(result)
+
+            snackbar_message = SnackbarMessage(
+                f"{self.resulting_product_name.title()} extracted successfully.",
+                color="success",
+                sender=self)
+            self.hub.broadcast(snackbar_message)
+
+        return result
 
     def _preview_x_from_extracted(self, extracted):
         return np.arange(extracted.shape[-1])
@@ -377,28 +398,38 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
             Additional keyword arguments passed to the NDDataArray collapse operation.
             Examples include ``propagate_uncertainties`` and ``operation_ignores_mask``.
         """
-        if self.conflicting_aperture_and_function:
-            raise ValueError(self.conflicting_aperture_error_message)
+        ndd = self._compute_live_result(self._live_result_inputs(**kwargs))
+        return self._apply_live_result(ndd, add_data=add_data)
 
-        selected_func = self.function_selected.lower()
-        ndd = self._extract_from_aperture(**kwargs)
-        self.extracted_ramp = ndd
-        self.extraction_available = True
-        fname_label = self.dataset_selected.replace("[", "_").replace("]", "")
-        self.filename = f"extracted_{selected_func}_{fname_label}.fits"
+    @with_spinner()
+    def extract_integrations(self, **kwargs):
+        """
+        Extract the ramp profile of every integration of the selected ramp, according to
+        the plugin inputs.  Integrations are read one at a time, so the whole ramp is never
+        loaded at once.
 
-        if add_data:
-            if default_color := self.aperture.selected_item.get('color', None):
-                ndd.meta['_default_color'] = default_color
-            self.add_results.add_results_from_plugin(ndd)
+        Parameters
+        ----------
+        kwargs : dict
+            Additional keyword arguments passed to the NDDataArray collapse operation.
 
-            snackbar_message = SnackbarMessage(
-                f"{self.resulting_product_name.title()} extracted successfully.",
-                color="success",
-                sender=self)
-            self.hub.broadcast(snackbar_message)
+        Returns
+        -------
+        ramps : list of `~astropy.nddata.NDDataArray`
+            Extracted ramp profile of each integration.
+        """
+        if self.conflicting_aperture_and_function:
+            raise ValueError(self.conflicting_aperture_error_message)
 
-        return ndd
+        cube = self.cube
+        n_integrations = getattr(cube.data, 'n_integrations', 1)
+        if n_integrations == 1:
+            return [self._extract_from_aperture(nddata=cube, **kwargs)]
+        return [self._extract_from_aperture(
+                    nddata=NDDataArray(cube.data.for_integration(integration),
+                                       unit=cube.unit, mask=cube.mask, meta=cube.meta),
+                    **kwargs)
+                for integration in range(n_integrations)]
 
     def vue_ramp_extraction(self, *args, **kwargs):
         try:
@@ -476,3 +507,24 @@ class RampExtraction(PluginTemplateMixin, ApertureSubsetSelectMixin,
 
         self.marks['extract'].update_xy(self._preview_x_from_extracted(ext),
                                         self._preview_y_from_extracted(ext))
+
+
+def _collapse_ramps(inputs):
+    # Collapses the ramps read by RampExtraction._aperture_inputs (only depends on its
+    # arguments, so can run in a background thread).
+    collapsed = getattr(np, inputs['function'])(
+        inputs['ramps'],
+        # after the fancy indexing of the aperture, axis=1 corresponds to groups, and
+        # operations over axis=0 corresponds to individual pixels:
+        axis=0
+    )
+    if inputs['unit'] is not None:
+        collapsed <<= inputs['unit']
+
+    # put the resulting 1D profile (counts vs. groups) into the
+    # third dimension, which is the group dimension in the
+    # original 3D cube:
+    return NDDataArray(
+        data=np.expand_dims(collapsed, axis=(0, 1)),
+        meta=inputs['meta']
+    )
@@ -1,3 +1,11 @@
+import mmap
+
+import numpy as np
+import pytest
+from astropy.io import fits
+from numpy.testing import assert_allclose
+
+from jdaviz.configs.rampviz.plugins.parsers import GroupDiffArray, LazyComponent, RampArray
 
 
 def test_load_rectangular_ramp(rampviz_helper, jwst_level_1b_rectangular_ramp):
@@ -32,3 +40,120 @@ def test_load_level_1_and_2(
 
     layers = rampviz_helper.app.get_viewer('level-2').layers
     assert len(layers) == 1
+
+
+def test_load_uint16_ramp_lazy_diff(rampviz_helper, tmp_path):
+    rng = np.random.default_rng(seed=42)
+    # integrations, groups, y, x
+    ramp = np.cumsum(rng.integers(0, 100, size=(2, 6, 8, 5)), axis=1).astype(np.uint16)
+    ramp[0, 3] = 0  # decreasing counts, which would wrap around in uint16
+    hdu = fits.ImageHDU(ramp, name='SCI')
+    hdu.header['BUNIT'] = 'DN'
+    filename = str(tmp_path / 'ramp.fits')
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(filename)
+    rampviz_helper.load_data(filename, data_label='ramp', integration=0)
+
+    dc = rampviz_helper.app.data_collection
+    data = dc['ramp[DATA]']
+    diff = dc['ramp[DIFF]']
+    # the ramp keeps its native data type, and the cache shares its array
+    assert data.get_component('data').data.dtype.kind == 'u'
+    cube_cache = rampviz_helper.cube_cache
+    assert cube_cache['ramp[DATA]'].data is data.get_component('data')._data
+
+    # group differences are computed on demand, for the requested view only
+    expected = np.concatenate([np.zeros((8, 5, 1)),
+                               np.diff(np.transpose(ramp[0], (1, 2, 0)).astype(float), axis=-1)],
+                              axis=-1)
+    component = diff.get_component('data')
+    assert isinstance(component, LazyComponent)
+    assert diff.shape == expected.shape
+    assert_allclose(diff.get_data(diff.id['data'], view=(slice(None), slice(None), 3)),
+                    expected[..., 3])
+    assert_allclose(diff.get_data(diff.id['data'], view=(slice(2, 5), 1, slice(None))),
+                    expected[2:5, 1])
+    assert_allclose(diff.get_data(diff.id['data']), expected)
+    assert cube_cache['ramp[DIFF]'].data is component._data
+
+    # the full array is only computed once
+    assert component.data is component.data
+    assert_allclose(component[2:5, 1], expected[2:5, 1])
+
+    # unless it is too large to be kept
+    component.max_cached_bytes = 0
+    component._materialized = None
+    assert component.data is not component.data
+    assert_allclose(component.data, expected)
+
+    # extraction from the virtual cube
+    extract = rampviz_helper.plugins['Ramp Extraction']
+    extract.dataset = 'ramp[DIFF]'
+    extract.function = 'Mean'
+    assert_allclose(extract.extract(add_data=False).data.ravel(), expected.mean(axis=(0, 1)))
+
+
+@pytest.mark.parametrize('key', [
+    (np.array([1, 2, 3]), slice(None), slice(None)),
+    (np.array([1, 2]), np.array([0, 1]), slice(2, 4)),
+    (np.array([1, 2]), slice(None), 2),
+    (1, np.array([0, 4]), slice(None, None, 2)),
+    (slice(None), slice(None), np.array([0, 2, 5])),
+    (np.array([1, 2]), np.array([0, 1]), np.array([0, 3])),
+    (np.array([1, 2]), slice(None), np.array([0, 3])),
+    (np.array([[1], [2]]), np.array([0, 1, 2]), 0),
+    (Ellipsis, 3)])
+def test_group_diff_array_indexing(key):
+    rng = np.random.default_rng(seed=42)
+    # y, x, groups
+    ramp = np.cumsum(rng.integers(0, 100, size=(8, 5, 6)), axis=-1).astype(np.uint16)
+    dense = np.diff(ramp.astype(float), axis=-1, prepend=ramp[..., :1].astype(float))
+    diff = GroupDiffArray(ramp)[key]
+    assert diff.shape == dense[key].shape
+    assert_allclose(diff, dense[key])
+
+
+def test_load_ramp_integrations(rampviz_helper, tmp_path):
+    rng = np.random.default_rng(seed=42)
+    ramp = np.cumsum(rng.integers(0, 100, size=(3, 6, 8, 5)), axis=1).astype(np.uint16)
+    hdu = fits.ImageHDU(ramp, name='SCI')
+    hdu.header['BUNIT'] = 'DN'
+    filename = str(tmp_path / 'ramp.fits')
+    fits.HDUList([fits.PrimaryHDU(), hdu]).writeto(filename)
+    rampviz_helper.load_data(filename, data_label='ramp', integration=1)
+
+    # all the integrations are mapped from the file, and read only as indexed
+    dc = rampviz_helper.app.data_collection
+    ramp_array = dc['ramp[DATA]'].get_component('data')._data
+    assert isinstance(ramp_array, RampArray)
+    base = ramp_array.ramps
+    while isinstance(base, np.ndarray):
+        base = base.base
+    assert isinstance(base, mmap.mmap)
+    assert rampviz_helper.n_integrations == 3
+    assert rampviz_helper.integration == 1
+
+    def group_view(label, group):
+        return dc[label].get_data(dc[label].id['data'],
+                                  view=(slice(None), slice(None), group))
+
+    assert_allclose(group_view('ramp[DATA]', 4), ramp[1, 4])
+    diff_component = dc['ramp[DIFF]'].get_component('data')
+    diff_integration_1 = diff_component.data
+    rampviz_helper.select_integration(2)
+    assert_allclose(group_view('ramp[DATA]', 4), ramp[2, 4])
+    assert_allclose(group_view('ramp[DIFF]', 4), ramp[2, 4].astype(float) - ramp[2, 3])
+    # the full array computed before is not used for another integration
+    assert diff_component.data is not diff_integration_1
+    assert_allclose(diff_component.data[..., 4], ramp[2, 4].astype(float) - ramp[2, 3])
+    with pytest.raises(ValueError, match='integration must be between'):
+        rampviz_helper.select_integration(3)
+
+    extract = rampviz_helper.plugins['Ramp Extraction']
+    extract.dataset = 'ramp[DATA]'
+    extract.function = 'Median'
+    ramps = extract.extract_integrations()
+    assert len(ramps) == 3
+    for integration, extracted in enumerate(ramps):
+        assert_allclose(extracted.data.ravel(), np.median(ramp[integration], axis=(1, 2)))
+    # the selected integration is unchanged
+    assert rampviz_helper.integration == 2
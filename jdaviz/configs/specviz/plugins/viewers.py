@@ -16,7 +16,7 @@ from jdaviz.core.events import (AddDataToViewerMessage,
                                 LineIdentifyMessage)
 from jdaviz.core.freezable_state import FreezableBqplotImageViewerState
 from jdaviz.core.registries import viewer_registry
-from jdaviz.core.marks import SpectralLine
+from jdaviz.core.marks import SpectralLines
 from jdaviz.core.linelists import load_preset_linelist, get_available_linelists
 from jdaviz.core.unit_conversion_utils import (spectral_axis_conversion,
                                                flux_conversion_general,
@@ -172,9 +172,33 @@ class Spectrum1DViewer(JdavizProfileView):
         if return_table:
             return line_table
 
+    @property
+    def spectral_lines_mark(self):
+        """
+        The `~jdaviz.core.marks.SpectralLines` mark of the plotted spectral lines, or
+        `None` if no lines were plotted in this viewer yet.
+        """
+        for mark in self.figure.marks:
+            if isinstance(mark, SpectralLines):
+                return mark
+        return None
+
+    def _get_spectral_lines_mark(self, redshift, **kwargs):
+        mark = self.spectral_lines_mark
+        if mark is None:
+            mark = SpectralLines(self, redshift, **kwargs)
+            self.figure.marks = self.figure.marks + mark.marks
+        else:
+            with mark.hold_sync():
+                for attr, value in kwargs.items():
+                    setattr(mark, attr, value)
+            mark.redshift = redshift
+        return mark
+
     def _broadcast_plotted_lines(self, marks=None):
         if marks is None:
-            marks = [x for x in self.figure.marks if isinstance(x, SpectralLine)]
+            lines_mark = self.spectral_lines_mark
+            marks = lines_mark.lines if lines_mark is not None else []
 
         msg = SpectralMarksChangedMessage(marks, sender=self)
         self.session.hub.broadcast(msg)
@@ -188,16 +212,16 @@ class Spectrum1DViewer(JdavizProfileView):
         """
         Erase either all spectral lines, all spectral lines sharing the same
         name (e.g. 'He II') or a specific name-rest value combination (e.g.
-        'HE II 1640.5', stored in SpectralLine as 'table_index').
+        'HE II 1640.5', stored in SpectralLines as 'table_indices').
         """
-        fig = self.figure
+        mark = self.spectral_lines_mark
         if name is None and name_rest is None:
-            fig.marks = [x for x in fig.marks if not isinstance(x, SpectralLine)]
+            if mark is not None:
+                mark.set_show(None, False)
             if show_none:
                 self.spectral_lines["show"] = False
             self._broadcast_plotted_lines([])
         else:
-            temp_marks = []
             # Toggle "show" value in main astropy table. The astropy table
             # machinery only allows updating a single row at a time.
             if name_rest is not None:
@@ -206,22 +230,13 @@ class Spectrum1DViewer(JdavizProfileView):
                 elif isinstance(name_rest, list):
                     for nr in name_rest:
                         self.spectral_lines.loc[nr]["show"] = False
-            # Get rid of the marks we no longer want
-            for x in fig.marks:
-                if isinstance(x, SpectralLine):
-                    if name is not None:
-                        self.spectral_lines.loc[name]["show"] = False
-                        if x.name == name:
-                            continue
-                    else:
-                        if isinstance(name_rest, str):
-                            if x.table_index == name_rest:
-                                continue
-                        elif isinstance(name_rest, list):
-                            if x.table_index in name_rest:
-                                continue
-                temp_marks.append(x)
-            fig.marks = temp_marks
+            # Hide the lines we no longer want
+            if mark is not None:
+                if name is not None:
+                    self.spectral_lines["show"][self.spectral_lines["linename"] == name] = False
+                    mark.set_show(mark.table_indices[mark.names == name], False)
+                else:
+                    mark.set_show(name_rest, False)
             self._broadcast_plotted_lines()
 
     def plot_spectral_line(self, line, global_redshift=None, plot_units=None, **kwargs):
@@ -239,17 +254,13 @@ class Spectrum1DViewer(JdavizProfileView):
         else:
             redshift = global_redshift
 
-        line_mark = SpectralLine(self,
-                                 line['rest'].to_value(plot_units),
-                                 redshift,
-                                 name=line["linename"],
-                                 table_index=line["name_rest"],
-                                 colors=[line["colors"]], **kwargs)
-
-        # Erase this line if it already existed, to avoid duplication
-        self.erase_spectral_lines(name_rest=line["name_rest"])
+        mark = self._get_spectral_lines_mark(redshift, **kwargs)
+        # Replaces this line if it already existed, to avoid duplication
+        mark.update_lines(line['rest'].to(plot_units, u.spectral()),
+                          [line["linename"]],
+                          [line["name_rest"]],
+                          [line["colors"]])
 
-        self.figure.marks = self.figure.marks + [line_mark]
         line["show"] = True
         self._broadcast_plotted_lines()
 
@@ -257,7 +268,6 @@ class Spectrum1DViewer(JdavizProfileView):
         """
         Plots a user-provided astropy table of spectral lines in the viewer.
         """
-        fig = self.figure
         self.erase_spectral_lines(show_none=False)
 
         # Check to see if colors were defined for each line
@@ -267,25 +277,17 @@ class Spectrum1DViewer(JdavizProfileView):
             colors = colors*len(self.spectral_lines)
 
         lines = self.spectral_lines
-        plot_units = self.data()[0].spectral_axis.unit
 
         if global_redshift is None:
             redshift = self.redshift
         else:
             redshift = global_redshift
 
-        marks = []
-        for line, color in zip(lines, colors):
-            if not line["show"]:
-                continue
-            line = SpectralLine(self,
-                                line['rest'].to_value(plot_units),
-                                redshift,
-                                name=line["linename"],
-                                table_index=line["name_rest"],
-                                colors=[color], **kwargs)
-            marks.append(line)
-        fig.marks = fig.marks + marks
+        # all lines are kept in the mark (hidden ones included), so that showing them
+        # later only updates the arrays of the mark
+        mark = self._get_spectral_lines_mark(redshift, **kwargs)
+        mark.set_lines(lines['rest'], lines["linename"], lines["name_rest"],
+                       colors, show=lines["show"])
         self._broadcast_plotted_lines()
 
     def available_linelists(self):
@@ -1,6 +1,9 @@
+import copy
+
 import numpy as np
 from functools import cached_property
 
+from glue_jupyter.utils import debounced
 from traitlets import Bool, List, Unicode, observe
 
 from jdaviz.configs.mosviz.plugins.viewers import Spectrum1DViewer
@@ -33,6 +36,17 @@ _model_cls = {'Spline': models.Spline1D,
               'Legendre': models.Legendre1D,
               'Chebyshev': models.Chebyshev1D}
 
+# delay after the last change of an input before updating the live extraction preview
+INTERACTIVE_EXTRACT_DELAY = 0.2  # seconds
+
+
+def _result_copy(result):
+    # adding a result to the app modifies its meta, so the memoized results (see
+    # SpectralExtraction2D._memoize) are added as copies sharing their arrays
+    result = copy.copy(result)
+    result.meta = copy.deepcopy(result.meta)
+    return result
+
 
 @tray_registry('spectral-extraction-2d', label="2D Spectral Extraction",
                category="data:reduction")
@@ -235,6 +249,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
         # description displayed under plugin title in tray
         self._plugin_description = 'Extract 1D spectrum from 2D image.'
 
+        # latest inputs and result of each step of the extraction (see _memoize)
+        self._stages = {}
+        # increased for every request to update the live extraction preview
+        self._interactive_extract_requests = 0
+
         # TRACE
         self.trace_trace = DatasetSelect(self,
                                          'trace_trace_items',
@@ -578,29 +597,48 @@ class SpectralExtraction2D(PluginTemplateMixin):
     @skip_if_not_relevant()
     def _update_interactive_extract(self, event={}):
         # also called by any of the _interaction_in_*_step
-        if self.interactive_extract:
-            try:
-                sp1d = self.export_extract_spectrum(add_data=False)
-            except Exception as e:
-                # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
-                # NOTE: FitTrace or manual background are often giving a
-                # "background regions overlapped" error from specreduce
-                self.ext_specreduce_err = repr(e)
-                self.marks['extract'].clear()
-            else:
-                self.ext_specreduce_err = ''
-                self.marks['extract'].update_xy(sp1d.spectral_axis.value,
-                                                sp1d.flux.value,
-                                                viewers=self.marks_viewers1d)
-        else:
+        if not self.interactive_extract:
             self.marks['extract'].clear()
+            self.marks['bg_spec'].clear()
+            return
+        # rapid changes (e.g., while dragging a slider) are coalesced into a single update
+        self._interactive_extract_requests += 1
+        self._debounced_interactive_extract(self._interactive_extract_requests)
+
+    @debounced(delay_seconds=INTERACTIVE_EXTRACT_DELAY, method=True)
+    def _debounced_interactive_extract(self, request):
+        def is_stale():
+            # a newer request was made while computing, which will update the marks instead
+            return request != self._interactive_extract_requests or not self.interactive_extract
 
-        if self.interactive_extract and self.active_step == 'bg':
+        if is_stale():
+            return
+        try:
+            sp1d = self.export_extract_spectrum(add_data=False)
+        except Exception as e:
+            if is_stale():
+                return
+            # NOTE: ignore error, but will be raised when clicking ANY of the export buttons
+            # NOTE: FitTrace or manual background are often giving a
+            # "background regions overlapped" error from specreduce
+            self.ext_specreduce_err = repr(e)
+            self.marks['extract'].clear()
+        else:
+            if is_stale():
+                return
+            self.ext_specreduce_err = ''
+            self.marks['extract'].update_xy(sp1d.spectral_axis.value,
+                                            sp1d.flux.value,
+                                            viewers=self.marks_viewers1d)
+
+        if self.active_step == 'bg':
             try:
                 spec = self.export_bg_spectrum()
             except Exception:
                 self.marks['bg_spec'].clear()
             else:
+                if is_stale():
+                    return
                 self.marks['bg_spec'].update_xy(spec.spectral_axis,
                                                 spec.flux,
                                                 viewers=self.marks_viewers1d)
@@ -743,6 +781,32 @@ class SpectralExtraction2D(PluginTemplateMixin):
         else:
             self.ext_uncert_warn = False
 
+    def _memoize(self, stage, inputs, compute):
+        """
+        Return the result of ``compute()`` for the extraction step ``stage``, reusing the
+        result of the previous call if ``inputs`` did not change, so that changing the
+        inputs of a step only recomputes that step and the ones depending on it.
+        ``inputs`` is a tuple of values compared by equality and of objects (e.g., the
+        results of other steps) compared by identity.
+        """
+        key = tuple(inp if isinstance(inp, (str, int, float, bool, type(None))) else id(inp)
+                    for inp in inputs)
+        cached = self._stages.get(stage)
+        if cached is not None and cached[0] == key:
+            return cached[2]
+        result = compute()
+        # the inputs are kept with the result so that their ids are not reused
+        self._stages[stage] = (key, inputs, result)
+        return result
+
+    def _dataset_inputs(self, dataset):
+        # inputs identifying the content of the selected data, in display units
+        data = dataset.selected_dc_item
+        if data is None:
+            return (dataset.selected,)
+        return (dataset.selected, data.uuid, self.app._object_cache.version(data),
+                self.app._get_display_unit('spectral'), self.app._get_display_unit('flux'))
+
     def _set_create_kwargs(self, **kwargs):
         invalid_kwargs = [k for k in kwargs.keys() if not hasattr(self, k)]
         if len(invalid_kwargs):
@@ -795,6 +859,22 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if len(kwargs) and self.active_step != 'trace':
             self.update_marks(step='trace')
 
+        inputs = (self.trace_trace_selected, self.trace_type_selected, self.trace_offset,
+                  self.trace_pixel, self.trace_order, self.trace_do_binning, self.trace_bins,
+                  self.trace_window, self.trace_peak_method_selected)
+        inputs += self._dataset_inputs(self.trace_dataset)
+        if self.trace_trace_selected != 'New Trace':
+            inputs += self._dataset_inputs(self.trace_trace)
+        trace = self._memoize('trace', inputs, self._create_trace)
+
+        if add_data:
+            self.trace_add_results.add_results_from_plugin(trace,
+                                                           format='Trace',
+                                                           replace=False)
+
+        return trace
+
+    def _create_trace(self):
         if self.trace_trace_selected != 'New Trace':
             # then we're offsetting an existing trace
             # for FlatTrace, we can keep and expose a new FlatTrace (which has the advantage of
@@ -823,11 +903,6 @@ class SpectralExtraction2D(PluginTemplateMixin):
         else:
             raise NotImplementedError(f"trace_type={self.trace_type_selected} not implemented")
 
-        if add_data:
-            self.trace_add_results.add_results_from_plugin(trace,
-                                                           format='Trace',
-                                                           replace=False)
-
         return trace
 
     def vue_create_trace(self, *args):
@@ -835,13 +910,18 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
     def _get_bg_trace(self):
         if self.bg_type_selected == 'Manual':
-            trace = tracing.FlatTrace(self.trace_dataset.get_selected_spectrum(
-                                      use_display_units=True),
-                                      self.bg_trace_pixel)
+            trace = self._memoize(
+                'bg_trace',
+                ('Manual', self.bg_trace_pixel) + self._dataset_inputs(self.trace_dataset),
+                lambda: tracing.FlatTrace(self.trace_dataset.get_selected_spectrum(
+                                          use_display_units=True),
+                                          self.bg_trace_pixel))
         elif self.bg_trace_selected == 'From Plugin':
             trace = self.export_trace(add_data=False)
         else:
-            trace = self.bg_trace.get_selected_spectrum(use_disaply_units=True)
+            trace = self._memoize(
+                'bg_trace', self._dataset_inputs(self.bg_trace),
+                lambda: self.bg_trace.get_selected_spectrum(use_disaply_units=True))
 
         return trace
 
@@ -891,7 +971,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             self.update_marks(step='bg')
 
         trace = self._get_bg_trace()
+        inputs = (trace, self.bg_type_selected, self.bg_separation, self.bg_width,
+                  self.bg_statistic_selected) + self._dataset_inputs(self.bg_dataset)
+        return self._memoize('bg', inputs, lambda: self._create_bg(trace))
 
+    def _create_bg(self, trace):
         if self.bg_type_selected == 'Manual':
             bg = background.Background(self.bg_dataset.get_selected_spectrum(
                                        use_display_units=True),
@@ -927,10 +1011,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             Whether to add the resulting image to the application, according to the options
             defined in the plugin.
         """
-        bg_spec = self.export_bg(**kwargs).bkg_image()
+        bg = self.export_bg(**kwargs)
+        bg_spec = self._memoize('bg_img', (bg,), bg.bkg_image)
 
         if add_data:
-            self.bg_add_results.add_results_from_plugin(bg_spec,
+            self.bg_add_results.add_results_from_plugin(_result_copy(bg_spec),
                                                         format='2D Spectrum',
                                                         replace=True)
 
@@ -956,10 +1041,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             Whether to add the resulting spectrum to the application, according to the options
             defined in the plugin.
         """
-        spec = self.export_bg(**kwargs).bkg_spectrum()
+        bg = self.export_bg(**kwargs)
+        spec = self._memoize('bg_spec', (bg,), bg.bkg_spectrum)
 
         if add_data:
-            self.bg_spec_add_results.add_results_from_plugin(spec,
+            self.bg_spec_add_results.add_results_from_plugin(_result_copy(spec),
                                                              format='1D Spectrum',
                                                              replace=False)
 
@@ -979,10 +1065,11 @@ class SpectralExtraction2D(PluginTemplateMixin):
             Whether to add the resulting image to the application, according to the options
             defined in the plugin.
         """
-        bg_sub_spec = self.export_bg(**kwargs).sub_image()
+        bg = self.export_bg(**kwargs)
+        bg_sub_spec = self._memoize('bg_sub', (bg,), bg.sub_image)
 
         if add_data:
-            self.bg_sub_add_results.add_results_from_plugin(bg_sub_spec,
+            self.bg_sub_add_results.add_results_from_plugin(_result_copy(bg_sub_spec),
                                                             format='2D Spectrum',
                                                             replace=True)
 
@@ -995,13 +1082,17 @@ class SpectralExtraction2D(PluginTemplateMixin):
         if self.ext_trace_selected == 'From Plugin':
             return self.export_trace(add_data=False)
         else:
-            return self.ext_trace.get_selected_spectrum(use_display_units=True)
+            return self._memoize(
+                'ext_trace', self._dataset_inputs(self.ext_trace),
+                lambda: self.ext_trace.get_selected_spectrum(use_display_units=True))
 
     def _get_ext_input_spectrum(self):
         if self.ext_dataset_selected == 'From Plugin':
             return self.export_bg_sub(add_data=False)
         else:
-            return self.ext_dataset.get_selected_spectrum(use_display_units=True)
+            return self._memoize(
+                'ext_input', self._dataset_inputs(self.ext_dataset),
+                lambda: self.ext_dataset.get_selected_spectrum(use_display_units=True))
 
     def import_extract(self, ext):
         """
@@ -1030,11 +1121,20 @@ class SpectralExtraction2D(PluginTemplateMixin):
 
         trace = self._get_ext_trace()
         inp_sp2d = self._get_ext_input_spectrum()
+        inputs = (trace, inp_sp2d, self.ext_type_selected, self.ext_width,
+                  self.horne_ext_profile_selected, self.self_prof_n_bins,
+                  self.self_prof_interp_degree_x, self.self_prof_interp_degree_y)
+        return self._memoize('ext', inputs, lambda: self._create_extract(trace, inp_sp2d))
 
+    def _create_extract(self, trace, inp_sp2d):
         if self.ext_type_selected == 'Boxcar':
             ext = extract.BoxcarExtract(inp_sp2d, trace, width=self.ext_width)
         elif self.ext_type_selected == 'Horne':
             spatial_profile = None
+            if (inp_sp2d.uncertainty is None
+                    or not hasattr(inp_sp2d.uncertainty, 'uncertainty_type')):
+                # do not modify the input spectrum, which is reused by other steps
+                inp_sp2d = copy.copy(inp_sp2d)
             if inp_sp2d.uncertainty is None:
                 inp_sp2d.uncertainty = VarianceUncertainty(np.ones_like(inp_sp2d.data))
 
@@ -1082,7 +1182,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
             defined in the plugin.
         """
         extract = self.export_extract(**kwargs)
-        spectrum = extract.spectrum
+        spectrum = self._memoize('ext_spec', (extract,), lambda: extract.spectrum)
 
         if add_data:
             # TODO: eventually generalize this logic into add_results_from_plugin
@@ -1097,7 +1197,7 @@ class SpectralExtraction2D(PluginTemplateMixin):
                                         open_data_menu_if_empty=False)
                 self.ext_add_results.viewer = viewer_ref
 
-            self.ext_add_results.add_results_from_plugin(spectrum,
+            self.ext_add_results.add_results_from_plugin(_result_copy(spectrum),
                                                          format='1D Spectrum',
                                                          replace=False)
 
@@ -402,6 +402,65 @@ def test_spectral_extraction_preview(deconfigged_helper, spectrum2d):
                        len(mark.x) == len(spectrum2d.spectral_axis)]) == int(interactive_extract)
 
 
+def test_spectral_extraction_memoized_steps(specviz2d_helper, spectrum2d, monkeypatch):
+    specviz2d_helper.load(spectrum2d, format='2D Spectrum')
+    pext = specviz2d_helper.plugins['2D Spectral Extraction']._obj
+
+    trace = pext.export_trace()
+    bg = pext.export_bg()
+    bg_sub = pext.export_bg_sub()
+    ext = pext.export_extract()
+    spectrum = pext.export_extract_spectrum()
+    # nothing is recomputed without changes
+    assert pext.export_trace() is trace
+    assert pext.export_bg() is bg
+    assert pext.export_extract_spectrum() is spectrum
+
+    # changing the extraction width only reruns the extraction
+    pext.ext_width += 1
+    assert pext.export_extract() is not ext
+    assert pext.export_extract().trace_object is trace
+    assert pext.export_bg() is bg
+    assert pext.export_bg_sub() is bg_sub
+    assert pext.export_extract_spectrum() is not spectrum
+
+    # changing the background reruns the background and the extraction, but not the trace
+    ext = pext.export_extract()
+    pext.bg_width += 1
+    assert pext.export_trace() is trace
+    assert pext.export_bg() is not bg
+    assert pext.export_bg_sub() is not bg_sub
+    assert pext.export_extract() is not ext
+
+    # and changing the trace reruns everything
+    bg, ext = pext.export_bg(), pext.export_extract()
+    pext.trace_pixel += 1
+    assert pext.export_trace() is not trace
+    assert pext.export_bg() is not bg
+    assert pext.export_extract() is not ext
+
+    # the results match a fresh extraction
+    fresh = extract.BoxcarExtract(pext.export_bg_sub(),
+                                  tracing.FlatTrace(spectrum2d, pext.trace_pixel),
+                                  width=pext.ext_width)
+    assert_allclose(pext.export_extract_spectrum().flux.value, fresh.spectrum.flux.value)
+
+    # results are added to the app as copies, leaving the memoized results unchanged
+    label = pext.ext_add_results.label
+    spectrum = pext.export_extract_spectrum(add_data=True)
+    assert 'Plugin' not in spectrum.meta
+    assert pext.export_extract_spectrum() is spectrum
+    assert specviz2d_helper.app.data_collection[label].meta['Plugin'] == '2D Spectral Extraction'
+
+    # live preview updates superseded by a newer request are dropped
+    def stale_extraction(*args, **kwargs):
+        raise AssertionError("stale preview was computed")
+
+    monkeypatch.setattr(pext, 'export_extract_spectrum', stale_extraction)
+    pext._interactive_extract_requests += 1
+    pext._debounced_interactive_extract(pext._interactive_extract_requests - 1)
+
+
 class TestTwo2dSpectra:
 
     def load_2d_spectrum(self, helper, spec2d, spec2d_label_idx=0, spec2d_ext_label_idx=1):
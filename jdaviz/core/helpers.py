@@ -7,6 +7,7 @@ See also https://github.com/spacetelescope/jdaviz/issues/104 for more details
 on the motivation behind this concept.
 """
 import warnings
+from collections.abc import Mapping
 from contextlib import contextmanager
 from inspect import isclass
 
@@ -64,7 +65,7 @@ class ConfigHelper(HubListener):
             self.app = Application(configuration=self._default_configuration)
         else:
             self.app = app
-        if (logger_plg := self.plugins.get('Logger')) is not None:
+        if (logger_plg := self.app._get_logger_plugin()) is not None:
             if verbosity is not None:
                 logger_plg.popup_verbosity = verbosity
             if history_verbosity is not None:
@@ -236,25 +237,15 @@ class ConfigHelper(HubListener):
 
         Returns
         -------
-        plugins : dict
-            dict of plugin objects
+        plugins : dict-like
+            mapping of plugin labels to plugin objects.  Plugins that defer their
+            instantiation are only instantiated when their entry is accessed.
         """
-        plugins = {item['label']: widget_serialization['from_json'](item['widget'], None).user_api
-                   for item in self.app.state.tray_items if item['is_relevant']}
-
-        msg_temp = "in the future, the formerly named \"{}\" plugin will only be available by its new name: \"{}\""  # noqa
-
         old_new = (('Imviz Line Profiles (XY)', 'Image Profiles (XY)'),  # renamed in 4.0
                    ('Spectral Extraction', '2D Spectral Extraction'),  # renamed in 4.3
                    ('Spectral Extraction', '3D Spectral Extraction'))  # renamed in 4.3
 
-        # handle renamed plugins during deprecation
-        for old, new in old_new:
-            if new in plugins:
-                plugins[old] = plugins[new]._obj.user_api
-                plugins[old]._deprecation_msg = msg_temp.format(old, new)
-
-        return plugins
+        return _PluginUserApis(self.app, renamed=old_new)
 
     @property
     def plugin_tables(self):
@@ -1035,6 +1026,42 @@ def _next_subset_num(label_prefix, subset_groups):
     return max_i + 1
 
 
+class _PluginUserApis(Mapping):
+    """
+    Mapping of the labels of the relevant plugins in the tray to their user APIs, which
+    only instantiates the plugins that defer their instantiation when their entry is
+    accessed.  Renamed plugins (``renamed`` pairs of old and new labels) are also available
+    by their old label during deprecation.
+    """
+    _msg_temp = "in the future, the formerly named \"{}\" plugin will only be available by its new name: \"{}\""  # noqa
+
+    def __init__(self, app, renamed=()):
+        self._app = app
+        self._labels = [item['label'] for item in app.state.tray_items if item['is_relevant']]
+        # old label -> new label
+        self._renamed = {old: new for old, new in renamed if new in self._labels}
+
+    def __getitem__(self, label):
+        if label in self._renamed:
+            new = self._renamed[label]
+            user_api = self[new]
+            user_api._deprecation_msg = self._msg_temp.format(label, new)
+            return user_api
+        if label not in self._labels:
+            raise KeyError(label)
+        return self._app.get_tray_item_from_name(label).user_api
+
+    def __contains__(self, label):
+        return label in self._labels or label in self._renamed
+
+    def __iter__(self):
+        return iter(self._labels + [label for label in self._renamed
+                                    if label not in self._labels])
+
+    def __len__(self):
+        return len(list(iter(self)))
+
+
 class CubeConfigHelper(ImageConfigHelper):
     """Base config helper class for cubes"""
 
@@ -1,19 +1,30 @@
+from copy import deepcopy
+from functools import lru_cache
 from importlib import resources
 import json
 
+import astropy.units as u
+import numpy as np
 from astropy.table import QTable
 
-__all__ = ['get_linelist_metadata', 'get_available_linelists', 'load_preset_linelist']
+__all__ = ['get_linelist_metadata', 'get_available_linelists', 'load_preset_linelist',
+           'PresetLineListIndex', 'get_preset_linelist_index']
 
 
-def get_linelist_metadata():
-    """Return metadata for line lists."""
+@lru_cache
+def _read_linelist_metadata():
     metadata_file = resources.files("jdaviz").joinpath("data/linelists/linelist_metadata.json")
     with open(metadata_file) as f:
         metadata = json.load(f)
     return metadata
 
 
+def get_linelist_metadata():
+    """Return metadata for line lists."""
+    # the file is only read once, but return a copy so callers can't alter the cache
+    return deepcopy(_read_linelist_metadata())
+
+
 def get_available_linelists():
     """
     Return all available line lists.
@@ -25,25 +36,120 @@ def get_available_linelists():
     return [list for list in list(metadata.keys()) if 'medium' in metadata[list]]
 
 
-def load_preset_linelist(name):
-    """Return one of the preset line lists, loaded into `~astropy.table.QTable`.
+class PresetLineListIndex:
     """
-    metadata = get_linelist_metadata()
-    if name not in metadata.keys():
-        raise ValueError("Line name not in available set of line lists. " +
-                         "Valid list names are: {}".format(list(metadata.keys())))
-    fname_base = metadata[name]["filename_base"]
-    fname = resources.files("jdaviz").joinpath("data/linelists/{}.csv".format(fname_base))
-    units = metadata[name]["units"]
-    linetable = QTable.read(fname)
+    Index of the preset line lists.
+
+    Each list is read once, sorted by rest value and its rest values are normalized to
+    Angstrom, so that the lines within a spectral range can be found by binary search
+    without re-reading or scanning the list.  Use `get_preset_linelist_index` to get the
+    shared (cached) instance.
+    """
+    def __init__(self):
+        self._metadata = _read_linelist_metadata()
+        # name -> (table sorted by rest value, rest values in Angstrom,
+        #          positions of the sorted lines in the list file)
+        self._lists = {name: self._read(name) for name in self._metadata}
+
+    def _read(self, name):
+        fname_base = self._metadata[name]["filename_base"]
+        fname = resources.files("jdaviz").joinpath("data/linelists/{}.csv".format(fname_base))
+        linetable = QTable.read(fname)
+
+        # Add units
+        linetable['Rest Value'].unit = self._metadata[name]["units"]
+
+        # Add column with list name reference
+        linetable['listname'] = name
+
+        # Rename remaining columns
+        linetable.rename_columns(('Line Name', 'Rest Value'), ('linename', 'rest'))
 
-    # Add units
-    linetable['Rest Value'].unit = units
+        rest_angstrom = linetable['rest'].to_value(u.Angstrom, equivalencies=u.spectral())
+        order = np.argsort(rest_angstrom, kind='stable')
+        return linetable[order], rest_angstrom[order], order
 
-    # Add column with list name reference
-    linetable['listname'] = name
+    def _get(self, name):
+        if name not in self._lists:
+            raise ValueError("Line name not in available set of line lists. " +
+                             "Valid list names are: {}".format(list(self._lists.keys())))
+        return self._lists[name]
 
-    # Rename remaining columns
-    linetable.rename_columns(('Line Name', 'Rest Value'), ('linename', 'rest'))
+    def __contains__(self, name):
+        return name in self._lists
 
-    return linetable
+    def n_lines(self, name):
+        """Number of lines in the preset list ``name``."""
+        return len(self._get(name)[1])
+
+    def query(self, name, spectral_range=None):
+        """
+        Positions (in the sorted list) of the lines of ``name`` within a range of rest values.
+
+        Parameters
+        ----------
+        name : str
+            Name of the preset line list.
+        spectral_range : `~astropy.units.Quantity`, optional
+            Lower and upper bounds of the rest values, in any spectral unit.  If not provided,
+            all the lines of the list are returned.
+
+        Returns
+        -------
+        indices : slice
+            Slice of the lines within ``spectral_range``.
+        """
+        _, rest_angstrom, _ = self._get(name)
+        if spectral_range is None:
+            return slice(0, len(rest_angstrom))
+        bounds = np.sort(u.Quantity(spectral_range).to_value(u.Angstrom,
+                                                             equivalencies=u.spectral()))
+        start = np.searchsorted(rest_angstrom, bounds[0], side='left')
+        stop = np.searchsorted(rest_angstrom, bounds[1], side='right')
+        return slice(int(start), int(stop))
+
+    def table(self, name, spectral_range=None, indices=None, sort=True):
+        """
+        Lines of the preset list ``name``.
+
+        Parameters
+        ----------
+        name : str
+            Name of the preset line list.
+        spectral_range : `~astropy.units.Quantity`, optional
+            Only return the lines with rest values within these bounds (see `query`).
+        indices : slice or array-like, optional
+            Positions of the lines to return in the sorted list (as returned by `query`),
+            takes precedence over ``spectral_range``.
+        sort : bool, optional
+            Whether to sort the lines by rest value, otherwise they are returned in the
+            order of the list file.
+
+        Returns
+        -------
+        linetable : `~astropy.table.QTable`
+            A new table with the ``linename``, ``rest`` and ``listname`` columns.
+        """
+        linetable, _, order = self._get(name)
+        if indices is None:
+            indices = self.query(name, spectral_range)
+        indices = np.arange(len(linetable))[indices]
+        if not sort:
+            indices = indices[np.argsort(order[indices], kind='stable')]
+        return linetable[indices]
+
+
+@lru_cache
+def get_preset_linelist_index():
+    """Return the (cached) `PresetLineListIndex` of all the preset line lists."""
+    return PresetLineListIndex()
+
+
+def load_preset_linelist(name, spectral_range=None):
+    """Return one of the preset line lists, loaded into `~astropy.table.QTable`.
+
+    Lines are in the order of the list file.  If ``spectral_range`` (lower and upper bounds
+    of the rest values as a `~astropy.units.Quantity`) is provided, only the lines within it
+    are returned.
+    """
+    return get_preset_linelist_index().table(name, spectral_range=spectral_range, sort=False)
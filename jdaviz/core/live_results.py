@@ -0,0 +1,204 @@
+from concurrent.futures import ThreadPoolExecutor, wait
+import threading
+
+from glue_jupyter.utils import debounced, get_ioloop
+
+__all__ = ['LiveResultsScheduler']
+
+# delay after the last change of an input before recomputing the live-updating results
+LIVE_RESULTS_DELAY = 0.3  # seconds
+
+
+class LiveResultsScheduler:
+    """
+    Schedule the recomputation of live-updating plugin results.
+
+    Requests are coalesced per result: requests made in quick succession (e.g., while a
+    subset is dragged) are debounced into a single recomputation of each result, and a
+    recomputation still running when a new request is made is superseded, its result being
+    discarded.  When ``asynchronous`` (by default, when running in a kernel), independent
+    results are recomputed concurrently in background threads, otherwise results are
+    recomputed when requested.
+
+    Only the computation runs in background threads: the inputs are snapshotted (by the
+    ``snapshot`` callable of each request, which must read all the inputs needed by
+    ``compute`` from the state of the app) and the results are swapped in by the thread
+    running the ioloop of the kernel (through the ioloop, or in `wait` when not running in a
+    kernel).  ``compute`` must therefore not access the state of the app.
+
+    Parameters
+    ----------
+    asynchronous : bool, optional
+        Whether to recompute results in background threads.  Defaults to whether running in
+        a kernel.
+    max_workers : int, optional
+        Maximum number of results recomputed concurrently.
+    """
+    def __init__(self, asynchronous=None, max_workers=4):
+        self._ioloop = get_ioloop()
+        self.asynchronous = self._ioloop is not None if asynchronous is None else asynchronous
+        self._max_workers = max_workers
+        self._executor = None
+        # _lock: protects the generations, pending requests, futures and completed
+        # computations below
+        self._lock = threading.Lock()
+        # key -> number of the latest request, any older request is superseded
+        self._generations = {}
+        # key -> (generation, snapshot, compute, apply, on_error) of requests waiting to be run
+        self._pending = {}
+        self._futures = set()
+        # callbacks of completed computations, waiting to be run in the main thread
+        self._completed = []
+
+    def request(self, key, compute, apply, on_error=None, snapshot=None):
+        """
+        Request the recomputation of a result, superseding any previous request for it.
+
+        Parameters
+        ----------
+        key : hashable
+            Identifier of the result (e.g., its data label).
+        compute : callable
+            Called to compute the new result (in a background thread if ``asynchronous``),
+            with the value returned by ``snapshot`` if provided, otherwise without arguments.
+        apply : callable
+            Called with the value returned by ``compute`` to swap in the new result, unless
+            superseded in the meantime.
+        on_error : callable, optional
+            Called with the exception raised by ``snapshot``, ``compute`` or ``apply``.
+            Exceptions are raised if not provided.
+        snapshot : callable, optional
+            Called without arguments, once the request is run, to collect the inputs of
+            ``compute`` (e.g., from the state of the app, which is not thread-safe).
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+            self._pending[key] = (generation, snapshot, compute, apply, on_error)
+        self._flush()
+
+    def cancel(self, key):
+        """
+        Cancel the pending and running recomputations of a result.
+        """
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+            self._pending.pop(key, None)
+
+    def close(self):
+        """
+        Cancel all the recomputations and shut down the background threads (e.g., when the
+        app is closed).  A later request starts new background threads.
+        """
+        with self._lock:
+            for key in self._generations:
+                self._generations[key] += 1
+            self._pending.clear()
+            self._completed.clear()
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def is_current(self, key, generation):
+        """
+        Whether ``generation`` is the latest request for the result ``key``.
+        """
+        return self._generations.get(key) == generation
+
+    @property
+    def running(self):
+        """
+        Whether recomputations are pending, running in the background, or waiting for
+        their results to be swapped in.
+        """
+        with self._lock:
+            return (len(self._pending) > 0 or len(self._completed) > 0
+                    or any(not f.done() for f in self._futures))
+
+    def wait(self, timeout=None):
+        """
+        Wait for the recomputations running in the background to complete, and swap in
+        their results.  Must be called from the main thread.
+        """
+        with self._lock:
+            futures = list(self._futures)
+        wait(futures, timeout=timeout)
+        self._run_completed()
+
+    @debounced(delay_seconds=LIVE_RESULTS_DELAY, method=True)
+    def _flush(self):
+        # runs in the main thread (through the ioloop when running in a kernel)
+        with self._lock:
+            pending, self._pending = self._pending, {}
+
+        for key, (generation, snapshot, compute, apply, on_error) in pending.items():
+            if not self.is_current(key, generation):
+                continue
+            try:
+                args = () if snapshot is None else (snapshot(),)
+            except Exception as e:
+                self._error(key, generation, on_error, e)
+                continue
+
+            if not self.asynchronous:
+                try:
+                    result = compute(*args)
+                except Exception as e:
+                    self._error(key, generation, on_error, e)
+                else:
+                    self._apply(key, generation, apply, on_error, result)
+                continue
+
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self._max_workers,
+                                                        thread_name_prefix='jdaviz-live-results')
+                future = self._executor.submit(self._compute, key, generation, compute, args,
+                                               apply, on_error)
+                self._futures.add(future)
+            future.add_done_callback(self._discard_future)
+
+    def _discard_future(self, future):
+        with self._lock:
+            self._futures.discard(future)
+
+    def _compute(self, key, generation, compute, args, apply, on_error):
+        # runs in a background thread, the result (or error) is handed back to the main thread
+        if not self.is_current(key, generation):
+            return
+        try:
+            result = compute(*args)
+        except Exception as e:
+            self._call_in_main_thread(self._error, key, generation, on_error, e)
+        else:
+            self._call_in_main_thread(self._apply, key, generation, apply, on_error, result)
+
+    def _call_in_main_thread(self, callback, *args):
+        with self._lock:
+            self._completed.append((callback, args))
+        if self._ioloop is not None:
+            self._ioloop.call_soon_threadsafe(self._run_completed)
+
+    def _run_completed(self):
+        while True:
+            with self._lock:
+                if not len(self._completed):
+                    return
+                callback, args = self._completed.pop(0)
+            callback(*args)
+
+    def _apply(self, key, generation, apply, on_error, result):
+        # a newer request supersedes this result, which is then discarded
+        if not self.is_current(key, generation):
+            return
+        try:
+            apply(result)
+        except Exception as e:
+            self._error(key, generation, on_error, e)
+
+    def _error(self, key, generation, on_error, error):
+        if not self.is_current(key, generation):
+            return
+        if on_error is None:
+            raise error
+        on_error(error)
@@ -20,7 +20,7 @@ from jdaviz.core.user_api import ImporterUserApi
 
 from jdaviz.utils import (
     PRIHDR_KEY, standardize_metadata, standardize_roman_metadata,
-    _try_gwcs_to_fits_sip, create_data_hash
+    _try_gwcs_to_fits_sip, _create_file_data_hash
 )
 
 try:
@@ -81,7 +81,6 @@ class ImageImporter(BaseImporterToDataCollection):
                                 'ver': hdu.ver,
                                 'name_ver': f"{hdu.name},{hdu.ver}",
                                 'index': index,
-                                'data_hash': create_data_hash(hdu),
                                 'obj': hdu}
                                for index, hdu in enumerate(input)]
             elif input_is_roman:
@@ -91,7 +90,6 @@ class ImageImporter(BaseImporterToDataCollection):
                                 'ver': None,
                                 'name_ver': key,
                                 'index': index,
-                                'data_hash': create_data_hash(value),
                                 'obj': value}
                                for index, (key, value) in enumerate(input.items())]
             else:
@@ -102,12 +100,11 @@ class ImageImporter(BaseImporterToDataCollection):
                                                           selected='extension_selected',
                                                           multiselect='extension_multiselect',
                                                           manual_options=ext_options,
-                                                          filters=filters)
+                                                          filters=filters,
+                                                          data_hash_func=self._extension_data_hash)  # noqa
 
             # changing selected extension will call _set_default_data_label
             self.extension.selected = [self.extension.choices[0]]
-            self.data_hashes = self.extension.data_hashes
-            self.hash_map_to_label = dict(zip(self.extension.data_hashes, self.extension.labels))
         else:
             self._set_default_data_label()
 
@@ -115,6 +112,20 @@ class ImageImporter(BaseImporterToDataCollection):
     def _get_supported_viewers():
         return [{'label': 'Image', 'reference': 'imviz-image-viewer'}]
 
+    def _extension_data_hash(self, ext_item):
+        # hashes of the extensions of a FITS file are kept until the file changes
+        filepath = self.input.filename() if isinstance(self.input, fits.HDUList) else None
+        return _create_file_data_hash(ext_item.get('obj'), filepath,
+                                      (ext_item['index'], ext_item['name_ver']))
+
+    def reset_and_check_existing_data_in_dc(self, change={}):
+        if self.input_has_extensions:
+            # only hash the extensions that could be duplicates of data already loaded
+            fingerprints = self._existing_data_fingerprints()
+            self.data_hashes = self.extension.data_hashes_matching(fingerprints)
+            self.hash_map_to_label = dict(zip(self.data_hashes, self.extension.labels))
+        super().reset_and_check_existing_data_in_dc(change)
+
     @property
     def user_api(self):
         expose = ['parent', 'data_label_as_prefix', 'gwcs_to_fits_sip']
@@ -286,7 +297,14 @@ class ImageImporter(BaseImporterToDataCollection):
             if self.gwcs_to_fits_sip:
                 output = self._glue_data_wcs_to_fits(output)
 
-            self.add_to_data_collection(output, data_label, data_hash=ext_item.get('data_hash'),
+            if 'index' in ext_item:
+                data_hash = self.extension.get_data_hash(ext_item['index'])
+                data_fingerprint = self.extension.get_data_fingerprint(ext_item['index'])
+            else:
+                data_hash, data_fingerprint = None, None
+
+            self.add_to_data_collection(output, data_label,
+                                        data_hash=data_hash, data_fingerprint=data_fingerprint,
                                         parent=parent_data_label if parent_data_label != data_label else None,  # noqa
                                         cls=CCDData)
 
@@ -14,7 +14,7 @@ from jdaviz.utils import (standardize_metadata,
                           _wcs_only_label,
                           CONFIGS_WITH_LOADERS,
                           SPECTRAL_AXIS_COMP_LABELS,
-                          create_data_hash)
+                          create_data_hash, create_data_fingerprint)
 
 __all__ = ['BaseImporter', 'BaseImporterToDataCollection', 'BaseImporterToPlugin',
            '_spectrum_assign_component_type']
@@ -92,6 +92,23 @@ class BaseImporter(PluginTemplateMixin):
         # override by subclass
         return self.input
 
+    def _existing_data_fingerprints(self):
+        """
+        Return the fingerprints (see `~jdaviz.utils.create_data_fingerprint`) of the
+        hashed data in the data collection, or `None` if any of them is unknown.  Only
+        data to be imported with one of these fingerprints needs to be hashed to check
+        for duplicates.
+        """
+        fingerprints = set()
+        for data in self.app.data_collection:
+            if data.meta.get('_data_hash') is None:
+                continue
+            fingerprint = data.meta.get('_data_fingerprint')
+            if fingerprint is None:
+                return None
+            fingerprints.add(fingerprint)
+        return fingerprints
+
     def _update_existing_data_in_dc_traitlet(self, change={}):
         self.existing_data_in_dc = self.app.existing_data_in_dc
 
@@ -105,17 +122,20 @@ class BaseImporter(PluginTemplateMixin):
             # If we do this here instead of at init, then we shouldn't get errors
             # from attempting to access unavailable importer attributes from 'output'
             self.data_hashes = [create_data_hash(self.output)]
+        data_hashes = self.data_hashes
 
         if not hasattr(self, 'hash_map_to_label'):
-            self.hash_map_to_label = {dh: '' for dh in self.data_hashes}
+            self.hash_map_to_label = {dh: '' for dh in data_hashes}
+        hash_map_to_label = self.hash_map_to_label
 
         dc_labels = []
         loader_labels = []
         existing_data_in_dc = [(data.meta.get('_data_hash'),
                                 data.label,
-                                self.hash_map_to_label[data.meta.get('_data_hash')])
+                                hash_map_to_label[data.meta.get('_data_hash')])
                                for data in self.app.data_collection
-                               if data.meta.get('_data_hash') in self.data_hashes]
+                               if data.meta.get('_data_hash') is not None
+                               and data.meta.get('_data_hash') in data_hashes]
 
         if len(existing_data_in_dc) > 0:
             existing_data_in_dc, dc_labels, loader_labels = zip(*existing_data_in_dc)
@@ -268,6 +288,7 @@ class BaseImporterToDataCollection(BaseImporter):
         return physical_type
 
     def add_to_data_collection(self, data, data_label=None, data_hash=None,
+                               data_fingerprint=None,
                                parent=None,
                                viewer_select=None,
                                cls=None):
@@ -296,6 +317,10 @@ class BaseImporterToDataCollection(BaseImporter):
 
         # Create a hashed representation of the data if not already present
         data.meta['_data_hash'] = data_hash if data_hash is not None else create_data_hash(data)
+        # and a cheap fingerprint to only hash data to be compared with this one if needed
+        if data_fingerprint is None:
+            data_fingerprint = create_data_fingerprint(data)
+        data.meta['_data_fingerprint'] = data_fingerprint
 
         self.app.add_data(data, data_label=data_label)
         if parent is not None:
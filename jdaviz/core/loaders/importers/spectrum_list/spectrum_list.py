@@ -14,7 +14,6 @@ from jdaviz.core.loaders.importers import (BaseImporterToDataCollection,
 from jdaviz.core.template_mixin import SelectFileExtensionComponent
 from jdaviz.core.user_api import ImporterUserApi
 from jdaviz.core.events import SnackbarMessage
-from jdaviz.utils import create_data_hash
 
 
 __all__ = ['SpectrumListImporter', 'SpectrumListConcatenatedImporter']
@@ -75,7 +74,6 @@ class SpectrumListImporter(BaseImporterToDataCollection):
                                     'ver': str(ver),
                                     'name_ver': str(name_ver),
                                     'suffix': suffix,
-                                    'data_hash': create_data_hash(spec),
                                     'obj': spec})
 
         self.sources = SelectFileExtensionComponent(self,
@@ -85,14 +83,18 @@ class SpectrumListImporter(BaseImporterToDataCollection):
                                                     manual_options=sources_options)
 
         self.sources.selected = [self.sources.choices[0]]
-        self.data_hashes = self.sources.data_hashes
-        self.hash_map_to_label = dict(zip(self.sources.data_hashes, self.sources.labels))
 
         # TODO: This observer will likely be removed in follow-up effort
         # If the resolver format is set to "1D Spectrum List", then we
         # only enable the import button if at least one spectrum is selected.
         self.resolver.observe(self._on_format_selected_change, names='format_selected')
 
+    def reset_and_check_existing_data_in_dc(self, change={}):
+        # only hash the spectra that could be duplicates of data already loaded
+        self.data_hashes = self.sources.data_hashes_matching(self._existing_data_fingerprints())
+        self.hash_map_to_label = dict(zip(self.data_hashes, self.sources.labels))
+        super().reset_and_check_existing_data_in_dc(change)
+
     def _apply_kwargs(self, kwargs):
         applied_kwargs = super()._apply_kwargs(kwargs)
         if 'sources' not in applied_kwargs:
@@ -254,8 +256,10 @@ class SpectrumListImporter(BaseImporterToDataCollection):
         with self.app._jdaviz_helper.batch_load():
             for spec_obj, item_dict in zip(self.output, self.sources.selected_item_list):
                 data_label = f"{self.data_label_value}_{item_dict['suffix']}"
+                index = item_dict['index']
                 self.add_to_data_collection(spec_obj, data_label,
-                                            data_hash=item_dict.get('data_hash'))
+                                            data_hash=self.sources.get_data_hash(index),
+                                            data_fingerprint=self.sources.get_data_fingerprint(index))  # noqa
 
 
 def combine_lists_to_1d_spectrum(wl, fnu, dfnu, wave_units, flux_units):
@@ -100,7 +100,6 @@ class TestSpectrumListImporter:
                 'name_ver': [f"{ver}_{name}", file_index],
                 'index': [index, index],
                 'suffix': [f"EXP-{ver}_ID-{name}", f"index-{file_index}"],
-                'data_hash': [create_data_hash(spec), create_data_hash(spec)],
                 'obj': None}
 
             assert isinstance(spec_dict, dict)
@@ -110,6 +109,10 @@ class TestSpectrumListImporter:
                 if key != 'obj':
                     assert spec_dict[key] in spec_keys[key]
 
+            # data hashes are only computed on demand
+            assert importer_obj.sources.get_data_hash(index) == create_data_hash(spec)
+            assert spec_dict['data_hash'] == create_data_hash(spec)
+
             assert isinstance(spec_dict['obj'], Spectrum)
             mask = premade_spectrum_list[index].spectral_axis.mask
             assert np.all(spec_dict['obj'].flux ==
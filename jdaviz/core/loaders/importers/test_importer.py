@@ -1,10 +1,12 @@
 from unittest.mock import patch
 
+import numpy as np
+from astropy.io import fits
 from specutils import SpectrumList
 from jdaviz.core.loaders.importers.importer import BaseImporter
 from jdaviz.core.registries import loader_importer_registry
 from jdaviz.conftest import _create_spectrum1d_with_spectral_unit
-from jdaviz.utils import create_data_hash
+from jdaviz.utils import create_data_hash, _file_data_hashes
 
 
 # Create a minimal test class that mimics the importer behavior
@@ -172,3 +174,36 @@ class TestResetAndCheckExistingDataInDC:
                 broadcast_msgs = [arg[0][0].text for arg in mock_broadcast.call_args_list
                                   if hasattr(arg[0][0], 'text')]
                 assert len(broadcast_msgs) > 0
+
+
+def test_lazy_image_extension_hashes(imviz_helper, tmp_path):
+    filename = tmp_path / 'multi_ext.fits'
+    rng = np.random.default_rng(0)
+    fits.HDUList([fits.PrimaryHDU()] +
+                 [fits.ImageHDU(rng.random((10, 10 + i)), name=f'SCI{i}') for i in range(3)]
+                 ).writeto(filename)
+
+    ldr = imviz_helper.loaders['file']
+    ldr.filepath = str(filename)
+    importer = ldr.importer._obj
+    # nothing is hashed until needed
+    assert 'data_hash' not in importer.extension.manual_options[1]
+    assert importer.data_hashes == [None, None, None]
+
+    ldr.importer.extension = ['1: [SCI0,1]']
+    ldr.importer()
+    data = imviz_helper.app.data_collection[0]
+    options = importer.extension.manual_options
+    assert data.meta['_data_hash'] == options[1]['data_hash'] == create_data_hash(options[1]['obj'])
+    assert data.meta['_data_fingerprint'] == 'shape:(10, 10)'
+    assert 'data_hash' not in options[2]
+    n_cached = len(_file_data_hashes)
+
+    # reloading the same file only hashes the extension with the same shape, from the cache
+    ldr = imviz_helper.loaders['file']
+    ldr.filepath = str(filename)
+    importer = ldr.importer._obj
+    importer.reset_and_check_existing_data_in_dc()
+    assert importer.data_hashes == [data.meta['_data_hash'], None, None]
+    assert imviz_helper.app.existing_data_in_dc == [data.meta['_data_hash']]
+    assert len(_file_data_hashes) == n_cached
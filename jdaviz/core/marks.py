@@ -15,7 +15,7 @@ from jdaviz.core.unit_conversion_utils import (all_flux_unit_conversion_equivs,
                                                flux_conversion_general)
 
 
-__all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLine',
+__all__ = ['OffscreenLinesMarks', 'BaseSpectrumVerticalLine', 'SpectralLines', 'SpectralLine',
            'SliceIndicatorMarks', 'ShadowMixin', 'ShadowLine', 'ShadowLabelFixedY',
            'PluginMark', 'LinesAutoUnit', 'PluginLine', 'PluginScatter',
            'LineAnalysisContinuum', 'LineAnalysisContinuumCenter',
@@ -59,11 +59,10 @@ class OffscreenLinesMarks(HubListener):
     def _update_counts(self, *args):
         oob_left, oob_right = 0, 0
         for m in self.viewer.figure.marks:
-            if isinstance(m, SpectralLine):
-                if m.x[0] < self.viewer.state.x_min:
-                    oob_left += 1
-                elif m.x[0] > self.viewer.state.x_max:
-                    oob_right += 1
+            if isinstance(m, SpectralLines):
+                obs_values = m.obs_values[m.show]
+                oob_left += np.count_nonzero(obs_values < self.viewer.state.x_min)
+                oob_right += np.count_nonzero(obs_values > self.viewer.state.x_max)
         self.left.text = [f'\u25c0 {oob_left}' if oob_left > 0 else '']
         self.right.text = [f'{oob_right} \u25b6' if oob_right > 0 else '']
 
@@ -312,48 +311,179 @@ class BaseSpectrumVerticalLine(Lines, PluginMark, HubListener):
         self.xunit = new_unit
 
 
-class SpectralLine(BaseSpectrumVerticalLine):
+class SpectralLines(BaseSpectrumVerticalLine):
     """
-    Subclass on bqplot Lines, mostly so that we can erase spectral lines
-    by eliminating any SpectralLines objects from a figures marks list. Also
-    lets us do wavelength redshifting here on mark creation.
+    Subclass on bqplot Lines drawing all the spectral lines of a viewer as a single mark,
+    with NaN-separated vertical segments (one row of segments per color), so that
+    redshift and unit changes are applied to all lines at once.  The state of each line
+    (name, rest value, color, whether it is shown or identified) is kept in arrays,
+    and the identified line is highlighted by a second mark (see ``marks``).
+    Individual lines can be accessed as `SpectralLine` objects through ``lines``.
     """
-    def __init__(self, viewer, rest_value, redshift=0, name=None, **kwargs):
-        self._rest_value = rest_value
-        self._identify = False
-        self.name = name
-
-        # table_index is same as name_rest elsewhere
-        self.table_index = kwargs.pop("table_index", None)
-
-        # setting redshift will set self.x and enable the obs_value property,
-        # but to do that we need x_unit set first (would normally be assigned
-        # in the super init)
+    def __init__(self, viewer, redshift=0, **kwargs):
+        self.names = np.array([], dtype=object)
+        # table_indices are the same as name_rest elsewhere
+        self.table_indices = np.array([], dtype=object)
+        self.line_colors = np.array([], dtype=object)
+        self.show = np.array([], dtype=bool)
+        self.identify = np.array([], dtype=bool)
+        self._rest_values = np.array([], dtype=float)
+        self._index = {}
+
+        # converting the rest values requires xunit to be set first (would normally be
+        # assigned in the super init)
         self.xunit = u.Unit(viewer.state.x_display_unit)
-        self.redshift = redshift
+        self._redshift = self._redshift_value(redshift)
+
+        self.identified_mark = Lines(x=[], y=[], stroke_width=3, fill='none',
+                                     close_path=False, visible=False,
+                                     scales={'x': viewer.scales['x'],
+                                             'y': LinearScale(min=0, max=1)})
 
         viewer.session.hub.subscribe(self, LineIdentifyMessage,
                                      handler=self._process_identify_change)
 
-        super().__init__(viewer=viewer, x=self.obs_value, stroke_width=1,
+        super().__init__(viewer=viewer, x=np.nan, stroke_width=1,
                          fill='none', close_path=False, **kwargs)
+        self._update_xy()
 
     @property
-    def name_rest(self):
-        return self.table_index
+    def marks(self):
+        """
+        The marks to add to the figure: this mark and the one of the identified line.
+        """
+        return [self, self.identified_mark]
 
     @property
-    def rest_value(self):
-        return self._rest_value
+    def rest_values(self):
+        return self._rest_values
 
     @property
-    def obs_value(self):
-        return self.x[0]
+    def obs_values(self):
+        """
+        Observed values of all the lines (shown or not) at the current redshift.
+        """
+        redshift = self._redshift
+        if str(self.xunit.physical_type) == 'length':
+            return self._rest_values*(1+redshift)
+        elif str(self.xunit.physical_type) == 'frequency':
+            return self._rest_values/(1+redshift)
+        # catch all for anything else (wavenumber, energy, etc)
+        rest_angstrom = (self._rest_values*self.xunit).to_value(u.Angstrom,
+                                                                equivalencies=u.spectral())
+        return (rest_angstrom*(1+redshift)*u.Angstrom).to_value(self.xunit,
+                                                                equivalencies=u.spectral())
 
-    def set_x_unit(self, unit=None):
-        prev_unit = self.xunit
-        super().set_x_unit(unit=unit)
-        self._rest_value = (self._rest_value * prev_unit).to_value(unit, u.spectral())
+    @property
+    def lines(self):
+        """
+        The shown lines, as `SpectralLine` objects.
+        """
+        return [SpectralLine(self, table_index) for table_index in self.table_indices[self.show]]
+
+    def __len__(self):
+        return len(self.table_indices)
+
+    def index(self, table_index):
+        """
+        Position of the line ``table_index`` in the arrays of the mark.
+        """
+        return self._index[table_index]
+
+    def _indices(self, table_indices):
+        if isinstance(table_indices, str):
+            table_indices = [table_indices]
+        return np.array([self._index[ti] for ti in table_indices if ti in self._index],
+                        dtype=int)
+
+    def _rest_to_xunit(self, rest_values):
+        if hasattr(rest_values, 'unit'):
+            return rest_values.to_value(self.xunit, equivalencies=u.spectral())
+        return np.asarray(rest_values, dtype=float)
+
+    def set_lines(self, rest_values, names, table_indices, colors, show=True):
+        """
+        Replace all the lines of the mark.
+
+        Parameters
+        ----------
+        rest_values : `~astropy.units.Quantity` or array-like
+            Rest values of the lines (in ``xunit`` if not a quantity).
+        names : array-like
+            Names of the lines.
+        table_indices : array-like
+            Unique identifiers of the lines (``name_rest`` in the line list tables).
+        colors : str or array-like
+            Colors of the lines.
+        show : bool or array-like, optional
+            Whether each line is shown.
+        """
+        n_lines = len(table_indices)
+        self._rest_values = np.array(self._rest_to_xunit(rest_values), dtype=float,
+                                     ndmin=1)
+        self.names = np.array(list(names), dtype=object)
+        self.table_indices = np.array(list(table_indices), dtype=object)
+        self.line_colors = np.empty(n_lines, dtype=object)
+        self.line_colors[:] = colors if isinstance(colors, str) else list(colors)
+        self.show = np.broadcast_to(np.asarray(show, dtype=bool), (n_lines,)).copy()
+        self.identify = np.zeros(n_lines, dtype=bool)
+        self._index = {ti: i for i, ti in enumerate(self.table_indices)}
+        self._update_xy()
+
+    def update_lines(self, rest_values, names, table_indices, colors, show=True):
+        """
+        Update the lines already in the mark and append the others, with the same
+        parameters as `set_lines`.
+        """
+        rest_values = np.array(self._rest_to_xunit(rest_values), dtype=float, ndmin=1)
+        table_indices = list(table_indices)
+        names = list(names)
+        if isinstance(colors, str):
+            colors = [colors] * len(table_indices)
+        show = np.broadcast_to(np.asarray(show, dtype=bool), (len(table_indices),))
+        new = [i for i, ti in enumerate(table_indices) if ti not in self._index]
+        existing = [i for i, ti in enumerate(table_indices) if ti in self._index]
+        if existing:
+            indices = self._indices([table_indices[i] for i in existing])
+            self._rest_values[indices] = rest_values[existing]
+            self.names[indices] = [names[i] for i in existing]
+            self.line_colors[indices] = [colors[i] for i in existing]
+            self.show[indices] = show[existing]
+        if new:
+            new_colors = np.empty(len(new), dtype=object)
+            new_colors[:] = [colors[i] for i in new]
+            self._rest_values = np.append(self._rest_values, rest_values[new])
+            self.names = np.append(self.names, np.array([names[i] for i in new], dtype=object))
+            self.table_indices = np.append(self.table_indices,
+                                           np.array([table_indices[i] for i in new],
+                                                    dtype=object))
+            self.line_colors = np.append(self.line_colors, new_colors)
+            self.show = np.append(self.show, show[new])
+            self.identify = np.append(self.identify, np.zeros(len(new), dtype=bool))
+            self._index = {ti: i for i, ti in enumerate(self.table_indices)}
+        self._update_xy()
+
+    def set_show(self, table_indices, show):
+        """
+        Show or hide the lines ``table_indices`` (or all lines if `None`).
+        """
+        indices = slice(None) if table_indices is None else self._indices(table_indices)
+        self.show[indices] = show
+        if not show:
+            self.identify[indices] = False
+        self._update_xy()
+
+    def set_colors(self, table_indices, color):
+        """
+        Set the color of the lines ``table_indices`` (or of all lines if `None`).
+        """
+        indices = slice(None) if table_indices is None else self._indices(table_indices)
+        self.line_colors[indices] = color
+        self._update_xy()
+
+    @staticmethod
+    def _redshift_value(redshift):
+        return float(u.Quantity(redshift).to_value(u.dimensionless_unscaled))
 
     @property
     def redshift(self):
@@ -361,34 +491,53 @@ class SpectralLine(BaseSpectrumVerticalLine):
 
     @redshift.setter
     def redshift(self, redshift):
-        self._redshift = redshift
-        if str(self.xunit.physical_type) == 'length':
-            obs_value = self._rest_value*(1+redshift)
-        elif str(self.xunit.physical_type) == 'frequency':
-            obs_value = self._rest_value/(1+redshift)
-        else:
-            # catch all for anything else (wavenumber, energy, etc)
-            rest_angstrom = (self._rest_value*self.xunit).to_value(u.Angstrom,
-                                                                   equivalencies=u.spectral())
-            obs_angstrom = rest_angstrom*(1+redshift)
-            obs_value = (obs_angstrom*u.Angstrom).to_value(self.xunit,
-                                                           equivalencies=u.spectral())
-        self.x = [obs_value, obs_value]
-
-    @property
-    def identify(self):
-        return self._identify
-
-    @identify.setter
-    def identify(self, identify):
-        if not isinstance(identify, bool):  # pragma: no cover
-            raise TypeError("identify must be of type bool")
-
-        self._identify = identify
-        self.stroke_width = 3 if identify else 1
+        self._redshift = self._redshift_value(redshift)
+        self._update_xy()
+
+    def _update_xy(self):
+        obs_values = self.obs_values
+        shown = self.show
+        colors = self.line_colors[shown]
+        groups = [obs_values[shown][colors == color] for color in dict.fromkeys(colors)]
+
+        # one row of NaN-separated segments per color, padded with NaNs to the same length
+        n_points = 3 * max([len(group) for group in groups], default=0)
+        x = np.full((len(groups), n_points), np.nan)
+        y = np.full((len(groups), n_points), np.nan)
+        for row, group in enumerate(groups):
+            x[row, 0:3*len(group):3] = group
+            x[row, 1:3*len(group):3] = group
+            y[row, 0:3*len(group):3] = 0
+            y[row, 1:3*len(group):3] = 1
+
+        with self.hold_sync():
+            if len(groups):
+                self.colors = list(dict.fromkeys(colors))
+            self.x, self.y = (x, y) if len(groups) else ([], [])
+        self._update_identified_mark(obs_values)
+
+    def _update_identified_mark(self, obs_values=None):
+        identified = np.flatnonzero(self.identify & self.show)
+        if not len(identified):
+            self.identified_mark.visible = False
+            return
+        if obs_values is None:
+            obs_values = self.obs_values
+        obs_value = obs_values[identified[0]]
+        with self.identified_mark.hold_sync():
+            self.identified_mark.x = [obs_value, obs_value]
+            self.identified_mark.y = [0, 1]
+            self.identified_mark.colors = [self.line_colors[identified[0]]]
+            self.identified_mark.visible = self.visible
 
     def _process_identify_change(self, msg):
-        self.identify = msg.name_rest == self.table_index
+        self.identify = self.table_indices == msg.name_rest
+        self._update_identified_mark()
+
+    def set_x_unit(self, unit=None):
+        if unit is None:
+            unit = self.viewer.state.x_display_unit
+        self._update_unit(u.Unit(unit))
 
     def _update_unit(self, new_unit):
         if self.xunit is None:
@@ -397,11 +546,75 @@ class SpectralLine(BaseSpectrumVerticalLine):
         if new_unit == self.xunit:
             return
 
-        old_quant = self._rest_value*self.xunit
-        self._rest_value = old_quant.to_value(new_unit, equivalencies=u.spectral())
-        # re-compute self.x from current redshift (instead of converting that as well)
-        self.redshift = self._redshift
+        old_quant = self._rest_values*self.xunit
+        self._rest_values = old_quant.to_value(new_unit, equivalencies=u.spectral())
         self.xunit = new_unit
+        # re-compute the observed values from the current redshift (instead of
+        # converting those as well)
+        self._update_xy()
+
+
+class SpectralLine:
+    """
+    A single line of a `SpectralLines` mark, with the same interface as a single line
+    mark (e.g., ``rest_value``, ``obs_value`` and ``identify``).
+    """
+    def __init__(self, mark, table_index):
+        self.mark = mark
+        # table_index is same as name_rest elsewhere
+        self.table_index = table_index
+
+    @property
+    def _i(self):
+        return self.mark.index(self.table_index)
+
+    @property
+    def name(self):
+        return self.mark.names[self._i]
+
+    @property
+    def name_rest(self):
+        return self.table_index
+
+    @property
+    def xunit(self):
+        return self.mark.xunit
+
+    @property
+    def rest_value(self):
+        return self.mark.rest_values[self._i]
+
+    @property
+    def obs_value(self):
+        return self.mark.obs_values[self._i]
+
+    @property
+    def redshift(self):
+        return self.mark.redshift
+
+    @property
+    def show(self):
+        return bool(self.mark.show[self._i])
+
+    @property
+    def identify(self):
+        return bool(self.mark.identify[self._i])
+
+    @identify.setter
+    def identify(self, identify):
+        if not isinstance(identify, bool):  # pragma: no cover
+            raise TypeError("identify must be of type bool")
+
+        self.mark.identify[self._i] = identify
+        self.mark._update_identified_mark()
+
+    @property
+    def colors(self):
+        return [self.mark.line_colors[self._i]]
+
+    @colors.setter
+    def colors(self, colors):
+        self.mark.set_colors(self.table_index, colors[0])
 
 
 class SliceIndicatorMarks(BaseSpectrumVerticalLine, HubListener):
@@ -0,0 +1,226 @@
+from collections import OrderedDict, namedtuple
+
+import numpy as np
+from glue.core import HubListener
+from glue.core.message import (DataCollectionDeleteMessage, NumericalDataChangedMessage,
+                               ComponentsChangedMessage,
+                               ExternallyDerivableComponentsChangedMessage,
+                               SubsetUpdateMessage, SubsetDeleteMessage)
+from glue.core.subset import Subset
+from glue.core.subset_group import SubsetGroup
+
+__all__ = ['ObjectCache', 'ObjectCacheKey']
+
+
+ObjectCacheKey = namedtuple('ObjectCacheKey', ['data_id', 'subset_id', 'cls',
+                                               'statistic', 'units'])
+ObjectCacheKey.__doc__ = """
+Key of an object in `ObjectCache`.  ``data_id`` and ``subset_id`` identify the
+content of the data and subset the object was translated from (and change when
+that content changes), the other fields identify the translation.
+"""
+
+
+class ObjectCache(HubListener):
+    """
+    Cache of the objects translated from glue data and subsets (e.g., through
+    ``get_object`` or ``get_subset_object``), so that they do not have to be
+    translated again for every use.
+
+    Objects are keyed by `ObjectCacheKey` (see `key`) and evicted in least recently
+    used order when their total size exceeds ``max_bytes``.  When connected to a hub,
+    the objects are dropped as soon as the data or subset they were translated from
+    changes or is removed.
+
+    Parameters
+    ----------
+    hub : `~glue.core.hub.Hub`, optional
+        Hub to subscribe to for invalidating the objects.
+    max_bytes : int, optional
+        Memory budget of the cache, from the size of the arrays of the objects.
+    """
+    def __init__(self, hub=None, max_bytes=512 * 1024**2):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._nbytes = 0
+        # versions of the data (by uuid) and subset groups (by id), increased on changes
+        self._versions = {}
+        self._next_version = 1
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        if hub is not None:
+            hub.subscribe(self, DataCollectionDeleteMessage,
+                          handler=lambda msg: self._invalidate_data(msg.data))
+            hub.subscribe(self, NumericalDataChangedMessage,
+                          handler=lambda msg: self._invalidate_data(msg.data))
+            hub.subscribe(self, ComponentsChangedMessage,
+                          handler=lambda msg: self._invalidate_data(msg.data))
+            hub.subscribe(self, SubsetUpdateMessage,
+                          handler=lambda msg: self._invalidate_subset(msg.subset),
+                          filter=lambda msg: msg.attribute == 'subset_state')
+            hub.subscribe(self, SubsetDeleteMessage,
+                          handler=lambda msg: self._invalidate_subset(msg.subset))
+            # subsets applied to data through links change with the links
+            hub.subscribe(self, ExternallyDerivableComponentsChangedMessage,
+                          handler=lambda msg: self._invalidate_subsets(msg.data))
+
+    def _version(self, obj_id):
+        return self._versions.setdefault(obj_id, 0)
+
+    def _bump(self, obj_id):
+        self._versions[obj_id] = self._next_version
+        self._next_version += 1
+
+    def version(self, layer):
+        """
+        Return the current version of ``layer`` (data, subset, or subset group), which
+        changes whenever its content changes.
+        """
+        if isinstance(layer, SubsetGroup):
+            return self._version(id(layer))
+        if isinstance(layer, Subset):
+            return self._version(id(layer.group))
+        return self._version(layer.uuid)
+
+    def key(self, layer, cls=None, statistic=None, units=None):
+        """
+        Return the key of the object translated from ``layer``.
+
+        Parameters
+        ----------
+        layer : `~glue.core.data.BaseData` or `~glue.core.subset.Subset`
+            The data or subset the object is translated from.
+        cls : type, optional
+            Class of the object.
+        statistic : str, optional
+            Statistic used to collapse the data, if any.
+        units : tuple, optional
+            Units the object is converted to, if any.
+
+        Returns
+        -------
+        key : `ObjectCacheKey`
+        """
+        if isinstance(layer, Subset):
+            data = layer.data
+            subset_id = (id(layer.group), self._version(id(layer.group)))
+        else:
+            data = layer
+            subset_id = None
+        data_id = (data.uuid, self._version(data.uuid))
+        return ObjectCacheKey(data_id, subset_id, cls, statistic,
+                              tuple(units) if isinstance(units, (list, tuple)) else units)
+
+    def __contains__(self, key):
+        return key in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key, default=None):
+        """
+        Return the object for ``key`` (marking it as recently used), or ``default``.
+        """
+        if key not in self._entries:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._entries.move_to_end(key)
+        return self._entries[key][0]
+
+    def __getitem__(self, key):
+        if key not in self._entries:
+            raise KeyError(key)
+        return self.get(key)
+
+    def __setitem__(self, key, obj):
+        if key in self._entries:
+            self._pop(key)
+        nbytes = _object_nbytes(obj)
+        self._entries[key] = (obj, nbytes)
+        self._nbytes += nbytes
+        # evict least recently used objects, but always keep the latest one
+        while self._nbytes > self.max_bytes and len(self._entries) > 1:
+            self._pop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def _pop(self, key):
+        obj, nbytes = self._entries.pop(key)
+        self._nbytes -= nbytes
+        return obj
+
+    def get_or_translate(self, key, translate):
+        """
+        Return the object for ``key``, calling ``translate()`` to create (and cache)
+        it if needed.
+        """
+        obj = self.get(key)
+        if obj is None:
+            obj = translate()
+            self[key] = obj
+        return obj
+
+    @property
+    def nbytes(self):
+        return self._nbytes
+
+    @property
+    def stats(self):
+        """
+        Dictionary of cache statistics: hits, misses, evictions, number of objects,
+        and their size in bytes.
+        """
+        return {'hits': self.hits, 'misses': self.misses, 'evictions': self.evictions,
+                'entries': len(self._entries), 'nbytes': self._nbytes,
+                'max_bytes': self.max_bytes}
+
+    def clear(self):
+        """
+        Drop all the objects (statistics are kept).
+        """
+        self._entries.clear()
+        self._nbytes = 0
+
+    def _drop(self, predicate):
+        for key in [key for key in self._entries if predicate(key)]:
+            self._pop(key)
+
+    def _invalidate_data(self, data):
+        self._bump(data.uuid)
+        self._drop(lambda key: key.data_id[0] == data.uuid)
+
+    def _invalidate_subset(self, subset):
+        group_id = id(subset.group)
+        self._bump(group_id)
+        self._drop(lambda key: key.subset_id is not None and key.subset_id[0] == group_id)
+
+    def _invalidate_subsets(self, data):
+        def is_subset_of_data(key):
+            return key.subset_id is not None and key.data_id[0] == data.uuid
+
+        for key in self._entries:
+            if is_subset_of_data(key):
+                self._bump(key.subset_id[0])
+        self._drop(is_subset_of_data)
+
+
+def _object_nbytes(obj):
+    # size of the arrays of the object, counting shared buffers once
+    if isinstance(obj, np.ndarray):
+        return obj.nbytes
+    buffers = {}
+    for attr in ('data', 'flux', 'spectral_axis', 'uncertainty', 'mask'):
+        try:
+            value = getattr(obj, attr, None)
+        except Exception:  # nosec
+            continue
+        value = getattr(value, 'array', value)
+        if isinstance(value, np.ndarray):
+            base = value if value.base is None else value.base
+            if isinstance(base, np.ndarray):
+                buffers[id(base)] = base.nbytes
+            else:
+                buffers[id(value)] = value.nbytes
+    return sum(buffers.values())
@@ -12,7 +12,7 @@ import bqplot
 import numpy as np
 from astropy.coordinates.sky_coordinate import SkyCoord
 from astropy.nddata import NDData
-from astropy.table import QTable
+from astropy.table import QTable, vstack
 from astropy.table.row import Row as QTableRow
 from echo import delay_callback
 from ipyvuetify import VuetifyTemplate
@@ -38,7 +38,7 @@ from photutils.aperture import CircularAperture, EllipticalAperture, Rectangular
 from regions import PixelRegion
 from specutils import Spectrum
 from specutils.manipulation import extract_region
-from traitlets import Any, Bool, Dict, Float, HasTraits, List, Unicode, observe
+from traitlets import Any, Bool, Dict, Float, HasTraits, Int, List, Unicode, observe
 
 from jdaviz.components.toolbar_nested import NestedJupyterToolbar
 from jdaviz.configs.cubeviz.plugins.viewers import WithSliceIndicator
@@ -65,7 +65,7 @@ from jdaviz.style_registry import PopoutStyleWrapper
 from jdaviz.utils import (
     get_subset_type, is_wcs_only, is_not_wcs_only, wcs_is_spectral,
     _wcs_only_label, layer_is_not_dq as layer_is_not_dq_global,
-    wildcard_match, CONFIGS_WITH_LOADERS
+    wildcard_match, CONFIGS_WITH_LOADERS, create_data_hash, create_data_fingerprint
 )
 
 
@@ -413,22 +413,10 @@ class TemplateMixin(VuetifyTemplate, HubListener, ViewerPropertiesMixin, WithCac
 
         # set user-API methods
         if hasattr(self, 'user_api'):
-            def get_api_text(name, obj):
-                if type(obj).__name__ == 'method':
-                    if hasattr(obj, "__wrapped__"):
-                        orig_sig = str(inspect.signature(obj.__wrapped__))
-                        if "(self)" in orig_sig:
-                            orig_sig = orig_sig.replace("(self)", "()")
-                        elif "(self, " in orig_sig:
-                            orig_sig = orig_sig.replace("(self, ", "(")
-                        return f"{name}{orig_sig}"
-                    return f"{name}{inspect.signature(obj)}"
-                return name
-
             with warnings.catch_warnings():
                 # Some API might be going through deprecation, so ignore the warning.
                 warnings.filterwarnings("ignore", category=DeprecationWarning)
-                self.api_methods = sorted([get_api_text(name, obj)
+                self.api_methods = sorted([_api_method_text(name, obj)
                                            for name, obj in inspect.getmembers(self.user_api)])
 
     @property
@@ -487,6 +475,19 @@ class TemplateMixin(VuetifyTemplate, HubListener, ViewerPropertiesMixin, WithCac
         self.api_hints_enabled = self.app.state.show_api_hints
 
 
+def _api_method_text(name, obj):
+    # text listed in api_methods for an exposed member of a plugin: the signature of
+    # methods (excluding self, whether bound or accessed from the class), otherwise the name
+    if type(obj).__name__ not in ('method', 'function'):
+        return name
+    sig = str(inspect.signature(getattr(obj, '__wrapped__', obj)))
+    if sig.startswith("(self)"):
+        sig = sig.replace("(self)", "()", 1)
+    elif sig.startswith("(self, "):
+        sig = sig.replace("(self, ", "(", 1)
+    return f"{name}{sig}"
+
+
 def skip_if_no_updates_since_last_active(skip_if_not_active=True):
     def decorator(meth):
         @wraps(meth)
@@ -608,6 +609,8 @@ class PluginTemplateMixin(TemplateMixin):
     _plugin_name = None  # noqa overwritten by the registry - won't be populated by plugins instantiated directly
     _sidebar = 'plugins'  # noqa overwritten by the registry
     _subtab = None  # noqa overwritten by the registry
+    _defer_instantiation = False  # noqa set to True in plugins that only need to be instantiated when first opened or accessed from the API (their relevance must not depend on the state of the app, see _class_is_relevant)
+    _user_api_expose = ()  # noqa names exposed in user_api, required by plugins deferring their instantiation to list their api_methods before being instantiated (see _class_api_methods)
     disabled_msg = Unicode("").tag(sync=True)  # noqa if non-empty, will show this message in place of plugin content
     irrelevant_msg = Unicode("").tag(sync=True)  # noqa if non-empty, will exclude from the tray, and show this message in place of any content in other instances
     plugin_key = Unicode("").tag(sync=True)  # noqa set to non-empty to override value in vue file (when supported by vue file)
@@ -669,6 +672,27 @@ class PluginTemplateMixin(TemplateMixin):
 
         super().__init__(app=app, **kwargs)
 
+    @classmethod
+    def _class_is_relevant(cls):
+        # relevance of the plugin before it is instantiated (e.g., for plugins deferring their
+        # instantiation), according to the default of irrelevant_msg
+        return len(cls.class_traits()['irrelevant_msg'].default_value) == 0
+
+    @classmethod
+    def _class_plugin_description(cls):
+        # description of the plugin before it is instantiated, according to the default of
+        # _plugin_description
+        return cls.class_traits()['_plugin_description'].default_value
+
+    @classmethod
+    def _class_api_methods(cls):
+        # api_methods of the plugin before it is instantiated, according to _user_api_expose
+        # and the methods exposed by PluginUserApi for all plugins in the tray
+        expose = set(cls._user_api_expose) | {'open_in_tray', 'close_in_tray', 'show'}
+        if cls.class_traits()['uses_active_status'].default_value:
+            expose |= {'keep_active', 'as_active'}
+        return sorted([_api_method_text(name, getattr(cls, name, None)) for name in expose])
+
     def new(self):
         new = self.__class__(app=self.app)
         new._plugin_name = self._plugin_name
@@ -1418,7 +1442,16 @@ class SelectPluginComponent(BasePluginComponent, HasTraits):
 
 
 class SelectFileExtensionComponent(SelectPluginComponent):
-    def __init__(self, plugin, items, selected, multiselect=None, manual_options=[], filters=[]):
+    """
+    Select among the extensions of a file (or the entries of a list).
+
+    Data hashes of the extensions are computed on demand, through ``data_hash_func``
+    (defaults to `~jdaviz.utils.create_data_hash` of the ``obj`` of the item), unless
+    a ``data_hash`` is provided in ``manual_options``.
+    """
+    def __init__(self, plugin, items, selected, multiselect=None, manual_options=[], filters=[],
+                 data_hash_func=None):
+        self._data_hash_func = data_hash_func
         super().__init__(plugin, items=items, selected=selected, multiselect=multiselect,
                          manual_options=manual_options, filters=filters)
 
@@ -1458,7 +1491,54 @@ class SelectFileExtensionComponent(SelectPluginComponent):
 
     @property
     def data_hashes(self):
-        return [item.get('data_hash', None) for item in self.items]
+        return self.data_hashes_matching(None)
+
+    def _compute_data_hash(self, option):
+        if 'data_hash' in option:
+            return False
+        if self._data_hash_func is not None:
+            option['data_hash'] = self._data_hash_func(option)
+        else:
+            option['data_hash'] = create_data_hash(option.get('obj'))
+        return True
+
+    def get_data_hash(self, index):
+        """
+        Return the data hash of the extension at ``index``, computing it if needed.
+        """
+        option = self.manual_options[index]
+        if self._compute_data_hash(option):
+            # expose the new hash to the UI
+            self._update_items()
+        return option['data_hash']
+
+    def get_data_fingerprint(self, index):
+        """
+        Return the cheap fingerprint (see `~jdaviz.utils.create_data_fingerprint`) of
+        the extension at ``index``.
+        """
+        option = self.manual_options[index]
+        if 'data_fingerprint' not in option:
+            option['data_fingerprint'] = create_data_fingerprint(option.get('obj'))
+        return option['data_fingerprint']
+
+    def data_hashes_matching(self, fingerprints):
+        """
+        Return the data hashes of the extensions, only computing them for extensions
+        which fingerprint is in ``fingerprints`` (or could not be determined) and
+        returning `None` for the others.  If ``fingerprints`` is `None`, all the data
+        hashes are computed.
+        """
+        computed = False
+        for item in self.items:
+            if fingerprints is not None:
+                fingerprint = self.get_data_fingerprint(item['index'])
+                if fingerprint is not None and fingerprint not in fingerprints:
+                    continue
+            computed |= self._compute_data_hash(self.manual_options[item['index']])
+        if computed:
+            self._update_items()
+        return [self.manual_options[item['index']].get('data_hash') for item in self.items]
 
     def _to_item(self, manual_item, index=None):
         if index is None:
@@ -3555,6 +3635,105 @@ class NonFiniteUncertaintyMismatchMixin(VuetifyTemplate, HubListener):
         self.non_finite_uncertainty_mismatch = bool(mismatch)
 
 
+def _batched_polyfit(x, y, x_eval, deg=1, axis=-1, mask=None):
+    """
+    Least-squares polynomial fits of ``y`` as a function of ``x`` along ``axis``,
+    for all the other indices of ``y`` at once, evaluated at ``x_eval``.
+
+    The fits are solved together from the shared normal-equation sums, ignoring
+    non-finite and masked (``mask`` is `True`) values of ``y``.  Fits with fewer
+    valid values than coefficients are NaN.
+
+    Parameters
+    ----------
+    x : array-like
+        1D array of the abscissas, matching ``y`` along ``axis``.
+    y : array-like
+        Values to fit, with the fitted dimension along ``axis``.
+    x_eval : array-like
+        1D array of the abscissas to evaluate the fits at.
+    deg : int, optional
+        Degree of the polynomials.
+    axis : int, optional
+        Axis of ``y`` along which to fit.
+    mask : array-like, optional
+        Values of ``y`` to ignore, broadcastable to ``y``.
+
+    Returns
+    -------
+    fits : `~numpy.ndarray`
+        The fits evaluated at ``x_eval`` (along ``axis``, with the other
+        dimensions of ``y``).
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    valid = np.isfinite(y)
+    if mask is not None:
+        valid &= ~np.broadcast_to(mask, y.shape)
+    y, valid = np.moveaxis(y, axis, -1), np.moveaxis(valid, axis, -1)
+
+    # center and scale the abscissas to keep the normal equations well-conditioned
+    center = 0.5 * (np.nanmax(x) + np.nanmin(x)) if len(x) else 0.
+    scale = 0.5 * (np.nanmax(x) - np.nanmin(x)) if len(x) else 1.
+    scale = scale if scale > 0 else 1.
+    powers = np.arange(deg + 1)
+    vander = ((x - center) / scale)[:, None] ** powers
+    eval_vander = ((np.asarray(x_eval, dtype=float) - center) / scale)[:, None] ** powers
+
+    # sums of y * x**k for each fit and of x**(k + l), shared by all the fits without
+    # invalid values
+    rhs = np.where(valid, y, 0.) @ vander
+    all_valid = valid.all()
+    if all_valid:
+        lhs = vander.T @ vander
+        n_valid = np.full(y.shape[:-1], y.shape[-1])
+    else:
+        power_sums = valid.astype(float) @ (((x - center) / scale)[:, None]
+                                            ** np.arange(2 * deg + 1))
+        lhs = power_sums[..., powers[:, None] + powers[None, :]]
+        n_valid = valid.sum(axis=-1)
+
+    solvable = n_valid > deg
+    if not all_valid:
+        # replace the singular systems so the others can be solved together
+        lhs = np.where(solvable[..., None, None], lhs, np.eye(deg + 1))
+    if lhs.ndim == 2:
+        # one system for all the fits
+        rhs = rhs.reshape(-1, deg + 1).T
+    else:
+        rhs = rhs[..., None]
+    try:
+        coeffs = np.linalg.solve(lhs, rhs)
+    except np.linalg.LinAlgError:
+        # degenerate abscissas, e.g., repeated values
+        coeffs = np.linalg.pinv(lhs) @ rhs
+    coeffs = coeffs.T.reshape(y.shape[:-1] + (deg + 1,)) if lhs.ndim == 2 else coeffs[..., 0]
+
+    fits = coeffs @ eval_vander.T
+    fits[~solvable] = np.nan
+    return np.moveaxis(fits, -1, axis)
+
+
+class _PerPixelContinuum:
+    """
+    Linear continuum of every spaxel of a cube, fitted and evaluated on demand for
+    chunks of spaxels (see `SpectralContinuumMixin._get_continuum`).
+    """
+    def __init__(self, continuum_x, continuum_y, x_offset, spectral_axis_index):
+        self.continuum_x = continuum_x
+        # spectral axis last, so that chunks are taken along the first spatial axis
+        self.continuum_y = np.moveaxis(continuum_y, spectral_axis_index, -1)
+        self.x_offset = x_offset
+
+    def evaluate(self, x, chunk=slice(None)):
+        """
+        Return the continuum at spectral axis values ``x`` (along the last axis) for
+        the spaxels in ``chunk`` of the first spatial axis.
+        """
+        return _batched_polyfit(self.continuum_x, self.continuum_y[chunk],
+                                np.asarray(x) - self.x_offset, deg=1, axis=-1)
+
+
 class SpectralContinuumMixin(VuetifyTemplate, HubListener):
     """
     Plugin select to choose options for a linear spectral continuum.
@@ -3615,7 +3794,17 @@ class SpectralContinuumMixin(VuetifyTemplate, HubListener):
                            mark_y.get(pos, []),
                            viewers=viewers)
 
-    def _get_continuum(self, dataset, spectral_subset, update_marks=False, per_pixel=False):
+    def _get_continuum(self, dataset, spectral_subset, update_marks=False, per_pixel=False,
+                       evaluate=True):
+        """
+        Return the spectrum in the selected spectral subset, its continuum, and the
+        continuum-subtracted spectrum.
+
+        With ``per_pixel=True`` and ``evaluate=False``, the continuum is returned as a
+        `_PerPixelContinuum` (or `None` for no continuum) which fits and evaluates the
+        continuum of chunks of spaxels on demand, and the continuum-subtracted spectrum
+        is `None`.
+        """
         if dataset.selected == '':
             self._update_continuum_marks()
             return None, None, None
@@ -3657,6 +3846,8 @@ class SpectralContinuumMixin(VuetifyTemplate, HubListener):
 
         if self.continuum_subset_selected == 'None':
             self._update_continuum_marks()
+            if not evaluate:
+                return spectrum, None, None
             return spectrum, np.zeros_like(spectrum.flux.value), spectrum
 
         # compute continuum
@@ -3739,22 +3930,14 @@ class SpectralContinuumMixin(VuetifyTemplate, HubListener):
         if per_pixel:
             # full_spectrum.flux is a cube, so we want to act on all spaxels independently
             continuum_y = np.take(full_spectrum.flux, continuum_mask, axis=spectral_axis_index).value  # noqa
-
-            def fit_continuum(continuum_y_spaxel):
-                return np.polyfit(continuum_x-min_x, continuum_y_spaxel, deg=1)
-
-            # compute the linear fit for each spaxel independently, along the spectral axis
-            slopes_intercepts = np.apply_along_axis(fit_continuum, spectral_axis_index, continuum_y)
-            slopes = np.take(slopes_intercepts, 0, spectral_axis_index)
-            intercepts = np.take(slopes_intercepts, 1, spectral_axis_index)
-
-            # spectrum.spectral_axis is an array, but we need our continuum to have the same
-            # shape as the fluxes in the cube, so let's just duplicate to the correct shape
-            spectral_axis_cube = np.zeros(spectrum.flux.shape)
-            reshape_inds = [1, 1, 1]
-            reshape_inds[spectral_axis_index] = -1
-            spectral_axis_cube[:, :, :] = spectrum.spectral_axis.value.reshape(reshape_inds)
-            continuum = np.expand_dims(slopes, spectral_axis_index) * (spectral_axis_cube-min_x) + np.expand_dims(intercepts, spectral_axis_index)  # noqa
+            if not evaluate:
+                return spectrum, _PerPixelContinuum(continuum_x-min_x, continuum_y, min_x,
+                                                    spectral_axis_index), None
+
+            # compute the linear fit for all spaxels at once, along the spectral axis
+            continuum = _batched_polyfit(continuum_x-min_x, continuum_y,
+                                         spectrum.spectral_axis.value-min_x,
+                                         deg=1, axis=spectral_axis_index)
         else:
             continuum_y = full_spectrum.flux[continuum_mask].value
             slope, intercept = np.polyfit(continuum_x-min_x, continuum_y, deg=1)
@@ -5301,6 +5484,120 @@ class PluginSubcomponent(VuetifyTemplate):
         show_widget(self, loc=loc, title=title)
 
 
+def _float_format(column):
+    if column in ('slice', 'index'):
+        # stored in astropy table as a float so we can also store nans,
+        # but should display in the UI without any decimals
+        return ".0f"
+    elif column in ('pixel', 'pixel_x', 'pixel_y'):
+        return "0.3f"
+    elif column in ('xcenter', 'ycenter'):
+        return "0.1f"
+    elif column in ('sum', 'spectral_axis'):
+        return ".3e"
+    else:
+        return "0.5f"
+
+
+def _float_precision(column, item):
+    return f"{item:{_float_format(column)}}"
+
+
+def _json_safe(column, item):
+    """
+    Convert a single table value into a JSON-safe value to show in the UI.
+    """
+    if isinstance(item, SkyCoord):
+        return item.to_string('hmsdms', precision=4)
+    elif isinstance(item, u.Quantity) and not np.isnan(item):
+        return f"{_float_precision(column, item.value)} {item.unit.to_string()}"
+
+    elif hasattr(item, 'to_string'):
+        return item.to_string()
+    elif isinstance(item, float) and np.isnan(item):
+        return ''
+    elif isinstance(item, tuple) and np.all([np.isnan(i) for i in item]):
+        return ''
+    elif isinstance(item, float):
+        return _float_precision(column, item)
+    elif isinstance(item, (list, tuple)):
+        return [_float_precision(column, i) if isinstance(i, float) else i for i in item]
+    elif isinstance(item, (np.float32, np.float64)):
+        return float(item)
+    elif isinstance(item, u.Quantity):
+        return {"value": item.value.tolist() if item.size > 1 else item.value, "unit": str(item.unit)}     # noqa: E501
+    elif isinstance(item, np.bool_):
+        return bool(item)
+    elif isinstance(item, np.ndarray):
+        return item.tolist()
+    elif isinstance(item, tuple):
+        return tuple(_json_safe(column, v) for v in item)
+    return item
+
+
+def _sexagesimal_strings(values, separators, precision, signed=False):
+    """
+    Format an array of hours or degrees as zero-padded sexagesimal strings,
+    such as ``12h04m05.1230s`` for ``separators='hms'`` and ``precision=4``.
+    """
+    scale = 10 ** precision
+    scaled = np.round(np.abs(values) * 3600 * scale).astype(np.int64)
+    whole, rest = np.divmod(scaled, 3600 * scale)
+    minutes, rest = np.divmod(rest, 60 * scale)
+    seconds, fraction = np.divmod(rest, scale)
+    parts = [np.char.mod('%02d', whole), separators[0],
+             np.char.mod('%02d', minutes), separators[1],
+             np.char.mod('%02d', seconds), '.', np.char.mod(f'%0{precision}d', fraction),
+             separators[2]]
+    if signed:
+        parts.insert(0, np.where(values < 0, '-', '+'))
+    strings = parts[0]
+    for part in parts[1:]:
+        strings = np.char.add(strings, part)
+    return strings
+
+
+def _json_safe_column(column, values):
+    """
+    Convert all the values of a table column into a list of JSON-safe values to
+    show in the UI, equivalent to calling `_json_safe` on every value, but
+    vectorized for the common column types.
+    """
+    if isinstance(values, SkyCoord):
+        lon, lat = values.spherical.lon.hour, values.spherical.lat.deg
+        if not (np.all(np.isfinite(lon)) and np.all(np.isfinite(lat))):
+            return list(np.atleast_1d(values.to_string('hmsdms', precision=4)))
+        # same as values.to_string('hmsdms', precision=4), which formats one value at a time
+        return np.char.add(np.char.add(_sexagesimal_strings(lon, 'hms', 4), ' '),
+                           _sexagesimal_strings(lat, 'dms', 4, signed=True)).tolist()
+
+    dtype = getattr(values, 'dtype', None)
+    masked = getattr(values, 'mask', None) is not None and np.any(values.mask)
+    if dtype is None or masked or values.ndim != 1:
+        if dtype is not None and values.ndim > 1 and not isinstance(values, u.Quantity):
+            # multi-valued cells were added as tuples
+            return [_json_safe(column, tuple(value.tolist())) for value in values]
+        return [_json_safe(column, value) for value in values]
+
+    fmt = '%' + _float_format(column)
+    if isinstance(values, u.Quantity):
+        value = np.asarray(values.value)
+        if dtype.kind not in 'fiu':
+            return [_json_safe(column, value) for value in values]
+        strings = np.char.add(np.char.mod(fmt, value), f" {values.unit.to_string()}")
+        if dtype.kind == 'f':
+            strings = np.where(np.isnan(value),
+                               u.Quantity(np.nan, values.unit).to_string(), strings)
+        return strings.tolist()
+
+    value = np.asarray(values)
+    if dtype == np.float64:
+        return np.where(np.isnan(value), '', np.char.mod(fmt, value)).tolist()
+    elif dtype.kind in 'fiubU':
+        return value.tolist()
+    return [_json_safe(column, value) for value in values]
+
+
 class Table(PluginSubcomponent):
     """
     Table subcomponent. For most cases where a plugin only requires a single table, use the mixin
@@ -5313,14 +5610,30 @@ class Table(PluginSubcomponent):
 
       <jupyter-widget :widget="table_widget"></jupyter-widget>
 
+    Tables with more than ``virtualize_threshold`` rows are virtualized: the full ``items`` list
+    is only kept in Python, and only the current page of rows (after sorting and filtering on the
+    Python side) is synced to the UI as ``frontend_items``.
     """
     template_file = __file__, "../components/plugin_table.vue"
 
     _default_values_by_colname = {}
 
+    # tables with more rows than this are virtualized: sorting, filtering and
+    # pagination are done here and only the visible page is sent to the UI
+    virtualize_threshold = 1000
+
     headers_visible = List([]).tag(sync=True)  # list of strings
     headers_avail = List([]).tag(sync=True)   # list of strings
-    items = List().tag(sync=True)  # list of dictionaries, pass single dict to add_row
+    items = List()  # list of dictionaries, pass single dict to add_row
+
+    # rows sent to the UI: all items, or only the current page if virtualized
+    frontend_items = List().tag(sync=True)
+    n_items = Int(0).tag(sync=True)
+    n_filtered_items = Int(0).tag(sync=True)
+    virtualized = Bool(False).tag(sync=True)
+    # page, itemsPerPage, sortBy, sortDesc, etc, as set by v-data-table
+    table_options = Dict().tag(sync=True)
+    filter_text = Unicode('').tag(sync=True)
 
     # NOTE: These UI features are not covered in test coverage. Plugins making use of
     # this feature should ensure test coverage for their respective tables.
@@ -5340,6 +5653,8 @@ class Table(PluginSubcomponent):
         self._table_name = name
         self._selected_rows_changed_callback = selected_rows_changed_callback
         self._clear_callback = clear_callback
+        # lower-case string representation of the items, per column, for filtering
+        self._filter_strings = {}
         super().__init__(plugin, 'Table', *args, **kwargs)
 
         plugin.session.hub.broadcast(PluginTableAddedMessage(sender=self))
@@ -5373,6 +5688,72 @@ class Table(PluginSubcomponent):
         if self._selected_rows_changed_callback is not None:
             self._selected_rows_changed_callback(msg)
 
+    @observe('items')
+    def _items_changed(self, msg=None):
+        self._filter_strings = {}
+        self.n_items = len(self.items)
+        self.virtualized = self.n_items > self.virtualize_threshold
+        self._update_frontend_items()
+
+    @observe('table_options', 'filter_text', 'headers_visible')
+    def _update_frontend_items(self, msg=None):
+        if not self.virtualized:
+            self.n_filtered_items = len(self.items)
+            self.frontend_items = self.items
+            return
+
+        indices = self._sorted_filtered_indices()
+        self.n_filtered_items = len(indices)
+
+        per_page = self.table_options.get('itemsPerPage', 10)
+        if per_page > 0:
+            page = max(self.table_options.get('page', 1), 1)
+            indices = indices[(page - 1) * per_page:page * per_page]
+        self.frontend_items = [self.items[i] for i in indices]
+
+    def _column_filter_strings(self, colname):
+        if colname not in self._filter_strings:
+            self._filter_strings[colname] = np.char.lower(
+                np.array([str(item.get(colname, '')) for item in self.items], dtype=str))
+        return self._filter_strings[colname]
+
+    def _column_sort_keys(self, colname):
+        # sort on the original values when available (so that numbers are not
+        # sorted as strings), otherwise on the values shown in the UI
+        if (self._qtable is not None and len(self._qtable) == len(self.items)
+                and colname in self._qtable.colnames):
+            values = self._qtable[colname]
+            values = np.asarray(getattr(values, 'value', values))
+            if values.ndim == 1 and values.dtype.kind in 'fiub':
+                return values
+        return self._column_filter_strings(colname)
+
+    def _sorted_filtered_indices(self):
+        """
+        Indices into ``items`` of the rows matching ``filter_text`` (case-insensitive,
+        in any visible column), sorted according to ``table_options``.
+        """
+        indices = np.arange(len(self.items))
+        if self.filter_text:
+            text = self.filter_text.lower()
+            matches = np.zeros(len(self.items), dtype=bool)
+            for colname in self.headers_visible:
+                matches |= np.char.find(self._column_filter_strings(colname), text) >= 0
+            indices = indices[matches]
+
+        sort_by = self.table_options.get('sortBy', [])
+        sort_desc = self.table_options.get('sortDesc', [])
+        if not len(sort_by) or not len(indices):
+            return indices
+
+        keys = []
+        for colname, desc in zip(sort_by, list(sort_desc) + [False] * len(sort_by)):
+            # rank the values so that descending order also works for strings
+            _, ranks = np.unique(self._column_sort_keys(colname)[indices], return_inverse=True)
+            keys.append(-ranks if desc else ranks)
+        # the last key is the primary one for lexsort
+        return indices[np.lexsort(keys[::-1])]
+
     def add_item(self, item):
         """
         Add an item/row to the table.
@@ -5381,51 +5762,8 @@ class Table(PluginSubcomponent):
         ----------
         item : QTable, QTableRow, or dictionary of row-name, value pairs
         """
-        def json_safe(column, item):
-            def float_precision(column, item):
-                if column in ('slice', 'index'):
-                    # stored in astropy table as a float so we can also store nans,
-                    # but should display in the UI without any decimals
-                    return f"{item:.0f}"
-                elif column in ('pixel', 'pixel_x', 'pixel_y'):
-                    return f"{item:0.3f}"
-                elif column in ('xcenter', 'ycenter'):
-                    return f"{item:0.1f}"
-                elif column in ('sum', 'spectral_axis'):
-                    return f"{item:.3e}"
-                else:
-                    return f"{item:0.5f}"
-
-            if isinstance(item, SkyCoord):
-                return item.to_string('hmsdms', precision=4)
-            elif isinstance(item, u.Quantity) and not np.isnan(item):
-                return f"{float_precision(column, item.value)} {item.unit.to_string()}"
-
-            elif hasattr(item, 'to_string'):
-                return item.to_string()
-            elif isinstance(item, float) and np.isnan(item):
-                return ''
-            elif isinstance(item, tuple) and np.all([np.isnan(i) for i in item]):
-                return ''
-            elif isinstance(item, float):
-                return float_precision(column, item)
-            elif isinstance(item, (list, tuple)):
-                return [float_precision(column, i) if isinstance(i, float) else i for i in item]
-            elif isinstance(item, (np.float32, np.float64)):
-                return float(item)
-            elif isinstance(item, u.Quantity):
-                return {"value": item.value.tolist() if item.size > 1 else item.value, "unit": str(item.unit)}     # noqa: E501
-            elif isinstance(item, np.bool_):
-                return bool(item)
-            elif isinstance(item, np.ndarray):
-                return item.tolist()
-            elif isinstance(item, tuple):
-                return tuple(json_safe(v) for v in item)
-            return item
-
         if isinstance(item, QTable):
-            for row in item:
-                self.add_item(row)
+            self.add_items(item)
             return
         if isinstance(item, QTableRow):
             # Row does not have .items() implemented
@@ -5435,25 +5773,74 @@ class Table(PluginSubcomponent):
         if self._qtable is None:
             self._qtable = QTable([item])
         else:
-            # add any missing columns with a default value for all previous rows
-            for colname, value in item.items():
-                if colname in self._qtable.colnames:
-                    continue
-                default_value = self.default_value_for_column(colname=colname,
-                                                              value=value)
-                self._qtable.add_column(default_value, name=colname)
-
+            self._add_missing_columns(item)
             self._qtable.add_row(item)
 
-        missing_headers = [k for k in item.keys() if k not in self.headers_avail]
-        if len(missing_headers):
-            self.headers_avail = self.headers_avail + missing_headers
-            self.headers_visible = self.headers_visible + [m for m in missing_headers if self._new_col_visible(m)]  # noqa
+        self._add_missing_headers(item.keys())
 
         # clean data to show in the UI
-        self.items = self.items + [{k: json_safe(k, v) for k, v in item.items()}]
+        self.items = self.items + [{k: _json_safe(k, v) for k, v in item.items()}]
         self._plugin.session.hub.broadcast(PluginTableAddedMessage(sender=self))
 
+    def add_items(self, items):
+        """
+        Add multiple items/rows to the table at once.  The rows are appended to the
+        underlying table column by column, and the UI is only updated once, so this
+        is much faster than calling :meth:`add_item` in a loop for large tables.
+
+        Parameters
+        ----------
+        items : QTable or list of QTableRow or dictionaries of row-name, value pairs
+        """
+        if not isinstance(items, QTable):
+            items = [{k: v for k, v in zip(item.keys(), item.values())}
+                     if isinstance(item, QTableRow) else item
+                     for item in items]
+            if not len(items):
+                return
+            items = QTable(rows=items)
+        if not len(items):
+            return
+
+        # save original sent values to the cached QTable object
+        if self._qtable is None:
+            self._qtable = QTable(items)
+        else:
+            self._add_missing_columns({colname: items[colname][0] for colname in items.colnames})
+            if all(colname in items.colnames for colname in self._qtable.colnames):
+                meta = self._qtable.meta
+                self._qtable = vstack([self._qtable, items[self._qtable.colnames]],
+                                      join_type='exact', metadata_conflicts='silent')
+                self._qtable.meta = meta
+            else:
+                # rows missing some columns are filled in by add_row
+                for row in items:
+                    self._qtable.add_row({k: v for k, v in zip(row.keys(), row.values())})
+
+        self._add_missing_headers(items.colnames)
+
+        # clean data to show in the UI, formatting whole columns at once
+        columns = {colname: _json_safe_column(colname, items[colname])
+                   for colname in items.colnames}
+        self.items = self.items + [dict(zip(columns.keys(), values))
+                                   for values in zip(*columns.values())]
+        self._plugin.session.hub.broadcast(PluginTableAddedMessage(sender=self))
+
+    def _add_missing_columns(self, item):
+        # add any missing columns with a default value for all previous rows
+        for colname, value in item.items():
+            if colname in self._qtable.colnames:
+                continue
+            default_value = self.default_value_for_column(colname=colname,
+                                                          value=value)
+            self._qtable.add_column(default_value, name=colname)
+
+    def _add_missing_headers(self, colnames):
+        missing_headers = [k for k in colnames if k not in self.headers_avail]
+        if len(missing_headers):
+            self.headers_avail = self.headers_avail + missing_headers
+            self.headers_visible = self.headers_visible + [m for m in missing_headers if self._new_col_visible(m)]  # noqa
+
     def __len__(self):
         return len(self.items)
 
@@ -0,0 +1,139 @@
+import threading
+
+import pytest
+
+from jdaviz.core.live_results import LiveResultsScheduler
+
+
+def test_synchronous():
+    scheduler = LiveResultsScheduler(asynchronous=False)
+    applied = []
+    scheduler.request('a', lambda: 1, applied.append)
+    scheduler.request('a', lambda: 2, applied.append)
+    assert applied == [1, 2]
+    assert not scheduler.running
+
+
+def test_superseded_result_discarded():
+    scheduler = LiveResultsScheduler(asynchronous=True)
+    started, release = threading.Event(), threading.Event()
+    applied = []
+
+    def slow_compute():
+        started.set()
+        release.wait(10)
+        return 'old'
+
+    scheduler.request('a', slow_compute, applied.append)
+    assert started.wait(10)
+    # a newer request while the first is computing supersedes it
+    scheduler.request('a', lambda: 'new', applied.append)
+    release.set()
+    scheduler.wait(10)
+    assert applied == ['new']
+    assert not scheduler.running
+
+
+def test_concurrent_results():
+    scheduler = LiveResultsScheduler(asynchronous=True)
+    # both computations need to run at the same time to pass the barrier
+    barrier = threading.Barrier(2, timeout=10)
+    applied = {}
+
+    def compute(key):
+        barrier.wait()
+        return key
+
+    for key in ('a', 'b'):
+        scheduler.request(key, lambda key=key: compute(key),
+                          lambda result, key=key: applied.__setitem__(key, result))
+    scheduler.wait(20)
+    assert applied == {'a': 'a', 'b': 'b'}
+
+
+def test_cancel_and_errors():
+    scheduler = LiveResultsScheduler(asynchronous=True)
+    started, release = threading.Event(), threading.Event()
+    applied, errors = [], []
+
+    def slow_compute():
+        started.set()
+        release.wait(10)
+        return 'cancelled'
+
+    scheduler.request('a', slow_compute, applied.append)
+    assert started.wait(10)
+    scheduler.cancel('a')
+    release.set()
+    scheduler.wait(10)
+    assert applied == []
+
+    def failing_compute():
+        raise ValueError('failed')
+
+    scheduler.request('a', failing_compute, applied.append, on_error=errors.append)
+    scheduler.wait(10)
+    assert applied == []
+    assert len(errors) == 1 and isinstance(errors[0], ValueError)
+
+
+def test_snapshot_and_apply_in_main_thread():
+    scheduler = LiveResultsScheduler(asynchronous=True)
+    threads = {}
+
+    def snapshot():
+        threads['snapshot'] = threading.current_thread()
+        return 1
+
+    def compute(value):
+        threads['compute'] = threading.current_thread()
+        return value + 1
+
+    def apply(result):
+        threads['apply'] = threading.current_thread()
+        threads['result'] = result
+
+    scheduler.request('a', compute, apply, snapshot=snapshot)
+    scheduler.wait(10)
+    assert threads['result'] == 2
+    assert threads['snapshot'] is threading.main_thread()
+    assert threads['compute'] is not threading.main_thread()
+    assert threads['apply'] is threading.main_thread()
+
+    # errors are raised when not handled
+    def failing_compute():
+        raise ValueError('failed')
+
+    scheduler.request('a', failing_compute, apply)
+    with pytest.raises(ValueError, match='failed'):
+        scheduler.wait(10)
+    assert not scheduler.running
+
+
+def test_close():
+    scheduler = LiveResultsScheduler(asynchronous=True)
+    started, release = threading.Event(), threading.Event()
+    applied = []
+
+    def slow_compute():
+        started.set()
+        release.wait(10)
+        return 'closed'
+
+    scheduler.request('a', slow_compute, applied.append)
+    assert started.wait(10)
+    executor = scheduler._executor
+    # running recomputations are discarded and the threads shut down once they complete
+    scheduler.close()
+    assert scheduler._executor is None
+    release.set()
+    executor.shutdown(wait=True)
+    scheduler.wait(10)
+    assert applied == []
+    assert not scheduler.running
+
+    # a later request starts new threads
+    scheduler.request('a', lambda: 'new', applied.append)
+    scheduler.wait(10)
+    assert applied == ['new']
+    scheduler.close()
@@ -0,0 +1,89 @@
+import numpy as np
+from glue.core import Data, DataCollection
+from glue.core.roi import XRangeROI
+from specutils import Spectrum
+
+from jdaviz.core.object_cache import ObjectCache
+
+
+def test_object_cache_lru():
+    dc = DataCollection([Data(x=np.arange(10), label='a'), Data(x=np.arange(10), label='b')])
+    cache = ObjectCache(max_bytes=200)
+
+    key_a = cache.key(dc['a'], cls=np.ndarray)
+    assert cache.get(key_a) is None
+    cache[key_a] = dc['a']['x']
+    assert cache.get(key_a) is dc['a']['x']
+    assert cache.nbytes == 80
+
+    # structured keys differ by class, statistic and units
+    assert cache.key(dc['a'], cls=np.ndarray) == key_a
+    assert cache.key(dc['a'], cls=np.ndarray, statistic='sum') != key_a
+    assert cache.key(dc['a'], cls=np.ndarray, units=('um', 'Jy')) != key_a
+    assert cache.key(dc['b'], cls=np.ndarray) != key_a
+
+    # least recently used objects are evicted beyond the memory budget
+    key_b = cache.key(dc['b'], cls=np.ndarray)
+    cache[key_b] = dc['b']['x']
+    key_sum = cache.key(dc['a'], cls=np.ndarray, statistic='sum')
+    cache.get(key_a)
+    cache[key_sum] = np.zeros(10)
+    assert key_b not in cache
+    assert key_a in cache and key_sum in cache
+    assert cache.stats == {'hits': 2, 'misses': 1, 'evictions': 1, 'entries': 2,
+                           'nbytes': 160, 'max_bytes': 200}
+
+
+def test_object_cache_invalidation(specviz_helper, spectrum1d):
+    specviz_helper.load_data(spectrum1d, data_label='test')
+    app = specviz_helper.app
+    cache = app._object_cache
+    viewer = specviz_helper.viewers['spectrum-viewer']._obj.glue_viewer
+
+    data = app.data_collection['test']
+    sp = viewer.data()[0]
+    assert isinstance(sp, Spectrum)
+    key = cache.key(data, cls=Spectrum, statistic=getattr(viewer.state, 'function', None))
+    assert key in cache
+    hits = cache.hits
+    assert viewer.data()[0] is sp
+    assert cache.hits == hits + 1
+
+    # the mouseover caches the spectrum converted to the display units of the viewer
+    label_mouseover = specviz_helper._coords_info
+    label_mouseover._viewer_mouse_event(viewer, {'event': 'mousemove',
+                                                 'domain': {'x': 6100, 'y': 12.5}})
+    units_key = cache.key(data, cls=np.ndarray,
+                          units=(viewer.state.x_display_unit, viewer.state.y_display_unit))
+    assert units_key in cache
+    assert units_key != cache.key(data, cls=np.ndarray, units=('um', viewer.state.y_display_unit))
+
+    # renaming or restyling the data does not change the object
+    data.style.color = '#ff0000'
+    assert key in cache
+
+    # subset objects are cached until the subset changes
+    viewer.apply_roi(XRangeROI(6000, 6500))
+    subset = data.subsets[0]
+    subset_key = cache.key(subset, cls=Spectrum,
+                           statistic=getattr(viewer.state, 'function', None))
+    sp_subset = viewer.data()[1]
+    assert subset_key in cache
+    assert viewer.data()[1] is sp_subset
+    subset.style.color = '#00ff00'
+    assert subset_key in cache
+
+    viewer.apply_roi(XRangeROI(6200, 6500))
+    assert subset_key not in cache
+    assert key in cache
+    sp_subset2 = viewer.data()[1]
+    assert sp_subset2 is not sp_subset
+    assert np.count_nonzero(~sp_subset2.mask) < np.count_nonzero(~sp_subset.mask)
+
+    # changing the data values drops its objects, including those of its subsets
+    data.update_components({data.id['flux']: data['flux'] * 2})
+    assert len(cache) == 0
+    assert viewer.data()[0] is not sp
+
+    app.data_collection.remove(data)
+    assert len(cache) == 0
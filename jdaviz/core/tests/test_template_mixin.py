@@ -4,10 +4,12 @@ import re
 import pytest
 import numpy as np
 import astropy.units as u
-from astropy.table import Table
+from astropy.table import QTable, Table
+from glue.core import HubListener
 from specutils import SpectralRegion
 
-from jdaviz.core.template_mixin import TableMixin
+from jdaviz.core.events import PluginTableAddedMessage
+from jdaviz.core.template_mixin import TableMixin, _batched_polyfit
 
 
 def test_spectralsubsetselect(specviz_helper, spectrum1d):
@@ -325,6 +327,94 @@ class FakeTable(TableMixin):
         self.table._qtable = catalog
 
 
+class RecordingTable(TableMixin):
+    template = ''
+
+    def __init__(self, session, *args, **kwargs):
+        self.session = session
+        self._plugin_name = 'test-recording-table'
+        super().__init__(*args, **kwargs)
+
+
+def test_table_add_items(deconfigged_helper):
+    session = deconfigged_helper.app.session
+    rows = [{'ra': 337.5 * u.deg, 'mag': 12.5, 'slice': 3., 'name': 'a', 'flag': True},
+            {'ra': 337.6 * u.deg, 'mag': np.nan, 'slice': 4., 'name': 'bb', 'flag': False},
+            {'ra': np.nan * u.deg, 'mag': 14.123456, 'slice': 5., 'name': 'c', 'flag': True}]
+
+    row_by_row = RecordingTable(session)
+    for row in rows:
+        row_by_row.table.add_item(row)
+
+    bulk = RecordingTable(session)
+    n_messages = []
+
+    def count_message(msg):
+        if msg.sender is bulk.table:
+            n_messages.append(msg)
+
+    listener = HubListener()
+    deconfigged_helper.app.hub.subscribe(listener, PluginTableAddedMessage,
+                                         handler=count_message)
+    bulk.table.add_items(rows[:1])
+    bulk.table.add_items(QTable(rows=rows[1:]))
+
+    # one message per batch
+    assert len(n_messages) == 2
+    assert len(bulk.table) == 3
+    assert bulk.table.items == row_by_row.table.items
+    assert bulk.table.headers_avail == row_by_row.table.headers_avail
+    assert bulk.table.items[1] == {'ra': '337.60000 deg', 'mag': '', 'slice': '4',
+                                   'name': 'bb', 'flag': False}
+    for colname in row_by_row.table._qtable.colnames:
+        np.testing.assert_array_equal(bulk.table._qtable[colname],
+                                      row_by_row.table._qtable[colname])
+
+    # new columns are filled with default values for the previous rows
+    bulk.table.add_items([{'ra': 1 * u.deg, 'mag': 1., 'slice': 1., 'name': 'd',
+                           'flag': False, 'extra': 2.}])
+    assert len(bulk.table._qtable) == 4
+    assert np.isnan(bulk.table._qtable['extra'][0])
+    assert bulk.table.items[-1]['extra'] == '2.00000'
+
+
+def test_table_virtualized(deconfigged_helper):
+    table = RecordingTable(deconfigged_helper.app.session).table
+    table.virtualize_threshold = 5
+
+    table.add_items([{'id': i, 'mag': float(10 - i), 'name': f'src_{i:02d}'} for i in range(4)])
+    # small tables are sent to the UI as a whole
+    assert not table.virtualized
+    assert table.frontend_items == table.items
+
+    table.add_items([{'id': i, 'mag': float(10 - i), 'name': f'src_{i:02d}'}
+                     for i in range(4, 12)])
+    assert table.virtualized
+    assert table.n_items == table.n_filtered_items == 12
+    assert len(table.items) == 12
+
+    table.table_options = {'page': 2, 'itemsPerPage': 5, 'sortBy': [], 'sortDesc': []}
+    assert [item['id'] for item in table.frontend_items] == [5, 6, 7, 8, 9]
+
+    # numbers are sorted by value, not as formatted strings
+    table.table_options = {'page': 1, 'itemsPerPage': 5, 'sortBy': ['mag'], 'sortDesc': [False]}
+    assert [item['id'] for item in table.frontend_items] == [11, 10, 9, 8, 7]
+    table.table_options = {'page': 1, 'itemsPerPage': 5, 'sortBy': ['name'], 'sortDesc': [True]}
+    assert [item['id'] for item in table.frontend_items] == [11, 10, 9, 8, 7]
+
+    table.filter_text = 'SRC_1'
+    assert table.n_filtered_items == 2
+    assert [item['id'] for item in table.frontend_items] == [11, 10]
+
+    table.table_options = {'page': 1, 'itemsPerPage': -1, 'sortBy': [], 'sortDesc': []}
+    table.filter_text = ''
+    assert len(table.frontend_items) == 12
+
+    table.clear_table()
+    assert not table.virtualized
+    assert table.frontend_items == []
+
+
 def astropy_table_write_formats():
     table_obj = Table({'a': [1, 2], 'b': [3, 4]})
     buf = io.StringIO()
@@ -397,3 +487,36 @@ def test_export_table(deconfigged_helper, source_catalog, tmp_path, valid_format
     else:
         table_obj.export_table(filename, format=valid_format)
         assert os.path.isfile(filename)
+
+
+@pytest.mark.parametrize('deg', [1, 3])
+def test_batched_polyfit(deg):
+    rng = np.random.default_rng(0)
+    x = np.sort(rng.uniform(5, 6, 30))
+    x_eval = np.linspace(4.5, 6.5, 50)
+    y = rng.normal(size=(4, 30, 5)) + 2 * x[:, None]
+
+    fits = _batched_polyfit(x, y, x_eval, deg=deg, axis=1)
+    assert fits.shape == (4, 50, 5)
+    for i, j in ((0, 0), (3, 4)):
+        expected = np.polyval(np.polyfit(x, y[i, :, j], deg), x_eval)
+        np.testing.assert_allclose(fits[i, :, j], expected, atol=1e-10)
+
+    # non-finite and masked values are ignored, fits without enough values are NaN
+    mask = np.zeros(y.shape, dtype=bool)
+    mask[1, :10, 1] = True
+    y[0, 5:8, 0] = np.nan
+    y[2, :, 2] = np.nan
+    y[3, :-deg, 3] = np.inf
+    fits = _batched_polyfit(x, y, x_eval, deg=deg, axis=1, mask=mask)
+    valid = np.isfinite(y[0, :, 0])
+    np.testing.assert_allclose(fits[0, :, 0],
+                               np.polyval(np.polyfit(x[valid], y[0, valid, 0], deg), x_eval),
+                               atol=1e-10)
+    np.testing.assert_allclose(fits[1, :, 1],
+                               np.polyval(np.polyfit(x[10:], y[1, 10:, 1], deg), x_eval),
+                               atol=1e-10)
+    assert np.all(np.isnan(fits[2, :, 2]))
+    assert np.all(np.isnan(fits[3, :, 3]))
+    np.testing.assert_allclose(fits[3, :, 4],
+                               np.polyval(np.polyfit(x, y[3, :, 4], deg), x_eval), atol=1e-10)
@@ -19,7 +19,7 @@ from bqplot.interacts import BrushSelector, BrushIntervalSelector
 
 from jdaviz.core.events import (LineIdentifyMessage, SpectralMarksChangedMessage,
                                 CatalogSelectClickEventMessage, FootprintSelectClickEventMessage)
-from jdaviz.core.marks import SpectralLine, FootprintOverlay
+from jdaviz.core.marks import SpectralLines, FootprintOverlay
 
 __all__ = []
 
@@ -381,19 +381,20 @@ class SelectLine(CheckableTool, HubListener):
         self.line_names = msg.names_rest
 
     def on_mouse_event(self, data):
-        # yes this would be avoid a list-comprehension by putting in
-        # _on_plotted_lines_changed, but by leaving it here, we let
-        # the marks worry about unit conversions
-        lines_x = np.array([mark.obs_value for mark in self.line_marks])
-        if not len(lines_x):
+        # read the observed values from the mark (instead of caching them in
+        # _on_plotted_lines_changed), to let the mark worry about unit conversions
+        lines_mark = self.viewer.spectral_lines_mark
+        if lines_mark is None or not lines_mark.show.any():
             return
+        lines_x = lines_mark.obs_values[lines_mark.show]
         ind = np.argmin(abs(lines_x - data['domain']['x']))
         # find line closest to mouse position and transmit event
-        msg = LineIdentifyMessage(self.line_names[ind], sender=self)
+        msg = LineIdentifyMessage(lines_mark.table_indices[lines_mark.show][ind], sender=self)
         self.viewer.session.hub.broadcast(msg)
 
     def is_visible(self):
-        return len([m for m in self.viewer.figure.marks if isinstance(m, SpectralLine)]) > 0
+        return bool(np.any([m.show.any() for m in self.viewer.figure.marks
+                            if isinstance(m, SpectralLines)]))
 
 
 @viewer_tool
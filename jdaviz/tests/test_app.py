@@ -30,6 +30,36 @@ def test_get_tray_item_from_name():
         app.get_tray_item_from_name('imviz-compass')
 
 
+def test_deferred_tray_item(cubeviz_helper):
+    app = cubeviz_helper.app
+    names = [item['name'] for item in app.state.tray_items]
+    index = names.index('g-collapse')
+    assert app.state.tray_items[index]['widget'] is None
+    assert app.state.tray_items[index]['is_relevant']
+    # searchable in the tray by description and API methods before being instantiated
+    description = app.state.tray_items[index]['tray_item_description']
+    api_methods = app.state.tray_items[index]['api_methods']
+    assert description == 'Collapse a spectral cube along one axis.'
+    assert 'collapse(add_data=True)' in api_methods
+
+    # instantiated when first opened in the tray
+    app.state.tray_items_open = [index]
+    assert app.state.tray_items[index]['widget'] is not None
+    assert app.state.tray_items[index]['tray_item_description'] == description
+    assert app.state.tray_items[index]['api_methods'] == api_methods
+    plg = app.get_tray_item_from_name('g-collapse')
+    app.state.tray_items_open = []
+    app.state.tray_items_open = [index]
+    assert app.get_tray_item_from_name('g-collapse') is plg
+
+
+def test_deferred_tray_item_api_access(cubeviz_helper):
+    assert 'Collapse' in cubeviz_helper.plugins
+    assert cubeviz_helper.plugins['Collapse']._obj.__class__.__name__ == 'Collapse'
+    names = [item['name'] for item in cubeviz_helper.app.state.tray_items]
+    assert cubeviz_helper.app.state.tray_items[names.index('g-collapse')]['widget'] is not None
+
+
 @pytest.mark.xfail(reason="hardcoded config logic during deconfigging process")
 def test_nonstandard_specviz_viewer_name(spectrum1d):
     config = {'settings': {'configuration': 'nonstandard',
@@ -0,0 +1,49 @@
+import subprocess
+import sys
+
+
+def _run_python(code):
+    result = subprocess.run([sys.executable, '-c', code],
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def test_import_is_lazy():
+    # importing jdaviz should not import the configs, plugins or the application
+    out = _run_python("import sys, jdaviz; "
+                      "print('jdaviz.configs' in sys.modules, 'jdaviz.app' in sys.modules)")
+    assert out == ['False', 'False']
+
+    # the configs are imported on first access
+    out = _run_python("import sys, jdaviz; jdaviz.Specviz; print('jdaviz.configs' in sys.modules)")
+    assert out == ['True']
+
+
+def test_configs_import_is_lazy():
+    # importing the configs package does not import the configs, but its exported names
+    # are still available
+    out = _run_python("import sys, jdaviz.configs; "
+                      "print('jdaviz.configs.specviz' in sys.modules); "
+                      "print(jdaviz.configs.Specviz.__name__)")
+    assert out == ['False', 'Specviz']
+
+
+def test_construction_defers_plugins():
+    from jdaviz import Cubeviz
+    from jdaviz.core.events import SnackbarMessage
+
+    def deferred(app):
+        return {item['label'] for item in app.state.tray_items if item['widget'] is None}
+
+    # plugins that defer their instantiation are not created with the app (including when
+    # setting the verbosity through the logger) nor by logging messages or listing the plugins
+    cubeviz = Cubeviz(verbosity='warning', history_verbosity='info')
+    assert deferred(cubeviz.app) == {'Collapse'}
+    cubeviz.app.hub.broadcast(SnackbarMessage('message', sender=cubeviz.app, color='info'))
+    assert 'Collapse' in cubeviz.plugins
+    assert 'Collapse' in list(cubeviz.plugins.keys())
+    assert deferred(cubeviz.app) == {'Collapse'}
+
+    # only the plugin that is accessed is instantiated
+    assert cubeviz.plugins['Collapse']._obj.__class__.__name__ == 'Collapse'
+    assert deferred(cubeviz.app) == set()
@@ -1,16 +1,19 @@
 import os
+import pickle
 import warnings
 import numpy as np
 import threading
 
 import pytest
 from astropy.io import fits
+from astropy.nddata import NDData
 from astropy.units.quantity import Quantity
 
 from jdaviz.utils import (alpha_index, download_uri_to_path,
                           get_cloud_fits, cached_uri, escape_brackets,
                           has_wildcard, wildcard_match, _clean_data_for_hash,
-                          create_data_hash, parallelize_calculation)
+                          create_data_hash, create_data_fingerprint, parallelize_calculation,
+                          SharedArray, SharedArrayStore)
 
 from jdaviz.conftest import FakeSpectrumListImporter
 
@@ -315,6 +318,67 @@ class TestParallelizeCalculation:
             assert collected == []
 
 
+@pytest.mark.parametrize('n_cpu', [1, 2])
+def test_parallelize_calculation_stream(n_cpu):
+    dispatched = []
+
+    def workers():
+        for v in range(200):
+            dispatched.append(v)
+            yield lambda v=v: v
+
+    collected = []
+
+    def collect_result_callback(res):
+        collected.append(res)
+        # request cancellation after the third result
+        return len(collected) == 3
+
+    completed = parallelize_calculation(workers(), collect_result_callback,
+                                        n_cpu=n_cpu, stream=True)
+    assert completed is False
+    # results are streamed in order and the remaining workers are never dispatched
+    assert collected == [0, 1, 2]
+    assert len(dispatched) < 200
+
+    collected = []
+    assert parallelize_calculation(workers(), collected.append, n_cpu=n_cpu, stream=True)
+    assert collected == list(range(200))
+
+
+@pytest.mark.parametrize('n_cpu', [1, 2])
+def test_parallelize_calculation_shared_arrays(n_cpu):
+    cube = np.arange(24, dtype=float).reshape(2, 3, 4) * Quantity(1, 'Jy')
+
+    def square_rows(inp, out, rows):
+        inp_arr, out_arr = inp.asarray(), out.asarray(writeable=True)
+        for row in rows:
+            out_arr[row] = inp_arr[row] ** 2
+        out_arr.flush()
+        return len(rows)
+
+    collected = []
+    with SharedArrayStore() as store:
+        inp = store.put(cube)
+        out = store.zeros(cube.shape)
+        assert isinstance(inp, SharedArray)
+        assert inp.shape == cube.shape
+        assert inp.dtype == cube.dtype
+        # handles are cheap to pickle regardless of the array size
+        assert len(pickle.dumps(inp)) < cube.nbytes
+
+        workers = [lambda rows=rows: square_rows(inp, out, rows) for rows in ([0], [1])]
+        parallelize_calculation(workers, collected.append, n_cpu=n_cpu)
+        result = np.array(out.asarray())
+
+    assert sorted(collected) == [1, 1]
+    np.testing.assert_array_equal(result, cube.value ** 2)
+    assert not os.path.exists(inp.filename)
+
+    with pytest.raises(RuntimeError, match='context manager'):
+        SharedArrayStore().zeros((2, 2))
+
+
 @pytest.mark.parametrize('input_data',
                          [np.arange(10), '12345',
                           np.ma.masked_array(np.arange(10), mask=[0, 1, 0, 0, 1, 1, 0, 0, 1, 0]),
@@ -388,3 +452,14 @@ def test_create_data_hash_none():
     assert create_data_hash([None, None, None]) is None
     assert create_data_hash(np.array([])) is None
     assert create_data_hash(np.array([None, None, None])) is None
+
+
+def test_create_data_fingerprint():
+    arr = np.arange(12.).reshape(3, 4)
+    hdu = fits.ImageHDU(arr)
+    # read from the header for HDUs, consistent with the data for other types
+    assert create_data_fingerprint(hdu) == create_data_fingerprint(arr) == 'shape:(3, 4)'
+    assert create_data_fingerprint(NDData(arr)) == 'shape:(3, 4)'
+    assert create_data_fingerprint(arr.T) != create_data_fingerprint(arr)
+    assert create_data_fingerprint(fits.BinTableHDU()) is None
+    assert create_data_fingerprint(None) is None
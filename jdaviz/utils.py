@@ -1,5 +1,6 @@
 import operator
 import os
+import tempfile
 import time
 import threading
 import warnings
@@ -43,7 +44,7 @@ __all__ = ['SnackbarQueue', 'enable_hot_reloading', 'bqplot_clear_figure',
            'layer_is_2d_or_3d', 'layer_is_image_data', 'layer_is_wcs_only',
            'get_wcs_only_layer_labels', 'get_top_layer_index',
            'get_reference_image_data', 'standardize_roman_metadata',
-           'wildcard_match', 'create_data_hash',
+           'wildcard_match', 'create_data_hash', 'create_data_fingerprint',
            'cmap_samples', 'glue_colormaps', 'att_to_componentid']
 
 NUMPY_LT_2_0 = not minversion("numpy", "2.0.dev")
@@ -962,25 +963,166 @@ def att_to_componentid(att_helper, att):
     raise ValueError(f"Could not find component ID for attribute '{att}'")
 
 
-def parallelize_calculation(workers, collect_result_callback, n_cpu=mp.cpu_count() - 1):
+def parallelize_calculation(workers, collect_result_callback, n_cpu=mp.cpu_count() - 1,
+                            stream=False, prefer=None):
     """
     Function to perform parallel processing with joblib.
     The function takes a list of callables (functions with no arguments
     that return a result) and executes them in parallel.
     The results of each callable are passed to a callback function for collection.
 
+    Large arrays should be handed to the workers as `SharedArray` handles
+    (see `SharedArrayStore`) rather than as arrays, so that they are not
+    serialized into every worker process.
+
     Parameters
     ----------
     workers : worker type object
         The function to be called within the parallel backend context.
+        This can be a generator, which is only consumed as workers are
+        dispatched to the pool.
     collect_result_callback : function
         A callback function to collect the results of each worker.
     n_cpu : int
         The number of CPU cores to use for parallel processing.
         Defaults to the total number of available CPU cores - 1.
+    stream : bool
+        If `False` (default), results are only collected once all the
+        workers have completed. If `True`, each result is passed to
+        ``collect_result_callback`` as soon as it is available (in the order
+        of ``workers``), and the callback can return `True` to cancel all
+        the remaining workers.
+    prefer : {'processes', 'threads'} or None
+        Soft hint passed to `joblib.Parallel` for the kind of workers to use.
+        Threads avoid serializing the workers and their results, and suit
+        workers that mostly wait on I/O or release the GIL.
+
+    Returns
+    -------
+    completed : bool
+        `False` if the calculation was cancelled by ``collect_result_callback``.
     """
-    results = Parallel(n_jobs=n_cpu)(delayed(worker)() for worker in workers)
-    _ = [collect_result_callback(r) for r in results]
+    if not stream:
+        results = Parallel(n_jobs=n_cpu, prefer=prefer)(delayed(worker)() for worker in workers)
+        _ = [collect_result_callback(r) for r in results]
+        return True
+
+    parallel = Parallel(n_jobs=n_cpu, return_as='generator', prefer=prefer)
+    results = parallel(delayed(worker)() for worker in workers)
+    try:
+        for result in results:
+            if collect_result_callback(result):
+                return False
+    finally:
+        # cancel the remaining tasks, also when interrupted (KeyboardInterrupt)
+        with warnings.catch_warnings():
+            # joblib warns about the remaining tasks being cancelled
+            warnings.simplefilter('ignore', UserWarning)
+            results.close()
+    return True
+
+
+class SharedArray:
+    """
+    Picklable handle to a numpy array stored in a memory-mapped file, created
+    through `SharedArrayStore`. Passing the handle to `parallelize_calculation`
+    workers only pickles the file name, shape and dtype; every worker then maps
+    the same buffer, so memory usage does not grow with the number of processes.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the memory-mapped file.
+    shape : tuple of int
+        Shape of the array.
+    dtype : `numpy.dtype` or str
+        Data type of the array.
+    """
+    def __init__(self, filename, shape, dtype):
+        self.filename = filename
+        self.shape = tuple(shape)
+        self.dtype = np.dtype(dtype)
+
+    def asarray(self, writeable=False):
+        """
+        Map the buffer into the current process.
+
+        Parameters
+        ----------
+        writeable : bool
+            Whether the returned array can be written to (e.g., by workers
+            storing their results into a preallocated output buffer).
+
+        Returns
+        -------
+        array : `numpy.memmap`
+        """
+        return np.memmap(self.filename, dtype=self.dtype, shape=self.shape,
+                         mode='r+' if writeable else 'r')
+
+
+class SharedArrayStore:
+    """
+    Context manager that creates `SharedArray` buffers in a temporary directory,
+    which is removed (along with all the buffers) on exit.
+
+    Examples
+    --------
+    >>> with SharedArrayStore() as store:  # doctest: +SKIP
+    ...     cube = store.put(flux)
+    ...     output = store.zeros(flux.shape)
+    ...     parallelize_calculation(workers, collect_result, n_cpu=n_cpu)
+    ...     result = np.array(output.asarray())
+    """
+    def __init__(self):
+        self._tmpdir = None
+        self._n_arrays = 0
+
+    def __enter__(self):
+        self._tmpdir = tempfile.TemporaryDirectory(prefix='jdaviz-', ignore_cleanup_errors=True)
+        return self
+
+    def __exit__(self, *exc):
+        self._tmpdir.cleanup()
+        self._tmpdir = None
+
+    def _new_array(self, shape, dtype):
+        if self._tmpdir is None:
+            raise RuntimeError("SharedArrayStore must be used as a context manager")
+        filename = os.path.join(self._tmpdir.name, f'array{self._n_arrays}.dat')
+        self._n_arrays += 1
+        shared = SharedArray(filename, shape, dtype)
+        return shared, np.memmap(filename, dtype=shared.dtype, shape=shared.shape, mode='w+')
+
+    def put(self, array):
+        """
+        Copy ``array`` once into a new shared buffer.
+
+        Parameters
+        ----------
+        array : array-like
+            Input data. Units of `~astropy.units.Quantity` objects are dropped.
+
+        Returns
+        -------
+        shared : `SharedArray`
+        """
+        array = np.asarray(getattr(array, 'value', array))
+        shared, buffer = self._new_array(array.shape, array.dtype)
+        buffer[...] = array
+        buffer.flush()
+        return shared
+
+    def zeros(self, shape, dtype=float):
+        """
+        Create a new zero-filled shared buffer (e.g., to preallocate outputs).
+
+        Returns
+        -------
+        shared : `SharedArray`
+        """
+        shared, _ = self._new_array(shape, dtype)
+        return shared
 
 
 def _clean_data_for_hash(data):
@@ -1100,6 +1242,65 @@ def create_data_hash(input_data):
     return hasher.hexdigest()
 
 
+def create_data_fingerprint(input_data):
+    """
+    Create and return a cheap fingerprint for the provided data, without reading
+    or hashing the data itself.  For FITS HDUs, the fingerprint is read from the
+    header, so that data which is not loaded yet stays on disk.
+
+    Identical data always have the same fingerprint, so that data with different
+    fingerprints do not need to be compared with `create_data_hash`.
+
+    Parameters
+    ----------
+    input_data : object
+        The data to fingerprint (see `create_data_hash`).
+
+    Returns
+    -------
+    str or None
+        The fingerprint, or `None` if it could not be determined (in which case
+        the data has to be compared by hash).
+    """
+    if isinstance(input_data, fits.hdu.base._BaseHDU):
+        if not input_data.is_image:
+            return None
+        header = input_data.header
+        naxis = header.get('NAXIS', 0)
+        return f"shape:{tuple(header.get(f'NAXIS{i}', 0) for i in range(naxis, 0, -1))}"
+
+    target = input_data
+    for attr in ('flux', 'data'):
+        if hasattr(input_data, attr):
+            target = getattr(input_data, attr)
+            break
+    shape = getattr(target, 'shape', None)
+    if shape is None:
+        return None
+    return f'shape:{tuple(shape)}'
+
+
+# hashes of data read from files, by file path, modification time and size and
+# the location of the data within the file
+_file_data_hashes = {}
+
+
+def _create_file_data_hash(input_data, filepath, key):
+    """
+    `create_data_hash` for data read from ``filepath``, cached so that reloading
+    an unchanged file does not hash its data again.  ``key`` identifies the data
+    within the file (e.g., the extension).
+    """
+    try:
+        stat = os.stat(filepath)
+    except (OSError, TypeError, ValueError):
+        return create_data_hash(input_data)
+    cache_key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size, key)
+    if cache_key not in _file_data_hashes:
+        _file_data_hashes[cache_key] = create_data_hash(input_data)
+    return _file_data_hashes[cache_key]
+
+
 # Add new and inverse colormaps to Glue global state. Also see ColormapRegistry in
 # https://github.com/glue-viz/glue/blob/main/glue/config.py
 new_cms = (['Rainbow', cm.rainbow],